@@ -23,6 +23,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import re
+from concurrent.futures import Future
 
 from utils.configurable import Configurable
 from utils.utils import serial_ports
@@ -31,6 +32,7 @@ from data import verbal_const
 
 from controllers.utils.resource_identifiers import Identifiers
 from controllers.utils.pin_modes import PinModes
+from controllers.utils.gpio_handle import GpioHandle
 
 from devices.drivers.modbus.function_code import FunctionCode
 
@@ -86,6 +88,9 @@ class BaseController(Configurable):
 
         self._remote_gpio_chunks_count = 5
 
+        self._gpio_handles = {}
+        """Compiled pins by pin description."""
+
     def __str__(self):
         """Returns controller vendor and model as string.
 
@@ -328,6 +333,13 @@ class BaseController(Configurable):
 
     def is_valid_gpio(self, gpio):
 
+        # Already compiled.
+        handle = gpio
+        if isinstance(gpio, str):
+            handle = self._gpio_handles.get(gpio)
+        if isinstance(handle, GpioHandle):
+            return not handle.off
+
         local_gpio = self.is_gpio_local(gpio)
         remote_gpio = self.is_gpio_remote(gpio)
 
@@ -401,6 +413,55 @@ class BaseController(Configurable):
 
         return identifier
 
+    def compile_gpio(self, pin):
+        """Compile the pin description to handle. The handles are cached by the description,
+        so the pin is parsed and validated only the first time it is used.
+
+        Args:
+            pin (str, GpioHandle): Pin description or already compiled handle.
+
+        Raises:
+            ValueError: None or empty pin.
+            ValueError: The pin is not local nor remote.
+
+        Returns:
+            GpioHandle: The handle.
+        """
+
+        if isinstance(pin, GpioHandle):
+            return pin
+
+        handle = self._gpio_handles.get(pin)
+        if handle is not None:
+            return handle
+
+        if self.is_gpio_nothing(pin):
+            raise ValueError("Pin can not be None or empty string.")
+
+        if self.is_gpio_off(pin):
+            handle = GpioHandle.create_off(pin)
+
+        elif self.is_gpio_local(pin):
+            name = pin.upper().replace("!", "")
+            handle = GpioHandle.create_local(pin, name, self.is_gpio_inverted(pin), self._gpio_map[name])
+
+        elif self.is_gpio_remote(pin):
+            name = pin.upper().replace("!", "")
+            handle = GpioHandle.create_remote(pin, name, self.parse_remote_gpio(pin))
+
+        else:
+            raise ValueError("Pin does not exists in pin map.")
+
+        self._gpio_handles[pin] = handle
+
+        return handle
+
+    def clear_gpio_handles(self):
+        """Clear the compiled pins. Call it when the GPIO map is changed.
+        """
+
+        self._gpio_handles.clear()
+
     def get_gpio_map(self):
         """Return GPIO map.
         """
@@ -641,6 +702,16 @@ class BaseController(Configurable):
             State of the device.
         """
 
+    def flush(self):
+        """Send the buffered writes to the controller.
+        Controllers without write buffer send them right away.
+
+        Returns:
+            int: Count of the sent writes.
+        """
+
+        return 0
+
     def get_1w_devices(self):
         """Gets all possible 1W devices connected to the controller.
 
@@ -652,14 +723,41 @@ class BaseController(Configurable):
 
         return []
 
-    def execute_mb_request(self, request):
+    def execute_mb_request(self, request, uart, priority=None, timeout=None):
         """Execute modbus request.
 
         Args:
             request (ModbusRequest): PyMODBUS request instance.
+            uart (int): UART index.
+            priority (Priority, optional): Transaction priority. Defaults to None.
+            timeout (float, optional): Seconds to wait in the queue before expiration. Defaults to None.
 
         Returns:
             ModbusResponse: PyMODBUS response instance.
         """
 
+    def submit_mb_request(self, request, uart, priority=None, timeout=None):
+        """Submit modbus request without waiting for the response.
+        Controllers without transaction queue execute the request right away.
+
+        Args:
+            request (ModbusRequest): PyMODBUS request instance.
+            uart (int): UART index.
+            priority (Priority, optional): Transaction priority. Defaults to None.
+            timeout (float, optional): Seconds to wait in the queue before expiration. Defaults to None.
+
+        Returns:
+            Future: Future of the PyMODBUS response instance.
+        """
+
+        future = Future()
+
+        try:
+            future.set_result(self.execute_mb_request(request, uart, priority, timeout))
+
+        except Exception as error:
+            future.set_exception(error)
+
+        return future
+
 #endregion
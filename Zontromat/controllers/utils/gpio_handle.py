@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+from collections import namedtuple
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class GpioHandle(namedtuple("GpioHandle", ["pin", "name", "inverted", "off", "local",\
+    "remote", "uart", "mb_id", "mb_fc", "io_reg", "io_type", "io_index"])):
+    """Compiled pin description. It is immutable, so it is safe to share and cache it.
+
+    Attributes:
+        pin (str): Pin as it is written in the register, U0:ID1:FC2:R0:DI1 or !DO1.
+        name (str): Pin without the inversion sign, in upper case.
+        inverted (bool): Inverted polarity.
+        off (bool): The pin is switched off.
+        local (mixed): Entry of the local GPIO map, None for the remote pins.
+        remote (bool): The pin is on a MODBUS-RTU device.
+        uart (int): UART index of the remote pin.
+        mb_id (int): MODBUS identifier of the remote pin.
+        mb_fc (int): MODBUS function code of the remote pin.
+        io_reg (int): First MODBUS register of the remote pin.
+        io_type (str): IO type of the remote pin, DI, DO, AI, AO ...
+        io_index (int): IO index of the remote pin.
+    """
+
+    __slots__ = ()
+
+#region Properties
+
+    @property
+    def address(self):
+        """MODBUS address of the remote pin.
+
+        Returns:
+            int: Register or coil address.
+        """
+
+        return self.io_reg + self.io_index
+
+#endregion
+
+#region Public Methods
+
+    def polarity(self, state):
+        """Apply the polarity of the pin to the state.
+
+        Args:
+            state (mixed): State of the pin.
+
+        Returns:
+            bool: State with the polarity of the pin.
+        """
+
+        if self.inverted:
+            return not state
+
+        return bool(state)
+
+#endregion
+
+#region Static Methods
+
+    @staticmethod
+    def create_off(pin):
+        """Handle of switched off pin.
+
+        Args:
+            pin (str): Pin.
+
+        Returns:
+            GpioHandle: The handle.
+        """
+
+        return GpioHandle(pin, pin, False, True, None, False, None, None, None, None, None, None)
+
+    @staticmethod
+    def create_local(pin, name, inverted, local):
+        """Handle of local pin.
+
+        Args:
+            pin (str): Pin.
+            name (str): Pin without the inversion sign, in upper case.
+            inverted (bool): Inverted polarity.
+            local (mixed): Entry of the local GPIO map.
+
+        Returns:
+            GpioHandle: The handle.
+        """
+
+        return GpioHandle(pin, name, inverted, False, local, False, None, None, None, None, None, None)
+
+    @staticmethod
+    def create_remote(pin, name, identifier):
+        """Handle of remote pin.
+
+        Args:
+            pin (str): Pin.
+            name (str): Pin without the inversion sign, in upper case.
+            identifier (dict): Parsed remote pin.
+
+        Returns:
+            GpioHandle: The handle.
+        """
+
+        return GpioHandle(pin, name, identifier["io_inverted"], False, None, True,\
+            identifier["uart"], identifier["mb_id"], identifier["mb_fc"],\
+            identifier["io_reg"], identifier["io_type"], identifier["io_index"])
+
+#endregion
@@ -22,6 +22,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
+import io
 import traceback
 import xml.etree.ElementTree as ET
 
@@ -79,8 +80,29 @@ class PiCons(BaseController):
     __args = "/?RelayOutputs=all&DigitalInputs=all&CounterInputs=all&AnalogInputs=all&ElectronicScales=all"
     """Arguments for the GPIO."""
 
-    __json_data = None
-    """JSON data container."""
+    __fields = None
+    """Fields of the status document, by tag."""
+
+    __entries = None
+    """Entries of the status document, by ID."""
+
+    __payload = None
+    """Last parsed status document."""
+
+    __etag = None
+    """ETag of the last status document."""
+
+    __session = None
+    """Pooled HTTP session, keeps the connection to the PiCons alive."""
+
+    __buffered_writes = True
+    """Buffer the output writes until flush."""
+
+    __writes = None
+    """Buffered output writes, by entry ID."""
+
+    __fields_tags = ["LastComTime", "Model", "SerialNumber", "ProtocolVersion", "Device"]
+    """Tags of the status document fields."""
 
     __map = \
     {\
@@ -230,58 +252,141 @@ class PiCons(BaseController):
         self.timeout = self._config["timeout"]
         self.__logger = get_logger(__name__)
 
+        self.__fields = {}
+        self.__entries = {}
+        self.__session = requests.Session()
+        self.__writes = {}
+
+        if "buffered_writes" in self._config:
+            self.__buffered_writes = bool(self._config["buffered_writes"])
+
 #endregion
 
 #region Private Methods
 
-    def __xml_to_dict(self, content):
-        """XML to dictionary."""
+    def __parse(self, content):
+        """Parse the status document in one pass.
 
-        root = ET.fromstring(content)
-        # root = tree.getroot()
+        Args:
+            content (bytes): Status document.
 
-        converted_data = dict()
+        Returns:
+            tuple: Fields by tag and entries by ID.
+        """
 
-        for child in root:
+        fields = {}
+        entries = {}
+        item = None
 
-            if child.tag == "LastComTime":
-                converted_data[child.tag] = child.text
+        for event, element in ET.iterparse(io.BytesIO(content), events=("start", "end")):
 
-            elif child.tag == "Model":
-                converted_data[child.tag] = child.text
+            if event == "start":
+                if element.tag == "item":
+                    item = {}
+                continue
 
-            elif child.tag == "SerialNumber":
-                converted_data[child.tag] = child.text
+            if element.tag == "item":
+                if "ID" in item:
+                    entries[item["ID"]] = item
+                item = None
 
-            elif child.tag == "ProtocolVersion":
-                converted_data[child.tag] = child.text
+            elif item is not None:
+                if element.tag == "ID":
+                    item[element.tag] = int(element.text)
+                else:
+                    item[element.tag] = element.text
 
-            elif child.tag == "Device":
-                converted_data[child.tag] = child.text
+            elif element.tag in self.__fields_tags:
+                fields[element.tag] = element.text
 
-            elif child.tag == "Entries":
-                if not child.tag in converted_data:
-                    converted_data[child.tag] = list()
+            # The values are taken, free the tree.
+            element.clear()
 
-                for entire in child:
+        return fields, entries
 
-                    if entire.tag == "item":
-                        data_item = dict()
+    def __load(self, response):
+        """Load the status document from the response.
+        The document is parsed only when it is changed.
 
-                        for attr in entire:
+        Args:
+            response (Response): Response with the status document.
+        """
 
-                            if attr.tag == "ID":
-                                data_item[attr.tag] = int(attr.text)
+        self.__etag = response.headers.get("ETag", None)
 
-                            else:
-                                data_item[attr.tag] = attr.text
+        content = response.content
+        if content == self.__payload:
+            return
 
-                        converted_data[child.tag].append(data_item)
+        self.__fields, self.__entries = self.__parse(content)
+        self.__payload = content
 
-            else:
-                print("Tag: {}; Text: {}".format(child.tag, child.text))
+    def __send(self, writes):
+        """Send the output writes with one request.
+        The PiCons answers with the status document.
+
+        Args:
+            writes (dict): Values by entry ID.
+
+        Returns:
+            bool: True when the PiCons accepts the writes.
+        """
+
+        circuits = []
+        for idx, value in writes.items():
+            circuits.append("Relay{}={}".format(idx+1, str(value)))
+
+        uri = self.__host + "/?" + "&".join(circuits)
+        response = self.__session.get(uri, timeout=self.__timeout)
+
+        if response.status_code != 200:
+            self.__logger.error("Controller answer with: {}".format(response.status_code))
+            return False
+
+        self.__load(response)
+
+        return True
+
+    def __write(self, idx, value):
+        """Write the output now or buffer it until flush.
+
+        Args:
+            idx (int): Entry ID.
+            value (int): Value of the output.
+
+        Returns:
+            mixed: Entry of the output, None when the write is buffered.
+        """
 
-        return converted_data
+        if not self.__buffered_writes:
+            self.__send({idx: value})
+            return self.__entries.get(idx, None)
+
+        # The last write of the tick wins.
+        self.__writes[idx] = value
+
+        return None
+
+    def __is_confirmed(self, idx, value):
+        """Check is the output already in this state.
+
+        Args:
+            idx (int): Entry ID.
+            value (int): Value of the output.
+
+        Returns:
+            bool: True when the status document has the same value.
+        """
+
+        entry = self.__entries.get(idx, None)
+        if entry is None:
+            return False
+
+        try:
+            return int(entry["Value"]) == int(value)
+
+        except (KeyError, TypeError, ValueError):
+            return False
 
 #endregion
 
@@ -292,17 +397,23 @@ class PiCons(BaseController):
 
         state = False
 
-        # Call the Neuron.
+        # Call the PiCons.
         uri = self.__host + self.__args
 
+        headers = {}
+        if self.__etag is not None:
+            headers["If-None-Match"] = self.__etag
+
         try:
-            response = requests.get(uri, timeout=self.__timeout)
+            response = self.__session.get(uri, timeout=self.__timeout, headers=headers)
+
+            # Not modified since the last document.
+            if response.status_code == 304:
+                state = True
 
-            if response.status_code == 200:
+            elif response.status_code == 200:
 
-                # print(response.text)
-                self.__json_data = self.__xml_to_dict(response.text)
-                # print(self.__json_data)
+                self.__load(response)
 
                 # Mark as successfull.
                 state = True
@@ -333,8 +444,11 @@ class PiCons(BaseController):
 
         value = None
 
-        if name in self.__json_data:
-            value = self.__json_data[name]
+        if name == "Entries":
+            value = list(self.__entries.values())
+
+        elif name in self.__fields:
+            value = self.__fields[name]
 
         return value
 
@@ -342,6 +456,9 @@ class PiCons(BaseController):
 
         item = None
 
+        if isinstance(entries, dict):
+            return entries.get(idx, None)
+
         for entre in entries:
             if entre["ID"] == idx:
                 item = entre
@@ -362,14 +479,10 @@ class PiCons(BaseController):
         Returns
         -------
         mixed
-            JSON response data.
+            Entry of the output, None when the write is buffered.
         """
 
-        circuit = "Relay{}={}".format(idx+1, str(value))
-        uri = self.__host + "/?" + circuit
-        response = requests.get(uri, timeout=self.__timeout)
-        json_data = self.__xml_to_dict(response.text)
-        return json_data
+        return self.__write(idx, value)
 
     def _set_digital_output(self, idx, value):
         """Turn the DO state.
@@ -384,14 +497,10 @@ class PiCons(BaseController):
         Returns
         -------
         mixed
-            JSON response data.
+            Entry of the output, None when the write is buffered.
         """
 
-        circuit = "Relay{}={}".format(idx+1, str(value))
-        uri = self.__host + "/?" + circuit
-        response = requests.get(uri, timeout=self.__timeout)
-        json_data = self.__xml_to_dict(response.text)
-        return json_data
+        return self.__write(idx, value)
 
     def _reset_input_counter(self, idx):
         """Turn the DI state.
@@ -413,11 +522,7 @@ class PiCons(BaseController):
             JSON response data.
         """
 
-        entries = self._get_field("Entries")
-
-        item = self._get_item(entries, idx)
-
-        return item
+        return self._get_item(self.__entries, idx)
 
     def _get_counter(self, idx):
         """Read digital input counter.
@@ -433,11 +538,7 @@ class PiCons(BaseController):
             JSON response data.
         """
 
-        entries = self._get_field("Entries")
-
-        item = self._get_item(entries, idx)
-
-        return item
+        return self._get_item(self.__entries, idx)
 
     def _get_digital_input(self, idx):
         """Read digital input.
@@ -453,11 +554,7 @@ class PiCons(BaseController):
             JSON response data.
         """
 
-        entries = self._get_field("Entries")
-
-        item = self._get_item(entries, idx)
-
-        return item
+        return self._get_item(self.__entries, idx)
 
     def _get_relay_outputs(self, idx):
         """Read relay outputs.
@@ -473,11 +570,7 @@ class PiCons(BaseController):
             JSON response data.
         """
 
-        entries = self._get_field("Entries")
-
-        item = self._get_item(entries, idx)
-
-        return item
+        return self._get_item(self.__entries, idx)
 
     def _get_digital_outputs(self, idx):
         """Read digital outputs.
@@ -493,11 +586,7 @@ class PiCons(BaseController):
             JSON response data.
         """
 
-        entries = self._get_field("Entries")
-
-        item = self._get_item(entries, idx)
-
-        return item
+        return self._get_item(self.__entries, idx)
 
     def _get_analog_in(self, idx):
         """Read analog inputs.
@@ -513,11 +602,7 @@ class PiCons(BaseController):
             JSON response data.
         """
 
-        entries = self._get_field("Entries")
-
-        item = self._get_item(entries, idx)
-
-        return item
+        return self._get_item(self.__entries, idx)
 
 #endregion
 
@@ -530,14 +615,47 @@ class PiCons(BaseController):
     def update(self):
         """Update controller state."""
 
+        self.flush()
+
         return self._update()
 
+    def flush(self):
+        """Send the buffered output writes to the PiCons with one request.
+        Writes of outputs that are already in the requested state are skipped.
+
+        Returns:
+            int: Count of the sent writes.
+        """
+
+        writes = {}
+        for idx, value in self.__writes.items():
+            if not self.__is_confirmed(idx, value):
+                writes[idx] = value
+
+        self.__writes = {}
+
+        if not writes:
+            return 0
+
+        try:
+            if self.__send(writes):
+                return len(writes)
+
+        except Exception:
+            self.__logger.error(traceback.format_exc())
+
+        # Try again on the next flush, unless there is a newer write.
+        for idx, value in writes.items():
+            self.__writes.setdefault(idx, value)
+
+        return 0
+
     def digital_read(self, pin):
         """Read the digital input pin.
 
         Parameters
         ----------
-        pin : str
+        pin : str/GpioHandle
             Pin index.
 
         Returns
@@ -548,18 +666,15 @@ class PiCons(BaseController):
 
         state = False
 
-        l_pin = pin.replace("!", "")
+        handle = self.compile_gpio(pin)
 
-        if not self.is_valid_gpio_type(l_pin):
-            raise ValueError("Pin can not be None or empty string.")
+        if handle.off:
+            return state
 
-        if not self.is_valid_gpio(l_pin):
+        if handle.remote:
             raise ValueError("Pin does not exists in pin map.")
 
-        if self.is_off_gpio(l_pin):
-            return state
-
-        gpio_map = self.__map[l_pin]
+        gpio_map = handle.local
         # if gpio_map["dev"] == "do":
         #     response = self._get_digital_output(gpio_map["id"])
         #     state = int(response["Value"])
@@ -573,21 +688,14 @@ class PiCons(BaseController):
             state = int(response["Value"])
 
         # Inversion
-        polarity = pin.startswith("!")
-
-        if polarity:
-            state = not state
-        else:
-            state = bool(state)
-
-        return state
+        return handle.polarity(state)
 
     def digital_write(self, pin, value):
         """Write the digital output pin.
 
         Parameters
         ----------
-        pin : str
+        pin : str/GpioHandle
             Pin index.
 
         value : int
@@ -599,33 +707,20 @@ class PiCons(BaseController):
             State of the pin.
         """
 
-        l_pin = pin.replace("!", "")
         response = None
 
-        if not self.is_valid_gpio_type(l_pin):
-            raise ValueError("Pin can not be None or empty string.")
-
-        if not self.is_valid_gpio(l_pin):
-            raise ValueError("Pin does not exists in pin map.")
+        handle = self.compile_gpio(pin)
 
-        if self.is_off_gpio(l_pin):
+        if handle.off:
             return response
 
-        gpio_map = self.__map[l_pin]
-
-        # Inversion
-        polarity = pin.startswith("!")
-        state = 0
-
-        if polarity:
-            state = not value
-        else:
-            state = bool(value)
+        if handle.remote:
+            raise ValueError("Pin does not exists in pin map.")
 
-        state = int(state)
+        gpio_map = handle.local
 
-        if state > 1:
-            state = 1
+        # Inversion
+        state = int(handle.polarity(value))
 
         if gpio_map["dev"] == "do":
             response = self._set_digital_output(gpio_map["id"], state)
@@ -639,7 +734,7 @@ class PiCons(BaseController):
 
         Parameters
         ----------
-        pin : str
+        pin : str/GpioHandle
             Pin index.
 
         Returns
@@ -650,18 +745,15 @@ class PiCons(BaseController):
 
         counter = 0
 
-        if not self.is_valid_gpio_type(pin):
-            raise ValueError("Pin can not be None or empty string.")
-
-        if not self.is_valid_gpio(pin):
-            raise ValueError("Pin does not exists in pin map.")
+        handle = self.compile_gpio(pin)
 
-        if self.is_off_gpio(pin):
+        if handle.off:
             return counter
 
-        gpio_map = self.__map[pin]
+        if handle.remote:
+            raise ValueError("Pin does not exists in pin map.")
 
-        response = self._get_counter(gpio_map)
+        response = self._get_counter(handle.local["id"])
         if response is not None:
             counter = response["counter"]
 
@@ -672,7 +764,7 @@ class PiCons(BaseController):
 
         Parameters
         ----------
-        pin : str
+        pin : str/GpioHandle
             Pin index.
 
         value : int
@@ -686,19 +778,18 @@ class PiCons(BaseController):
 
         response = None
 
-        if not self.is_valid_gpio_type(pin):
-            raise ValueError("Pin can not be None or empty string.")
-
-        if not self.is_valid_gpio(pin):
-            raise ValueError("Pin does not exists in pin map.")
+        handle = self.compile_gpio(pin)
 
-        if self.is_off_gpio(pin):
+        if handle.off:
             return response
 
-        gpio_map = self.__map[pin]
+        if handle.remote:
+            raise ValueError("Pin does not exists in pin map.")
+
+        gpio_map = handle.local
 
         if gpio_map["dev"] == "ai":
-            response = self._get_analog_in(gpio_map)
+            response = self._get_analog_in(gpio_map["id"])
 
         return response
 
@@ -707,7 +798,7 @@ class PiCons(BaseController):
 
         Parameters
         ----------
-        pin : str
+        pin : str/GpioHandle
             Pin index.
 
         value : int
@@ -721,18 +812,15 @@ class PiCons(BaseController):
 
         response = None
 
-        if not self.is_valid_gpio_type(pin):
-            raise ValueError("Pin can not be None or empty string.")
+        handle = self.compile_gpio(pin)
 
-        if not self.is_valid_gpio(pin):
-            raise ValueError("Pin does not exists in pin map.")
-
-        if self.is_off_gpio(pin):
+        if handle.off:
             return response
 
-        gpio_map = self.__map[pin]
+        if handle.remote:
+            raise ValueError("Pin does not exists in pin map.")
 
-        response = self._reset_input_counter(gpio_map)
+        response = self._reset_input_counter(handle.local["id"])
 
         return response
 
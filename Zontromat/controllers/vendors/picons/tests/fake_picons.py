@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, urlparse
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    """Threaded HTTP server."""
+
+    daemon_threads = True
+
+def x1_entries(inputs=6, relays=4, analogs=8, extra=0):
+    """Entries of PiCons X1 like device.
+
+    Args:
+        inputs (int, optional): Digital inputs. Defaults to 6.
+        relays (int, optional): Relays. Defaults to 4.
+        analogs (int, optional): Analog inputs. Defaults to 8.
+        extra (int, optional): Additional entries, scales and counters. Defaults to 0.
+
+    Returns:
+        list: Entries, as dictionaries.
+    """
+
+    entries = []
+
+    for index in range(relays):
+        entries.append({"ID": len(entries), "Name": "Relay {}".format(index + 1),\
+            "Unit": "LogicLevel", "Value": "0"})
+
+    for index in range(inputs):
+        entries.append({"ID": len(entries), "Name": "Digital In {}".format(index + 1),\
+            "Unit": "LogicLevel", "Value": "0", "counter": "0"})
+
+    # Reserved IDs of the X1 map.
+    while len(entries) < 12:
+        entries.append({"ID": len(entries), "Name": "Reserved", "Unit": "", "Value": "0"})
+
+    for index in range(analogs):
+        entries.append({"ID": len(entries), "Name": "Analog In {}".format(index + 1),\
+            "Unit": "V", "Value": "0.00"})
+
+    for index in range(extra):
+        entries.append({"ID": len(entries), "Name": "Scale {}".format(index + 1),\
+            "Unit": "kg", "Value": "0.000"})
+
+    return entries
+
+class FakePiCons:
+    """Local fake of the PiCons HTTP interface.
+    Serves the XML status document and accepts the RelayN=V writes,
+    one or many in the query."""
+
+#region Constructor
+
+    def __init__(self, entries, port=8090, etag=False):
+        """Constructor
+
+        Args:
+            entries (list): Entries of the status document.
+            port (int, optional): HTTP port. Defaults to 8090.
+            etag (bool, optional): Send ETag and answer If-None-Match with 304. Defaults to False.
+        """
+
+        self.__entries = {}
+        """Entries by ID.
+        """
+
+        for entry in entries:
+            self.__entries[entry["ID"]] = dict(entry)
+
+        self.__etag = etag
+        """ETag support.
+        """
+
+        self.__lock = threading.Lock()
+        """Guards the entries.
+        """
+
+        self.requests_count = 0
+        """Count of all requests.
+        """
+
+        self.not_modified_count = 0
+        """Count of the 304 answers.
+        """
+
+        self.__server = _ThreadingHTTPServer(("127.0.0.1", port), self.__handler())
+        """HTTP server.
+        """
+
+        self.__thread = None
+        """Server thread.
+        """
+
+#endregion
+
+#region Private Methods
+
+    def __handler(self):
+        """Request handler class of the server.
+        """
+
+        picons = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """PiCons requests handler."""
+
+            # Keep-alive.
+            protocol_version = "HTTP/1.1"
+
+            # Headers and body go in separate writes, do not wait for the delayed ACK.
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                picons.requests_count += 1
+
+                query = parse_qs(urlparse(self.path).query)
+                for key in query:
+                    if key.startswith("Relay") and key[5:].isdigit():
+                        picons.change(int(key[5:]) - 1, query[key][0])
+
+                body = picons.document()
+                tag = '"{}"'.format(hashlib.md5(body).hexdigest())
+
+                if picons.etag and self.headers.get("If-None-Match", None) == tag:
+                    picons.not_modified_count += 1
+                    self.send_response(304)
+                    self.send_header("ETag", tag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/xml")
+                self.send_header("Content-Length", str(len(body)))
+                if picons.etag:
+                    self.send_header("ETag", tag)
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+#endregion
+
+#region Properties
+
+    @property
+    def etag(self):
+        """ETag support.
+
+        Returns:
+            bool: ETag support.
+        """
+
+        return self.__etag
+
+#endregion
+
+#region Public Methods
+
+    def start(self):
+        """Start the server.
+        """
+
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """Stop the server.
+        """
+
+        self.__server.shutdown()
+        self.__server.server_close()
+
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def document(self):
+        """Status document.
+
+        Returns:
+            bytes: XML document.
+        """
+
+        lines = ["<?xml version=\"1.0\" encoding=\"utf-8\"?>", "<PiCons>",\
+            "<LastComTime>1601280859</LastComTime>", "<Model>X1-Black</Model>",\
+            "<SerialNumber>25</SerialNumber>", "<ProtocolVersion>1.0</ProtocolVersion>",\
+            "<Device>PiCons</Device>", "<Entries>"]
+
+        with self.__lock:
+            for entry in self.__entries.values():
+                lines.append("<item>")
+                for key, value in entry.items():
+                    lines.append("<{0}>{1}</{0}>".format(key, value))
+                lines.append("</item>")
+
+        lines += ["</Entries>", "</PiCons>"]
+
+        return "".join(lines).encode("utf-8")
+
+    def change(self, idx, value):
+        """Change the value of the entry.
+
+        Args:
+            idx (int): Entry ID.
+            value (str): Value.
+        """
+
+        with self.__lock:
+            if idx in self.__entries:
+                self.__entries[idx]["Value"] = str(value)
+
+#endregion
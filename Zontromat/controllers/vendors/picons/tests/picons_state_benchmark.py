@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import argparse
+import statistics
+import time
+import xml.etree.ElementTree as ET
+
+import requests
+
+from controllers.vendors.picons.x1_black_titanium import X1BlackTitanium
+from controllers.vendors.picons.tests.fake_picons import FakePiCons, x1_entries
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+ARGS = "/?RelayOutputs=all&DigitalInputs=all&CounterInputs=all&AnalogInputs=all&ElectronicScales=all"
+"""Arguments of the status request.
+"""
+
+INPUTS = ["DI0", "DI1", "DI2", "DI3", "DI4", "DI5"]
+"""Digital inputs read in each tick.
+"""
+
+ANALOGS = ["AI0", "AI1", "AI2", "AI3", "AI4", "AI5", "AI6", "AI7"]
+"""Analog inputs read in each tick.
+"""
+
+RELAYS = [0, 1, 2, 3]
+"""Relays written in each tick.
+"""
+
+def legacy_xml_to_dict(content):
+    """Status document to dictionary, as the PiCons class was doing before the index.
+    """
+
+    root = ET.fromstring(content)
+    converted_data = dict()
+
+    for child in root:
+        if child.tag == "Entries":
+            converted_data[child.tag] = list()
+            for entire in child:
+                if entire.tag == "item":
+                    data_item = dict()
+                    for attr in entire:
+                        if attr.tag == "ID":
+                            data_item[attr.tag] = int(attr.text)
+                        else:
+                            data_item[attr.tag] = attr.text
+                    converted_data[child.tag].append(data_item)
+        else:
+            converted_data[child.tag] = child.text
+
+    return converted_data
+
+def legacy_get_item(entries, idx):
+    """Linear scan of the entries.
+    """
+
+    for entre in entries:
+        if entre["ID"] == idx:
+            return entre
+
+    return None
+
+def run_legacy(host, picons, ticks, reads, change):
+    """New connection for each request, full parse and linear scan for each read.
+
+    Returns:
+        list: Tick latency [s].
+    """
+
+    latency = []
+    gpio_map = X1BlackTitanium({"host": host, "timeout": 5}).get_gpio_map()
+
+    for tick in range(ticks):
+        if change:
+            picons.change(4, tick % 2)
+
+        t_start = time.perf_counter()
+
+        response = requests.get(host + ARGS, timeout=5)
+        data = legacy_xml_to_dict(response.text)
+
+        for _ in range(reads):
+            for pin in INPUTS + ANALOGS:
+                legacy_get_item(data["Entries"], gpio_map[pin]["id"])
+
+        for idx in RELAYS:
+            response = requests.get("{}/?Relay{}={}".format(host, idx + 1, tick % 2), timeout=5)
+            legacy_xml_to_dict(response.text)
+
+        latency.append(time.perf_counter() - t_start)
+
+    return latency
+
+def run_controller(controller, picons, ticks, reads, change):
+    """Update, reads and writes through the controller, then flush as the zone does.
+
+    Returns:
+        list: Tick latency [s].
+    """
+
+    latency = []
+
+    for tick in range(ticks):
+        if change:
+            picons.change(4, tick % 2)
+
+        t_start = time.perf_counter()
+
+        controller.update()
+
+        for _ in range(reads):
+            for pin in INPUTS:
+                controller.digital_read(pin)
+            for pin in ANALOGS:
+                controller.analog_read(pin)
+
+        for idx in RELAYS:
+            controller._set_relay(idx, tick % 2)
+
+        controller.flush()
+
+        latency.append(time.perf_counter() - t_start)
+
+    return latency
+
+def report(name, latency, picons, count):
+    """Print the results.
+    """
+
+    latency = sorted(value * 1000 for value in latency)
+    p95 = latency[int(len(latency) * 0.95) - 1]
+
+    print("{:<10} tick mean: {:7.3f} ms; p95: {:7.3f} ms; HTTP requests: {:5d}; 304: {:5d}"\
+        .format(name, statistics.mean(latency), p95, picons.requests_count - count[0],\
+            picons.not_modified_count - count[1]))
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--port", type=int, default=8090, help="Port of the fake PiCons.")
+    parser.add_argument("--ticks", type=int, default=200, help="Zone updates to measure.")
+    parser.add_argument("--reads", type=int, default=4, help="Reads of each input in the tick.")
+    parser.add_argument("--extra", type=int, default=200, help="Additional entries of the document.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    host = "http://127.0.0.1:{}".format(args.port)
+
+    for etag in (False, True):
+        picons = FakePiCons(x1_entries(extra=args.extra), args.port, etag)
+        picons.start()
+        print("ETag: {}; document: {} bytes".format(etag, len(picons.document())))
+
+        for change in (True, False):
+            title = "changed" if change else "same"
+
+            count = (picons.requests_count, picons.not_modified_count)
+            latency = run_legacy(host, picons, args.ticks, args.reads, change)
+            report("Legacy " + title, latency, picons, count)
+
+            controller = X1BlackTitanium({"host": host, "timeout": 5})
+            count = (picons.requests_count, picons.not_modified_count)
+            latency = run_controller(controller, picons, args.ticks, args.reads, change)
+            report("Indexed " + title, latency, picons, count)
+
+        picons.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+from pymodbus.datastore import ModbusSlaveContext, ModbusSequentialDataBlock
+
+from devices.drivers.modbus.device import ModbusDevice
+from devices.drivers.modbus.function_code import FunctionCode
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class SimulatedSlave:
+    """MODBUS slave that serves the parameter maps of the devices from a PyMODBUS data store.
+    The requests are executed the same way as the PyMODBUS server executes them,
+    so the responses and the exception responses are the real ones."""
+
+#region Attributes
+
+    __tables = {
+        FunctionCode.ReadCoil: FunctionCode.ReadCoil,
+        FunctionCode.WriteSingleCoil: FunctionCode.ReadCoil,
+        FunctionCode.WriteMultipleCoils: FunctionCode.ReadCoil,
+        FunctionCode.ReadDiscreteInput: FunctionCode.ReadDiscreteInput,
+        FunctionCode.ReadHoldingRegisters: FunctionCode.ReadHoldingRegisters,
+        FunctionCode.WriteSingleHoldingRegister: FunctionCode.ReadHoldingRegisters,
+        FunctionCode.WriteMultipleHoldingRegisters: FunctionCode.ReadHoldingRegisters,
+        FunctionCode.ReadInputRegisters: FunctionCode.ReadInputRegisters,
+    }
+    """Data table of the parameter by its function code.
+    """
+
+#endregion
+
+#region Constructor
+
+    def __init__(self, unit):
+        """Constructor
+
+        Args:
+            unit (int): Unit ID.
+        """
+
+        self.__unit = unit
+        """Unit ID.
+        """
+
+        self.__parameters = {}
+        """Parameters by name.
+        """
+
+        self.__sizes = {table: 1 for table in set(self.__tables.values())}
+        """Size of the data tables.
+        """
+
+        self.__blocks = {}
+        """Data blocks by the read function code of the table.
+        """
+
+        self.__context = None
+        """PyMODBUS data store.
+        """
+
+        self.__build()
+
+#endregion
+
+#region Properties
+
+    @property
+    def unit(self):
+        """Unit ID.
+
+        Returns:
+            int: Unit ID.
+        """
+
+        return self.__unit
+
+    @property
+    def parameters(self):
+        """Parameters names.
+
+        Returns:
+            list: Parameters names.
+        """
+
+        return list(self.__parameters)
+
+#endregion
+
+#region Private Methods
+
+    def __build(self):
+        """Create the data store with the sizes of the tables. The old values are kept.
+        """
+
+        blocks = {}
+        for table, size in self.__sizes.items():
+            values = [0] * size
+            if table in self.__blocks:
+                old = self.__blocks[table].values
+                values[:len(old)] = old
+            self.__blocks[table] = ModbusSequentialDataBlock(0, values)
+            blocks[self.__store_key(table)] = self.__blocks[table]
+
+        # Address 0 is the first item, as the devices maps are written.
+        self.__context = ModbusSlaveContext(zero_mode=True, **blocks)
+
+    @staticmethod
+    def __store_key(table):
+        """Key of the data table in the PyMODBUS data store.
+
+        Args:
+            table (FunctionCode): Read function code of the table.
+
+        Returns:
+            str: Key of the table.
+        """
+
+        keys = {
+            FunctionCode.ReadCoil: "co",
+            FunctionCode.ReadDiscreteInput: "di",
+            FunctionCode.ReadHoldingRegisters: "hr",
+            FunctionCode.ReadInputRegisters: "ir",
+        }
+
+        return keys[table]
+
+    def __parameter(self, name):
+        """Get the parameter and its table.
+
+        Args:
+            name (str): Parameter name.
+
+        Raises:
+            ValueError: Unknown parameter.
+
+        Returns:
+            tuple: Parameter and read function code of its table.
+        """
+
+        if name not in self.__parameters:
+            raise ValueError("Unknown parameter {} of unit {}.".format(name, self.__unit))
+
+        parameter = self.__parameters[name]
+
+        return parameter, self.__tables[parameter.function_code]
+
+#endregion
+
+#region Public Methods
+
+    def attach(self, device):
+        """Serve the parameter map of the device.
+        Devices with the same unit ID share the slave.
+
+        Args:
+            device (ModbusDevice): MODBUS device.
+        """
+
+        for parameter in device.parameters:
+            if parameter.function_code not in self.__tables:
+                continue
+
+            addresses = parameter.addresses
+            if not isinstance(addresses, list) or not addresses:
+                continue
+
+            table = self.__tables[parameter.function_code]
+            self.__sizes[table] = max(self.__sizes[table], max(addresses) + 1)
+            self.__parameters[parameter.parameter_name] = parameter
+
+        self.__build()
+
+    def set_value(self, name, value):
+        """Set the value of the parameter.
+
+        Args:
+            name (str): Parameter name.
+            value (mixed): Parameter value.
+        """
+
+        parameter, table = self.__parameter(name)
+
+        if table in (FunctionCode.ReadCoil, FunctionCode.ReadDiscreteInput):
+            self.__context.setValues(table.value, parameter.addresses[0], [bool(value)])
+            return
+
+        registers = ModbusDevice.converts_from_parameter(\
+            parameter.data_type, parameter.addresses, value)
+        for address, data in registers.items():
+            self.__context.setValues(table.value, address, [data])
+
+    def get_value(self, name):
+        """Get the value of the parameter, as the devices convert it.
+
+        Args:
+            name (str): Parameter name.
+
+        Returns:
+            mixed: Parameter value.
+        """
+
+        parameter, table = self.__parameter(name)
+
+        if table in (FunctionCode.ReadCoil, FunctionCode.ReadDiscreteInput):
+            return self.__context.getValues(table.value, parameter.addresses[0], 1)[0]
+
+        registers = {}
+        for address in parameter.addresses:
+            registers[address] = self.__context.getValues(table.value, address, 1)[0]
+
+        return ModbusDevice.converts_to_parameter(parameter.data_type,\
+            parameter.addresses, registers)
+
+    def execute(self, request):
+        """Execute the request on the data store.
+
+        Args:
+            request (ModbusRequest): PyMODBUS request instance.
+
+        Returns:
+            ModbusResponse: PyMODBUS response instance.
+        """
+
+        return request.execute(self.__context)
+
+#endregion
@@ -0,0 +1,877 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import random
+import threading
+import time
+
+from pymodbus.exceptions import ModbusIOException
+from pymodbus.pdu import ExceptionResponse, ModbusExceptions
+
+from services.global_error_handler.global_error_handler import GlobalErrorHandler
+
+from utils.logger import get_logger
+
+from controllers.base_controller import BaseController
+from controllers.vendors.simulation.simulated_slave import SimulatedSlave
+from controllers.vendors.simulation.thermal_model import ThermalModel
+
+from devices.drivers.modbus.function_code import FunctionCode
+from devices.drivers.modbus.requests.read_device_coils import ReadDeviceCoils
+from devices.drivers.modbus.requests.read_device_discrete_inputs import ReadDeviceDiscreteInputs
+from devices.drivers.modbus.requests.read_device_holding_registers import ReadDeviceHoldingRegisters
+from devices.drivers.modbus.requests.read_device_input_registers import ReadDeviceInputRegisters
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+__class_name__ = "Simulation"
+"""Controller target class.
+"""
+
+#endregion
+
+class Simulation(BaseController):
+    """Simulated building controller. The outputs drive the thermal model of the zone,
+    the inputs and the MODBUS slaves are fed by it. Each I/O type and each UART
+    has its latency and the MODBUS transactions occupy the simulated bus
+    for the time of the frames at the baud rate of the UART.
+
+    Configuration, in addition to the MODBUS-RTU keys of the other controllers:
+        sim_latency_digital, sim_latency_analog, sim_latency_counter, sim_latency_1w:
+            Latency of the I/O type [s].
+        sim_turnaround_<uart>: Turnaround time of the slaves on the UART [s].
+        sim_fault_mb_error: Probability of exception response.
+        sim_fault_mb_timeout: Probability of missing response.
+        sim_fault_gpio: Probability of wrong digital input.
+        sim_speed: Simulated seconds per second.
+        sim_seed: Seed of the fault injection.
+        sim_model_<key>: Thermal model parameters.
+    """
+
+#region Attributes
+
+    __uarts_count = 2
+    """Simulated UARTs count.
+    """
+
+    __map = \
+    {\
+        "identification": {"vendor": "simulation", "model": "simulation"},\
+
+        # LEDs
+        "LED0": 0, "LED1": 1, "LED2": 2, "LED3": 3,
+
+        # Digital Inputs
+        "DI0": 0, "DI1": 1, "DI2": 2, "DI3": 3,
+        "DI4": 4, "DI5": 5, "DI6": 6, "DI7": 7,
+        "DI8": 8, "DI9": 9,
+
+        # Digital Outputs
+        "DO0": 0, "DO1": 1, "DO2": 2, "DO3": 3,
+        "DO4": 4, "DO5": 5, "DO6": 6, "DO7": 7,
+        "DO8": 8, "DO9": 9, "DO10": 10, "DO11": 11,
+
+        # Relay Outputs
+        "RO0": 0, "RO1": 1, "RO2": 2, "RO3": 3,
+        "RO4": 4, "RO5": 5, "RO6": 6, "RO7": 7,
+        "RO8": 8, "RO9": 9, "RO10": 10, "RO11": 11,
+
+        # Analog Inputs
+        "AI0": 0, "AI1": 1, "AI2": 2, "AI3": 3,
+        "AI4": 4, "AI5": 5, "AI6": 6, "AI7": 7,
+
+        # Analog Outputs
+        "AO0": 0, "AO1": 1, "AO2": 2, "AO3": 3,
+    }
+    """GPIO map, the same terminals as the ZL101PCC.
+    """
+
+    __roles = ["heating", "cooling", "ventilation", "lighting", "occupancy"]
+    """Roles of the pins in the thermal model.
+    """
+
+    __analog_limits = [0.0, 10.0]
+    """Analog I/O volts.
+    """
+
+    __signals = {
+        # Thermometers, luxmeters.
+        "Temperature": lambda model: model.temperature * 10,
+        "Humidity": lambda model: model.humidity,
+        "Lux": lambda model: model.lux,
+
+        # Motion sensors.
+        "MotionDetected": lambda model: 1 if model.occupied else 0,
+
+        # Energy meters.
+        "Voltage": lambda model: 230.0,
+        "Current": lambda model: model.power / 230.0,
+        "ActivePower": lambda model: model.power,
+        "ApparentPower": lambda model: model.power,
+        "PowerFactor": lambda model: 1.0,
+        "Frequency": lambda model: 50.0,
+        "ImportActiveEnergy": lambda model: model.energy,
+        "TotalActiveEnergy": lambda model: model.energy,
+        "TotalSystemPowerDemand": lambda model: model.power,
+        "ImportSystemPowerDemand": lambda model: model.power,
+
+        # Heat pumps.
+        "OperatingStatus": lambda model: 1 if model.heating > 0 else 0,
+        "GetAmbientTemperature": lambda model: model.outside * 10,
+        "GetSystemEvaporationReturnWaterTemperature": lambda model: 120,
+        "GetSystemEvaporationWaterTemperature": lambda model: 70,
+        "GetSystemCondensateReturnWaterTemperature": lambda model: 400,
+        "GetSystemCondensateWaterTemperature": lambda model: 450,
+        "GetHotWaterTemperature": lambda model: 450,
+    }
+    """Parameters of the slaves that follow the thermal model, by parameter name.
+    """
+
+#endregion
+
+#region Properties
+
+    @property
+    def vendor(self):
+        """Get device vendor.
+
+        Returns:
+            str: Vendor
+        """
+
+        return "Simulation"
+
+    @property
+    def model(self):
+        """Get device model.
+
+        Returns:
+            str: Model
+        """
+
+        return "Simulation"
+
+    @property
+    def serial_number(self):
+        """Get device serial number.
+
+        Returns:
+            str: Serial number.
+        """
+
+        return str(self._config.get("serial_number", "0"))
+
+    @property
+    def version(self):
+        """Get device version.
+
+        Returns:
+            str: Version
+        """
+
+        return "1.0.0"
+
+    @property
+    def thermal_model(self):
+        """Thermal model of the zone.
+
+        Returns:
+            ThermalModel: Thermal model.
+        """
+
+        return self.__model
+
+#endregion
+
+#region Constructor
+
+    def __init__(self, config):
+        """Constructor
+        """
+
+        super().__init__(config)
+
+        self._gpio_map = self.__map
+
+        self.__logger = get_logger(__name__)
+        """Logger
+        """
+
+        self.__random = random.Random(int(config.get("sim_seed", 0)))
+        """Source of the injected faults.
+        """
+
+        self.__latency = {
+            "digital": float(config.get("sim_latency_digital", 0.0005)),
+            "analog": float(config.get("sim_latency_analog", 0.0005)),
+            "counter": float(config.get("sim_latency_counter", 0.0005)),
+            "1w": float(config.get("sim_latency_1w", 0.01)),
+        }
+        """Latency of the I/O types [s].
+        """
+
+        self.__faults = {
+            "mb_error": float(config.get("sim_fault_mb_error", 0.0)),
+            "mb_timeout": float(config.get("sim_fault_mb_timeout", 0.0)),
+            "gpio": float(config.get("sim_fault_gpio", 0.0)),
+        }
+        """Probabilities of the injected faults.
+        """
+
+        self.__speed = float(config.get("sim_speed", 60.0))
+        """Simulated seconds per second.
+        """
+
+        self.__uarts = {}
+        """Simulated buses by UART index.
+        """
+
+        for index in range(self.__uarts_count):
+            baudrate = int(config.get("modbus_rtu_baud_{}".format(index), 9600))
+            self.__uarts[index] = {
+                "lock": threading.Lock(),
+                # Start, 8 data, parity and stop bit.
+                "char_time": 11.0 / baudrate,
+                "turnaround": float(config.get("sim_turnaround_{}".format(index), 0.005)),
+                "timeout": float(config.get("modbus_rtu_timeout_{}".format(index), 0.6)),
+                "busy": 0.0,
+                "transactions": 0,
+                "errors": 0,
+                "timeouts": 0,
+            }
+
+        self.__slaves = {}
+        """Simulated slaves by (UART, unit).
+        """
+
+        self.__dead = set()
+        """Slaves that do not respond, by (UART, unit).
+        """
+
+        self.__pins = {}
+        """State of the pins by terminal name.
+        """
+
+        self.__bindings = {}
+        """Terminal names of the pins by role.
+        """
+
+        for role in self.__roles:
+            self.__bindings[role] = []
+
+        model_config = {}
+        for key in config:
+            if key.startswith("sim_model_"):
+                model_config[key[len("sim_model_"):]] = config[key]
+
+        if "start" not in model_config:
+            model_config["start"] = time.time()
+
+        self.__model = ThermalModel(**model_config)
+        """Thermal model of the zone.
+        """
+
+        self.__last_update = time.monotonic()
+        """Last update of the thermal model.
+        """
+
+        self.__started = self.__last_update
+        """Start of the statistics.
+        """
+
+#endregion
+
+#region Private Methods
+
+    def __handle(self, pin):
+        """Compile the pin.
+
+        Args:
+            pin (str, GpioHandle): Pin.
+
+        Returns:
+            GpioHandle: The handle or None for the off and the not existing pins.
+        """
+
+        try:
+            handle = self.compile_gpio(pin)
+
+        except ValueError:
+            GlobalErrorHandler.log_hardware_malfunction(self.__logger,\
+                "GPIO: {} @ {} Pin does not exists in pin map.".format(pin, self))
+            return None
+
+        if handle.off:
+            return None
+
+        return handle
+
+    def __io(self, handle, kind):
+        """Spend the time of the I/O operation.
+        Remote pins are one transaction on their UART.
+
+        Args:
+            handle (GpioHandle): Pin.
+            kind (str): I/O type.
+        """
+
+        if handle.remote and handle.uart in self.__uarts:
+            # Single bit or register request and response.
+            self.__hold_bus(handle.uart, 16)
+        else:
+            time.sleep(self.__latency[kind])
+
+    def __hold_bus(self, uart, frames_size, extra=0.0, action=None):
+        """Occupy the simulated bus for the transaction.
+
+        Args:
+            uart (int): UART index.
+            frames_size (int): Bytes of the request and the response.
+            extra (float, optional): Additional time [s]. Defaults to 0.0.
+            action (callable, optional): Executed while the bus is occupied. Defaults to None.
+
+        Returns:
+            mixed: Result of the action.
+        """
+
+        bus = self.__uarts[uart]
+        duration = bus["turnaround"] + frames_size * bus["char_time"] + extra
+        result = None
+
+        with bus["lock"]:
+            time.sleep(duration)
+            if action is not None:
+                result = action()
+            bus["busy"] += duration
+            bus["transactions"] += 1
+
+        return result
+
+    @staticmethod
+    def __frames_size(request):
+        """Size of the RTU frames of the request and its response.
+
+        Args:
+            request (ModbusRequest): PyMODBUS request instance.
+
+        Returns:
+            tuple: Bytes of the request and of the response.
+        """
+
+        function_code = request.function_code
+        count = getattr(request, "count", 1)
+        if not isinstance(count, int):
+            count = 1
+
+        values = getattr(request, "values", None)
+        if isinstance(values, list):
+            count = len(values)
+
+        if function_code in (FunctionCode.ReadCoil.value, FunctionCode.ReadDiscreteInput.value):
+            return 8, 5 + (count + 7) // 8
+
+        if function_code in (FunctionCode.ReadHoldingRegisters.value,\
+            FunctionCode.ReadInputRegisters.value):
+            return 8, 5 + 2 * count
+
+        if function_code == FunctionCode.WriteMultipleCoils.value:
+            return 9 + (count + 7) // 8, 8
+
+        if function_code == FunctionCode.WriteMultipleHoldingRegisters.value:
+            return 9 + 2 * count, 8
+
+        return 8, 8
+
+    def __update_model(self):
+        """Step the thermal model with the outputs and feed the slaves with it.
+        """
+
+        now = time.monotonic()
+        step = (now - self.__last_update) * self.__speed
+        self.__last_update = now
+
+        for role in ["heating", "cooling", "ventilation", "lighting"]:
+            pins = self.__bindings[role]
+            if not pins:
+                continue
+
+            total = 0.0
+            for name in pins:
+                total += self.__level(self.__pins.get(name, 0))
+
+            setattr(self.__model, role, total / len(pins))
+
+        self.__model.update(step)
+
+        for slave in self.__slaves.values():
+            for name in slave.parameters:
+                if name in self.__signals:
+                    slave.set_value(name, self.__signals[name](self.__model))
+
+    def __level(self, value):
+        """Level of the output.
+
+        Args:
+            value (mixed): Digital state or analog volts.
+
+        Returns:
+            float: Level [0 - 1].
+        """
+
+        if isinstance(value, bool):
+            return float(value)
+
+        level = float(value) / self.__analog_limits[1]
+
+        return min(max(level, 0.0), 1.0)
+
+#endregion
+
+#region Public Methods
+
+    def bind(self, role, pins):
+        """Bind the pins to the thermal model.
+        The outputs of heating, cooling, ventilation and lighting set the respective level
+        of the model. The occupancy inputs follow the people in the zone.
+
+        Args:
+            role (str): Role of the pins.
+            pins (str, list): Pin or pins.
+
+        Raises:
+            ValueError: Unknown role.
+        """
+
+        if role not in self.__roles:
+            raise ValueError("Unknown role {}.".format(role))
+
+        if not isinstance(pins, list):
+            pins = [pins]
+
+        for pin in pins:
+            if self.is_gpio_nothing(pin) or self.is_gpio_off(pin):
+                continue
+
+            handle = self.__handle(pin)
+            if handle is not None and handle.name not in self.__bindings[role]:
+                self.__bindings[role].append(handle.name)
+
+    def add_slave(self, device):
+        """Simulate the slave of the MODBUS device.
+
+        Args:
+            device (ModbusDevice): MODBUS device.
+
+        Returns:
+            SimulatedSlave: Simulated slave.
+        """
+
+        key = (device.uart, device.unit)
+        if key not in self.__slaves:
+            self.__slaves[key] = SimulatedSlave(device.unit)
+
+        self.__slaves[key].attach(device)
+
+        # Start with the current state of the model.
+        for name in self.__slaves[key].parameters:
+            if name in self.__signals:
+                self.__slaves[key].set_value(name, self.__signals[name](self.__model))
+
+        return self.__slaves[key]
+
+    def set_slave_fault(self, uart, unit, state=True):
+        """Stop or start the responses of the slave.
+
+        Args:
+            uart (int): UART index.
+            unit (int): Unit ID.
+            state (bool, optional): The slave does not respond. Defaults to True.
+        """
+
+        if state:
+            self.__dead.add((uart, unit))
+        else:
+            self.__dead.discard((uart, unit))
+
+    def set_input(self, pin, value):
+        """Set the state of the input pin.
+
+        Args:
+            pin (str): Pin.
+            value (mixed): Digital state or analog volts.
+        """
+
+        handle = self.__handle(pin)
+        if handle is not None:
+            self.__pins[handle.name] = value
+
+    def get_output(self, pin):
+        """Get the state of the output pin.
+
+        Args:
+            pin (str): Pin.
+
+        Returns:
+            mixed: Digital state or analog volts.
+        """
+
+        handle = self.__handle(pin)
+        if handle is None:
+            return None
+
+        return self.__pins.get(handle.name, None)
+
+    def statistics(self):
+        """Statistics of the simulated buses since the start.
+
+        Returns:
+            dict: Transactions, errors, timeouts and utilization by UART index.
+        """
+
+        elapsed = max(time.monotonic() - self.__started, 1e-9)
+
+        statistics = {}
+        for index, bus in self.__uarts.items():
+            statistics[index] = {
+                "transactions": bus["transactions"],
+                "errors": bus["errors"],
+                "timeouts": bus["timeouts"],
+                "utilization": bus["busy"] / elapsed,
+            }
+
+        return statistics
+
+#endregion
+
+#region Base Controller Implementation
+
+    def update(self):
+        """Update controller state."""
+
+        self.__update_model()
+
+        return True
+
+    def digital_read(self, pin):
+        """Read the digital input pin.
+
+        Args:
+            pin (str, GpioHandle, list): Pin or pins.
+
+        Returns:
+            bool: State of the pin.
+        """
+
+        if isinstance(pin, list):
+            response = []
+            for item in pin:
+                if self.is_gpio_off(item):
+                    break
+                response.append(self.digital_read(item))
+
+            return response
+
+        handle = self.__handle(pin)
+        if handle is None:
+            return False
+
+        self.__io(handle, "digital")
+
+        if handle.name in self.__bindings["occupancy"]:
+            # Motion of the people, not each read sees it.
+            state = self.__model.occupied and self.__random.random() < 0.7
+        else:
+            state = bool(self.__pins.get(handle.name, False))
+
+        if self.__random.random() < self.__faults["gpio"]:
+            state = not state
+
+        return handle.polarity(state)
+
+    def digital_write(self, pin, value):
+        """Write the digital output pin.
+
+        Args:
+            pin (str, GpioHandle, list): Pin or pins.
+            value (mixed): Value for the output pin.
+
+        Returns:
+            bool: State of the pin.
+        """
+
+        if isinstance(pin, list):
+            response = False
+            for item in pin:
+                if self.is_gpio_off(item):
+                    break
+                response = self.digital_write(item, value)
+
+            return response
+
+        handle = self.__handle(pin)
+        if handle is None:
+            return False
+
+        self.__io(handle, "digital")
+
+        state = handle.polarity(value)
+        self.__pins[handle.name] = state
+
+        return state
+
+    def analog_read(self, pin):
+        """Read the analog input pin.
+
+        Args:
+            pin (str, GpioHandle): Pin.
+
+        Returns:
+            float: Volts of the pin.
+        """
+
+        handle = self.__handle(pin)
+        if handle is None:
+            return 0
+
+        self.__io(handle, "analog")
+
+        return self.__pins.get(handle.name, 0)
+
+    def analog_write(self, pin, value):
+        """Write the analog output pin.
+
+        Args:
+            pin (str, GpioHandle): Pin.
+            value (float): Volts of the pin.
+
+        Returns:
+            bool: Success.
+        """
+
+        handle = self.__handle(pin)
+        if handle is None:
+            return False
+
+        self.__io(handle, "analog")
+
+        self.__pins[handle.name] = float(value)
+
+        return True
+
+    def read_counter(self, pin):
+        """Read the digital counter input.
+
+        Args:
+            pin (str, GpioHandle): Pin.
+
+        Returns:
+            int: Value of the counter.
+        """
+
+        handle = self.__handle(pin)
+        if handle is None:
+            return 0
+
+        self.__io(handle, "counter")
+
+        return int(self.__pins.get(handle.name, 0))
+
+    def write_counter(self, pin, value):
+        """Write the digital counter value.
+
+        Args:
+            pin (str, GpioHandle): Pin.
+            value (int): Value for the counter.
+
+        Returns:
+            int: Value of the counter.
+        """
+
+        handle = self.__handle(pin)
+        if handle is None:
+            return 0
+
+        self.__io(handle, "counter")
+
+        self.__pins[handle.name] = int(value)
+
+        return int(value)
+
+    def set_led(self, pin, value):
+        """Write the LED.
+
+        Args:
+            pin (str): Pin.
+            value (int): Value for the LED.
+
+        Returns:
+            int: Value of the LED.
+        """
+
+        handle = self.__handle(pin)
+        if handle is not None:
+            self.__pins[handle.name] = value
+
+        return value
+
+    def read_temperature(self, dev, circuit):
+        """Read the thermometer.
+
+        Args:
+            dev (str): Dev ID.
+            circuit (str): Circuit ID.
+
+        Returns:
+            float: Temperature of the zone.
+        """
+
+        time.sleep(self.__latency["1w"])
+
+        return round(self.__model.temperature, 2)
+
+    def read_light(self, dev, circuit):
+        """Read the light sensor.
+
+        Args:
+            dev (str): Dev ID.
+            circuit (str): Circuit ID.
+
+        Returns:
+            float: Illumination of the zone.
+        """
+
+        time.sleep(self.__latency["1w"])
+
+        return round(self.__model.lux, 2)
+
+    def read_mb_registers(self, uart, dev_id, registers, function_code=None):
+        """Read MODBUS registers with one request.
+
+        Args:
+            uart (int): UART index.
+            dev_id (int): MODBUS ID.
+            registers (list): Registers IDs.
+            function_code (FunctionCode, optional): Registers type. Defaults to input registers.
+
+        Returns:
+            dict: Values by register ID.
+        """
+
+        values = {}
+
+        if not registers:
+            return values
+
+        requests = {
+            FunctionCode.ReadCoil: ReadDeviceCoils,
+            FunctionCode.ReadDiscreteInput: ReadDeviceDiscreteInputs,
+            FunctionCode.ReadHoldingRegisters: ReadDeviceHoldingRegisters,
+            FunctionCode.ReadInputRegisters: ReadDeviceInputRegisters,
+        }
+
+        if function_code not in requests:
+            function_code = FunctionCode.ReadInputRegisters
+
+        address = min(registers)
+        count = max(registers) - address + 1
+        response = self.execute_mb_request(requests[function_code](dev_id, address, count), uart)
+        if response is None or response.isError():
+            return values
+
+        data = getattr(response, "registers", None)
+        if data is None:
+            data = response.bits
+
+        for register in registers:
+            values[register] = data[register - address]
+
+        return values
+
+    def execute_mb_request(self, request, uart, priority=None, timeout=None):
+        """Execute modbus request on the simulated bus.
+
+        Args:
+            request (ModbusRequest): PyMODBUS request instance.
+            uart (int): UART index.
+            priority (Priority, optional): Not used, the simulated bus has no queue.
+            timeout (float, optional): Not used, the simulated bus has no queue.
+
+        Returns:
+            ModbusResponse: PyMODBUS response instance or None when the UART is missing.
+        """
+
+        if not uart in self.__uarts:
+            GlobalErrorHandler.log_missing_resource(self.__logger, "Missing MODBUS-RTU UART{} interface".format(uart))
+            return None
+
+        bus = self.__uarts[uart]
+
+        # PyMODBUS 2.x uses unit_id, 3.x uses slave_id.
+        unit = getattr(request, "slave_id", getattr(request, "unit_id", None))
+        slave = self.__slaves.get((uart, unit), None)
+        request_size, response_size = self.__frames_size(request)
+        draw = self.__random.random()
+
+        # No response, the master waits for the timeout.
+        if slave is None or (uart, unit) in self.__dead or draw < self.__faults["mb_timeout"]:
+            self.__hold_bus(uart, request_size, bus["timeout"])
+            bus["timeouts"] += 1
+            return ModbusIOException("No response from unit {}.".format(unit), request.function_code)
+
+        if draw < self.__faults["mb_timeout"] + self.__faults["mb_error"]:
+            self.__hold_bus(uart, request_size + 5)
+            bus["errors"] += 1
+            return ExceptionResponse(request.function_code, ModbusExceptions.SlaveFailure)
+
+        return self.__hold_bus(uart, request_size + response_size,\
+            action=lambda: slave.execute(request))
+
+#endregion
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import argparse
+import os
+import threading
+import time
+
+from controllers.controller_factory import ControllerFactory
+
+from data.registers import Registers
+
+from devices.drivers.modbus.device import ModbusDevice
+from devices.factories.heat_pumps.heat_pump_factory import HeatPumpFactory
+from devices.factories.luxmeters.luxmeters_factory import LuxmeterFactory
+from devices.factories.pir.pir_factory import PIRFactory
+from devices.factories.power_analyzers.power_analyser_factory import PowerAnalyzerFactory
+from devices.factories.thermometers.thermometers_factory import ThermometersFactory
+
+from plugins.plugins_manager import PluginsManager
+
+from services.global_error_handler.global_error_handler import GlobalErrorHandler
+
+from utils.performance_profiler import Histogram
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+SLAVES = {
+    "monitoring.pa.settings": PowerAnalyzerFactory,
+    "hvac.air_temp_cent_1.settings": ThermometersFactory,
+    "hvac.air_temp_lower_1.settings": ThermometersFactory,
+    "hvac.air_temp_upper_1.settings": ThermometersFactory,
+    "light.sensor.settings": LuxmeterFactory,
+    "echp.hp.settings": HeatPumpFactory,
+    "envm.pir.settings": PIRFactory,
+}
+"""Devices settings registers of the simulated slaves and their factories.
+"""
+
+class SimulatedZone:
+    """Registers, simulated controller and plugins of one zone.
+    """
+
+    def __init__(self, index, plugins, args):
+        """Constructor
+
+        Args:
+            index (int): Index of the zone.
+            plugins (list): Names of the enabled plugins.
+            args (Namespace): Arguments of the benchmark.
+        """
+
+        cwf = os.path.dirname(os.path.abspath(__file__))
+        registers_file = os.path.join(cwf, "..", "..", "..", "..", "..", "registers.json")
+
+        self.registers = Registers.from_snapshot(os.path.normpath(registers_file))
+
+        for name in plugins:
+            register = self.registers.by_name("{}.enabled".format(name))
+            if register is not None:
+                register.value = True
+
+        config = {
+            "vendor": "simulation",
+            "model": "simulation",
+            "serial_number": str(index),
+            "sim_seed": index,
+            "sim_speed": args.speed,
+            "sim_turnaround_0": args.turnaround,
+            "sim_turnaround_1": args.turnaround,
+            "modbus_rtu_baud_0": args.baudrate,
+            "modbus_rtu_baud_1": args.baudrate,
+            "sim_fault_mb_error": args.mb_error,
+            "sim_fault_mb_timeout": args.mb_timeout,
+            "sim_fault_gpio": args.gpio_error,
+        }
+        self.controller = ControllerFactory.create(config)
+
+        self.__bind()
+        self.__add_slaves()
+
+        self.plugins = PluginsManager(self.registers, self.controller)
+        self.plugins.profiler = None
+
+        self.latency = Histogram()
+        """Tick latency [ns].
+        """
+
+    def __settings(self, suffix, key):
+        """Pins from the options of the devices settings registers.
+        """
+
+        pins = []
+        for register in self.registers:
+            if not register.name.endswith(suffix) or not isinstance(register.value, dict):
+                continue
+
+            options = register.value.get("options", {})
+            for option in options:
+                if not option.startswith(key):
+                    continue
+
+                if isinstance(options[option], list):
+                    pins.extend(options[option])
+                else:
+                    pins.append(options[option])
+
+        return pins
+
+    def __bind(self):
+        """Bind the outputs and the inputs of the plugins to the thermal model.
+        """
+
+        self.controller.bind("heating", self.__settings(".valve.settings", "output"))
+        self.controller.bind("heating", self.__settings(".convector_1.settings", "stage"))
+        self.controller.bind("heating", self.__settings(".convector_2.settings", "stage"))
+        self.controller.bind("heating", self.__settings(".convector_3.settings", "stage"))
+        self.controller.bind("ventilation", self.__settings(".fan.settings", "output"))
+
+        for register in self.registers:
+            if register.name.startswith("light.") and register.name.endswith(".output"):
+                self.controller.bind("lighting", register.value)
+
+            if register.name.startswith("ac.pir_") and register.name.endswith(".input"):
+                self.controller.bind("occupancy", register.value)
+
+    def __add_slaves(self):
+        """Simulate the MODBUS slaves of the devices.
+        """
+
+        for name, factory in SLAVES.items():
+            register = self.registers.by_name(name)
+            if register is None or not isinstance(register.value, dict) or not register.value:
+                continue
+
+            # One device or devices by name.
+            settings = {name: register.value}
+            if "vendor" not in register.value:
+                settings = register.value
+
+            for device_name, device_settings in settings.items():
+                try:
+                    device = factory.create(
+                        name=device_name,
+                        controller=self.controller,
+                        vendor=device_settings["vendor"],
+                        model=device_settings["model"],
+                        options=device_settings["options"])
+
+                except (KeyError, TypeError, ValueError, NotImplementedError):
+                    continue
+
+                if isinstance(device, ModbusDevice):
+                    self.controller.add_slave(device)
+
+    def tick(self):
+        """One update of the zone, as the zone runtime does it.
+        """
+
+        t_start = time.perf_counter_ns()
+
+        if self.controller.update():
+            self.plugins.update()
+            self.controller.flush()
+
+        self.latency.record(time.perf_counter_ns() - t_start)
+
+    def shutdown(self):
+        """Shutdown the plugins.
+        """
+
+        self.plugins.shutdown()
+
+def run(zone, period, duration, start):
+    """Tick the zone with the update period.
+    """
+
+    deadline = start
+    while time.monotonic() < start + duration:
+        zone.tick()
+        GlobalErrorHandler.update()
+
+        deadline += period
+        delay = deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--zones", type=int, default=4, help="Simulated zones.")
+    parser.add_argument("--plugins", type=str, default="sys,monitoring,envm,hvac,light,vent,ac",\
+        help="Enabled plugins, comma separated.")
+    parser.add_argument("--duration", type=float, default=20.0, help="Measurement time [s].")
+    parser.add_argument("--period", type=float, default=0.5, help="Update period of the zones [s].")
+    parser.add_argument("--speed", type=float, default=60.0, help="Simulated seconds per second.")
+    parser.add_argument("--baudrate", type=int, default=9600, help="Baud rate of the UARTs.")
+    parser.add_argument("--turnaround", type=float, default=0.005, help="Turnaround time of the slaves [s].")
+    parser.add_argument("--mb-error", type=float, default=0.0, help="Probability of MODBUS exception response.")
+    parser.add_argument("--mb-timeout", type=float, default=0.0, help="Probability of missing MODBUS response.")
+    parser.add_argument("--gpio-error", type=float, default=0.0, help="Probability of wrong digital input.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    plugins = [name.strip() for name in args.plugins.split(",") if name.strip()]
+
+    t_start = time.perf_counter()
+    zones = [SimulatedZone(index, plugins, args) for index in range(args.zones)]
+    print("Created {} zones in {:.2f} s".format(len(zones), time.perf_counter() - t_start))
+
+    start = time.monotonic()
+    threads = [threading.Thread(target=run, args=(zone, args.period, args.duration, start))\
+        for zone in zones]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    for zone in zones:
+        zone.shutdown()
+
+    latency = Histogram()
+    for index, zone in enumerate(zones):
+        statistics = zone.controller.statistics()
+        print("Zone {:2d} ticks: {:5d}; p50: {:8.2f} ms; p95: {:8.2f} ms; p99: {:8.2f} ms; max: {:8.2f} ms; {}"\
+            .format(index, zone.latency.count,\
+                zone.latency.percentile(50) / 1e6, zone.latency.percentile(95) / 1e6,\
+                zone.latency.percentile(99) / 1e6, zone.latency.max / 1e6,\
+                "; ".join("UART{} {:5.1f}% {} tr. {} err. {} t/o".format(uart,\
+                    bus["utilization"] * 100, bus["transactions"], bus["errors"], bus["timeouts"])\
+                    for uart, bus in statistics.items())))
+
+    print("Errors by code: {}".format(GlobalErrorHandler.get_counters()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import math
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class ThermalModel:
+    """Lumped thermal model of one zone.
+    The zone is one heat capacity, that loses heat trough the envelope and the ventilation
+    and gains heat from the heating, the lights and the people. The occupancy follows
+    the working hours of the simulated clock."""
+
+#region Attributes
+
+#endregion
+
+#region Constructor
+
+    def __init__(self, **config):
+        """Constructor
+
+        Args:
+            temperature (float): Start air temperature [ºC]. Defaults to 20.0.
+            outside (float): Mean outside temperature [ºC]. Defaults to 5.0.
+            capacity (float): Heat capacity of the zone [J/K]. Defaults to 2e6.
+            envelope (float): Heat loss coefficient of the envelope [W/K]. Defaults to 100.0.
+            ventilation (float): Heat loss coefficient of the ventilation at full speed [W/K].
+                Defaults to 150.0.
+            heating_power (float): Heating power at full output [W]. Defaults to 3000.0.
+            cooling_power (float): Cooling power at full output [W]. Defaults to 3000.0.
+            lighting_power (float): Lighting power at full output [W]. Defaults to 200.0.
+            fan_power (float): Fans power at full speed [W]. Defaults to 100.0.
+            base_power (float): Power of the other consumers [W]. Defaults to 150.0.
+            people (int): People in the zone in the working hours. Defaults to 4.
+            start (float): Start of the simulated clock [s], time stamp. Defaults to now.
+        """
+
+        self.__capacity = float(config.get("capacity", 2e6))
+        """Heat capacity of the zone [J/K].
+        """
+
+        self.__envelope = float(config.get("envelope", 100.0))
+        """Heat loss coefficient of the envelope [W/K].
+        """
+
+        self.__ventilation_loss = float(config.get("ventilation", 150.0))
+        """Heat loss coefficient of the ventilation at full speed [W/K].
+        """
+
+        self.__heating_power = float(config.get("heating_power", 3000.0))
+        """Heating power at full output [W].
+        """
+
+        self.__cooling_power = float(config.get("cooling_power", 3000.0))
+        """Cooling power at full output [W].
+        """
+
+        self.__lighting_power = float(config.get("lighting_power", 200.0))
+        """Lighting power at full output [W].
+        """
+
+        self.__fan_power = float(config.get("fan_power", 100.0))
+        """Fans power at full speed [W].
+        """
+
+        self.__base_power = float(config.get("base_power", 150.0))
+        """Power of the other consumers [W].
+        """
+
+        self.__people = int(config.get("people", 4))
+        """People in the zone in the working hours.
+        """
+
+        self.__mean_outside = float(config.get("outside", 5.0))
+        """Mean outside temperature [ºC].
+        """
+
+        self.time = float(config.get("start", 0.0))
+        """Simulated clock [s], time stamp.
+        """
+
+        self.temperature = float(config.get("temperature", 20.0))
+        """Air temperature [ºC].
+        """
+
+        self.outside = self.__mean_outside
+        """Outside temperature [ºC].
+        """
+
+        self.humidity = 45.0
+        """Relative humidity [%].
+        """
+
+        self.lux = 0.0
+        """Illumination [lux].
+        """
+
+        self.power = self.__base_power
+        """Electrical power [W].
+        """
+
+        self.energy = 0.0
+        """Electrical energy [kWh].
+        """
+
+        self.occupied = False
+        """There are people in the zone.
+        """
+
+        self.heating = 0.0
+        """Heating output [0 - 1].
+        """
+
+        self.cooling = 0.0
+        """Cooling output [0 - 1].
+        """
+
+        self.ventilation = 0.0
+        """Ventilation output [0 - 1].
+        """
+
+        self.lighting = 0.0
+        """Lighting output [0 - 1].
+        """
+
+#endregion
+
+#region Properties
+
+    @property
+    def hour(self):
+        """Hour of the simulated clock.
+
+        Returns:
+            float: Hour of the day [0 - 24).
+        """
+
+        return (self.time % 86400) / 3600.0
+
+#endregion
+
+#region Public Methods
+
+    def update(self, step):
+        """Step the model.
+
+        Args:
+            step (float): Simulated time step [s].
+        """
+
+        if step <= 0:
+            return
+
+        self.time += step
+        hour = self.hour
+
+        # Coldest at 3 o'clock and warmest at 15 o'clock.
+        self.outside = self.__mean_outside - 5.0 * math.cos(2 * math.pi * (hour - 3.0) / 24.0)
+
+        # Working hours.
+        self.occupied = 8.0 <= hour < 18.0
+
+        daylight = max(0.0, math.sin(math.pi * (hour - 6.0) / 12.0))
+
+        people = self.__people if self.occupied else 0
+        gains = self.heating * self.__heating_power\
+            - self.cooling * self.__cooling_power\
+            + self.lighting * self.__lighting_power\
+            + people * 100.0
+        losses = (self.__envelope + self.ventilation * self.__ventilation_loss)\
+            * (self.temperature - self.outside)
+
+        self.temperature += (gains - losses) * step / self.__capacity
+
+        self.humidity = 45.0 + 2.5 * people - 10.0 * self.ventilation
+        self.lux = 500.0 * self.lighting + 300.0 * daylight
+
+        self.power = self.__base_power\
+            + self.lighting * self.__lighting_power\
+            + self.ventilation * self.__fan_power
+        self.energy += self.power * step / 3.6e6
+
+#endregion
@@ -24,13 +24,16 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import json
 import struct
+import threading
+import traceback
 
 import requests
 
 from utils.logger import get_logger
+from utils.logic.timer import Timer
 
 from controllers.base_controller import BaseController
-from controllers.vendors.unipi.evok.server import Server
+from controllers.vendors.unipi.evok.state import State
 
 from devices.drivers.modbus.function_code import FunctionCode
 
@@ -75,8 +78,8 @@ class Evok(BaseController):
     __logger = None
     """Logger"""
 
-    __json_data = None
-    """JSON data container."""
+    __state = None
+    """Indexed snapshot of the Evok state."""
 
     __timeout = 5
     """Communication timeout."""
@@ -115,6 +118,34 @@ class Evok(BaseController):
     """EVOK web service.
     """
 
+    __webhook_cb = None
+    """Webhook callback of the owner.
+    """
+
+    __incremental = False
+    """Keep the state with the webhook changes instead of reading it on each update.
+    """
+
+    __resync_timer = None
+    """Full state resync timer of the incremental mode.
+    """
+
+    __sessions = None
+    """Pooled HTTP session of each thread, keeps the connection to the Evok alive.
+    """
+
+    __buffered_writes = True
+    """Buffer the output writes until flush.
+    """
+
+    __writes = None
+    """Buffered output writes by (REST path, circuit).
+    """
+
+    __confirmed = None
+    """Last confirmed output writes by (REST path, circuit).
+    """
+
     __instance = None
     """Singelton instance."""
 
@@ -131,7 +162,7 @@ class Evok(BaseController):
         str
             Whole JSON data.
         """
-        return self.__json_data
+        return self.__state.data
 
     @property
     def host(self):
@@ -186,6 +217,34 @@ class Evok(BaseController):
 
         self.__timeout = timeout
 
+    @property
+    def incremental(self):
+        """Incremental state mode.
+
+        Returns
+        -------
+        bool
+            True when the state is kept with the webhook changes.
+        """
+
+        return self.__incremental
+
+    @property
+    def webhook_device_mask(self):
+        """Device types that the Evok should report with the webhook.
+
+        Returns
+        -------
+        list
+            Device types.
+        """
+
+        if self.__incremental:
+            return ["input", "relay", "output", "led", "ai", "ao", "wd",\
+                "temp", "1wdevice", "register"]
+
+        return ["input", "wd"]
+
     @property
     def last_com_time(self):
         """Get last connection time. [seconds]
@@ -259,6 +318,23 @@ class Evok(BaseController):
         self.host = self._config["host"]
         self.timeout = self._config["timeout"]
         self.__logger = get_logger(__name__)
+        self.__state = State()
+
+        if "incremental" in self._config:
+            self.__incremental = bool(self._config["incremental"])
+
+        resync_time = 60
+        if "resync_time" in self._config:
+            resync_time = float(self._config["resync_time"])
+
+        self.__resync_timer = Timer(resync_time)
+
+        self.__sessions = threading.local()
+        self.__writes = {}
+        self.__confirmed = {}
+
+        if "buffered_writes" in self._config:
+            self.__buffered_writes = bool(self._config["buffered_writes"])
 
     def __del__(self):
         """Destructor
@@ -271,6 +347,22 @@ class Evok(BaseController):
 
 #region Private Methods
 
+    def __session(self):
+        """Pooled HTTP session of the calling thread. The threaded plugins read through
+        the controller too, and requests.Session is not thread safe.
+
+        Returns
+        -------
+        requests.Session
+            Session of the thread.
+        """
+
+        session = getattr(self.__sessions, "session", None)
+        if session is None:
+            session = self.__sessions.session = requests.Session()
+
+        return session
+
     def __get_device_parameter(self, parameter):
         """Get device parameter of the Evok.
 
@@ -287,23 +379,118 @@ class Evok(BaseController):
 
         value = None
 
-        if self.__json_data is None:
-            return value
-
-        for field in self.__json_data:
-            if ("circuit" in field) and ("dev" in field) and (parameter in field):
-                if (field["circuit"] == "1") and (field["dev"] == "neuron"):
-                    value = field[parameter]
-                    break
+        device = self.__state.get_device("neuron", "1")
+        if (device is not None) and (parameter in device):
+            value = device[parameter]
 
         return value
 
+    def __post(self, rest_path, dev, circuit, data):
+        """Post the output write to the Evok.
+
+        Args:
+            rest_path (str): REST path of the device type.
+            dev (str): Device type.
+            circuit (str): Circuit.
+            data (dict): Values of the device.
+
+        Returns:
+            mixed: JSON response data.
+        """
+
+        uri = self.__host + rest_path + circuit
+        response = self.__session().post(uri, data=data, timeout=self.__timeout)
+        json_data = json.loads(response.text)
+
+        if response.status_code == 200:
+            self.__confirmed[(rest_path, circuit)] = data
+
+            # Evok answers with the new state of the device.
+            if isinstance(json_data, dict) and isinstance(json_data.get("result", None), dict):
+                self.__state.apply(json_data["result"])
+
+        return json_data
+
+    def __write(self, rest_path, dev, circuit, data):
+        """Write the output now or buffer it until flush.
+
+        Args:
+            rest_path (str): REST path of the device type.
+            dev (str): Device type.
+            circuit (str): Circuit.
+            data (dict): Values of the device.
+
+        Returns:
+            mixed: JSON response data, None when the write is buffered.
+        """
+
+        if not self.__buffered_writes:
+            return self.__post(rest_path, dev, circuit, data)
+
+        # The last write of the tick wins.
+        self.__writes[(rest_path, circuit)] = (dev, data)
+
+        return None
+
+    def __is_confirmed(self, rest_path, dev, circuit, data):
+        """Check is the output already in this state.
+
+        Args:
+            rest_path (str): REST path of the device type.
+            dev (str): Device type.
+            circuit (str): Circuit.
+            data (dict): Values of the device.
+
+        Returns:
+            bool: True when the last confirmed write is the same and the Evok state agrees.
+        """
+
+        if self.__confirmed.get((rest_path, circuit), None) != data:
+            return False
+
+        # Output changed by somebody else after the last write.
+        device = None
+        if self.__state.is_loaded:
+            device = self.__state.get_device(dev, circuit)
+
+        if device is None:
+            return True
+
+        for key in data:
+            if key not in device:
+                continue
+
+            try:
+                if float(device[key]) != float(data[key]):
+                    return False
+
+            except (TypeError, ValueError):
+                if str(device[key]) != str(data[key]):
+                    return False
+
+        return True
+
+    def __on_webhook(self, data):
+        """Evok webhook handler.
+
+        Args:
+            data (JSON): Changed devices.
+        """
+
+        if self.__incremental:
+            self.__state.apply(data)
+
+        if self.__webhook_cb is not None:
+            self.__webhook_cb(data)
+
 #endregion
 
 #region Protected Methods
 
     def _update(self):
         """Make request to the device to update the data.
+        In incremental mode the webhook keeps the state and it is read again
+        only when the resync time expires.
 
         This method is directly related to the EVOK REST API.
         See https://evok-14.api-docs.io/1.11/rest/get-complete-state
@@ -311,14 +498,26 @@ class Evok(BaseController):
 
         state = False
 
+        # The webhook changes are already in the state.
+        if self.__incremental and (self.__web_service is not None)\
+            and self.__state.is_loaded:
+
+            self.__resync_timer.update()
+            if not self.__resync_timer.expired:
+                return True
+
+            self.__resync_timer.clear()
+
         # Call the Evok.
         uri = self.host + self.__rest_all
 
         try:
-            response = requests.get(uri, timeout=self.__timeout)
+            self.__state.begin_load()
+            response = self.__session().get(uri, timeout=self.__timeout)
 
             if response.status_code == 200:
-                self.__json_data = json.loads(response.text)
+                self.__state.load(json.loads(response.text))
+                self.__resync_timer.update_last_time()
                 # Mark as successfull.
                 state = True
 
@@ -347,17 +546,10 @@ class Evok(BaseController):
             Description of device values and parameters.
         """
 
-        if self.__json_data is None:
+        if not self.__state.is_loaded:
             raise BufferError("Data buffer is not set yet.")
 
-        device = None
-
-        for field in self.__json_data:
-            if ("dev" in field)  and ("circuit" in field):
-                if (field["dev"] == dev) and (field["circuit"] == circuit):
-                    device = field
-
-        return device
+        return self.__state.get_device(dev, circuit)
 
     def _get_1w_devices(self):
         """Get 1W device from the list of all.
@@ -368,19 +560,7 @@ class Evok(BaseController):
             1W devices.
         """
 
-        circuits = []
-
-        if self.__json_data is None:
-            return circuits
-
-        for field in self.__json_data:
-            if "dev" in field:
-                if field["dev"] == "temp":
-                    circuits.append(field)
-                if field["dev"] == "1wdevice":
-                    circuits.append(field)
-
-        return circuits
+        return self.__state.get_1w_devices()
 
     def _get_modbus_devices(self):
         """Get MODBUS device from the list of all.
@@ -390,17 +570,7 @@ class Evok(BaseController):
         tuple
             MODBUS devices.
         """
-        circuits = []
-
-        if self.__json_data is None:
-            return circuits
-
-        for field in self.__json_data:
-            if "uart_port" in field:
-                if field["uart_port"] != "":
-                    circuits.append(field)
-
-        return circuits
+        return self.__state.get_modbus_devices()
 
     def _get_uart_register(self, uart, dev_id, register, function_code=None):
         """Get register data of the device.
@@ -485,7 +655,7 @@ class Evok(BaseController):
 
         circuit = Evok.generate_uart_circuit(uart, dev_id, register)
         uri = self.__host + self.__rest_register + circuit
-        response = requests.post(uri, data={"value":str(value)}, timeout=self.__timeout)
+        response = self.__session().post(uri, data={"value":str(value)}, timeout=self.__timeout)
         return json.loads(response.text)
 
     def _set_led(self, major_index, minor_index, value=0):
@@ -509,9 +679,7 @@ class Evok(BaseController):
         """
 
         circuit = Evok.generate_device_circuit(major_index, minor_index)
-        uri = self.__host + self.__rest_led + circuit
-        response = requests.post(uri, data={"value":str(value)}, timeout=self.__timeout)
-        return json.loads(response.text)
+        return self.__write(self.__rest_led, "led", circuit, {"value":str(value)})
 
     def _set_relay(self, major_index, minor_index, value):
         """Turn the Relay state.
@@ -534,9 +702,7 @@ class Evok(BaseController):
         """
 
         circuit = Evok.generate_device_circuit(major_index, minor_index)
-        uri = self.__host + self.__rest_relay + circuit
-        response = requests.post(uri, data={"value":str(value)}, timeout=self.__timeout)
-        return json.loads(response.text)
+        return self.__write(self.__rest_relay, "relay", circuit, {"value":str(value)})
 
     def _set_digital_output(self, major_index, minor_index, value):
         """Turn the DO state.
@@ -559,10 +725,8 @@ class Evok(BaseController):
         """
 
         circuit = Evok.generate_device_circuit(major_index, minor_index)
-        uri = self.__host + self.__rest_output + circuit
-        response = requests.post(uri, data={"value":str(value), "mode":"Simple"}, \
-            timeout=self.__timeout)
-        return json.loads(response.text)
+        return self.__write(self.__rest_output, "output", circuit,\
+            {"value":str(value), "mode":"Simple"})
 
     def _set_pwm(self, major_index, minor_index, value=0, freq=8000):
         """Turn the PWM state.
@@ -587,10 +751,8 @@ class Evok(BaseController):
         """
 
         circuit = Evok.generate_device_circuit(major_index, minor_index)
-        uri = self.__host + self.__rest_output + circuit
-        response = requests.post(uri, data={"mode":"PWM", "pwm_duty":int(value), \
-            "pwm_freq":int(freq)}, timeout=self.__timeout)
-        return json.loads(response.text)
+        return self.__write(self.__rest_output, "output", circuit,\
+            {"mode":"PWM", "pwm_duty":int(value), "pwm_freq":int(freq)})
 
     def _set_analog_output(self, major_index, minor_index, value=0):
         """Turn the AO state.
@@ -613,11 +775,8 @@ class Evok(BaseController):
         """
 
         circuit = Evok.generate_device_circuit(major_index, minor_index)
-        uri = self.__host + self.__rest_ao + circuit
-
-        response = requests.post(uri, data={"value":str(value), \
-            "mode":"Voltage"}, timeout=self.__timeout)
-        return json.loads(response.text)
+        return self.__write(self.__rest_ao, "ao", circuit,\
+            {"value":str(value), "mode":"Voltage"})
 
     def _set_input_mode(self, major_index, minor_index, mode="Simple"):
         """Turn the DI state.
@@ -641,7 +800,7 @@ class Evok(BaseController):
 
         circuit = Evok.generate_device_circuit(major_index, minor_index)
         uri = self.__host + self.__rest_di + circuit
-        response = requests.post(uri, data={"mode":mode}, timeout=self.__timeout)
+        response = self.__session().post(uri, data={"mode":mode}, timeout=self.__timeout)
         return json.loads(response.text)
 
     def _set_input_debounce(self, major_index, minor_index, debounce=50):
@@ -666,7 +825,7 @@ class Evok(BaseController):
 
         circuit = Evok.generate_device_circuit(major_index, minor_index)
         uri = self.__host + self.__rest_di + circuit
-        response = requests.post(uri, data={"debounce":str(debounce)}, timeout=self.__timeout)
+        response = self.__session().post(uri, data={"debounce":str(debounce)}, timeout=self.__timeout)
         return json.loads(response.text)
 
     def _reset_input_counter(self, major_index, minor_index, counter=0):
@@ -691,7 +850,7 @@ class Evok(BaseController):
 
         circuit = Evok.generate_device_circuit(major_index, minor_index)
         uri = self.__host + self.__rest_di + circuit
-        response = requests.post(uri, data={"counter":str(counter)}, timeout=self.__timeout)
+        response = self.__session().post(uri, data={"counter":str(counter)}, timeout=self.__timeout)
         return json.loads(response.text)
 
     def _toggle_input_counter(self, major_index, minor_index, value=0):
@@ -720,7 +879,7 @@ class Evok(BaseController):
             counter_mode = "True"
         circuit = Evok.generate_device_circuit(major_index, minor_index)
         uri = self.__host + self.__rest_di + circuit
-        response = requests.post(uri, data={"counter_mode":str(counter_mode)}, \
+        response = self.__session().post(uri, data={"counter_mode":str(counter_mode)}, \
             timeout=self.__timeout)
         return json.loads(response.text)
 
@@ -746,7 +905,7 @@ class Evok(BaseController):
 
         circuit = Evok.generate_device_circuit(major_index, minor_index)
         uri = self.__host + self.__rest_watchdog + circuit
-        response = requests.post(uri, data={"nv_save": 1}, timeout=self.__timeout)
+        response = self.__session().post(uri, data={"nv_save": 1}, timeout=self.__timeout)
         return json.loads(response.text)
 
     def _get_digital_input(self, major_index, minor_index):
@@ -770,7 +929,7 @@ class Evok(BaseController):
         circuit = Evok.generate_device_circuit(major_index, minor_index)
         circuit_data = self.get_device("input", circuit)
         # uri = self.__host + self.__rest_di + circuit
-        # response = requests.get(uri, timeout=self.__timeout)
+        # response = self.__session().get(uri, timeout=self.__timeout)
         # return json.loads(response.text)
         return circuit_data
 
@@ -798,7 +957,7 @@ class Evok(BaseController):
         # return circuit_data
 
         uri = self.__host + self.__rest_di + circuit
-        response = requests.get(uri, timeout=self.__timeout)
+        response = self.__session().get(uri, timeout=self.__timeout)
         return json.loads(response.text)
 
     def _get_analog_in(self, major_index, minor_index):
@@ -809,7 +968,7 @@ class Evok(BaseController):
         # return circuit_data
 
         uri = self.__host + self.__rest_ai + circuit
-        response = requests.get(uri, timeout=self.__timeout)
+        response = self.__session().get(uri, timeout=self.__timeout)
         return json.loads(response.text)
 
 #endregion
@@ -1049,20 +1208,23 @@ class Evok(BaseController):
         if self.__web_service is not None:
             return
 
+        # Flask is imported only when the webhooks are used.
+        from controllers.vendors.unipi.evok.server import Server
+
         self.__web_service = Server()
 
         if self.__web_service is not None:
+            self.__web_service.set_cb(self.__on_webhook)
             self.__web_service.start()
 
     def set_webhook(self, callback):
         """We webhook method.
 
         Args:
-            callback (function): [description]
+            callback (function): Handler of the changed devices.
         """
 
-        if self.__web_service is not None:
-            self.__web_service.set_cb(callback)
+        self.__webhook_cb = callback
 
 #endregion
 
@@ -1071,14 +1233,46 @@ class Evok(BaseController):
     def update(self):
         """Update controller state."""
 
+        self.flush()
+
         return self._update()
 
+    def flush(self):
+        """Send the buffered output writes to the Evok.
+        Writes of outputs that are already in the requested state are skipped.
+
+        Returns:
+            int: Count of the sent writes.
+        """
+
+        writes = self.__writes
+        self.__writes = {}
+
+        count = 0
+
+        for (rest_path, circuit), (dev, data) in writes.items():
+
+            if self.__is_confirmed(rest_path, dev, circuit, data):
+                continue
+
+            try:
+                self.__post(rest_path, dev, circuit, data)
+                count += 1
+
+            except Exception:
+                self.__logger.error(traceback.format_exc())
+
+                # Try again on the next flush, unless there is a newer write.
+                self.__writes.setdefault((rest_path, circuit), (dev, data))
+
+        return count
+
     def digital_read(self, pin):
         """Read the digital input pin.
 
         Parameters
         ----------
-        pin : str
+        pin : str/GpioHandle
             Pin index.
 
         Returns
@@ -1089,78 +1283,45 @@ class Evok(BaseController):
 
         state = False
 
-        if pin is None:
-            raise ValueError("Pin can not be None.")
-
-        l_pin = pin.replace("!", "")
+        handle = self.compile_gpio(pin)
 
-        if not self.is_valid_gpio_type(l_pin):
-            raise ValueError("Pin can not be None or empty string.")
-
-        if not self.is_valid_gpio(l_pin):
-            raise ValueError("Pin does not exists in pin map.")
-
-        if self.is_off_gpio(l_pin):
+        if handle.off:
             return state
 
-        is_remote = False
-        try:
-            is_remote = self.is_valid_remote_gpio(pin)
-        except Exception:
-            pass
-
-        if is_remote:
-
-            pin_data = self.parse_remote_gpio(pin)
-            print(pin_data)
-            if pin_data is not None:
+        if handle.remote:
 
-                # This is the map of the GPIO to registers.
-                if pin_data["io_type"] == "DI":
-                    io_index = pin_data["io_index"]
+            # This is the map of the GPIO to registers.
+            if handle.io_type == "DI":
 
-                    # Comments are from date 15.01.2021 y., meeting with M.G.
+                # Comments are from date 15.01.2021 y., meeting with M.G.
 
-                    # Add two serial registers that holding two 16 bit boolean inputs.
-                    reg_adr = 244
-                    if -1 < io_index < 16:
-                        reg_adr = 244
+                # Add two serial registers that holding two 16 bit boolean inputs.
+                reg_adr = 244
+                if 16 <= handle.io_index < 32:
+                    reg_adr = 245
 
-                    if 16 >= io_index < 32:
-                        reg_adr = 245
+                # After determing the registers...
+                value = self._get_uart_register(handle.uart, handle.mb_id, reg_adr)
+                if value is not None:
 
-                    # After determing the registers...
-                    value = self._get_uart_register(pin_data["uart"], pin_data["mb_id"], reg_adr)
-                    if value is not None:
+                    # Extract individual bits, that holds, them.
+                    state = (value & (1 << (handle.io_index % 16))) != 0
 
-                        # Extract individual bits, that holds, them.
-                        state = (value & (1 << io_index)) != 0
-
-                        print(value)
-
-        if not is_remote:
-            gpio_map = self._gpio_map[l_pin]
+        else:
+            gpio_map = handle.local
             response = self._get_digital_input(gpio_map["major_index"], gpio_map["minor_index"])
             if response is not None:
                 state = response["value"]
 
-        # Inversion
-        polarity = pin.startswith("!")
-
         # Check and apply the polarity of the state.
-        if polarity:
-            state = not state
-        else:
-            state = bool(state)
-
-        return state
+        return handle.polarity(state)
 
     def digital_write(self, pin, value):
         """Write the digital output pin.
 
         Parameters
         ----------
-        pin : str
+        pin : str/GpioHandle
             Pin index.
 
         value : int
@@ -1172,33 +1333,20 @@ class Evok(BaseController):
             State of the pin.
         """
 
-        l_pin = pin.replace("!", "")
         response = None
 
-        if self.is_off_gpio(l_pin):
-            return response
+        handle = self.compile_gpio(pin)
 
-        if not self.is_valid_gpio_type(l_pin):
-            raise ValueError("Pin can not be None or empty string.")
+        if handle.off:
+            return response
 
-        if not self.is_valid_gpio(l_pin):
+        if handle.remote:
             raise ValueError("Pin does not exists in pin map.")
 
-        gpio_map = self._gpio_map[l_pin]
+        gpio_map = handle.local
 
         # Inversion
-        polarity = pin.startswith("!")
-        state = 0
-
-        if polarity:
-            state = not value
-        else:
-            state = bool(value)
-
-        state = int(state)
-
-        if state > 1:
-            state = 1
+        state = int(handle.polarity(value))
 
         if gpio_map["dev"] == "do":
             response = self._set_digital_output(gpio_map["major_index"],\
@@ -1213,7 +1361,7 @@ class Evok(BaseController):
 
         Parameters
         ----------
-        pin : str
+        pin : str/GpioHandle
             Pin index.
 
         value : int
@@ -1227,16 +1375,15 @@ class Evok(BaseController):
 
         response = None
 
-        if not self.is_valid_gpio_type(pin):
-            raise ValueError("Pin can not be None or empty string.")
-
-        if not self.is_valid_gpio(pin):
-            raise ValueError("Pin does not exists in pin map.")
+        handle = self.compile_gpio(pin)
 
-        if self.is_off_gpio(pin):
+        if handle.off:
             return response
 
-        gpio_map = self._gpio_map[pin]
+        if handle.remote:
+            raise ValueError("Pin does not exists in pin map.")
+
+        gpio_map = handle.local
 
         if gpio_map["dev"] == "ao":
             response = self._set_analog_output(gpio_map["major_index"],\
@@ -1251,7 +1398,7 @@ class Evok(BaseController):
 
         Parameters
         ----------
-        pin : str
+        pin : str/GpioHandle
             Pin index.
 
         Returns
@@ -1262,16 +1409,15 @@ class Evok(BaseController):
 
         counter = 0
 
-        if not self.is_valid_gpio_type(pin):
-            raise ValueError("Pin can not be None or empty string.")
+        handle = self.compile_gpio(pin)
 
-        if not self.is_valid_gpio(pin):
-            raise ValueError("Pin does not exists in pin map.")
-
-        if self.is_off_gpio(pin):
+        if handle.off:
             return counter
 
-        gpio_map = self._gpio_map[pin]
+        if handle.remote:
+            raise ValueError("Pin does not exists in pin map.")
+
+        gpio_map = handle.local
 
         response = self._get_counter(gpio_map["major_index"], gpio_map["minor_index"])
         if response is not None:
@@ -1284,7 +1430,7 @@ class Evok(BaseController):
 
         Parameters
         ----------
-        pin : str
+        pin : str/GpioHandle
             Pin index.
 
         value : int
@@ -1298,16 +1444,15 @@ class Evok(BaseController):
 
         response = None
 
-        if not self.is_valid_gpio_type(pin):
-            raise ValueError("Pin can not be None or empty string.")
-
-        if not self.is_valid_gpio(pin):
-            raise ValueError("Pin does not exists in pin map.")
+        handle = self.compile_gpio(pin)
 
-        if self.is_off_gpio(pin):
+        if handle.off:
             return response
 
-        gpio_map = self._gpio_map[pin]
+        if handle.remote:
+            raise ValueError("Pin does not exists in pin map.")
+
+        gpio_map = handle.local
 
         if gpio_map["dev"] == "ai":
             response = self._get_analog_in(gpio_map["major_index"],\
@@ -1320,7 +1465,7 @@ class Evok(BaseController):
 
         Parameters
         ----------
-        pin : str
+        pin : str/GpioHandle
             Pin index.
 
         value : int
@@ -1334,16 +1479,15 @@ class Evok(BaseController):
 
         response = None
 
-        if not self.is_valid_gpio_type(pin):
-            raise ValueError("Pin can not be None or empty string.")
-
-        if not self.is_valid_gpio(pin):
-            raise ValueError("Pin does not exists in pin map.")
+        handle = self.compile_gpio(pin)
 
-        if self.is_off_gpio(pin):
+        if handle.off:
             return response
 
-        gpio_map = self._gpio_map[pin]
+        if handle.remote:
+            raise ValueError("Pin does not exists in pin map.")
+
+        gpio_map = handle.local
         response = self._reset_input_counter(gpio_map["major_index"],\
             gpio_map["minor_index"], value)
 
@@ -1354,7 +1498,7 @@ class Evok(BaseController):
 
         Parameters
         ----------
-        pin : str
+        pin : str/GpioHandle
             Pin index.
 
         value : int
@@ -1366,31 +1510,17 @@ class Evok(BaseController):
             State of the pin.
         """
 
-        l_pin = pin.replace("!", "")
-
         response = None
 
-        if not self.is_valid_gpio_type(l_pin):
-            raise ValueError("Pin can not be None or empty string.")
-
-        if not self.is_valid_gpio(l_pin):
-            raise ValueError("Pin does not exists in pin map.")
+        handle = self.compile_gpio(pin)
 
-        if self.is_off_gpio(l_pin):
+        if handle.off:
             return response
 
-        gpio_map = self._gpio_map[l_pin]
-
-        # Inversion
-        polarity = pin.startswith("!")
-        state = 0
-
-        if polarity:
-            state = not value
-        else:
-            state = bool(value)
+        if handle.remote:
+            raise ValueError("Pin does not exists in pin map.")
 
-        state = int(state)
+        gpio_map = handle.local
 
         response = self._set_led(gpio_map["major_index"], gpio_map["minor_index"], value)
 
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+from threading import Lock
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class State:
+    """Snapshot of the Evok state, the response of /rest/all.
+    Indexes the devices by (dev, circuit) and by dev type once per snapshot,
+    so the lookups do not scan the whole list.
+    Change events of the Evok are applied on the snapshot as deltas."""
+
+#region Attributes
+
+#endregion
+
+#region Constructor
+
+    def __init__(self, data=None):
+        """Constructor
+
+        Args:
+            data (list, optional): Evok devices list. Defaults to None.
+        """
+
+        self.__data = None
+        """Evok devices list.
+        """
+
+        self.__devices = {}
+        """Devices by (dev, circuit).
+        """
+
+        self.__types = {}
+        """Devices by dev type.
+        """
+
+        self.__1w_devices = []
+        """1W devices in the order of the snapshot.
+        """
+
+        self.__modbus_devices = []
+        """MODBUS devices in the order of the snapshot.
+        """
+
+        self.__journal = None
+        """Changes that came while a new snapshot was loading.
+        """
+
+        self.__lock = Lock()
+        """Guards the snapshot against the webhook thread.
+        """
+
+        if data is not None:
+            self.load(data)
+
+#endregion
+
+#region Properties
+
+    @property
+    def data(self):
+        """Evok devices list.
+
+        Returns:
+            list: Devices as they came from the Evok.
+        """
+
+        return self.__data
+
+    @property
+    def is_loaded(self):
+        """Is there a snapshot.
+
+        Returns:
+            bool: True when a snapshot is loaded.
+        """
+
+        return self.__data is not None
+
+#endregion
+
+#region Private Methods
+
+    @staticmethod
+    def __index(field, devices, types, onewire_devices, modbus_devices):
+        """Put the device in the indexes.
+
+        Args:
+            field (dict): Device description.
+            devices (dict): Devices by (dev, circuit).
+            types (dict): Devices by dev type.
+            onewire_devices (list): 1W devices.
+            modbus_devices (list): MODBUS devices.
+        """
+
+        dev = field.get("dev", None)
+        if dev is not None:
+            types.setdefault(dev, []).append(field)
+
+            if "circuit" in field:
+                # The last one wins, as the linear search did.
+                devices[(dev, field["circuit"])] = field
+
+            if dev in ("temp", "1wdevice"):
+                onewire_devices.append(field)
+
+        if field.get("uart_port", "") != "":
+            modbus_devices.append(field)
+
+#endregion
+
+#region Public Methods
+
+    def begin_load(self):
+        """Start recording the changes, before the request of the new snapshot.
+        They are applied again on the new snapshot, because it may be older than them.
+        """
+
+        with self.__lock:
+            self.__journal = []
+
+    def load(self, data):
+        """Load a new snapshot and index it.
+
+        Args:
+            data (list): Evok devices list.
+        """
+
+        devices = {}
+        types = {}
+        onewire_devices = []
+        modbus_devices = []
+
+        for field in data:
+            State.__index(field, devices, types, onewire_devices, modbus_devices)
+
+        with self.__lock:
+            self.__data = data
+            self.__devices = devices
+            self.__types = types
+            self.__1w_devices = onewire_devices
+            self.__modbus_devices = modbus_devices
+
+            journal = self.__journal
+            self.__journal = None
+
+        if journal:
+            self.apply(journal)
+
+    def apply(self, changes):
+        """Apply change events on the snapshot.
+        Known devices are updated in place, unknown devices are added.
+
+        Args:
+            changes (mixed): Changed device or list of changed devices.
+
+        Returns:
+            list: Applied devices, as they are in the snapshot.
+        """
+
+        if changes is None:
+            return []
+
+        if isinstance(changes, dict):
+            changes = [changes]
+
+        changes = [change for change in changes\
+            if isinstance(change, dict) and ("dev" in change) and ("circuit" in change)]
+
+        applied = []
+
+        with self.__lock:
+
+            if self.__journal is not None:
+                self.__journal.extend(changes)
+
+            # Nothing to apply on, wait for the full snapshot.
+            if self.__data is None:
+                return applied
+
+            for change in changes:
+
+                field = self.__devices.get((change["dev"], change["circuit"]), None)
+
+                if field is None:
+                    field = dict(change)
+                    self.__data.append(field)
+                    State.__index(field, self.__devices, self.__types,\
+                        self.__1w_devices, self.__modbus_devices)
+
+                else:
+                    field.update(change)
+
+                applied.append(field)
+
+        return applied
+
+    def get_device(self, dev, circuit):
+        """Get device by type and circuit.
+
+        Args:
+            dev (str): Device type.
+            circuit (str): Circuit.
+
+        Returns:
+            dict: Device description or None.
+        """
+
+        return self.__devices.get((dev, circuit), None)
+
+    def get_devices(self, dev):
+        """Get all devices of the type.
+
+        Args:
+            dev (str): Device type.
+
+        Returns:
+            list: Devices descriptions.
+        """
+
+        return list(self.__types.get(dev, []))
+
+    def get_1w_devices(self):
+        """Get 1W devices.
+
+        Returns:
+            list: 1W devices descriptions.
+        """
+
+        return list(self.__1w_devices)
+
+    def get_modbus_devices(self):
+        """Get MODBUS devices.
+
+        Returns:
+            list: MODBUS devices descriptions.
+        """
+
+        return list(self.__modbus_devices)
+
+#endregion
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+import argparse
+import random
+import time
+
+from controllers.vendors.unipi.m523 import M523
+from controllers.vendors.unipi.tests.evok_state_benchmark import m523_payload
+from controllers.vendors.unipi.tests.fake_evok import FakeEvok
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+def run(controller, evok, rate, duration, changes_rate):
+    """Zone like loop, the inputs change on the fake Evok meanwhile.
+
+    Returns:
+        tuple: CPU time of the loop and count of the /rest/all requests.
+    """
+
+    inputs = [device["circuit"] for device in evok.get_all() if device["dev"] == "input"]
+    requests_start = evok.rest_all_count
+
+    t_stop = time.monotonic() + duration
+    t_change = time.monotonic()
+    cpu_start = time.process_time()
+
+    while time.monotonic() < t_stop:
+
+        # Simulated field events.
+        while time.monotonic() >= t_change:
+            evok.change("input", random.choice(inputs), value=random.randint(0, 1))
+            t_change += 1.0 / changes_rate
+
+        controller.update()
+
+        for circuit in inputs:
+            controller.get_device("input", circuit)
+
+        time.sleep(rate)
+
+    return time.process_time() - cpu_start, evok.rest_all_count - requests_start
+
+def check(controller, evok):
+    """Compare the state of the controller with the fake Evok.
+
+    Returns:
+        int: Count of the different devices.
+    """
+
+    # Give time to the last webhooks.
+    time.sleep(0.5)
+
+    differences = 0
+    for device in evok.get_all():
+        if controller.get_device(device["dev"], device["circuit"]) != device:
+            differences += 1
+
+    return differences
+
+def report(name, duration, cpu_time, rest_all_count, differences):
+    """Print the results.
+    """
+
+    print("{:<12} CPU: {:6.2f} %; /rest/all requests: {:5d}; different devices: {}"\
+        .format(name, 100 * cpu_time / duration, rest_all_count, differences))
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--port", type=int, default=8080, help="Port of the fake Evok.")
+    parser.add_argument("--rate", type=float, default=0.1, help="Zone update rate [s].")
+    parser.add_argument("--duration", type=float, default=20.0, help="Measurement time for each mode [s].")
+    parser.add_argument("--changes", type=float, default=5.0, help="Input changes per second.")
+    parser.add_argument("--resync", type=float, default=10.0, help="Full resync time of the incremental mode [s].")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    # The webhook server of the controller listens on 8889.
+    evok = FakeEvok(m523_payload(600, 200), args.port,\
+        "http://127.0.0.1:8889/api/v1/evok/webhooks")
+    evok.start()
+
+    config = {"vendor": "unipi", "model": "M523", "timeout": 5,\
+        "host": "http://127.0.0.1:{}".format(args.port)}
+
+    # Polling mode, the whole state each update.
+    controller = M523(config)
+    cpu_time, rest_all_count = run(controller, evok, args.rate, args.duration, args.changes)
+    report("Polling", args.duration, cpu_time, rest_all_count, check(controller, evok))
+
+    # Incremental mode, the state is kept with the webhook.
+    config["incremental"] = True
+    config["resync_time"] = args.resync
+    controller = M523(config)
+    controller.start_web_service()
+    time.sleep(1)
+    cpu_time, rest_all_count = run(controller, evok, args.rate, args.duration, args.changes)
+    report("Incremental", args.duration, cpu_time, rest_all_count, check(controller, evok))
+
+    evok.stop()
+
+if __name__ == "__main__":
+    main()
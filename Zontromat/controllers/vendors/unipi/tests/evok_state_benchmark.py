@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+import argparse
+import json
+import time
+
+from controllers.vendors.unipi.evok.state import State
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+def m523_payload(registers, uart_registers):
+    """Neuron M523 /rest/all like payload.
+
+    Args:
+        registers (int): Count of the Neuron registers.
+        uart_registers (int): Count of the registers of the UART devices.
+
+    Returns:
+        list: Evok devices list.
+    """
+
+    data = [{"dev": "neuron", "circuit": "1", "model": "M523", "sn": 523,\
+        "ver2": "0.1", "last_comm": 0.01, "glob_dev_id": 1}]
+
+    # Digital inputs and outputs, relays, analog I/O and LEDs.
+    for index in range(1, 5):
+        data.append({"dev": "input", "circuit": "1_0{}".format(index), "value": 0,\
+            "counter": 0, "debounce": 50, "mode": "Simple", "glob_dev_id": 1})
+        data.append({"dev": "output", "circuit": "1_0{}".format(index), "value": 0,\
+            "pwm_freq": 100.0, "pwm_duty": 0, "glob_dev_id": 1})
+        data.append({"dev": "led", "circuit": "1_0{}".format(index), "value": 0, "glob_dev_id": 1})
+
+    for index in range(1, 10):
+        data.append({"dev": "input", "circuit": "2_0{}".format(index), "value": 0,\
+            "counter": 0, "debounce": 50, "mode": "Simple", "glob_dev_id": 1})
+
+    for index in range(1, 6):
+        data.append({"dev": "relay", "circuit": "2_0{}".format(index), "value": 0,\
+            "relay_type": "physical", "glob_dev_id": 1})
+
+    for index in range(1, 5):
+        data.append({"dev": "ai", "circuit": "2_0{}".format(index), "value": 0.0,\
+            "unit": "V", "mode": "Voltage", "glob_dev_id": 1})
+        data.append({"dev": "ao", "circuit": "2_0{}".format(index), "value": 0.0,\
+            "unit": "V", "mode": "Voltage", "glob_dev_id": 1})
+
+    data.append({"dev": "ai", "circuit": "1_01", "value": 0.0, "unit": "V", "glob_dev_id": 1})
+    data.append({"dev": "ao", "circuit": "1_01", "value": 0.0, "unit": "V", "glob_dev_id": 1})
+
+    # Watchdogs, bus and UART ports.
+    for index in range(1, 3):
+        data.append({"dev": "wd", "circuit": str(index), "value": 0, "timeout": 5000,\
+            "nv_save": 0, "glob_dev_id": 1})
+        data.append({"dev": "uart", "circuit": "{}_01".format(index), "parity": "None",\
+            "speed": "19200bps", "glob_dev_id": 1})
+
+    data.append({"dev": "owbus", "circuit": "1", "bus": "/dev/i2c-0", "scan_interval": 60})
+
+    # 1W thermometers.
+    for index in range(8):
+        data.append({"dev": "temp", "circuit": "28FF{:012X}".format(index),\
+            "typ": "DS18B20", "value": 21.5, "lost": False, "time": 0})
+
+    # Neuron registers.
+    for index in range(registers):
+        data.append({"dev": "register", "circuit": "{}_{:02d}".format(index // 1000 + 1, index % 1000),\
+            "value": index, "glob_dev_id": 1})
+
+    # Registers of the extension devices.
+    for index in range(uart_registers):
+        data.append({"dev": "register", "circuit": "UART_1_{}_{}".format(index // 100 + 1, index % 100),\
+            "value": index, "uart_port": "/dev/extcomm/0/0", "glob_dev_id": index // 100 + 2})
+
+    return data
+
+def linear_get_device(data, dev, circuit):
+    """Device lookup, as Evok.get_device was doing before the index.
+    """
+
+    device = None
+
+    for field in data:
+        if ("dev" in field)  and ("circuit" in field):
+            if (field["dev"] == dev) and (field["circuit"] == circuit):
+                device = field
+
+    return device
+
+def linear_get_1w_devices(data):
+    """1W devices, as Evok._get_1w_devices was doing before the index.
+    """
+
+    circuits = []
+
+    for field in data:
+        if "dev" in field:
+            if field["dev"] == "temp":
+                circuits.append(field)
+            if field["dev"] == "1wdevice":
+                circuits.append(field)
+
+    return circuits
+
+def tick_lookups(data):
+    """Lookups of one zone update.
+
+    Returns:
+        list: (dev, circuit) pairs.
+    """
+
+    lookups = [("neuron", "1")] * 4
+    lookups += [(field["dev"], field["circuit"]) for field in data\
+        if field.get("dev") in ("input", "output", "relay", "ai", "ao", "temp")]
+    lookups += [("register", "UART_1_1_{}".format(index)) for index in range(40)]
+
+    return lookups
+
+def run_linear(data, lookups, ticks):
+    """Linear scans of the list.
+
+    Returns:
+        float: Time for one tick [s].
+    """
+
+    t_start = time.perf_counter()
+
+    for _ in range(ticks):
+        for dev, circuit in lookups:
+            linear_get_device(data, dev, circuit)
+        linear_get_1w_devices(data)
+
+    return (time.perf_counter() - t_start) / ticks
+
+def run_indexed(data, lookups, ticks):
+    """Index is built for every snapshot, then the lookups.
+
+    Returns:
+        float: Time for one tick [s].
+    """
+
+    state = State()
+    t_start = time.perf_counter()
+
+    for _ in range(ticks):
+        state.load(data)
+        for dev, circuit in lookups:
+            state.get_device(dev, circuit)
+        state.get_1w_devices()
+
+    return (time.perf_counter() - t_start) / ticks
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--payload", type=str, default="", help="Recorded /rest/all JSON file.")
+    parser.add_argument("--registers", type=int, default=600, help="Neuron registers in the generated payload.")
+    parser.add_argument("--uart-registers", type=int, default=200, help="UART registers in the generated payload.")
+    parser.add_argument("--ticks", type=int, default=200, help="Zone updates to measure.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    if args.payload != "":
+        with open(args.payload, "r") as payload_file:
+            data = json.load(payload_file)
+    else:
+        data = m523_payload(args.registers, args.uart_registers)
+
+    lookups = tick_lookups(data)
+
+    # The index must answer as the linear search.
+    state = State(data)
+    for dev, circuit in lookups:
+        assert state.get_device(dev, circuit) is linear_get_device(data, dev, circuit)
+    assert state.get_1w_devices() == linear_get_1w_devices(data)
+
+    print("Devices: {}; lookups per tick: {}".format(len(data), len(lookups)))
+
+    tick_time = run_linear(data, lookups, args.ticks)
+    print("{:<8} tick: {:8.3f} ms".format("Linear", tick_time * 1000))
+
+    tick_time = run_indexed(data, lookups, args.ticks)
+    print("{:<8} tick: {:8.3f} ms".format("Indexed", tick_time * 1000))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+import argparse
+import random
+import statistics
+import time
+
+import requests
+
+from controllers.vendors.unipi.m523 import M523
+from controllers.vendors.unipi.tests.evok_state_benchmark import m523_payload
+from controllers.vendors.unipi.tests.fake_evok import FakeEvok
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+def outputs_of(evok):
+    """Relays and digital outputs of the fake Evok.
+
+    Returns:
+        list: (REST path, circuit) of each output.
+    """
+
+    outputs = []
+    for device in evok.get_all():
+        if device["dev"] in ("relay", "output"):
+            outputs.append((device["dev"], device["circuit"]))
+
+    return outputs
+
+def run_direct(host, outputs, ticks, change_ratio):
+    """New connection for each write, as the Evok class was doing before the session.
+
+    Returns:
+        list: Tick latency [s].
+    """
+
+    latency = []
+
+    for _ in range(ticks):
+        t_start = time.perf_counter()
+
+        for dev, circuit in outputs:
+            value = int(random.random() < change_ratio)
+            requests.post("{}/rest/{}/{}".format(host, dev, circuit),\
+                data={"value": str(value)}, timeout=5)
+
+        latency.append(time.perf_counter() - t_start)
+
+    return latency
+
+def run_controller(controller, outputs, ticks, change_ratio):
+    """Writes through the controller, then flush as the zone does at the end of the tick.
+
+    Returns:
+        list: Tick latency [s].
+    """
+
+    latency = []
+
+    for _ in range(ticks):
+        t_start = time.perf_counter()
+
+        for dev, circuit in outputs:
+            value = int(random.random() < change_ratio)
+            major_index, minor_index = [int(index) for index in circuit.split("_")]
+            if dev == "relay":
+                controller._set_relay(major_index, minor_index, value)
+            else:
+                controller._set_digital_output(major_index, minor_index, value)
+
+        controller.flush()
+
+        latency.append(time.perf_counter() - t_start)
+
+    return latency
+
+def report(name, latency, requests_count):
+    """Print the results.
+    """
+
+    latency = sorted(value * 1000 for value in latency)
+    p95 = latency[int(len(latency) * 0.95) - 1]
+
+    print("{:<9} tick mean: {:7.2f} ms; p95: {:7.2f} ms; HTTP requests: {:5d}"\
+        .format(name, statistics.mean(latency), p95, requests_count))
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--port", type=int, default=8080, help="Port of the fake Evok.")
+    parser.add_argument("--ticks", type=int, default=100, help="Zone updates to measure.")
+    parser.add_argument("--change", type=float, default=0.1, help="Probability an output to be on in the tick.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    evok = FakeEvok(m523_payload(600, 200), args.port)
+    evok.start()
+
+    host = "http://127.0.0.1:{}".format(args.port)
+    outputs = outputs_of(evok)
+    print("Outputs written per tick: {}".format(len(outputs)))
+
+    random.seed(0)
+    count = evok.requests_count
+    latency = run_direct(host, outputs, args.ticks, args.change)
+    report("Direct", latency, evok.requests_count - count)
+
+    config = {"vendor": "unipi", "model": "M523", "timeout": 5, "host": host,\
+        "buffered_writes": False}
+
+    random.seed(0)
+    controller = M523(config)
+    count = evok.requests_count
+    latency = run_controller(controller, outputs, args.ticks, args.change)
+    report("Pooled", latency, evok.requests_count - count)
+
+    config["buffered_writes"] = True
+
+    random.seed(0)
+    controller = M523(config)
+    controller.update()
+    count = evok.requests_count
+    latency = run_controller(controller, outputs, args.ticks, args.change)
+    report("Buffered", latency, evok.requests_count - count)
+
+    evok.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, urlencode
+from urllib.request import urlopen
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    """Threaded HTTP server."""
+
+    daemon_threads = True
+
+class FakeEvok:
+    """Local fake of the Evok REST API and webhook.
+    Serves /rest/all from a payload, accepts the writes of the devices
+    and posts the changes to the webhook address as the Evok does."""
+
+#region Constructor
+
+    def __init__(self, data, port=8080, webhook_address=None):
+        """Constructor
+
+        Args:
+            data (list): Evok devices list, /rest/all.
+            port (int, optional): HTTP port. Defaults to 8080.
+            webhook_address (str, optional): Address of the webhook. Defaults to None.
+        """
+
+        self.__data = data
+        """Evok devices list.
+        """
+
+        self.__devices = {}
+        """Devices by (dev, circuit).
+        """
+
+        for field in data:
+            if ("dev" in field) and ("circuit" in field):
+                self.__devices[(field["dev"], field["circuit"])] = field
+
+        self.__lock = threading.Lock()
+        """Guards the devices.
+        """
+
+        self.__webhook_address = webhook_address
+        """Webhook address.
+        """
+
+        self.rest_all_count = 0
+        """Count of the /rest/all requests.
+        """
+
+        self.requests_count = 0
+        """Count of all requests.
+        """
+
+        self.__server = _ThreadingHTTPServer(("127.0.0.1", port), self.__handler())
+        """HTTP server.
+        """
+
+        self.__thread = None
+        """Server thread.
+        """
+
+#endregion
+
+#region Private Methods
+
+    def __handler(self):
+        """Request handler class of the server.
+        """
+
+        evok = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Evok REST requests handler."""
+
+            # Keep-alive, as the Evok does.
+            protocol_version = "HTTP/1.1"
+
+            # Headers and body go in separate writes, do not wait for the delayed ACK.
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def __send(self, content):
+                body = json.dumps(content).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                chunks = [chunk for chunk in self.path.split("/") if chunk != ""]
+                evok.requests_count += 1
+
+                if chunks == ["rest", "all"]:
+                    evok.rest_all_count += 1
+                    self.__send(evok.get_all())
+
+                elif len(chunks) == 3 and chunks[0] == "rest":
+                    device = evok.get_device(chunks[1], chunks[2])
+                    if device is None:
+                        self.send_error(404)
+                    else:
+                        self.__send(device)
+
+                else:
+                    self.send_error(404)
+
+            def do_POST(self):
+                chunks = [chunk for chunk in self.path.split("/") if chunk != ""]
+                evok.requests_count += 1
+
+                if len(chunks) != 3 or chunks[0] != "rest":
+                    self.send_error(404)
+                    return
+
+                length = int(self.headers.get("Content-Length", 0))
+                form = parse_qs(self.rfile.read(length).decode("utf-8"))
+                values = {}
+                for key in form:
+                    value = form[key][0]
+                    try:
+                        value = json.loads(value)
+                    except ValueError:
+                        pass
+                    values[key] = value
+
+                device = evok.change(chunks[1], chunks[2], **values)
+                if device is None:
+                    self.send_error(404)
+                else:
+                    self.__send({"success": True, "result": device})
+
+        return Handler
+
+    def __post_webhook(self, changes):
+        """Post the changes to the webhook as the Evok does with complex events.
+
+        Args:
+            changes (list): Changed devices.
+        """
+
+        if self.__webhook_address is None:
+            return
+
+        # Evok sends the devices as escaped JSON string.
+        form = urlencode({"registers": json.dumps(json.dumps(changes))}).encode("utf-8")
+
+        try:
+            with urlopen(self.__webhook_address, data=form, timeout=5) as response:
+                response.read()
+
+        except Exception as exception:
+            print(exception)
+
+#endregion
+
+#region Public Methods
+
+    def start(self):
+        """Start the server.
+        """
+
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """Stop the server.
+        """
+
+        self.__server.shutdown()
+        self.__server.server_close()
+
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def get_all(self):
+        """Get copy of all devices.
+
+        Returns:
+            list: Evok devices list.
+        """
+
+        with self.__lock:
+            return [dict(field) for field in self.__data]
+
+    def get_device(self, dev, circuit):
+        """Get copy of the device.
+
+        Args:
+            dev (str): Device type.
+            circuit (str): Circuit.
+
+        Returns:
+            dict: Device description or None.
+        """
+
+        with self.__lock:
+            device = self.__devices.get((dev, circuit), None)
+            if device is not None:
+                device = dict(device)
+
+        return device
+
+    def change(self, dev, circuit, **values):
+        """Change the device and post the change to the webhook.
+
+        Args:
+            dev (str): Device type.
+            circuit (str): Circuit.
+
+        Returns:
+            dict: Changed device or None.
+        """
+
+        with self.__lock:
+            device = self.__devices.get((dev, circuit), None)
+            if device is None:
+                return None
+
+            device.update(values)
+            device = dict(device)
+
+        self.__post_webhook([device])
+
+        return device
+
+#endregion
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import argparse
+import time
+
+from controllers.vendors.unipi.m523 import M523
+from controllers.vendors.unipi.tests.evok_state_benchmark import m523_payload
+from controllers.vendors.unipi.tests.fake_evok import FakeEvok
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+def run(controller, pins, calls, mode):
+    """Call the I/O of the controller with the pins.
+
+    Returns:
+        float: Time per call [s].
+    """
+
+    if mode == "handle":
+        pins = [(controller.compile_gpio(pin), remote) for pin, remote in pins]
+
+    t_start = time.perf_counter()
+
+    for index in range(calls):
+        for pin, remote in pins:
+
+            # Parse the pin each time, as it was before the handles.
+            if mode == "parse":
+                controller.clear_gpio_handles()
+
+            if remote:
+                controller.digital_read(pin)
+            else:
+                controller.digital_write(pin, index & 1)
+
+    return (time.perf_counter() - t_start) / (calls * len(pins))
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--port", type=int, default=8080, help="Port of the fake Evok.")
+    parser.add_argument("--calls", type=int, default=5000, help="Calls per pin.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    evok = FakeEvok(m523_payload(600, 200), args.port)
+    evok.start()
+
+    # The writes stay in the buffer, only the state is read from the fake Evok.
+    config = {"vendor": "unipi", "model": "M523", "timeout": 5,\
+        "host": "http://127.0.0.1:{}".format(args.port), "buffered_writes": True}
+    controller = M523(config)
+    controller.update()
+
+    pins = [("RO{}".format(index), False) for index in range(5)]
+    pins += [("!DO{}".format(index), False) for index in range(4)]
+    pins += [("U1:ID3:FC2:R0:DI{}".format(index), True) for index in range(0, 32, 4)]
+
+    for mode in ("parse", "string", "handle"):
+        t_call = run(controller, pins, args.calls, mode)
+        print("{:<7} {:7.2f} us per call".format(mode, t_call * 1000000))
+
+    evok.stop()
+
+if __name__ == "__main__":
+    main()
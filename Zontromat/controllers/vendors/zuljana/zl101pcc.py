@@ -24,6 +24,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import subprocess
 import os
+from concurrent.futures import Future
 
 from services.global_error_handler.global_error_handler import GlobalErrorHandler
 
@@ -32,10 +33,14 @@ from utils.logic.functions import l_scale
 from .utils.generate_uuid import UUID
 
 from controllers.base_controller import BaseController
+from controllers.utils.gpio_handle import GpioHandle
 
 # from devices.vendors.super.s8_3cn.s8_3cn import S83CN as BlackIsland
 from devices.vendors.cwt.mb308v.mb308v import MB308V as BlackIsland
 from devices.drivers.modbus.function_code import FunctionCode
+from devices.drivers.modbus.priority import Priority
+from devices.drivers.modbus.process_image import ProcessImage
+from devices.drivers.modbus.transaction_queue import TransactionQueue
 
 # Import MODBUS clients.
 # from pymodbus.client.sync import ModbusTcpClient as ModbusClient
@@ -96,6 +101,10 @@ class ZL101PCC(BaseController):
     """Modbus-RTU clients.
     """
 
+    __transaction_queues = {}
+    """Modbus-RTU transaction queues by UART.
+    """
+
     __black_island = None
     """IO
     """
@@ -228,6 +237,8 @@ class ZL101PCC(BaseController):
                     parity=modbus_rtu_cfg["parity"],
                     stopbits=modbus_rtu_cfg["stopbits"]
                     )
+                self.__transaction_queues[index] = TransactionQueue(
+                    self.__modbus_rtu_clients[index], "UART{}".format(index))
             else:
                 self.show_valid_serial_ports(modbus_rtu_cfg["port"])
         
@@ -237,6 +248,10 @@ class ZL101PCC(BaseController):
 
             self.__uuid = UUID()
 
+        self.__remote_io = ProcessImage(self.__transaction_queues)
+        """Remote I/O image of the MODBUS slaves.
+        """
+
 #endregion
 
 #region Private Methods
@@ -290,100 +305,103 @@ class ZL101PCC(BaseController):
     def update(self):
         """Update controller state."""
 
+        self.__remote_io.update()
+
         return self.__modbus_rtu_clients is not None or {}
 
+    def flush(self):
+        """Write the staged remote outputs.
+
+        Returns:
+            int: Count of the write requests.
+        """
+
+        return self.__remote_io.flush()
+
     def digital_read(self, pin):
         """Read the digital input pin.
 
         Args:
-            pin (int): Pin index.
+            pin (str, GpioHandle, list): Pin or pins.
 
         Returns:
             int: State of the pin.
         """
 
-        if self.is_gpio_off(pin):
-            return False
-
-        if self.is_gpio_nothing(pin):
-            raise ValueError("Pin can not be None or empty string.")
-
         response = False
 
         # Local GPIO.
-        def get_local_gpio(pin):
+        def get_local_gpio(handle):
 
             lgpio_response = False
 
             # Read device digital inputs.
             request = self.__black_island.generate_request("GetDigitalInputs")
-            di_response = self.__modbus_rtu_clients[0].execute(request)
+            di_response = self.__transaction_queues[0].execute(request, Priority.Control)
             if di_response is not None:
                 if not di_response.isError():
                     self.__DI = di_response.bits
                 else:
-                    GlobalErrorHandler.log_hardware_malfunction(self.__logger, "GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(pin, self))
+                    GlobalErrorHandler.log_hardware_malfunction(self.__logger, "GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(handle.pin, self))
             else:
-                GlobalErrorHandler.log_hardware_malfunction(self.__logger, "GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(pin, self))
+                GlobalErrorHandler.log_hardware_malfunction(self.__logger, "GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(handle.pin, self))
 
-            lgpio_response = self.__DI[self._gpio_map[pin]]
+            lgpio_response = self.__DI[handle.local]
 
             # Inversion
-            if self.is_gpio_inverted(pin):
-                lgpio_response = not lgpio_response
-
-            return lgpio_response
+            return handle.polarity(lgpio_response)
 
         # Remote GPIO.
-        def get_remote_gpio(pin):
+        def get_remote_gpio(handle):
 
-            rgpio_response = False
-
-            remote_gpio = self.parse_remote_gpio(pin)
-
-            if not remote_gpio["uart"] in self.__modbus_rtu_clients:
-                GlobalErrorHandler.log_missing_resource("Missing MODBUS-RTU UART{} interface".format(remote_gpio["uart"]))
+            if not handle.uart in self.__transaction_queues:
+                GlobalErrorHandler.log_missing_resource(self.__logger, "Missing MODBUS-RTU UART{} interface".format(handle.uart))
                 return False
 
-            read_response = self.__modbus_rtu_clients[remote_gpio["uart"]].read_discrete_inputs(
-                remote_gpio["io_reg"],
-                remote_gpio["io_index"]+1,
-                remote_gpio["mb_id"])
+            # Served from the image, the slave is read once per update.
+            rgpio_response = self.__remote_io.read_input(
+                handle.uart,
+                handle.mb_id,
+                handle.address)
 
-            if not read_response.isError():
-                rgpio_response = read_response.bits[remote_gpio["io_index"]]
+            # Inversion
+            return handle.polarity(rgpio_response)
 
-                # Inversion
-                if self.is_gpio_inverted(pin):
-                    rgpio_response = not rgpio_response
+        def get_gpio(pin):
 
-            return rgpio_response
+            if self.is_gpio_nothing(pin):
+                raise ValueError("Pin can not be None or empty string.")
 
-        if isinstance(pin, str):
-            if self.is_gpio_off(pin):
-                return response
-            elif self.is_gpio_local(pin):
-                response = get_local_gpio(pin)
-            elif self.is_gpio_remote(pin):
-                response = get_remote_gpio(pin)
-            else:
+            try:
+                handle = self.compile_gpio(pin)
+            except ValueError:
                 GlobalErrorHandler.log_hardware_malfunction(self.__logger, "Remote GPIO: {} @ {} Pin does not exists in pin map.".format(pin, self))
+                return None
+
+            if handle.off:
+                return None
+            elif handle.remote:
+                return get_remote_gpio(handle)
+            else:
+                return get_local_gpio(handle)
 
-        elif isinstance(pin, list):
+        if isinstance(pin, list):
             response = []
             # Go trough all pins.
             for p in pin:
                 if self.is_gpio_off(p):
                     break
-                elif self.is_gpio_local(p):
-                    response.append(get_local_gpio(p))
-                elif self.is_gpio_remote(p):
-                    response.append(get_remote_gpio(p))
-                else:
-                    GlobalErrorHandler.log_hardware_malfunction(self.__logger, "Remote GPIO: {} @ {} Pin does not exists in pin map.".format(pin, self))
+                state = get_gpio(p)
+                if state is not None:
+                    response.append(state)
+
+        elif isinstance(pin, (str, GpioHandle)):
+            state = get_gpio(pin)
+            if state is not None:
+                response = state
 
         else:
-             GlobalErrorHandler.log_missing_resource(f"Pin ({pin}) does not confirm list or str.")
+             GlobalErrorHandler.log_missing_resource(self.__logger, f"Pin ({pin}) does not confirm list or str.")
 
         return response
 
@@ -391,122 +409,89 @@ class ZL101PCC(BaseController):
         """Write the digital output pin.
 
         Args:
-            pin (str, list): Pin
+            pin (str, GpioHandle, list): Pin or pins.
             value (_type_): Value for the output pin.
 
-        Raises:
-            ValueError: _description_
-            ValueError: _description_
-
         Returns:
             any: State of the pin.
         """
-        
-        response = False
-        
-        # Local GPIO.
-        def set_local_gpio(pin, state):
-
-            state = False
-
-            if self.is_gpio_off(pin):
-                state = False
 
-            if self.is_gpio_nothing(pin):
-                raise ValueError("Pin can not be None or empty string.")
+        response = False
 
-            # Make is bool.
-            state = bool(value)
+        # Local GPIO.
+        def set_local_gpio(handle):
 
-            # Inversion
-            if self.is_gpio_inverted(pin):
-                state = not state
+            # Make is bool. Inversion
+            state = handle.polarity(value)
 
-            gpio = self._gpio_map[pin]
-            self.__DORO[gpio] = state
+            self.__DORO[handle.local] = state
             # Write device digital & relay outputs.
             request = self.__black_island.generate_request("SetRelays", SetRelays=self.__DORO)
-            cw_response = self.__modbus_rtu_clients[0].execute(request)
+            cw_response = self.__transaction_queues[0].execute(request, Priority.Actuator)
 
             if cw_response is not None:
                 if cw_response.isError():
-                    GlobalErrorHandler.log_hardware_malfunction(self.__logger, "Local GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(pin, self))
+                    GlobalErrorHandler.log_hardware_malfunction(self.__logger, "Local GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(handle.pin, self))
                     state = False
             else:
-                GlobalErrorHandler.log_hardware_malfunction(self.__logger, "Local GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(pin, self))
+                GlobalErrorHandler.log_hardware_malfunction(self.__logger, "Local GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(handle.pin, self))
                 state = False
-            
+
             # self.__logger.debug("digital_write({}, {}, {})".format(self.model, pin, value))
             return state
 
         # Remote GPIO.
-        def set_remote_gpio(pin, state):
+        def set_remote_gpio(handle):
 
-            state = False
+            # Make is bool. Inversion
+            state = handle.polarity(value)
 
-            if self.is_gpio_off(pin):
+            if not handle.uart in self.__transaction_queues:
+                GlobalErrorHandler.log_missing_resource(self.__logger, "Missing MODBUS-RTU UART{} interface".format(handle.uart))
                 return False
 
-            if self.is_gpio_nothing(pin):
-                raise ValueError("Pin can not be None or empty string.")
-
-            # Make is bool.
-            state = bool(value)
-
-            # Inversion
-            if self.is_gpio_inverted(pin):
-                state = not state
-
-            remote_gpio = self.parse_remote_gpio(pin)
-
-            if remote_gpio["mb_fc"] == FunctionCode.WriteSingleCoil.value:
-                write_response = self.__modbus_rtu_clients[remote_gpio["uart"]].write_coil(
-                    remote_gpio["io_reg"]+remote_gpio["io_index"],
+            # Staged in the image, written on flush.
+            if handle.mb_fc in (FunctionCode.WriteSingleCoil.value,\
+                FunctionCode.WriteMultipleCoils.value):
+                self.__remote_io.write_coil(
+                    handle.uart,
+                    handle.mb_id,
+                    handle.address,
                     value,
-                    remote_gpio["mb_id"])
+                    handle.mb_fc == FunctionCode.WriteSingleCoil.value)
 
-                if not write_response.isError():
-                    response = True
-                else:
-                    GlobalErrorHandler.log_hardware_malfunction(self.__logger, "GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(pin, self))
+            return state
 
-            elif remote_gpio["mb_fc"] == FunctionCode.WriteMultipleCoils.value:
-                write_response = self.__modbus_rtu_clients[remote_gpio["uart"]].write_coils(
-                    remote_gpio["io_reg"]+remote_gpio["io_index"],
-                    [value],
-                    remote_gpio["mb_id"])
+        def set_gpio(pin):
 
-                if not write_response.isError():
-                    response = True
-                else:
-                    GlobalErrorHandler.log_hardware_malfunction(self.__logger, "GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(pin, self))
+            if self.is_gpio_nothing(pin):
+                raise ValueError("Pin can not be None or empty string.")
 
-            return state
+            try:
+                handle = self.compile_gpio(pin)
+            except ValueError:
+                GlobalErrorHandler.log_hardware_malfunction(self.__logger, "Remote GPIO: {} @ {} Pin does not exists in pin map.".format(pin, self))
+                return False
 
-        if isinstance(pin, str):
-            if self.is_gpio_off(pin):
-                return response
-            elif self.is_gpio_local(pin):
-                response = set_local_gpio(pin, value)
-            elif self.is_gpio_remote(pin):
-                response = set_remote_gpio(pin, value)
+            if handle.off:
+                return False
+            elif handle.remote:
+                return set_remote_gpio(handle)
             else:
-                GlobalErrorHandler.log_hardware_malfunction(self.__logger, "Remote GPIO: {} @ {} Pin does not exists in pin map.".format(pin, self))
+                return set_local_gpio(handle)
 
-        elif isinstance(pin, list):
+        if isinstance(pin, list):
             # Go trough all pins.
             for p in pin:
                 if self.is_gpio_off(p):
                     break
-                elif self.is_gpio_local(p):
-                    response = set_local_gpio(p, value)
-                elif self.is_gpio_remote(p):
-                    response = set_remote_gpio(p, value)
-                else:
-                    GlobalErrorHandler.log_hardware_malfunction(self.__logger, "Remote GPIO: {} @ {} Pin does not exists in pin map.".format(pin, self))
+                response = set_gpio(p)
+
+        elif isinstance(pin, (str, GpioHandle)):
+            response = set_gpio(pin)
 
         else:
-             GlobalErrorHandler.log_missing_resource(f"Pin ({pin}) does not confirm list or str.")
+             GlobalErrorHandler.log_missing_resource(self.__logger, f"Pin ({pin}) does not confirm list or str.")
 
         return response
 
@@ -515,7 +500,7 @@ class ZL101PCC(BaseController):
 
         Parameters
         ----------
-        pin : str
+        pin : str/GpioHandle
             Pin index.
 
         value : int
@@ -527,72 +512,67 @@ class ZL101PCC(BaseController):
             State of the pin.
         """
 
-        if self.is_gpio_off(pin):
-            return False
+        handle = self.compile_gpio(pin)
 
-        if self.is_gpio_nothing(pin):
-            raise ValueError("Pin can not be None or empty string.")
+        if handle.off:
+            return False
 
         value = int(value)
 
         response = False
 
+        # Remote GPIO.
+        if handle.remote:
+
+            # self.__logger.debug(f"GPIO: {handle}")
+
+            if not handle.uart in self.__transaction_queues:
+                GlobalErrorHandler.log_missing_resource(self.__logger, "Missing MODBUS-RTU UART{} interface".format(handle.uart))
+                return False
+
+            # Staged in the image, written on flush.
+            if handle.mb_fc == FunctionCode.WriteSingleHoldingRegister.value:
+                self.__remote_io.write_register(
+                    handle.uart,
+                    handle.mb_id,
+                    handle.address,
+                    value)
+                response = True
+
+            elif handle.mb_fc == FunctionCode.WriteMultipleHoldingRegisters.value:
+                result_value = l_scale(value, self.__analog_limits, [0, 24000])
+                result_value = int(result_value)
+                self.__remote_io.write_register(
+                    handle.uart,
+                    handle.mb_id,
+                    handle.address,
+                    result_value,
+                    False)
+                response = True
+
         # Local GPIO.
-        if self.is_gpio_local(pin):
+        else:
 
             # Transform values from 0-10V to device specific values.
             param_name = "SetAnalogOutputs"
             parameter = self.__black_island.get_parameter_by_name(param_name)
             result_value = l_scale(value, self.__analog_limits, parameter.limits)
-            self.__AO[self._gpio_map[pin]] = int(result_value)
+            self.__AO[handle.local] = int(result_value)
 
             # Write device analog outputs.
             request = self.__black_island\
                 .generate_request(param_name, SetAnalogOutputs=self.__AO)
-            hrw_response = self.__modbus_rtu_clients[0].execute(request)
+            hrw_response = self.__transaction_queues[0].execute(request, Priority.Actuator)
             if hrw_response is not None:
                 if not hrw_response.isError():
                     response = True
                 else:
-                    GlobalErrorHandler.log_hardware_malfunction(self.__logger, "GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(pin, self))
+                    GlobalErrorHandler.log_hardware_malfunction(self.__logger, "GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(handle.pin, self))
             else:
-                GlobalErrorHandler.log_hardware_malfunction(self.__logger, "GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(pin, self))
+                GlobalErrorHandler.log_hardware_malfunction(self.__logger, "GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(handle.pin, self))
 
             # self.__logger.debug("analog_write({}, {}, {})".format(self.model, pin, value))
 
-        # Remote GPIO.
-        elif self.is_gpio_remote(pin):
-            remote_gpio = self.parse_remote_gpio(pin)
-
-            # self.__logger.debug(f"GPIO: {remote_gpio}")
-
-            if remote_gpio["mb_fc"] == FunctionCode.WriteSingleHoldingRegister.value:
-                write_response = self.__modbus_rtu_clients[remote_gpio["uart"]].write_register(
-                    remote_gpio["io_reg"]+remote_gpio["io_index"],
-                    value,
-                    remote_gpio["mb_id"])
-
-                if not write_response.isError():
-                    response = True
-                else:
-                    GlobalErrorHandler.log_hardware_malfunction(self.__logger, "GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(pin, self))
-
-            elif remote_gpio["mb_fc"] == FunctionCode.WriteMultipleHoldingRegisters.value:
-                result_value = l_scale(value, self.__analog_limits, [0, 24000])
-                result_value = int(result_value)
-                write_response = self.__modbus_rtu_clients[remote_gpio["uart"]].write_registers(
-                    remote_gpio["io_reg"]+remote_gpio["io_index"],
-                    [result_value],
-                    remote_gpio["mb_id"])
-
-                if not write_response.isError():
-                    response = True
-                else:
-                    GlobalErrorHandler.log_hardware_malfunction(self.__logger, "GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(pin, self))
-
-        else:
-            raise ValueError("Pin does not exists in pin map.")
-
         return response
 
     def analog_read(self, pin):
@@ -600,7 +580,7 @@ class ZL101PCC(BaseController):
 
         Parameters
         ----------
-        pin : str
+        pin : str/GpioHandle
             Pin index.
 
         value : int
@@ -612,69 +592,96 @@ class ZL101PCC(BaseController):
             State of the pin.
         """
 
-        if self.is_gpio_off(pin):
-            return False
+        handle = self.compile_gpio(pin)
 
-        if self.is_gpio_nothing(pin):
-            raise ValueError("Pin can not be None or empty string.")
+        if handle.off:
+            return False
 
         value = 0.0
         state = {"value": value, "min": 0.0, "max": 10.0}
 
+        # Remote GPIO.
+        if handle.remote:
+
+            self.__logger.debug(f"GPIO: {handle}")
+
+            # write_response = self.__modbus_rtu_clients[handle.uart].write_coil(
+            #     handle.address,
+            #     state,
+            #     handle.mb_id)
+
+            # if not write_response.isError():
+            #     response = True
+
         # Local GPIO.
-        if self.is_gpio_local(pin):
+        else:
 
             # Read device analog inputs.
             param_name = "GetAnalogInputs"
             request = self.__black_island.generate_request(param_name)
-            irr_response = self.__modbus_rtu_clients[0].execute(request)
+            irr_response = self.__transaction_queues[0].execute(request, Priority.Control)
             if irr_response is not None:
                 if not irr_response.isError():
                     self.__AI = irr_response.registers
                 else:
-                    GlobalErrorHandler.log_hardware_malfunction(self.__logger, "GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(pin, self))
+                    GlobalErrorHandler.log_hardware_malfunction(self.__logger, "GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(handle.pin, self))
             else:
-                GlobalErrorHandler.log_hardware_malfunction(self.__logger, "GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(pin, self))
+                GlobalErrorHandler.log_hardware_malfunction(self.__logger, "GPIO: {} @ {} malfunctioning, check modbus cables and connections.".format(handle.pin, self))
 
             # Scale analog inputs value in 0 to 10 volts.
-            input_value = self.__AI[self._gpio_map[pin]]
+            input_value = self.__AI[handle.local]
             param = self.__black_island.get_parameter_by_name(param_name)
             state["value"] = l_scale(input_value, param.limits, self.__analog_limits)
 
             # self.__logger.debug("analog_read({}, {})".format(self.model, pin))
 
-        # Remote GPIO.
-        elif self.is_gpio_remote(pin):
-            remote_gpio = self.parse_remote_gpio(pin)
+        return state
 
-            self.__logger.debug(f"GPIO: {remote_gpio}")
+    def submit_mb_request(self, request, uart, priority=None, timeout=None):
+        """Put modbus request in the transaction queue of the UART.
 
-            # write_response = self.__modbus_rtu_clients[remote_gpio["uart"]].write_coil(
-            #     remote_gpio["io_reg"]+remote_gpio["io_index"],
-            #     state,
-            #     remote_gpio["mb_id"])
+        Args:
+            request (ModbusRequest): PyMODBUS request instance.
+            uart (int): UART index.
+            priority (Priority, optional): Transaction priority.
+                Defaults to the priority of the function code.
+            timeout (float, optional): Seconds to wait in the queue before expiration.
+                Defaults to no expiration.
 
-            # if not write_response.isError():
-            #     response = True
+        Returns:
+            Future: Future of the PyMODBUS response instance.
+        """
 
-        else:
-            raise ValueError("Pin does not exists in pin map.")
+        if not uart in self.__transaction_queues:
+            GlobalErrorHandler.log_missing_resource(self.__logger, "Missing MODBUS-RTU UART{} interface".format(uart))
+            future = Future()
+            future.set_result(None)
+            return future
 
-        return state
+        return self.__transaction_queues[uart].submit(request, priority, timeout)
 
-    def execute_mb_request(self, request, uart):
+    def execute_mb_request(self, request, uart, priority=None, timeout=None):
         """Execute modbus request.
 
         Args:
             request (ModbusRequest): PyMODBUS request instance.
+            uart (int): UART index.
+            priority (Priority, optional): Transaction priority.
+                Defaults to the priority of the function code.
+            timeout (float, optional): Seconds to wait in the queue before expiration.
+                Defaults to no expiration.
 
         Returns:
-            ModbusResponse: PyMODBUS response instance.
+            ModbusResponse: PyMODBUS response instance or None when the request expires.
         """
+
         response = None
 
-        if self.__modbus_rtu_clients is not None:
-            response = self.__modbus_rtu_clients[uart].execute(request)
+        try:
+            response = self.submit_mb_request(request, uart, priority, timeout).result()
+
+        except TimeoutError:
+            GlobalErrorHandler.log_hardware_malfunction(self.__logger, "MODBUS request @ UART{} expired in the queue.".format(uart))
 
         return response
 
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+from collections import deque
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class DeferredRegisters:
+    """Registers of a plugin that runs in a worker thread.
+    Reading goes to the registers. Writing is queued and applied by the main loop,
+    so the handlers of the registers run only on the main thread."""
+
+#region Constructor
+
+    def __init__(self, registers):
+        """Constructor
+
+        Args:
+            registers (Registers): Registers of the zone.
+        """
+
+        self.__registers = registers
+        """Registers of the zone.
+        """
+
+        self.__writes = deque()
+        """Queued writes of names and values.
+        """
+
+#endregion
+
+#region Properties
+
+    @property
+    def registers(self):
+        """Registers of the zone.
+
+        Returns:
+            Registers: Registers.
+        """
+
+        return self.__registers
+
+    @property
+    def pending(self):
+        """Count of the queued writes.
+
+        Returns:
+            int: Count.
+        """
+
+        return len(self.__writes)
+
+#endregion
+
+#region Public Methods
+
+    def __getattr__(self, name):
+
+        return getattr(self.__registers, name)
+
+    def __iter__(self):
+
+        return iter(self.__registers)
+
+    def __len__(self):
+
+        return len(self.__registers)
+
+    def write(self, name: str, value):
+        """Queue write in specific register.
+
+        Args:
+            name (str): The name.
+            value (Any): The value.
+
+        Returns:
+            bool: Execution status.
+        """
+
+        if self.__registers.by_name(name) is None:
+            return False
+
+        self.__writes.append((name, value))
+
+        return True
+
+    def apply(self):
+        """Write the queued values. Call it from the main loop.
+
+        Returns:
+            int: Count of the written values.
+        """
+
+        count = 0
+
+        while True:
+            try:
+                name, value = self.__writes.popleft()
+            except IndexError:
+                break
+
+            self.__registers.write(name, value)
+            count += 1
+
+        return count
+
+#endregion
@@ -22,7 +22,9 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
+import sys
 import time
+import weakref
 from enum import Enum
 import json
 
@@ -135,11 +137,252 @@ class Scope(Enum):
 
         return out_scope
 
+#region Coercers
+
+def _bool_to_value(value):
+    """Convert default/CSV value to bool."""
+
+    out_value = None
+
+    if isinstance(value, bool):
+        out_value = value
+
+    elif value == "false":
+        out_value = False
+
+    elif value == "true":
+        out_value = True
+
+    return out_value
+
+def _json_to_value(value):
+    """Convert default/CSV value to JSON object."""
+
+    if isinstance(value, (list, dict)):
+        return value
+
+    if not isinstance(value, str):
+        raise TypeError("Unsupported data type: {}".format(type(value)))
+
+    # Remove first "
+    if value.startswith("\""):
+        value = value[1:]
+
+    # Remove last "
+    if value.endswith("\""):
+        value = value[:-1]
+
+    try:
+        return json.loads(value)
+
+    except ValueError:
+        # Convert single quotes to double, only when it is not valid JSON.
+        return json.loads(value.replace("\'", "\""))
+
+def _any_to_value(value):
+    """Keep the value as it is."""
+
+    return value
+
+_VALUE_COERCERS = {
+    "bool": _bool_to_value,
+    "int": int,
+    "float": float,
+    "json": _json_to_value,
+}
+"""Default/CSV value coercers by data type."""
+
+def _any_from_raw(raw):
+    """Convert raw (ERP) value by its content."""
+
+    out_value = raw
+
+    if isinstance(raw, str):
+
+        if raw == "false":
+            out_value = False
+
+        elif raw == "true":
+            out_value = True
+
+        elif raw.startswith("[") and raw.endswith("]"):
+            out_value = json.loads(raw)
+
+        elif raw.startswith("{") and raw.endswith("}"):
+            out_value = json.loads(raw)
+
+    return out_value
+
+def _json_from_raw(raw):
+    """Convert raw (ERP) value of JSON register."""
+
+    if isinstance(raw, str) and len(raw) > 1:
+
+        first = raw[0]
+        last = raw[-1]
+        if (first == "[" and last == "]") or (first == "{" and last == "}"):
+            return json.loads(raw)
+
+    return _any_from_raw(raw)
+
+_RAW_COERCERS = {
+    "json": _json_from_raw,
+}
+"""Raw (ERP) value coercers by data type of the register."""
+
+#endregion
+
+class RegisterSchema:
+    """Static metadata of the register. Instances are shared (flyweight)
+    between all registers that have the same metadata and must not be changed.
+    """
+
+#region Attributes
+
+    __slots__ = ("__plugin_name", "__description", "__range", "__limit", "__profiles", "__weakref__")
+
+    __table = weakref.WeakValueDictionary()
+    """Schema table. Metadata key -> shared schema instance.
+    """
+
+#endregion
+
+#region Constructor
+
+    def __init__(self, plugin_name="", description="", range="", limit=0.0, profiles=""):
+        """Constructor. Use RegisterSchema.get to obtain the shared instance.
+
+        Args:
+            plugin_name (str, optional): Plugin name. Defaults to "".
+            description (str, optional): Verbal register description. Defaults to "".
+            range (str, optional): Range. Defaults to "".
+            limit (float, optional): Limit. Defaults to 0.0.
+            profiles (str, optional): Profiles that register are used from. Defaults to "".
+        """
+
+        self.__plugin_name = RegisterSchema.__intern(plugin_name)
+        self.__description = description
+        self.__range = RegisterSchema.__intern(range)
+        self.__limit = limit
+        self.__profiles = RegisterSchema.__intern(profiles)
+
+#endregion
+
+#region Properties
+
+    @property
+    def plugin_name(self):
+        """Plugin name."""
+
+        return self.__plugin_name
+
+    @property
+    def description(self):
+        """Description"""
+
+        return self.__description
+
+    @property
+    def range(self):
+        """Range!"""
+
+        return self.__range
+
+    @property
+    def limit(self):
+        """Limit!"""
+
+        return self.__limit
+
+    @property
+    def profiles(self):
+        """Profiles that register are used in."""
+
+        return self.__profiles
+
+#endregion
+
+#region Public Methods
+
+    def replace(self, **kwargs):
+        """Get the shared schema with some of the fields replaced.
+
+        Returns:
+            RegisterSchema: Schema instance.
+        """
+
+        fields = {
+            "plugin_name": self.__plugin_name,
+            "description": self.__description,
+            "range": self.__range,
+            "limit": self.__limit,
+            "profiles": self.__profiles,
+        }
+        fields.update(kwargs)
+
+        return RegisterSchema.get(**fields)
+
+    def __reduce__(self):
+        """Pickle as call to get, so the loaded schemas are shared too.
+        """
+
+        return (RegisterSchema.get, (self.__plugin_name, self.__description, self.__range,\
+            self.__limit, self.__profiles))
+
+#endregion
+
+#region Private Static Methods
+
+    @staticmethod
+    def __intern(value):
+
+        if isinstance(value, str):
+            value = sys.intern(value)
+
+        return value
+
+#endregion
+
+#region Public Static Methods
+
+    @staticmethod
+    def get(plugin_name="", description="", range="", limit=0.0, profiles=""):
+        """Get the shared schema instance for the metadata.
+
+        Returns:
+            RegisterSchema: Schema instance.
+        """
+
+        key = (plugin_name, description, range, limit, profiles)
+
+        try:
+            schema = RegisterSchema.__table.get(key)
+
+        # Not hashable metadata can not be shared.
+        except TypeError:
+            return RegisterSchema(plugin_name, description, range, limit, profiles)
+
+        if schema is None:
+            schema = RegisterSchema(plugin_name, description, range, limit, profiles)
+            RegisterSchema.__table[key] = schema
+
+        return schema
+
+#endregion
+
 class Register:
     """Register"""
 
 #region Attributes
 
+    __slots__ = ("__name", "__ts", "__value", "__scope", "__handlers", "__force", "__schema", "__trackers",\
+        "__coercer", "__raw")
+
+    __scope_revision = 0
+    """Incremented each time the scope of any register is changed.
+    Used by the registers containers to invalidate their scope index.
+    """
+
 #endregion
 
 #region Constructor
@@ -153,7 +396,7 @@ class Register:
             Current class instance.
         """
 
-        self.__name = name
+        self.__name = sys.intern(name)
         """Register name.
         """
 
@@ -169,31 +412,27 @@ class Register:
         """Scope of register.
         """
 
-        self.__handlers = []
+        self.__handlers = None
         """Update handler.
         """
 
         self.__force = False
         """"""
 
-        self.__plugin_name = ""
-        """Plugin name.
+        self.__schema = RegisterSchema.get()
+        """Shared static metadata (plugin name, description, range, limit and profiles).
         """
 
-        self.__description = ""
-        """Verbal register description.
+        self.__trackers = None
+        """Change trackers of the registers containers.
         """
 
-        self.__range = ""
-        """Range!
+        self.__coercer = None
+        """Raw value coercer. Resolved on demand for the current data type.
         """
 
-        self.__limit = 0.0
-        """Limit!
-        """
-
-        self.__profiles = ""
-        """Profiles that register are used from.
+        self.__raw = None
+        """Raw text that the current JSON value is parsed from.
         """
 
     def __str__(self):
@@ -309,8 +548,18 @@ class Register:
         # Update time.
         self.__ts = int(time.time())
 
+        # Resolve the coercer again if the data type is changed.
+        if type(value) is not type(self.__value):
+            self.__coercer = None
+
         # Update value.
         self.__value = value # here OK
+        self.__raw = None
+
+        # Notify the containers that track the changes.
+        if self.__trackers is not None:
+            for tracker in self.__trackers:
+                tracker(self)
 
         self.update()
 
@@ -362,8 +611,13 @@ class Register:
             Value of the scope flag.
         """
 
+        if self.__scope == value:
+            return
+
         self.__scope = value
 
+        Register.__scope_revision += 1
+
     @property
     def update_handlers(self):
         """Returns list of the handlers.
@@ -374,6 +628,10 @@ class Register:
             List of the handlers.
         """
 
+        # Most of the registers have no handlers, so the list is created on demand.
+        if self.__handlers is None:
+            self.__handlers = []
+
         return self.__handlers
 
     @update_handlers.setter
@@ -417,49 +675,49 @@ class Register:
     def plugin_name(self):
         """Plugin Name"""
 
-        return self.__plugin_name
+        return self.__schema.plugin_name
 
     @plugin_name.setter
     def plugin_name(self, value):
         """Plugin name."""
 
-        self.__plugin_name = value
+        self.__schema = self.__schema.replace(plugin_name=value)
 
     @property
     def description(self):
         """Description"""
 
-        return self.__description
+        return self.__schema.description
 
     @description.setter
     def description(self, value):
         """Description"""
 
-        self.__description = value
+        self.__schema = self.__schema.replace(description=value)
 
     @property
     def range(self):
         """Range!"""
 
-        return self.__range
+        return self.__schema.range
 
     @range.setter
     def range(self, value):
         """Range!"""
 
-        self.__range = value
+        self.__schema = self.__schema.replace(range=value)
 
     @property
     def limit(self):
         """Limit!"""
 
-        return self.__limit
+        return self.__schema.limit
 
     @limit.setter
     def limit(self, value):
         """Limit!"""
 
-        self.__limit = value
+        self.__schema = self.__schema.replace(limit=value)
 
     @property
     def profiles(self):
@@ -468,7 +726,7 @@ class Register:
         Returns:
             str: Profiles list that are separated by "|"
         """
-        return self.__profiles
+        return self.__schema.profiles
 
     @profiles.setter
     def profiles(self, value: (Profiles)):
@@ -477,7 +735,7 @@ class Register:
         Args:
             value (str): Profiles list that are separated by "|"
         """
-        self.__profiles = value
+        self.__schema = self.__schema.replace(profiles=value)
 
 #endregion
 
@@ -486,11 +744,62 @@ class Register:
     def update(self):
 
         # Execute CB.
-        if self.update_handlers is not None:
-            for item in self.update_handlers:
+        if self.__handlers is not None:
+            for item in self.__handlers:
                 if item is not None:
                     item(self)
 
+    def set_raw(self, raw):
+        """Set the value from its raw representation, as it comes from the ERP.
+        Text of JSON values is kept, so the same text is not parsed twice.
+
+        Args:
+            raw (mixed): Raw value.
+        """
+
+        # Same JSON text as the current value.
+        if self.__raw is not None and raw == self.__raw:
+            return
+
+        if self.__coercer is None:
+            self.__coercer = _RAW_COERCERS.get(self.data_type, _any_from_raw)
+
+        value = self.__coercer(raw)
+
+        self.value = value
+
+        if isinstance(raw, str) and isinstance(value, (list, dict)):
+            self.__raw = raw
+
+    def add_tracker(self, tracker):
+        """Add change tracker. It is called on every change of the value.
+
+        Args:
+            tracker (function): Callback pointer.
+        """
+
+        if self.__trackers is None:
+            self.__trackers = []
+
+        if tracker not in self.__trackers:
+            self.__trackers.append(tracker)
+
+    def remove_tracker(self, tracker):
+        """Remove change tracker.
+
+        Args:
+            tracker (function): Callback pointer.
+        """
+
+        if self.__trackers is not None and tracker in self.__trackers:
+            self.__trackers.remove(tracker)
+
+    def __reduce__(self):
+        """Pickle the name, value, scope and schema. The handlers and the trackers are not stored.
+        """
+
+        return (Register.restore, (self.__name, self.__value, self.__scope, self.__schema))
+
     def get_json(self):
         """Converts register in to JSON ready dictionary.
 
@@ -517,71 +826,54 @@ class Register:
 #region Public Static Methods
 
     @staticmethod
-    def create_profile(*profiles):
-        return f"|".join(profiles)
-
-    @staticmethod
-    def to_value(data_type, value):
-
-        out_value = None
-
-        # bool
-        if data_type == "bool":
-            value_type = type(value)
-
-            if value_type == bool:
-                out_value = value
-
-            else:
-                if value == "false":
-                    out_value = False
-
-                if value == "true":
-                    out_value = True
-
-        # int
-        elif data_type == "int":
-            out_value = int(value)
+    def restore(name, value, scope, schema):
+        """Create register from pickled fields, without the setters checks.
 
-        # float
-        elif data_type == "float":
-            out_value = float(value)
-
-        # json
-        elif data_type == "json":
-            value_type = type(value)
+        Args:
+            name (str): Register name.
+            value (mixed): Value.
+            scope (Scope): Scope.
+            schema (RegisterSchema): Shared static metadata.
 
-            if value_type == list:
-                out_value = value
+        Returns:
+            Register: Register instance.
+        """
 
-            elif value_type == dict:
-                out_value = value
+        register = Register(name)
+        register.__value = value
+        register.__scope = scope
+        register.__schema = schema
+        register.__ts = int(time.time())
 
-            elif value_type == str:
+        return register
 
-                # Remove first "
-                if value.startswith("\""):
-                    value = value[1:]
+    @staticmethod
+    def scope_revision():
+        """Returns the revision of the registers scopes.
 
-                # Remove last "
-                if value.endswith("\""):
-                    value = value[:-1]
+        Returns:
+            int: Number of scope changes since start.
+        """
 
-                # Convert single quotes to double.
-                value = value.replace("\'", "\"") 
+        return Register.__scope_revision
 
-                # Converts to JSON.
-                value = json.loads(value)
+    @staticmethod
+    def create_profile(*profiles):
+        return f"|".join(profiles)
 
-                out_value = value
+    @staticmethod
+    def to_value(data_type, value):
+        """Convert default/CSV value to the data type.
 
-            else:
-                raise TypeError("Unsupported data type: {}".format(value_type))
+        Args:
+            data_type (str): Data type string.
+            value (any): Value input.
 
-        else:
-            out_value = value
+        Returns:
+            any: Value of the data type.
+        """
 
-        return out_value
+        return _VALUE_COERCERS.get(data_type, _any_to_value)(value)
 
     @staticmethod
     def from_value(data_type: str, value):
@@ -22,8 +22,11 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
+import os
 import time
 import json
+import pickle
+from threading import Lock
 
 from data.register import Register
 
@@ -32,6 +35,8 @@ from utils.logger import get_logger
 from services.global_error_handler.global_error_handler import GlobalErrorHandler
 
 from data.register import Scope
+from data.register import Profiles
+from data.register import RegisterSchema
 
 #region File Attributes
 
@@ -73,12 +78,23 @@ class Registers(list):
     """Logger
     """
 
+    __snapshot_version = 1
+    """Format version of the binary snapshot. Increment it when Register pickling is changed.
+    """
+
+    __compiled_version = 2
+    """Format version of the compiled registers. Increment it when Register pickling is changed.
+    """
+
 #endregion
 
 #region Constructor
 
-    def __init__(self):
+    def __init__(self, registers=None):
         """Constructor
+
+        Args:
+            registers (iterable, optional): Initial registers. Defaults to None.
         """
 
         super().__init__()
@@ -86,35 +102,289 @@ class Registers(list):
         # Create logger.
         self.__logger = get_logger(__name__)
 
+        self.__names_index = {}
+        """Register by name index. (First register with the name wins.)
+        """
+
+        self.__groups_index = {}
+        """Registers by plugin prefix (base name) index.
+        """
+
+        self.__scope_index = {}
+        """Registers by scope mask index. Built on demand.
+        """
+
+        self.__scope_index_revision = -1
+        """Scope revision that the scope index is built for.
+        """
+
+        self.__consumers = {}
+        """Changes consumers. Consumer name -> filter and changed registers.
+        """
+
+        self.__changes_lock = Lock()
+        """Changes lock. Registers are written from the ERP server thread too.
+        """
+
+        if registers is not None:
+            self.extend(registers)
+
 #endregion
 
-#region Private Methods
+#region List Methods
+
+    def append(self, register):
+        """Append register.
+
+        Args:
+            register (Register): The register.
+        """
+
+        super().append(register)
+        self.__index_add(register)
 
-    def __preprocess_value(self, value):
+        if self.__consumers:
+            register.add_tracker(self.__on_register_change)
+            self.__on_register_change(register)
 
-        out_value = None
+    def extend(self, registers):
+        """Extend with registers.
 
-        if isinstance(value, str):
+        Args:
+            registers (iterable): The registers.
+        """
 
-            if value == "false":
-                out_value = False
+        for register in registers:
+            self.append(register)
 
-            elif value == "true":
-                out_value = True
+    def __iadd__(self, registers):
 
-            elif value.startswith("[") and value.endswith("]"):
-                out_value = json.loads(value)
+        self.extend(registers)
 
-            elif value.startswith("{") and value.endswith("}"):
-                out_value = json.loads(value)
+        return self
 
-            else:
-                out_value = value
+    def insert(self, index, register):
+        """Insert register before index.
 
-        else:
-            out_value = value
+        Args:
+            index (int): Position.
+            register (Register): The register.
+        """
+
+        super().insert(index, register)
+        self.__index_rebuild()
+
+    def remove(self, register):
+        """Remove first occurrence of the register.
+
+        Args:
+            register (Register): The register.
+        """
+
+        super().remove(register)
+        self.__index_remove(register)
+        self.__untrack(register)
+
+    def pop(self, index=-1):
+        """Remove and return register at index.
+
+        Args:
+            index (int, optional): Position. Defaults to -1.
+
+        Returns:
+            Register: The register.
+        """
+
+        register = super().pop(index)
+        self.__index_remove(register)
+        self.__untrack(register)
+
+        return register
+
+    def clear(self):
+        """Remove all registers.
+        """
+
+        super().clear()
+        self.__index_rebuild()
+
+    def __setitem__(self, index, value):
+
+        super().__setitem__(index, value)
+        self.__index_rebuild()
+
+    def __delitem__(self, index):
+
+        super().__delitem__(index)
+        self.__index_rebuild()
+
+    def sort(self, *args, **kwargs):
+        """Sort the registers in place.
+        """
+
+        super().sort(*args, **kwargs)
+        self.__index_rebuild()
+
+    def reverse(self):
+        """Reverse the registers in place.
+        """
+
+        super().reverse()
+        self.__index_rebuild()
+
+#endregion
+
+#region Private Methods (Index)
+
+    def __index_add(self, register):
+        """Add register to the indexes.
+
+        Args:
+            register (Register): The register.
+        """
+
+        if register.name not in self.__names_index:
+            self.__names_index[register.name] = register
+
+        group = self.__groups_index.get(register.base_name)
+        if group is None:
+            group = []
+            self.__groups_index[register.base_name] = group
+        group.append(register)
+
+        self.__scope_index_revision = -1
+
+    def __index_remove(self, register):
+        """Remove register from the indexes. Should be called after removal from the list.
+
+        Args:
+            register (Register): The register.
+        """
+
+        if self.__names_index.get(register.name) is register:
+            del self.__names_index[register.name]
+
+            # Fall back to the next register with the same name.
+            for item in self:
+                if item.name == register.name:
+                    self.__names_index[item.name] = item
+                    break
+
+        group = self.__groups_index.get(register.base_name)
+        if group is not None:
+            for index, item in enumerate(group):
+                if item is register:
+                    del group[index]
+                    break
+
+            if not group:
+                del self.__groups_index[register.base_name]
+
+        self.__scope_index_revision = -1
+
+    def __index_rebuild(self):
+        """Rebuild all indexes from the list content.
+        """
+
+        self.__names_index = {}
+        self.__groups_index = {}
+
+        for register in self:
+            self.__index_add(register)
+
+            if self.__consumers:
+                register.add_tracker(self.__on_register_change)
+
+        self.__scope_index_revision = -1
+
+    def __scope_bucket(self, scope):
+        """Get registers that match the scope mask.
+
+        Args:
+            scope (Scope): Scope of action.
+
+        Returns:
+            list: Registers with scope.
+        """
+
+        # Any scope change makes the cached buckets invalid.
+        revision = Register.scope_revision()
+        if self.__scope_index_revision != revision:
+            self.__scope_index = {}
+            self.__scope_index_revision = revision
+
+        bucket = self.__scope_index.get(scope.value)
+        if bucket is None:
+            bucket = []
+            for register in self:
+                if (scope.value & register.scope.value) > 0:
+                    bucket.append(register)
+
+            self.__scope_index[scope.value] = bucket
+
+        return bucket
+
+#endregion
+
+#region Private Methods (Changes)
+
+    def __is_consumed_by(self, consumer, register):
+        """Check if the register passes the filter of the consumer.
+
+        Args:
+            consumer (dict): The consumer.
+            register (Register): The register.
+
+        Returns:
+            bool: Passed the filter.
+        """
+
+        if consumer["scope"] is not None:
+            if (consumer["scope"].value & register.scope.value) == 0:
+                return False
+
+        if consumer["names"] is not None:
+            if register.name not in consumer["names"]:
+                return False
+
+        return True
+
+    def __on_register_change(self, register):
+        """Record the changed register for all consumers.
+
+        Args:
+            register (Register): The register.
+        """
+
+        # Removed or shadowed by another register with the same name.
+        if self.__names_index.get(register.name) is not register:
+            return
+
+        with self.__changes_lock:
+            for consumer in self.__consumers.values():
+                if self.__is_consumed_by(consumer, register):
+                    consumer["changes"][register.name] = register
+
+    def __untrack(self, register):
+        """Stop tracking the changes of removed register.
 
-        return out_value
+        Args:
+            register (Register): The register.
+        """
+
+        if not self.__consumers:
+            return
+
+        # It may still be in the list as duplicate.
+        if self.__names_index.get(register.name) is register:
+            return
+
+        register.remove_tracker(self.__on_register_change)
+
+        with self.__changes_lock:
+            for consumer in self.__consumers.values():
+                if consumer["changes"].get(register.name) is register:
+                    del consumer["changes"][register.name]
 
 #endregion
 
@@ -139,17 +409,16 @@ class Registers(list):
         # Go through registers.
         for name in registers:
 
-            register = None
+            register = self.__names_index.get(name)
 
             # Update registers.
-            if name in self.names():
-                register = self.by_name(name)
-                register.value = self.__preprocess_value(registers[name])
+            if register is not None:
+                register.set_raw(registers[name])
 
             # Add missing register.
             else:
                 register = Register(name)
-                register.value = self.__preprocess_value(registers[name])
+                register.set_raw(registers[name])
                 self.append(register)
 
                 GlobalErrorHandler.log_unexpected_register(self.__logger, register)
@@ -164,18 +433,96 @@ class Registers(list):
             bool: Exists or not.
         """
 
-        result = False
+        result = name in self.__names_index
 
-        for register in self:
-            if name in register.name:
-                result = True
-                break
+        # Partial names are still accepted.
+        if not result:
+            for register in self:
+                if name in register.name:
+                    result = True
+                    break
 
         if not result:
             GlobalErrorHandler.log_register_not_found(self.__logger, name)
 
         return result
 
+    def add_consumer(self, name: str, scope=None, names=None):
+        """Add changes consumer. All registers that pass the filter
+        are marked as changed for it, so the first drain gives the full state.
+
+        Args:
+            name (str): Name of the consumer.
+            scope (Scope, optional): Scope filter. Defaults to None.
+            names (list, optional): Names filter. Defaults to None.
+        """
+
+        if name is None:
+            raise ValueError("Name can not be None.")
+
+        if name == "":
+            raise ValueError("Name can not be empty string.")
+
+        if names is not None:
+            names = set(names)
+
+        # Start tracking with the first consumer.
+        if not self.__consumers:
+            for register in self:
+                register.add_tracker(self.__on_register_change)
+
+        with self.__changes_lock:
+            self.__consumers[name] = {"scope": scope, "names": names, "changes": {}}
+
+        self.reset_changes(name)
+
+    def reset_changes(self, name: str):
+        """Mark all registers of the consumer as changed.
+
+        Args:
+            name (str): Name of the consumer.
+        """
+
+        consumer = self.__consumers[name]
+
+        with self.__changes_lock:
+            for register in self.__names_index.values():
+                if self.__is_consumed_by(consumer, register):
+                    consumer["changes"][register.name] = register
+
+    def drain_changes(self, name: str):
+        """Take the registers changed since the last drain of the consumer.
+
+        Args:
+            name (str): Name of the consumer.
+
+        Returns:
+            Registers: Changed registers.
+        """
+
+        consumer = self.__consumers[name]
+
+        with self.__changes_lock:
+            changes = consumer["changes"]
+            consumer["changes"] = {}
+
+        return Registers(changes.values())
+
+    def restore_changes(self, name: str, registers):
+        """Return not delivered changes to the consumer.
+
+        Args:
+            name (str): Name of the consumer.
+            registers (list): Registers from the failed drain.
+        """
+
+        consumer = self.__consumers[name]
+
+        with self.__changes_lock:
+            for register in registers:
+                if self.__names_index.get(register.name) is register:
+                    consumer["changes"][register.name] = register
+
     def by_ts(self, ts):
         """Get registers with specified scope.
 
@@ -226,13 +573,7 @@ class Registers(list):
             list: Registers with scope.
         """
 
-        result = Registers()
-
-        for register in self:
-            if (scope.value & register.scope.value) > 0:
-                result.append(register)
-
-        return result
+        return Registers(self.__scope_bucket(scope))
 
     def by_key(self, key: str):
         """Get registers with specified key in name.
@@ -268,14 +609,7 @@ class Registers(list):
         if name == "":
             raise ValueError("Name can not be empty string.")
 
-        result = None
-
-        for register in self:
-            if name == register.name:
-                result = register
-                break
-
-        return result
+        return self.__names_index.get(name)
 
     def by_names(self, names: list):
         """Returns registers with specified name.
@@ -290,7 +624,7 @@ class Registers(list):
         filtered = Registers()
 
         for name in names:
-            selected = self.by_name(name)
+            selected = self.__names_index.get(name)
 
             if selected is not None:
                 filtered.append(selected)
@@ -366,9 +700,19 @@ class Registers(list):
 
         result = []
 
-        for register in self:
-            if register.name.startswith("{}.".format(name)):
-                result.append(register)
+        prefix = "{}.".format(name)
+
+        # Plugin prefix is the only key that is indexed.
+        if "." not in name:
+            group = self.__groups_index.get(name, [])
+            for register in group:
+                if register.name.startswith(prefix):
+                    result.append(register)
+
+        else:
+            for register in self:
+                if register.name.startswith(prefix):
+                    result.append(register)
 
         return result
 
@@ -379,12 +723,7 @@ class Registers(list):
             list: Names of the registers in list.
         """
 
-        base_names = []
-        for register in self:
-            if not register.base_name in base_names:
-                base_names.append(register.base_name)
-
-        return base_names
+        return list(self.__groups_index)
 
     def keys(self):
         """Return keys.
@@ -544,6 +883,137 @@ class Registers(list):
 
         return registers
 
+    @staticmethod
+    def from_snapshot(file_path="registers.json", snapshot_path=None):
+        """Load registers from the binary snapshot of the JSON or CSV file.
+        The snapshot is created on the first load and again when the source file
+        is changed, by its modification time and size.
+
+        Args:
+            file_path (str, optional): Source file. Defaults to "registers.json".
+            snapshot_path (str, optional): Snapshot file. Defaults to the source file with ".snapshot".
+
+        Returns:
+            Registers: Registers.
+        """
+
+        if snapshot_path is None:
+            snapshot_path = file_path + ".snapshot"
+
+        stat = os.stat(file_path)
+        key = (Registers.__snapshot_version, stat.st_mtime_ns, stat.st_size)
+
+        try:
+            with open(snapshot_path, "rb") as snapshot_file:
+                if pickle.load(snapshot_file) == key:
+                    return Registers(pickle.load(snapshot_file))
+
+        # Missing, old or broken snapshot, it is created again.
+        except Exception:
+            pass
+
+        if file_path.endswith("csv"):
+            registers = Registers.from_csv(file_path)
+        else:
+            registers = Registers.from_json(file_path)
+
+        try:
+            # Write it at once, so the concurrent loads do not see half of it.
+            temp_path = "{}.{}".format(snapshot_path, os.getpid())
+            with open(temp_path, "wb") as snapshot_file:
+                pickle.dump(key, snapshot_file, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(list(registers), snapshot_file, pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temp_path, snapshot_path)
+
+        # Read only file system, the registers are loaded from the source next time too.
+        except OSError:
+            pass
+
+        return registers
+
+    @staticmethod
+    def __layout():
+        """Fields of the pickled registers. The compiled file is not loaded by software
+        with other fields.
+
+        Returns:
+            tuple: Slots of the register and of its schema.
+        """
+
+        return (Register.__slots__, RegisterSchema.__slots__)
+
+    @staticmethod
+    def to_compiled(registers, file_path="registers.bin", profile=Profiles.NONE):
+        """Compile the registers of the profile to binary file, that is loaded at start.
+        The registers that are not used in the profile are left out.
+
+        Args:
+            registers (Registers): Registers.
+            file_path (str, optional): Compiled file. Defaults to "registers.bin".
+            profile (Profiles, optional): Profile of the device. Defaults to Profiles.NONE, all registers.
+        """
+
+        profile = Profiles(profile)
+
+        compiled = []
+        for register in registers:
+
+            # Registers without profiles are used in all of them.
+            if profile != Profiles.NONE and register.profiles != "" and\
+                profile.value not in register.profiles.split("|"):
+                continue
+
+            compiled.append(register)
+
+        header = (Registers.__compiled_version, Registers.__layout(), profile.value)
+
+        with open(file_path, "wb") as compiled_file:
+            pickle.dump(header, compiled_file, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(compiled, compiled_file, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def from_compiled(file_path="registers.bin", source_path=None):
+        """Load registers from the compiled file.
+
+        Args:
+            file_path (str, optional): Compiled file. Defaults to "registers.bin".
+            source_path (str, optional): Source file, the compiled file is not used when it is older. Defaults to None.
+
+        Returns:
+            Registers: Registers, None when the file is missing, older than the source,
+            of other format version or of other registers layout.
+        """
+
+        logger = get_logger(__name__)
+
+        try:
+            if source_path is not None and os.path.exists(source_path) and\
+                os.stat(file_path).st_mtime_ns < os.stat(source_path).st_mtime_ns:
+                return None
+
+            with open(file_path, "rb") as compiled_file:
+                version, layout, profile = pickle.load(compiled_file)
+
+                # Compiled by other version of the software.
+                if version != Registers.__compiled_version or layout != Registers.__layout():
+                    logger.warning("Compiled registers {} are of other version, they are not used".format(file_path))
+                    return None
+
+                registers = Registers(pickle.load(compiled_file))
+
+        except FileNotFoundError:
+            return None
+
+        # Broken file or registers that can not be loaded by this software.
+        except Exception:
+            logger.warning("Compiled registers {} can not be loaded, they are not used".format(file_path))
+            return None
+
+        logger.info("Registers of profile \"{}\" are loaded from: {}".format(profile, file_path))
+
+        return registers
+
     @staticmethod
     def to_md(registers, file_path="registers.md"):
         
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import argparse
+import gc
+import json
+import os
+import tracemalloc
+
+from data.register import Register
+from data.register import Scope
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class LegacyRegister:
+    """Register with the previous per instance dictionary layout."""
+
+    def __init__(self, name):
+
+        self.name = name
+        self.ts = 0
+        self.value = None
+        self.scope = Scope.Global
+        self.handlers = []
+        self.force = False
+        self.plugin_name = ""
+        self.description = ""
+        self.range = ""
+        self.limit = 0.0
+        self.profiles = ""
+
+def registers_file_path():
+    """Path to the registers.json.
+
+    Returns:
+        str: File path.
+    """
+
+    # Current file path. & Go to file.
+    cwf = os.path.dirname(os.path.abspath(__file__))
+
+    return os.path.join(cwf, "..", "..", "..", "registers.json")
+
+def load_zone(register_class):
+    """Load all registers of one zone from the registers.json.
+
+    Args:
+        register_class (class): Register implementation.
+
+    Returns:
+        list: The registers.
+    """
+
+    registers = []
+
+    with open(registers_file_path(), newline="") as json_file:
+
+        rows = json.load(json_file)
+        for row in rows:
+
+            register = register_class(row["name"])
+            register.description = row["description"]
+            register.range = row["range"]
+            register.plugin_name = row["plugin"]
+            register.scope = Scope.from_str(row["scope"])
+            register.value = Register.to_value(row["data_type"], row["default"])
+            register.profiles = row["profiles"]
+
+            registers.append(register)
+
+    return registers
+
+def measure(register_class, zones):
+    """Measure the memory that stays allocated after the zones are loaded.
+
+    Args:
+        register_class (class): Register implementation.
+        zones (int): Zones count.
+
+    Returns:
+        tuple: Retained bytes and registers count.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+
+    loaded = []
+    for _ in range(zones):
+        loaded.append(load_zone(register_class))
+
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    count = sum(len(registers) for registers in loaded)
+
+    return current, count
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--zones", type=int, default=4, help="Zones on one controller.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    legacy, count = measure(LegacyRegister, args.zones)
+    slotted, _ = measure(Register, args.zones)
+
+    print("Registers: {}".format(count))
+    print("Legacy:  {:10.1f} kB; {:6.1f} B/register".format(legacy / 1024, legacy / count))
+    print("Slotted: {:10.1f} kB; {:6.1f} B/register".format(slotted / 1024, slotted / count))
+    print("Saved:   {:10.1f} %".format(100 * (legacy - slotted) / legacy))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+
+from data.register import Scope
+from data.registers import Registers
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+def legacy_preprocess_value(value):
+    """Value preprocessing as it was done before the coercers.
+
+    Args:
+        value (mixed): Raw value.
+
+    Returns:
+        mixed: Value.
+    """
+
+    out_value = None
+
+    if isinstance(value, str):
+
+        if value == "false":
+            out_value = False
+
+        elif value == "true":
+            out_value = True
+
+        elif value.startswith("[") and value.endswith("]"):
+            out_value = json.loads(value)
+
+        elif value.startswith("{") and value.endswith("}"):
+            out_value = json.loads(value)
+
+        else:
+            out_value = value
+
+    else:
+        out_value = value
+
+    return out_value
+
+def legacy_update(registers, payload):
+    """Registers update as it was done before the coercers.
+
+    Args:
+        registers (Registers): Registers.
+        payload (dict): ERP sync response.
+    """
+
+    for name in payload:
+        register = registers.by_name(name)
+        if register is not None:
+            register.value = legacy_preprocess_value(payload[name])
+
+def load_registers(blob_size):
+    """Load the registers and make the JSON registers look like real schedules.
+
+    Args:
+        blob_size (int): Items in each JSON list register.
+
+    Returns:
+        Registers: The registers.
+    """
+
+    # Current file path. & Go to file.
+    cwf = os.path.dirname(os.path.abspath(__file__))
+    registers_file = os.path.join(cwf, "..", "..", "..", "registers.json")
+
+    registers = Registers.from_json(registers_file)
+
+    for register in registers:
+        if isinstance(register.value, list):
+            register.value = [{"hour": index % 24, "day": index % 7, "temp": 21.5, "mode": "auto"}\
+                for index in range(blob_size)]
+
+    return registers
+
+def measure(update, registers, payload, cycles):
+    """Measure the sync time.
+
+    Returns:
+        float: Median sync time in milliseconds.
+    """
+
+    samples = []
+    for _ in range(cycles):
+        t_start = time.perf_counter()
+        update(registers, payload)
+        samples.append((time.perf_counter() - t_start) * 1000)
+
+    return statistics.median(samples)
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--cycles", type=int, default=50, help="Syncs per measurement.")
+    parser.add_argument("--blob-size", type=int, default=168, help="Items in the JSON list registers.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    # ERP returns the system registers.
+    source = load_registers(args.blob_size)
+    payload = source.by_scope(Scope.System).to_dict()
+    size = len(json.dumps(payload))
+
+    legacy = measure(legacy_update, load_registers(args.blob_size), payload, args.cycles)
+    coerced = measure(lambda regs, data: regs.update(data),\
+        load_registers(args.blob_size), payload, args.cycles)
+
+    print("Payload: {} registers; {:.1f} kB".format(len(payload), size / 1024))
+    print("Legacy:  {:8.3f} ms/sync".format(legacy))
+    print("Cached:  {:8.3f} ms/sync".format(coerced))
+
+if __name__ == "__main__":
+    main()
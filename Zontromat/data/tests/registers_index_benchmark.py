@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import time
+
+from data.register import Register
+from data.register import Scope
+from data.registers import Registers
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+def linear_by_name(registers, name):
+    """Reference lookup that walks the whole list, as before the index.
+
+    Args:
+        registers (list): Registers.
+        name (str): Name of the register.
+
+    Returns:
+        Register: The register or None.
+    """
+
+    for register in registers:
+        if register.name == name:
+            return register
+
+    return None
+
+def create_registers(count):
+    """Create registers from the registers.json and pad them with synthetic ones.
+
+    Args:
+        count (int): Target registers count.
+
+    Returns:
+        Registers: The registers.
+    """
+
+    # Current file path. & Go to file.
+    cwf = os.path.dirname(os.path.abspath(__file__))
+    registers_file = os.path.join(cwf, "..", "..", "..", "registers.json")
+
+    registers = Registers.from_json(registers_file)
+
+    index = 0
+    scopes = [Scope.System, Scope.Device, Scope.Both]
+    while len(registers) < count:
+        register = Register("synthetic_{}.parameter_{}".format(index % 40, index))
+        register.scope = scopes[index % len(scopes)]
+        register.value = 0.0
+        registers.append(register)
+        index += 1
+
+    return registers
+
+def tick(registers, names, payload, by_name):
+    """One controller tick: plugin lookups and ERP update.
+
+    Args:
+        registers (Registers): Registers.
+        names (list): Names looked up by the plugins.
+        payload (dict): ERP sync response.
+        by_name (function): Lookup function.
+    """
+
+    for name in names:
+        by_name(registers, name)
+
+    registers.update(payload)
+
+def measure(registers, names, payload, by_name, cycles):
+    """Measure the tick time.
+
+    Returns:
+        float: Median tick time in milliseconds.
+    """
+
+    samples = []
+    for _ in range(cycles):
+        t_start = time.perf_counter()
+        tick(registers, names, payload, by_name)
+        samples.append((time.perf_counter() - t_start) * 1000)
+
+    return statistics.median(samples)
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--lookups", type=int, default=2000, help="by_name calls per tick.")
+    parser.add_argument("--cycles", type=int, default=20, help="Ticks per measurement.")
+    parser.add_argument("--linear", action="store_true", help="Measure the linear scan too.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    print("{:>8} {:>14} {:>14}".format("count", "indexed [ms]", "linear [ms]"))
+
+    for count in [600, 1000, 2500, 5000, 10000]:
+
+        registers = create_registers(count)
+
+        # Plugins look up the real registers only.
+        real_names = [register.name for register in registers if not register.name.startswith("synthetic_")]
+        random.seed(0)
+        names = [random.choice(real_names) for _ in range(args.lookups)]
+
+        # ERP returns a part of the device registers.
+        payload = {}
+        for register in registers.by_scope(Scope.Device)[:50]:
+            payload[register.name] = json.dumps(register.value)\
+                if register.data_type == "json" else register.value
+
+        indexed = measure(registers, names, payload,
+            lambda regs, name: regs.by_name(name), args.cycles)
+
+        linear = float("nan")
+        if args.linear:
+            linear = measure(registers, names, payload, linear_by_name, args.cycles)
+
+        print("{:>8} {:>14.3f} {:>14.3f}".format(count, indexed, linear))
+
+if __name__ == "__main__":
+    main()
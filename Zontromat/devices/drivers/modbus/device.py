@@ -137,6 +137,48 @@ class ModbusDevice(BaseDevice):
 
         self._uart = value
 
+    @property
+    def max_count(self):
+        """Maximum registers count in one read request.
+
+        Returns:
+            int: Registers count.
+        """
+
+        return self._max_count
+
+    @max_count.setter
+    def max_count(self, value):
+        """Maximum registers count in one read request.
+
+        Args:
+            value (int): Registers count.
+        """
+
+        self._max_count = value
+
+    @property
+    def gap_tolerance(self):
+        """Maximum count of not used registers between two parameters,
+        that still can be read in one request.
+
+        Returns:
+            int: Registers count.
+        """
+
+        return self._gap_tolerance
+
+    @gap_tolerance.setter
+    def gap_tolerance(self, value):
+        """Maximum count of not used registers between two parameters,
+        that still can be read in one request.
+
+        Args:
+            value (int): Registers count.
+        """
+
+        self._gap_tolerance = value
+
     #endregion
 
     #region Constructor
@@ -153,6 +195,12 @@ class ModbusDevice(BaseDevice):
         self._unit = 0
         self._uart = 0
 
+        # 125 is the limit of the MODBUS read registers request.
+        self._max_count = 125
+
+        # Do not read registers that are not described by default.
+        self._gap_tolerance = 0
+
         if "mb_id" in config:
             self._unit = config["mb_id"]
 
@@ -162,6 +210,12 @@ class ModbusDevice(BaseDevice):
         if "uart" in config:
             self._uart = config["uart"]
 
+        if "mb_max_count" in config:
+            self._max_count = int(config["mb_max_count"])
+
+        if "mb_gap" in config:
+            self._gap_tolerance = int(config["mb_gap"])
+
     def __str__(self):
         """Returns device vendor and model as string.
 
@@ -275,6 +329,130 @@ class ModbusDevice(BaseDevice):
 
         return value
 
+    def generate_read_requests(self, names):
+        """Generate the fewest read requests for the parameters.
+        Parameters with the same function code are merged in one request
+        when the registers between them are not more than the gap tolerance
+        and the request is not longer than the maximum count.
+
+        Args:
+            names (list): Parameters names.
+
+        Returns:
+            list: Tuples of request and parameters that it reads.
+        """
+
+        read_codes = [FunctionCode.ReadCoil, FunctionCode.ReadDiscreteInput,\
+            FunctionCode.ReadHoldingRegisters, FunctionCode.ReadInputRegisters]
+
+        # Split by function code.
+        by_code = {}
+        for name in names:
+            param = self.get_parameter_by_name(name)
+            if param is None or param.function_code not in read_codes:
+                continue
+
+            by_code.setdefault(param.function_code, []).append(param)
+
+        requests = []
+
+        for function_code in by_code:
+
+            params = sorted(by_code[function_code], key=lambda item: min(item.addresses))
+
+            # Coalesce the address ranges.
+            blocks = []
+            for param in params:
+                begin = min(param.addresses)
+                end = max(param.addresses)
+
+                if blocks:
+                    block = blocks[-1]
+                    merged_end = max(block["end"], end)
+                    if begin - block["end"] - 1 <= self._gap_tolerance and\
+                        merged_end - block["begin"] + 1 <= self._max_count:
+                        block["end"] = merged_end
+                        block["params"].append(param)
+                        continue
+
+                blocks.append({"begin": begin, "end": end, "params": [param]})
+
+            for block in blocks:
+                address = block["begin"]
+                count = block["end"] - block["begin"] + 1
+                request = None
+
+                if function_code == FunctionCode.ReadCoil:
+                    request = ReadDeviceCoils(self.unit, address, count)
+
+                elif function_code == FunctionCode.ReadDiscreteInput:
+                    request = ReadDeviceDiscreteInputs(self.unit, address, count)
+
+                elif function_code == FunctionCode.ReadHoldingRegisters:
+                    request = ReadDeviceHoldingRegisters(self.unit, address, count)
+
+                elif function_code == FunctionCode.ReadInputRegisters:
+                    request = ReadDeviceInputRegisters(self.unit, address, count)
+
+                requests.append((request, block["params"]))
+
+        return requests
+
+    def read_parameters(self, names, priority=None, timeout=None):
+        """Read parameters values with the fewest requests.
+        All requests are queued at once and the values are collected after that.
+
+        Args:
+            names (list): Parameters names.
+            priority (Priority, optional): Transactions priority.
+                Defaults to the priority of the function code.
+            timeout (float, optional): Seconds to wait in the queue before expiration.
+                Defaults to no expiration.
+
+        Returns:
+            dict: Parameters values by name. Not read parameters are None.
+        """
+
+        values = {}
+        for name in names:
+            values[name] = None
+
+        pending = []
+        for request, params in self.generate_read_requests(names):
+            future = self._controller.submit_mb_request(request, self.uart, priority, timeout)
+            pending.append((request, params, future))
+
+        for request, params, future in pending:
+
+            try:
+                response = future.result()
+
+            except TimeoutError:
+                continue
+
+            if response is None or response.isError():
+                continue
+
+            # Bits for coils and discrete inputs.
+            data = getattr(response, "registers", None)
+            if data is None:
+                data = response.bits
+
+            # Response map by address.
+            registers = {}
+            for index in range(request.count):
+                registers[request.address + index] = data[index]
+
+            for param in params:
+                param_registers = {}
+                for address in param.addresses:
+                    param_registers[address] = registers[address]
+
+                values[param.parameter_name] = ModbusDevice.converts_to_parameter(\
+                    param.data_type, param.addresses, param_registers)
+
+        return values
+
     def get_parameters_mous(self):
         """Returns parameters measuring units.
 
@@ -487,4 +665,59 @@ class ModbusDevice(BaseDevice):
 
         return value
 
+    @staticmethod
+    def converts_from_parameter(parameter_type, registers, value):
+        """Convert a single parameter to registers data.
+        The opposite of converts_to_parameter.
+
+        Parameters
+        ----------
+        parameter_type : ParameterType
+            Data type.
+        registers : array
+            Registers addresses.
+        value : mixed
+            Parameter value.
+
+        Returns
+        -------
+        dict
+            Registers data by address.
+        """
+
+        if ParameterType.is_valid(parameter_type) is not True:
+            raise Exception("Modbus data type mismatch.")
+
+        if not registers:
+            raise Exception("Invalid registers length.")
+
+        registers_data = {}
+
+        if parameter_type in (ParameterType.INT16_T_LE, ParameterType.UINT16_T_LE):
+            registers_data[registers[0]] = int(value) & 0xFFFF
+
+        elif parameter_type == ParameterType.INT32_T_LE:
+            raise Exception("Not implemented")
+
+        elif parameter_type == ParameterType.UINT32_T_LE:
+            words = unpack(">HH", pack("i", int(value)))
+            registers_data[registers[0]] = words[0]
+            registers_data[registers[1]] = words[1]
+
+        elif parameter_type == ParameterType.UINT32_T_BE:
+            words = unpack("<HH", pack("i", int(value)))
+            registers_data[registers[1]] = words[0]
+            registers_data[registers[0]] = words[1]
+
+        elif parameter_type == ParameterType.FLOAT:
+            words = unpack("<HH", pack("f", float(value)))
+            registers_data[registers[1]] = words[0]
+            registers_data[registers[0]] = words[1]
+
+        elif parameter_type == ParameterType.ARR_UINT16_T_LE:
+            for index, address in enumerate(registers):
+                registers_data[address] = int(value[index]) & 0xFFFF
+
+        return registers_data
+
     #endregion
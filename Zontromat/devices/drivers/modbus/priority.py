@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+from enum import Enum
+
+from devices.drivers.modbus.function_code import FunctionCode
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class Priority(Enum):
+    """MODBUS transaction priority. Lower value is served first."""
+
+    Actuator = 0
+    """Actuator writes, valves, relays and analog outputs."""
+
+    Control = 1
+    """Reads that the control loops depend on."""
+
+    Metering = 2
+    """Energy and water meters reads."""
+
+    @staticmethod
+    def from_function_code(function_code):
+        """Default priority of the function code.
+        Writes are actuator transactions and reads are control transactions.
+
+        Args:
+            function_code (int): MODBUS function code.
+
+        Returns:
+            Priority: Transaction priority.
+        """
+
+        write_codes = (FunctionCode.WriteSingleCoil.value,\
+            FunctionCode.WriteSingleHoldingRegister.value,\
+            FunctionCode.WriteMultipleCoils.value,\
+            FunctionCode.WriteMultipleHoldingRegisters.value)
+
+        if function_code in write_codes:
+            return Priority.Actuator
+
+        return Priority.Control
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+from services.global_error_handler.global_error_handler import GlobalErrorHandler
+
+from utils.logger import get_logger
+
+from devices.drivers.modbus.priority import Priority
+from devices.drivers.modbus.requests.read_device_discrete_inputs import ReadDeviceDiscreteInputs
+from devices.drivers.modbus.requests.write_device_coil import WriteDeviceCoil
+from devices.drivers.modbus.requests.write_device_coils import WriteDeviceCoils
+from devices.drivers.modbus.requests.write_device_register import WriteDeviceRegister
+from devices.drivers.modbus.requests.write_device_registers import WriteDeviceRegisters
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class ProcessImage:
+    """Remote I/O image of the MODBUS slaves.
+    The discrete inputs of each slave are read with one request per update
+    over the span of the used addresses. The coils and the holding registers are staged
+    and written with one request per contiguous run on flush."""
+
+#region Attributes
+
+#endregion
+
+#region Constructor
+
+    def __init__(self, queues):
+        """Constructor
+
+        Args:
+            queues (dict): Transaction queues by UART index.
+        """
+
+        self.__logger = get_logger(__name__)
+        """Logger
+        """
+
+        self.__queues = queues
+        """Transaction queues by UART index.
+        """
+
+        self.__inputs = {}
+        """Discrete inputs span and bits by (UART, unit).
+        """
+
+        self.__coils = {}
+        """Last written coils by (UART, unit).
+        """
+
+        self.__registers = {}
+        """Last written holding registers by (UART, unit).
+        """
+
+        self.__dirty_coils = {}
+        """Staged coils by (UART, unit).
+        """
+
+        self.__dirty_registers = {}
+        """Staged holding registers by (UART, unit).
+        """
+
+        self.__reads = 0
+        """Count of the read requests.
+        """
+
+        self.__writes = 0
+        """Count of the write requests.
+        """
+
+#endregion
+
+#region Properties
+
+    @property
+    def reads(self):
+        """Count of the read requests.
+
+        Returns:
+            int: Count of the read requests.
+        """
+
+        return self.__reads
+
+    @property
+    def writes(self):
+        """Count of the write requests.
+
+        Returns:
+            int: Count of the write requests.
+        """
+
+        return self.__writes
+
+    @property
+    def pending(self):
+        """Count of the staged outputs.
+
+        Returns:
+            int: Count of the staged coils and holding registers.
+        """
+
+        coils = sum(len(values) for values in self.__dirty_coils.values())
+        registers = sum(len(values) for values in self.__dirty_registers.values())
+
+        return coils + registers
+
+#endregion
+
+#region Private Methods
+
+    def __result(self, future, key):
+        """Wait for the response of the request.
+
+        Args:
+            future (Future): Future of the response.
+            key (tuple): UART and unit of the request.
+
+        Returns:
+            ModbusResponse: Response or None when the request failed.
+        """
+
+        response = None
+
+        try:
+            response = future.result()
+
+        except Exception:
+            response = None
+
+        if response is None or response.isError():
+            GlobalErrorHandler.log_hardware_malfunction(self.__logger,\
+                "MODBUS slave {} @ UART{} malfunctioning, check modbus cables and connections."\
+                .format(key[1], key[0]))
+            return None
+
+        return response
+
+    def __refresh(self, keys):
+        """Read the discrete inputs of the slaves.
+        All requests are queued first, so the UARTs work in parallel.
+
+        Args:
+            keys (list): UART and unit of the slaves.
+
+        Returns:
+            bool: True when all slaves responded.
+        """
+
+        pending = []
+        for key in keys:
+            span = self.__inputs[key]
+            request = ReadDeviceDiscreteInputs(key[1], span["start"],\
+                span["end"] - span["start"])
+            pending.append((key, span, self.__queues[key[0]].submit(request, Priority.Control)))
+            self.__reads += 1
+
+        state = True
+        for key, span, future in pending:
+            response = self.__result(future, key)
+            if response is None:
+                state = False
+                continue
+
+            span["bits"] = list(response.bits[:span["end"] - span["start"]])
+
+        return state
+
+    @staticmethod
+    def __runs(values):
+        """Split the staged values to contiguous runs.
+
+        Args:
+            values (dict): Value and single flag by address.
+
+        Returns:
+            list: Start address, values and single flag of each run.
+        """
+
+        runs = []
+        for address in sorted(values):
+            value, single = values[address]
+            if runs and runs[-1][0] + len(runs[-1][1]) == address and\
+                runs[-1][2] == single:
+                runs[-1][1].append(value)
+            else:
+                runs.append((address, [value], single))
+
+        return runs
+
+    def __stage(self, shadow, dirty, uart, unit, address, value, single):
+        """Stage the output value when it differs from the last written one.
+        """
+
+        key = (uart, unit)
+
+        if key in dirty and address in dirty[key]:
+            dirty[key][address] = (value, single)
+
+        elif shadow.get(key, {}).get(address) != value:
+            dirty.setdefault(key, {})[address] = (value, single)
+
+    def __write(self, shadow, dirty, single_request, multiple_request):
+        """Write the staged outputs, one request per contiguous run.
+        Failed runs stay staged for the next flush.
+
+        Returns:
+            dict: Outputs to stage again.
+        """
+
+        pending = []
+        for key, values in dirty.items():
+            for start, run, single in self.__runs(values):
+                if single and len(run) == 1:
+                    request = single_request(key[1], start, run[0])
+                else:
+                    request = multiple_request(key[1], start, run)
+                future = self.__queues[key[0]].submit(request, Priority.Actuator)
+                pending.append((key, start, run, single, future))
+                self.__writes += 1
+
+        failed = {}
+        for key, start, run, single, future in pending:
+            response = self.__result(future, key)
+            if response is None:
+                # Unknown state of the slave, write all the outputs again.
+                shadow.pop(key, None)
+                for index, value in enumerate(run):
+                    failed.setdefault(key, {})[start + index] = (value, single)
+                continue
+
+            for index, value in enumerate(run):
+                shadow.setdefault(key, {})[start + index] = value
+
+        return failed
+
+#endregion
+
+#region Public Methods
+
+    def read_input(self, uart, unit, address):
+        """Read discrete input from the image.
+        The first read of an address outside the span of the slave reads the slave immediately.
+
+        Args:
+            uart (int): UART index.
+            unit (int): Unit ID.
+            address (int): Address of the input.
+
+        Returns:
+            bool: State of the input.
+        """
+
+        key = (uart, unit)
+        span = self.__inputs.get(key)
+
+        if span is None:
+            span = {"start": address, "end": address + 1, "bits": []}
+            self.__inputs[key] = span
+            self.__refresh([key])
+
+        elif address < span["start"] or address >= span["end"]:
+            span["start"] = min(span["start"], address)
+            span["end"] = max(span["end"], address + 1)
+            span["bits"] = []
+            self.__refresh([key])
+
+        index = address - span["start"]
+        if index < len(span["bits"]):
+            return bool(span["bits"][index])
+
+        return False
+
+    def write_coil(self, uart, unit, address, value, single=True):
+        """Stage coil for the next flush.
+
+        Args:
+            uart (int): UART index.
+            unit (int): Unit ID.
+            address (int): Address of the coil.
+            value (bool): State of the coil.
+            single (bool, optional): Write a lone coil with single coil request. Defaults to True.
+        """
+
+        self.__stage(self.__coils, self.__dirty_coils, uart, unit, address, bool(value), single)
+
+    def write_register(self, uart, unit, address, value, single=True):
+        """Stage holding register for the next flush.
+
+        Args:
+            uart (int): UART index.
+            unit (int): Unit ID.
+            address (int): Address of the register.
+            value (int): Value of the register.
+            single (bool, optional): Write a lone register with single register request. Defaults to True.
+        """
+
+        self.__stage(self.__registers, self.__dirty_registers, uart, unit, address, int(value), single)
+
+    def update(self):
+        """Read the discrete inputs of all slaves in the image.
+
+        Returns:
+            bool: True when all slaves responded.
+        """
+
+        return self.__refresh(list(self.__inputs))
+
+    def flush(self):
+        """Write the staged coils and holding registers.
+
+        Returns:
+            int: Count of the write requests.
+        """
+
+        writes = self.__writes
+
+        dirty_coils, self.__dirty_coils = self.__dirty_coils, {}
+        dirty_registers, self.__dirty_registers = self.__dirty_registers, {}
+
+        failed_coils = self.__write(self.__coils, dirty_coils,\
+            WriteDeviceCoil, WriteDeviceCoils)
+        failed_registers = self.__write(self.__registers, dirty_registers,\
+            WriteDeviceRegister, WriteDeviceRegisters)
+
+        # Newer values staged while writing win over the failed ones.
+        for dirty, failed in ((self.__dirty_coils, failed_coils),\
+            (self.__dirty_registers, failed_registers)):
+            for key, values in failed.items():
+                for address, item in values.items():
+                    dirty.setdefault(key, {}).setdefault(address, item)
+
+        return self.__writes - writes
+
+    def clear(self):
+        """Forget the image, the next reads and writes go to the slaves.
+        """
+
+        self.__inputs.clear()
+        self.__coils.clear()
+        self.__registers.clear()
+        self.__dirty_coils.clear()
+        self.__dirty_registers.clear()
+
+#endregion
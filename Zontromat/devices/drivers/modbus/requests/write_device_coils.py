@@ -67,4 +67,4 @@ class WriteDeviceCoils(WriteMultipleCoilsRequest):
         """
 
         # Address, Count, key word args.
-        WriteMultipleCoilsRequest.__init__(self, address, coils, unit=unit)
+        WriteMultipleCoilsRequest.__init__(self, address, coils, unit)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import argparse
+import threading
+import time
+
+from devices.drivers.modbus.priority import Priority
+from devices.drivers.modbus.process_image import ProcessImage
+from devices.drivers.modbus.transaction_queue import TransactionQueue
+from devices.drivers.modbus.requests.read_device_discrete_inputs import ReadDeviceDiscreteInputs
+from devices.drivers.modbus.requests.write_device_coil import WriteDeviceCoil
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class FakeResponse:
+    """Successful MODBUS response.
+    """
+
+    def __init__(self, count):
+
+        self.bits = [False] * count
+
+    def isError(self):
+        """Is error response.
+        """
+
+        return False
+
+class FakeSerialClient:
+    """Simulated serial bus of remote I/O slaves. Each transaction occupies the bus
+    for the turnaround time.
+    """
+
+    def __init__(self, latency, slaves):
+        """Constructor
+
+        Args:
+            latency (float): Turnaround time of the request [s].
+            slaves (int): Count of the slaves, with units from 1.
+        """
+
+        self.__latency = latency
+        self.__slaves = slaves
+        self.__bus = threading.Lock()
+        self.transactions = 0
+
+    def execute(self, request):
+        """Execute the request on the simulated bus.
+        """
+
+        # No slave answers to the request of other unit.
+        unit = request.slave_id
+        if not isinstance(unit, int) or unit < 1 or unit > self.__slaves:
+            raise ValueError("{} is addressed to unit {}".format(type(request).__name__, unit))
+
+        with self.__bus:
+            self.transactions += 1
+            time.sleep(self.__latency)
+
+        count = getattr(request, "count", None)
+        if not isinstance(count, int):
+            count = 1
+
+        return FakeResponse(count)
+
+def direct_tick(queues, slaves, inputs, outputs, tick):
+    """One pin one transaction, as the controller was doing before the image.
+    """
+
+    for unit in range(1, slaves + 1):
+        for index in range(inputs):
+            request = ReadDeviceDiscreteInputs(unit, 0, index + 1)
+            queues[0].execute(request, Priority.Control)
+
+        for index in range(outputs):
+            request = WriteDeviceCoil(unit, index, (tick + index) % 4 == 0)
+            queues[0].execute(request, Priority.Actuator)
+
+def image_tick(image, slaves, inputs, outputs, tick):
+    """Read the slaves once on update, stage the writes and flush them.
+    """
+
+    image.update()
+
+    for unit in range(1, slaves + 1):
+        for index in range(inputs):
+            image.read_input(0, unit, index)
+
+        for index in range(outputs):
+            image.write_coil(0, unit, index, (tick + index) % 4 == 0)
+
+    image.flush()
+
+def run(name, tick, target, client, ticks, args):
+    """Run the ticks and print the results.
+    """
+
+    # Warm up, the image learns the used inputs.
+    tick(target, args.slaves, args.inputs, args.outputs, 0)
+    transactions = client.transactions
+
+    t_start = time.perf_counter()
+    for index in range(1, ticks + 1):
+        tick(target, args.slaves, args.inputs, args.outputs, index)
+    elapsed = time.perf_counter() - t_start
+
+    print("{:<7} transactions per tick: {:6.1f}; time per tick: {:7.2f} ms"\
+        .format(name, (client.transactions - transactions) / ticks, elapsed / ticks * 1000))
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--slaves", type=int, default=4, help="Remote I/O slaves on the bus.")
+    parser.add_argument("--inputs", type=int, default=8, help="Used discrete inputs of each slave.")
+    parser.add_argument("--outputs", type=int, default=8, help="Used coils of each slave.")
+    parser.add_argument("--latency", type=float, default=0.010, help="Turnaround time of each request [s].")
+    parser.add_argument("--ticks", type=int, default=20, help="Count of the ticks.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    client = FakeSerialClient(args.latency, args.slaves)
+    queues = {0: TransactionQueue(client, "SIM")}
+    run("Direct", direct_tick, queues, client, args.ticks, args)
+    queues[0].shutdown()
+
+    client = FakeSerialClient(args.latency, args.slaves)
+    queues = {0: TransactionQueue(client, "SIM")}
+    image = ProcessImage(queues)
+    run("Image", image_tick, image, client, args.ticks, args)
+    queues[0].shutdown()
+    print("Image reads: {}; writes: {}".format(image.reads, image.writes))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+import argparse
+import threading
+import time
+
+from devices.drivers.modbus.priority import Priority
+from devices.drivers.modbus.transaction_queue import TransactionQueue
+from devices.drivers.modbus.requests.write_device_coil import WriteDeviceCoil
+from devices.drivers.modbus.requests.write_device_coils import WriteDeviceCoils
+from devices.drivers.modbus.requests.write_device_register import WriteDeviceRegister
+from devices.drivers.modbus.requests.write_device_registers import WriteDeviceRegisters
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class FakeRequest:
+    """MODBUS request with the fields that the transaction queue looks at.
+    """
+
+    def __init__(self, function_code, unit, address, count):
+
+        self.function_code = function_code
+        self.unit_id = unit
+        self.address = address
+        self.count = count
+
+class FakeResponse:
+    """Successful MODBUS response.
+    """
+
+    def __init__(self, count):
+
+        self.registers = [0] * count
+        self.bits = [False] * count
+
+    def isError(self):
+        """Is error response.
+        """
+
+        return False
+
+class FakeSerialClient:
+    """Simulated serial bus. Each transaction occupies the bus for the turnaround
+    time plus the time to transfer its registers.
+    """
+
+    def __init__(self, latency, word_time):
+        """Constructor
+
+        Args:
+            latency (float): Turnaround time of the request [s].
+            word_time (float): Transfer time of one register [s].
+        """
+
+        self.__latency = latency
+        self.__word_time = word_time
+        self.__bus = threading.Lock()
+        self.transactions = 0
+
+    def execute(self, request):
+        """Execute the request on the simulated bus.
+        """
+
+        with self.__bus:
+            self.transactions += 1
+            time.sleep(self.__latency + self.__word_time * request.count)
+
+        return FakeResponse(request.count)
+
+class DirectBus:
+    """Callers share the client and execute in the order they win the bus,
+    as the controller was doing before the transaction queue.
+    """
+
+    def __init__(self, client):
+
+        self.__client = client
+        self.__lock = threading.Lock()
+
+    def execute(self, request, priority=None):
+
+        with self.__lock:
+            return self.__client.execute(request)
+
+    def read_all(self, requests, priority=None):
+
+        return [self.execute(request, priority) for request in requests]
+
+class QueuedBus:
+    """Callers go through the transaction queue.
+    """
+
+    def __init__(self, client):
+
+        self.queue = TransactionQueue(client, "SIM")
+
+    def execute(self, request, priority=None):
+
+        return self.queue.execute(request, priority)
+
+    def read_all(self, requests, priority=None):
+
+        futures = [self.queue.submit(request, priority) for request in requests]
+        return [future.result() for future in futures]
+
+def meter_requests(unit):
+    """Read requests of one energy meter, SDM630 like.
+    """
+
+    return [FakeRequest(4, unit, 0, 60), FakeRequest(4, unit, 70, 40),\
+        FakeRequest(4, unit, 342, 4)]
+
+def run(bus, meters, duration, write_period):
+    """Metering threads read all the time and one actuator thread writes periodically.
+
+    Returns:
+        list: Latency of each write [s].
+    """
+
+    stop = threading.Event()
+    latency = []
+
+    def metering(unit):
+        requests = meter_requests(unit)
+        while not stop.is_set():
+            bus.read_all(requests, Priority.Metering)
+
+    def actuator():
+        request = FakeRequest(5, 1, 0, 1)
+        while not stop.is_set():
+            t_start = time.perf_counter()
+            bus.execute(request, Priority.Actuator)
+            latency.append(time.perf_counter() - t_start)
+            stop.wait(write_period)
+
+    # Each meter is read by two plugins, the second reads are duplicates.
+    threads = [threading.Thread(target=metering, args=(unit,)) for unit in range(meters)]
+    threads += [threading.Thread(target=metering, args=(unit,)) for unit in range(meters)]
+    threads.append(threading.Thread(target=actuator))
+
+    for thread in threads:
+        thread.start()
+
+    time.sleep(duration)
+    stop.set()
+
+    for thread in threads:
+        thread.join()
+
+    return latency
+
+def report(name, latency, client):
+    """Print the results.
+    """
+
+    latency = sorted(value * 1000 for value in latency)
+    p95 = latency[int(len(latency) * 0.95) - 1] if latency else float("nan")
+
+    print("{:<8} writes: {:4d}; bus transactions: {:5d}; write latency p50: {:7.2f} ms; p95: {:7.2f} ms; max: {:7.2f} ms"\
+        .format(name, len(latency), client.transactions,\
+            latency[len(latency) // 2] if latency else float("nan"), p95,\
+            latency[-1] if latency else float("nan")))
+
+def check_requests(unit):
+    """Check that the write requests are addressed to the unit.
+
+    Args:
+        unit (int): Unit ID.
+    """
+
+    requests = [
+        WriteDeviceCoil(unit, 10, True),
+        WriteDeviceCoils(unit, 10, [True, False]),
+        WriteDeviceRegister(unit, 10, 1),
+        WriteDeviceRegisters(unit, 10, [1, 2])
+    ]
+
+    for request in requests:
+        if request.slave_id != unit:
+            raise ValueError("{} is addressed to {}, not to {}"\
+                .format(type(request).__name__, request.slave_id, unit))
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--meters", type=int, default=3, help="Energy meters on the bus.")
+    parser.add_argument("--latency", type=float, default=0.010, help="Turnaround time of each request [s].")
+    parser.add_argument("--word-time", type=float, default=0.0023, help="Transfer time of one register [s], 9600 baud.")
+    parser.add_argument("--write-period", type=float, default=0.2, help="Time between the actuator writes [s].")
+    parser.add_argument("--duration", type=float, default=10.0, help="Measurement time for each bus [s].")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    check_requests(5)
+
+    client = FakeSerialClient(args.latency, args.word_time)
+    latency = run(DirectBus(client), args.meters, args.duration, args.write_period)
+    report("Direct", latency, client)
+
+    client = FakeSerialClient(args.latency, args.word_time)
+    bus = QueuedBus(client)
+    latency = run(bus, args.meters, args.duration, args.write_period)
+    bus.queue.shutdown()
+    report("Queued", latency, client)
+    print("Deduplicated reads: {}; expired: {}".format(bus.queue.deduplicated, bus.queue.expired))
+
+if __name__ == "__main__":
+    main()
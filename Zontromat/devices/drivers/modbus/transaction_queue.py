@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+import heapq
+import itertools
+import threading
+import time
+import traceback
+from concurrent.futures import Future
+
+from utils.logger import get_logger
+
+from devices.drivers.modbus.function_code import FunctionCode
+from devices.drivers.modbus.priority import Priority
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class Transaction:
+    """MODBUS transaction waiting in the queue."""
+
+    __slots__ = ("request", "priority", "deadline", "future", "key")
+
+    def __init__(self, request, priority, deadline, key):
+        """Constructor
+
+        Args:
+            request (ModbusRequest): PyMODBUS request instance.
+            priority (Priority): Transaction priority.
+            deadline (float): Deadline in time.monotonic seconds or None.
+            key (tuple): Deduplication key of the read requests or None.
+        """
+
+        self.request = request
+        self.priority = priority
+        self.deadline = deadline
+        self.future = Future()
+        self.key = key
+
+class TransactionQueue:
+    """Transactions queue of one MODBUS UART. A worker thread executes the requests
+    one by one, the actuator writes first, then the control reads and the metering reads last.
+    Identical pending reads share one transaction and one future."""
+
+#region Attributes
+
+#endregion
+
+#region Constructor
+
+    def __init__(self, client, name="UART"):
+        """Constructor
+
+        Args:
+            client (ModbusClient): PyMODBUS client of the UART.
+            name (str, optional): Name of the queue. Defaults to "UART".
+        """
+
+        self.__logger = get_logger(__name__)
+        """Logger
+        """
+
+        self.__client = client
+        """MODBUS client.
+        """
+
+        self.__name = name
+        """Name of the queue.
+        """
+
+        self.__heap = []
+        """Transactions heap. Entries are (priority, deadline, sequence, transaction).
+        Transactions that are already started or cancelled are skipped.
+        """
+
+        self.__reads = {}
+        """Pending read transactions by deduplication key.
+        """
+
+        self.__sequence = itertools.count()
+        """Sequence that keeps the equal priorities in order.
+        """
+
+        self.__condition = threading.Condition()
+        """Guards the heap and wakes up the worker.
+        """
+
+        self.__worker = None
+        """Worker thread.
+        """
+
+        self.__stop = False
+        """Stop flag of the worker.
+        """
+
+        self.__executed = 0
+        """Executed transactions count.
+        """
+
+        self.__expired = 0
+        """Expired transactions count.
+        """
+
+        self.__deduplicated = 0
+        """Deduplicated reads count.
+        """
+
+#endregion
+
+#region Properties
+
+    @property
+    def client(self):
+        """MODBUS client.
+
+        Returns:
+            ModbusClient: PyMODBUS client of the UART.
+        """
+
+        return self.__client
+
+    @property
+    def pending(self):
+        """Count of the waiting transactions.
+
+        Returns:
+            int: Transactions count.
+        """
+
+        with self.__condition:
+            return len(self.__heap)
+
+    @property
+    def executed(self):
+        """Executed transactions count.
+
+        Returns:
+            int: Transactions count.
+        """
+
+        return self.__executed
+
+    @property
+    def expired(self):
+        """Transactions that passed their deadline before execution.
+
+        Returns:
+            int: Transactions count.
+        """
+
+        return self.__expired
+
+    @property
+    def deduplicated(self):
+        """Reads that were served by an identical pending read.
+
+        Returns:
+            int: Reads count.
+        """
+
+        return self.__deduplicated
+
+#endregion
+
+#region Private Methods
+
+    @staticmethod
+    def __read_key(request):
+        """Deduplication key of the read request.
+
+        Args:
+            request (ModbusRequest): PyMODBUS request instance.
+
+        Returns:
+            tuple: Key or None for the write requests.
+        """
+
+        read_codes = (FunctionCode.ReadCoil.value,\
+            FunctionCode.ReadDiscreteInput.value,\
+            FunctionCode.ReadHoldingRegisters.value,\
+            FunctionCode.ReadInputRegisters.value)
+
+        function_code = getattr(request, "function_code", None)
+        if function_code not in read_codes:
+            return None
+
+        # PyMODBUS 2.x uses unit_id, 3.x uses slave_id.
+        unit = getattr(request, "slave_id", getattr(request, "unit_id", None))
+
+        return (function_code, unit, getattr(request, "address", None),\
+            getattr(request, "count", None))
+
+    @staticmethod
+    def __entry(transaction, sequence):
+        """Heap entry of the transaction.
+
+        Args:
+            transaction (Transaction): Transaction.
+            sequence (int): Sequence number.
+
+        Returns:
+            tuple: Heap entry.
+        """
+
+        # Earlier deadline first in the same priority.
+        deadline = transaction.deadline
+        if deadline is None:
+            deadline = float("inf")
+
+        return (transaction.priority.value, deadline, sequence, transaction)
+
+    def __start(self):
+        """Start the worker thread. Call it with the condition held.
+        """
+
+        if self.__worker is not None:
+            return
+
+        self.__stop = False
+        self.__worker = threading.Thread(target=self.__work,\
+            name="MODBUS {}".format(self.__name), daemon=True)
+        self.__worker.start()
+
+    def __take(self):
+        """Wait for the next transaction.
+
+        Returns:
+            Transaction: Transaction to execute or None when the queue is stopped.
+        """
+
+        with self.__condition:
+            while True:
+                while not self.__heap and not self.__stop:
+                    self.__condition.wait()
+
+                if self.__stop:
+                    return None
+
+                transaction = heapq.heappop(self.__heap)[3]
+
+                if transaction.key is not None and\
+                    self.__reads.get(transaction.key) is transaction:
+                    del self.__reads[transaction.key]
+
+                # Moved to higher priority or cancelled by the caller.
+                if transaction.future.done() or transaction.future.running():
+                    continue
+
+                if not transaction.future.set_running_or_notify_cancel():
+                    continue
+
+                return transaction
+
+    def __work(self):
+        """Worker thread body.
+        """
+
+        while True:
+
+            transaction = self.__take()
+            if transaction is None:
+                break
+
+            if transaction.deadline is not None and\
+                transaction.deadline < time.monotonic():
+                self.__expired += 1
+                transaction.future.set_exception(TimeoutError(\
+                    "MODBUS {} transaction expired in the queue.".format(self.__name)))
+                continue
+
+            try:
+                response = self.__client.execute(transaction.request)
+                transaction.future.set_result(response)
+
+            except Exception as error:
+                self.__logger.error(traceback.format_exc())
+                transaction.future.set_exception(error)
+
+            self.__executed += 1
+
+#endregion
+
+#region Public Methods
+
+    def submit(self, request, priority=None, timeout=None):
+        """Put the request in the queue.
+
+        Args:
+            request (ModbusRequest): PyMODBUS request instance.
+            priority (Priority, optional): Transaction priority.
+                Defaults to the priority of the function code.
+            timeout (float, optional): Seconds to wait in the queue before expiration.
+                Defaults to no expiration.
+
+        Returns:
+            Future: Future of the PyMODBUS response.
+                Cancelling a deduplicated read cancels it for all of its callers.
+        """
+
+        if priority is None:
+            priority = Priority.from_function_code(getattr(request, "function_code", None))
+
+        deadline = None
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+
+        key = TransactionQueue.__read_key(request)
+
+        with self.__condition:
+
+            self.__start()
+
+            transaction = None
+            if key is not None:
+                transaction = self.__reads.get(key)
+
+            if transaction is not None:
+                self.__deduplicated += 1
+
+                # Serve all callers, the latest deadline wins.
+                if transaction.deadline is not None:
+                    if deadline is None:
+                        transaction.deadline = None
+                    else:
+                        transaction.deadline = max(transaction.deadline, deadline)
+
+                # The old entry is skipped by the worker when this one is served first.
+                if priority.value < transaction.priority.value:
+                    transaction.priority = priority
+                    heapq.heappush(self.__heap,\
+                        TransactionQueue.__entry(transaction, next(self.__sequence)))
+
+                return transaction.future
+
+            transaction = Transaction(request, priority, deadline, key)
+            if key is not None:
+                self.__reads[key] = transaction
+
+            heapq.heappush(self.__heap,\
+                TransactionQueue.__entry(transaction, next(self.__sequence)))
+            self.__condition.notify()
+
+        return transaction.future
+
+    def execute(self, request, priority=None, timeout=None):
+        """Put the request in the queue and wait for the response.
+
+        Args:
+            request (ModbusRequest): PyMODBUS request instance.
+            priority (Priority, optional): Transaction priority.
+                Defaults to the priority of the function code.
+            timeout (float, optional): Seconds to wait in the queue before expiration.
+                Defaults to no expiration.
+
+        Returns:
+            ModbusResponse: PyMODBUS response instance.
+        """
+
+        return self.submit(request, priority, timeout).result()
+
+    def shutdown(self):
+        """Stop the worker thread and cancel the waiting transactions.
+        """
+
+        with self.__condition:
+            self.__stop = True
+            self.__condition.notify_all()
+            worker = self.__worker
+            self.__worker = None
+
+            for entry in self.__heap:
+                entry[3].future.cancel()
+
+            self.__heap.clear()
+            self.__reads.clear()
+
+        if worker is not None and worker is not threading.current_thread():
+            worker.join()
+
+#endregion
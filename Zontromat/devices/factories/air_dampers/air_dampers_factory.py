@@ -22,8 +22,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
-from devices.vendors.fonyes.model_1.model_1 import AirDamper1
-
 #region File Attributes
 
 __author__ = "Orlin Dimitrov"
@@ -98,6 +96,8 @@ class AirDampersFactory:
         # no_vendor_1 / air_damper_1 / (DO0,R0) / (DO1,R1) / DI0 / DI1
         if vendor == "fonyes" and  model == "model_1":
 
+            from devices.vendors.fonyes.model_1.model_1 import AirDamper1
+
             device = AirDamper1(
                 name=name,
                 controller=controller,
@@ -22,8 +22,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
-from devices.vendors.silpa.klimafan.klimafan import Klimafan
-
 #region File Attributes
 
 __author__ = "Orlin Dimitrov"
@@ -99,6 +97,8 @@ class ConvectorsFactory:
         # Silpa / Klimafan / (DO0,R0,U1:ID1:R0:DO0) / (DO1,R1,U1:ID1:R0:DO1) / (DO2,R2,U1:ID1:R0:DO2)
         if vendor == "Silpa" and  model == "Klimafan":
 
+            from devices.vendors.silpa.klimafan.klimafan import Klimafan
+
             device = Klimafan(
                 name=name,
                 controller=controller,
@@ -22,8 +22,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
-from devices.vendors.hangzhou_airflow_electric_applications.f3p146ec072600.f3p146ec072600 import F3P146EC072600
-
 #region File Attributes
 
 __author__ = "Orlin Dimitrov"
@@ -99,6 +97,8 @@ class FansFactory:
         # HangzhouAirflowElectricApplications / f3p146ec072600 / AO0
         if vendor == "HangzhouAirflowElectricApplications" and  model == "f3p146ec072600":
 
+            from devices.vendors.hangzhou_airflow_electric_applications.f3p146ec072600.f3p146ec072600 import F3P146EC072600
+
             device = F3P146EC072600(
                 name=name,
                 controller=controller,
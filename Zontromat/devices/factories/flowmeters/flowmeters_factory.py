@@ -22,10 +22,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
-from devices.vendors.enbra.sk09 import SK09
-from devices.vendors.mainone.flowmeter_dn20.flowmeter_dn20 import FlowmeterDN20
-from devices.vendors.smii.mw_uml_15.mw_uml_15 import MW_UML_15
-
 #region File Attributes
 
 __author__ = "Orlin Dimitrov"
@@ -101,6 +97,8 @@ class FlowmeterFactory:
         # enbra / SK09
         if vendor == "enbra" and  model == "sk09":
 
+            from devices.vendors.enbra.sk09 import SK09
+
             device = SK09(
                 name=name,
                 controller=controller,
@@ -110,6 +108,8 @@ class FlowmeterFactory:
         # mainone / flowmeter_dn20
         elif vendor == "mainone" and  model == "flowmeter_dn20":
 
+            from devices.vendors.mainone.flowmeter_dn20.flowmeter_dn20 import FlowmeterDN20
+
             device = FlowmeterDN20(
                 name=name,
                 controller=controller,
@@ -121,6 +121,8 @@ class FlowmeterFactory:
         # Wattmeter subcontractor of Mainone.
         elif vendor == "smii" and model == "mw_uml_15":
 
+            from devices.vendors.smii.mw_uml_15.mw_uml_15 import MW_UML_15
+
             device = MW_UML_15(
                 name=name,
                 controller=controller,
@@ -22,8 +22,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
-from devices.vendors.hstars_guangzhou_refrigerating_equipment_group.heat_pump import HP_40STD_N420WHSB4
-
 #region File Attributes
 
 __author__ = "Orlin Dimitrov"
@@ -99,6 +97,8 @@ class HeatPumpFactory:
         # HstarsGuangzhouRefrigeratingEquipmentGroup / HP_40STD_N420WHSB4 / 0
         if vendor == "HstarsGuangzhouRefrigeratingEquipmentGroup" and  model == "40STD-N420WHSB4":
 
+            from devices.vendors.hstars_guangzhou_refrigerating_equipment_group.heat_pump import HP_40STD_N420WHSB4
+
             device = HP_40STD_N420WHSB4(
                 name=name,
                 controller=controller,
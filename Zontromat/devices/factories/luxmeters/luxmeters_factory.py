@@ -22,11 +22,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
-from devices.vendors.sed_tronic.u1wtvs.u1wtvs import U1WTVS
-
-from devices.vendors.pt.light_sensor.light_sensor import LightSensor
-from devices.vendors.gemho.envse.envse import Envse
-
 #region File Attributes
 
 __author__ = "Orlin Dimitrov"
@@ -111,6 +106,8 @@ class LuxmeterFactory:
         # POLYGON Team / light_sensor
         if vendor == "PT" and  model == "light_sensor":
 
+            from devices.vendors.pt.light_sensor.light_sensor import LightSensor
+
             device = LightSensor(
                 name=name,
                 controller=controller,
@@ -120,6 +117,8 @@ class LuxmeterFactory:
         # SEDtronic / u1wtvs
         elif vendor == "SEDtronic" and model == "u1wtvs":
 
+            from devices.vendors.sed_tronic.u1wtvs.u1wtvs import U1WTVS
+
             device = U1WTVS(
                 name=name,
                 controller=controller,
@@ -130,6 +129,8 @@ class LuxmeterFactory:
         # Gemho / envse
         elif vendor == "Gemho" and model == "envse":
 
+            from devices.vendors.gemho.envse.envse import Envse
+
             device = Envse(
                 name=name,
                 controller=controller,
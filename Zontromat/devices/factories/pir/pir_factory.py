@@ -22,8 +22,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
-from devices.vendors.gasim.rs2.rs2 import RS2
-
 #region File Attributes
 
 __author__ = "Orlin Dimitrov"
@@ -109,6 +107,8 @@ class PIRFactory:
         # Gasim / RS2
         if vendor == "Gasim" and  model == "RS2":
 
+            from devices.vendors.gasim.rs2.rs2 import RS2
+
             device = RS2(
                 controller=controller,
                 name=name,
@@ -22,9 +22,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
-from devices.vendors.eastron.sdm120.sdm120 import SDM120
-from devices.vendors.eastron.sdm630.sdm630 import SDM630
-
 #region File Attributes
 
 __author__ = "Orlin Dimitrov"
@@ -110,6 +107,8 @@ class PowerAnalyzerFactory:
         # Eastron / SDM120
         if vendor == "Eastron" and  model == "SDM120":
 
+            from devices.vendors.eastron.sdm120.sdm120 import SDM120
+
             device = SDM120(
                 controller=controller,
                 name=name,
@@ -119,6 +118,8 @@ class PowerAnalyzerFactory:
         # Eastron / ACR122
         elif vendor == "Eastron" and model == "SDM630":
 
+            from devices.vendors.eastron.sdm630.sdm630 import SDM630
+
             device = SDM630(
                 controller=controller,
                 name=name,
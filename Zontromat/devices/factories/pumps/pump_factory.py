@@ -22,15 +22,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
-from devices.vendors.grundfos.magna1_80_100_f_360_1x230v_pn6.magna1_80_100_f_360_1x230v_pn6 import MAGNA1_80_100_F_360_1x230V_PN6
-from devices.vendors.grundfos.magna3_40_150_f_q.magna3_40_150_f_q import Magna3_40_150_F_Q
-from devices.vendors.grundfos.magna3_40_180_f_250_1x230v_pn6_10.magna3_40_180_f_250_1x230v_pn6_10 import MAGNA3_40_180_F_250_1x230V_PN6_10
-from devices.vendors.grundfos.nbe_65_125_127s2af2abqqe.nbe_65_125_127s2af2abqqe import NBE_65_125_127S2AF2ABQQE
-from devices.vendors.grundfos.tp_80_240_2_a_f_b_baqe_lx1_ie3.tp_80_240_2_a_f_b_baqe_lx1_ie3 import TP_80_240_2_A_F_B_BAQE_LX1_IE3
-from devices.vendors.grundfos.tpe3_40_240_s_a_f_a_bqbe_hac_ie5.tpe3_40_240_s_a_f_a_bqbe_hac_ie5 import TPE3_40_240_S_A_F_A_BQBE_HAC_IE5
-from devices.vendors.grundfos.tpe3_40_240_s_a_f_a_bqbe_hdc_ie5.tpe3_40_240_s_a_f_a_bqbe_hdc_ie5 import TPE3_40_240_S_A_F_A_BQBE_HDC_IE5
-from devices.vendors.grundfos.tpe_100_240_2_s_a_f_a_baqemdb.tpe_100_240_2_s_a_f_a_baqemdb import TPE_100_240_2_S_A_F_A_BAQEMDB
-
 #region File Attributes
 
 __author__ = "Orlin Dimitrov"
@@ -106,6 +97,8 @@ class PumpFactory:
         # Grundfos / MAGNA1_80_100_F_360_1x230V_PN6 / 0
         if vendor == "Grundfos" and  model == "MAGNA1_80_100_F_360_1x230V_PN6":
 
+            from devices.vendors.grundfos.magna1_80_100_f_360_1x230v_pn6.magna1_80_100_f_360_1x230v_pn6 import MAGNA1_80_100_F_360_1x230V_PN6
+
             device = MAGNA1_80_100_F_360_1x230V_PN6(
                 name=name,
                 controller=controller,
@@ -120,6 +113,8 @@ class PumpFactory:
         # Grundfos / Magna3_40_150_F_Q / 0
         elif vendor == "Grundfos" and  model == "Magna3_40_150_F_Q":
 
+            from devices.vendors.grundfos.magna3_40_150_f_q.magna3_40_150_f_q import Magna3_40_150_F_Q
+
             device = Magna3_40_150_F_Q(
                 name=name,
                 controller=controller,
@@ -129,6 +124,8 @@ class PumpFactory:
         # Grundfos / MAGNA3_40_180_F_250_1x230V_PN6_10 / 0
         elif vendor == "Grundfos" and  model == "MAGNA3_40_180_F_250_1x230V_PN6_10":
 
+            from devices.vendors.grundfos.magna3_40_180_f_250_1x230v_pn6_10.magna3_40_180_f_250_1x230v_pn6_10 import MAGNA3_40_180_F_250_1x230V_PN6_10
+
             device = MAGNA3_40_180_F_250_1x230V_PN6_10(
                 name=name,
                 controller=controller,
@@ -138,6 +135,8 @@ class PumpFactory:
         # Grundfos / NBE_65_125_127S2AF2ABQQE / 0
         elif vendor == "Grundfos" and  model == "NBE_65_125_127S2AF2ABQQE":
 
+            from devices.vendors.grundfos.nbe_65_125_127s2af2abqqe.nbe_65_125_127s2af2abqqe import NBE_65_125_127S2AF2ABQQE
+
             device = NBE_65_125_127S2AF2ABQQE(
                 name=name,
                 controller=controller,
@@ -147,6 +146,8 @@ class PumpFactory:
         # Grundfos / TP_80_240_2_A_F_B_BAQE_LX1_IE3 / 0
         elif vendor == "Grundfos" and  model == "TP_80_240_2_A_F_B_BAQE_LX1_IE3":
 
+            from devices.vendors.grundfos.tp_80_240_2_a_f_b_baqe_lx1_ie3.tp_80_240_2_a_f_b_baqe_lx1_ie3 import TP_80_240_2_A_F_B_BAQE_LX1_IE3
+
             device = TP_80_240_2_A_F_B_BAQE_LX1_IE3(
                 name=name,
                 controller=controller,
@@ -156,6 +157,8 @@ class PumpFactory:
         # Grundfos / TPE_100_240_2_S_A_F_A_BAQEMDB / 0
         elif vendor == "Grundfos" and  model == "TPE_100_240_2_S_A_F_A_BAQEMDB":
 
+            from devices.vendors.grundfos.tpe_100_240_2_s_a_f_a_baqemdb.tpe_100_240_2_s_a_f_a_baqemdb import TPE_100_240_2_S_A_F_A_BAQEMDB
+
             device = TPE_100_240_2_S_A_F_A_BAQEMDB(
                 name=name,
                 controller=controller,
@@ -165,6 +168,8 @@ class PumpFactory:
         # Grundfos / TPE3_40_240_S_A_F_A_BQBE_HAC_IE5 / 0
         elif vendor == "Grundfos" and  model == "TPE3_40_240_S_A_F_A_BQBE_HAC_IE5":
 
+            from devices.vendors.grundfos.tpe3_40_240_s_a_f_a_bqbe_hac_ie5.tpe3_40_240_s_a_f_a_bqbe_hac_ie5 import TPE3_40_240_S_A_F_A_BQBE_HAC_IE5
+
             device = TPE3_40_240_S_A_F_A_BQBE_HAC_IE5(
                 name=name,
                 controller=controller,
@@ -174,6 +179,8 @@ class PumpFactory:
         # Grundfos / TPE3_40_240_S_A_F_A_BQBE_HDC_IE5 / 0
         elif vendor == "Grundfos" and  model == "TPE3_40_240_S_A_F_A_BQBE_HDC_IE5":
 
+            from devices.vendors.grundfos.tpe3_40_240_s_a_f_a_bqbe_hdc_ie5.tpe3_40_240_s_a_f_a_bqbe_hdc_ie5 import TPE3_40_240_S_A_F_A_BQBE_HDC_IE5
+
             device = TPE3_40_240_S_A_F_A_BQBE_HDC_IE5(
                 name=name,
                 controller=controller,
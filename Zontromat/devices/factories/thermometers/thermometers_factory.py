@@ -22,13 +22,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
-from devices.vendors.dallas.ds18b20.ds18b20 import DS18B20
-from devices.vendors.sed_tronic.u1wtvs.u1wtvs import U1WTVS
-from devices.vendors.donkger.xy_md02.xy_md02 import XYMD02
-from devices.vendors.mainone.thermometer.ushm_inlet import USHMInlet
-from devices.vendors.mainone.flowmeter_dn20.flowmeter_dn20 import FlowmeterDN20
-from devices.vendors.gemho.envse.envse import Envse
-from devices.vendors.cwt.mb318e.mb318e import MB318E
 
 #region File Attributes
 
@@ -104,6 +97,8 @@ class ThermometersFactory:
         # Dallas / DS18B20
         if vendor == "Dallas" and  model == "DS18B20":
 
+            from devices.vendors.dallas.ds18b20.ds18b20 import DS18B20
+
             device = DS18B20(
                 name=name,
                 controller=controller,
@@ -114,6 +109,8 @@ class ThermometersFactory:
         # SEDtronic / u1wtvs
         elif vendor == "SEDtronic" and model == "u1wtvs":
 
+            from devices.vendors.sed_tronic.u1wtvs.u1wtvs import U1WTVS
+
             device = U1WTVS(
                 name=name,
                 controller=controller,
@@ -124,6 +121,8 @@ class ThermometersFactory:
         # Donkger / u1wtvs
         elif vendor == "Donkger" and model == "XY-MD02":
 
+            from devices.vendors.donkger.xy_md02.xy_md02 import XYMD02
+
             device = XYMD02(
                 name=name,
                 controller=controller,
@@ -134,6 +133,8 @@ class ThermometersFactory:
         # mainone / flowmeter_dn20
         elif vendor == "mainone" and  model == "flowmeter_dn20":
 
+            from devices.vendors.mainone.flowmeter_dn20.flowmeter_dn20 import FlowmeterDN20
+
             device = FlowmeterDN20(
                 name=name,
                 controller=controller,
@@ -144,6 +145,8 @@ class ThermometersFactory:
         # Gemho / Envse
         elif vendor == "Gemho" and  model == "Envse":
 
+            from devices.vendors.gemho.envse.envse import Envse
+
             device = Envse(
                 name=name,
                 controller=controller,
@@ -154,6 +157,8 @@ class ThermometersFactory:
         # CWT / Envse
         elif vendor == "CWT" and  model == "MB318E":
 
+            from devices.vendors.cwt.mb318e.mb318e import MB318E
+
             device = MB318E(
                 name=name,
                 controller=controller,
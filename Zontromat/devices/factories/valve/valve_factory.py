@@ -22,9 +22,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
-from devices.vendors.tonhe.a20m15b2c.a20m15b2c import A20M15B2C
-from devices.vendors.tonhe.a20t20b2c.a20t20b2c import A20T20B2C
-from devices.vendors.flowx.flx05f.flx05f import FLX05F
 
 #region File Attributes
 
@@ -104,6 +101,8 @@ class ValveFactory:
             if "output_enable" in config["options"]:
                 output_enable = config["options"]["output_enable"]
 
+            from devices.vendors.flowx.flx05f.flx05f import FLX05F
+
             device = FLX05F(
                 name=name,
                 controller=controller,
@@ -119,6 +118,8 @@ class ValveFactory:
         # Tonhe / a20m15b2c / (RO0/AO0) / AI0
         elif vendor == "Tonhe" and model == "a20m15b2c":
 
+            from devices.vendors.tonhe.a20m15b2c.a20m15b2c import A20M15B2C
+
             device = A20M15B2C(
                 name=name,
                 controller=controller,
@@ -131,6 +132,8 @@ class ValveFactory:
         # Tonhe / a20t20b2c / (RO0/AO0) / AI0
         elif vendor == "Tonhe" and model == "a20t20b2c":
 
+            from devices.vendors.tonhe.a20t20b2c.a20t20b2c import A20T20B2C
+
             device = A20T20B2C(
                 name=name,
                 controller=controller,
@@ -31,6 +31,7 @@ from devices.vendors.dallas.ds2480b.commands import Commands
 from devices.vendors.dallas.ds2480b.slew_rate_controll import PulldownSlewRateControl
 from devices.vendors.dallas.ds2480b.low_time import Write1LowTime
 from devices.vendors.dallas.ds2480b.data_sample import DataSampleOffsetAndWrite0RecoveryTime
+from devices.vendors.dallas.ds18b20.commands import Commands as DS18B20
 
 from utils.logger import get_logger
 
@@ -83,6 +84,14 @@ class DS2480B(BaseDevice):
     """Timeout
     """
 
+    __conversion_time = 0.75
+    """Temperature conversion time of DS18B20 at 12 bits resolution.
+    """
+
+    __data_mode = False
+    """The bus master is in data mode. Each byte sent in it gives one byte response.
+    """
+
 #endregion
 
 #region Constructor
@@ -99,14 +108,17 @@ class DS2480B(BaseDevice):
 
         self.__logger = get_logger(__name__)
 
-        # Create port.
+        if "timeout" in self._config:
+            self.__timeout = self._config["timeout"]
+
+        if "conversion_time" in self._config:
+            self.__conversion_time = self._config["conversion_time"]
+
+        # Create port. The reads block until the whole response is received or the timeout.
         self.__serial_port = serial.Serial(\
             port=self._config["port_name"],\
             baudrate=self._config["baudrate"],
-            timeout=1)
-
-        if "timeout" in self._config:
-            self.__timeout = self._config["timeout"]
+            timeout=self.__timeout)
 
 #endregion
 
@@ -129,25 +141,70 @@ class DS2480B(BaseDevice):
         self.__logger.debug(msg)
         self.__serial_port.write(frame)
 
-    def __receive(self):
-        """Receive response.
+    def __response_size(self, frame):
+        """Calculate the size of the response of the request.
+
+        Args:
+            frame (byte array): Request package.
+
+        Returns:
+            int: Count of the response bytes.
         """
 
-        frame = None
-        wait = 0.1
-        times = 0
+        size = 0
+        index = 0
+
+        while index < len(frame):
+
+            item = frame[index]
+            index += 1
+
+            if self.__data_mode:
+                if item != Commands.SwitchToCommandMode.value:
+                    size += 1
+
+                # Sent twice, it is one data byte.
+                elif index < len(frame) and frame[index] == Commands.SwitchToCommandMode.value:
+                    size += 1
+                    index += 1
+
+                else:
+                    self.__data_mode = False
 
-        while True:
-            size = self.__serial_port.inWaiting()
-            if size > 0:
-                frame = self.__serial_port.read(size)
-                break
+            elif item == Commands.SwitchToDataMode.value:
+                self.__data_mode = True
 
-            times += wait
-            time.sleep(wait)
+            elif item == Commands.SwitchToCommandMode.value:
+                pass
 
-            if times > self.__timeout:
-                raise TimeoutError("Time out has ocurred in Communicator.")
+            # Search accelerator control commands has no response.
+            elif (item & 0xE3) == 0xA1:
+                pass
+
+            else:
+                size += 1
+
+        return size
+
+    def __receive(self, size):
+        """Receive response.
+
+        Args:
+            size (int): Count of the expected bytes.
+
+        Returns:
+            byte array: Response package.
+        """
+
+        # Block on the port until the whole frame is received.
+        frame = self.__serial_port.read(size)
+        if len(frame) < size:
+            raise TimeoutError("Time out has ocurred in Communicator.")
+
+        # Do not leave unexpected bytes for the next request.
+        size = self.__serial_port.inWaiting()
+        if size > 0:
+            frame += self.__serial_port.read(size)
 
         msg = "RX < {}".format(self.__make_buffer(frame))
         self.__logger.debug(msg)
@@ -172,11 +229,61 @@ class DS2480B(BaseDevice):
             raise FileNotFoundError("Port is not opened on level Communicator.")
 
         #self._open()
+        size = self.__response_size(req_frame)
         self.__send(req_frame)
-        res_frame = self.__receive()
+        res_frame = self.__receive(size)
         #self._close()
         return res_frame
 
+    def __crc8(self, data):
+        """Dallas/Maxim CRC8 of the data.
+
+        Args:
+            data (byte array): Data.
+
+        Returns:
+            int: CRC
+        """
+
+        crc = 0
+
+        for item in data:
+            for _ in range(8):
+                mix = (crc ^ item) & 0x01
+                crc >>= 1
+                if mix:
+                    crc ^= 0x8C
+                item >>= 1
+
+        return crc
+
+    def __escape(self, data):
+        """Bytes to send in data mode. The switch to command mode value is sent twice,
+        so the master takes it as data.
+
+        Args:
+            data (list): Data bytes.
+
+        Returns:
+            list: Escaped data bytes.
+        """
+
+        escaped = []
+
+        for item in data:
+            escaped.append(item)
+
+            if item == Commands.SwitchToCommandMode.value:
+                escaped.append(item)
+
+        return escaped
+
+    def __reset_request(self):
+        """Request of the bus reset.
+        """
+
+        return [Commands.SwitchToCommandMode.value, Commands.CommandResetAtFlexSpeed.value]
+
     def __decode_search_response(self, response):
 
         bytes_count = len(response)
@@ -345,8 +452,7 @@ class DS2480B(BaseDevice):
         commands = []
         if "commands" in config:
             commands = config["commands"]
-        for command in commands:
-            request.append(command)
+        request.extend(self.__escape(commands))
 
         request.append(Commands.SwitchToCommandMode.value)
         request.append(Commands.CommandSearchAcceleratorControlOnAtRegularSpeed.value)
@@ -373,8 +479,7 @@ class DS2480B(BaseDevice):
         commands = []
         if "commands" in config:
             commands = config["commands"]
-        for command in commands:
-            request.append(command)
+        request.extend(self.__escape(commands))
 
         request.append(Commands.SwitchToCommandMode.value)
         request.append(Commands.CommandSingleBitReadDataAtFlexSpeed.value)
@@ -394,8 +499,7 @@ class DS2480B(BaseDevice):
         commands = []
         if "commands" in config:
             commands = config["commands"]
-        for command in commands:
-            request.append(command)
+        request.extend(self.__escape(commands))
 
         response = self.__send_request(request)
 
@@ -412,11 +516,77 @@ class DS2480B(BaseDevice):
         commands = []
         if "commands" in config:
             commands = config["commands"]
-        for command in commands:
-            request.append(command)
+        request.extend(self.__escape(commands))
 
         response = self.__send_request(request)
 
         return response
 
+    def convert_all(self):
+        """Start the temperature conversion of all DS18B20 on the bus at once.
+
+        Returns:
+            byte array: Response package.
+        """
+
+        request = self.__reset_request()
+        request.append(Commands.SwitchToDataMode.value)
+        request.append(DS18B20.SKIP_ROM.value)
+        request.append(DS18B20.CONVERT_T.value)
+
+        return self.__send_request(request)
+
+    def read_temperatures(self, roms, convert=True):
+        """Read the temperatures of DS18B20 sensors.
+        The conversion is started for all sensors at once and after it
+        the scratchpads are read in one request.
+
+        Args:
+            roms (list): ROM codes of the sensors, 8 bytes each.
+            convert (bool): Start the conversion and wait for it. Defaults to True.
+
+        Returns:
+            list: Temperatures in deg C, None for the sensors with bad CRC.
+        """
+
+        if len(roms) == 0:
+            return []
+
+        if convert:
+            self.convert_all()
+            time.sleep(self.__conversion_time)
+
+        # Reset, select and read the scratchpad of each sensor.
+        request = []
+        for rom in roms:
+            request.extend(self.__reset_request())
+            request.append(Commands.SwitchToDataMode.value)
+            request.append(DS18B20.MATCH_ROM.value)
+            request.extend(self.__escape(rom))
+            request.append(DS18B20.READ_SCRATCHPAD.value)
+            request.extend([0xFF] * 9)
+
+        response = self.__send_request(request)
+
+        # Reset response, echo of match ROM, ROM code and read scratchpad.
+        offset = 1 + 1 + 8 + 1
+        frame_size = offset + 9
+
+        temperatures = []
+        for index in range(len(roms)):
+            scratchpad = response[index * frame_size + offset:(index + 1) * frame_size]
+
+            if len(scratchpad) < 9 or self.__crc8(scratchpad[:8]) != scratchpad[8]:
+                self.__logger.warning("Bad scratchpad of sensor {}".format(self.__make_buffer(roms[index])))
+                temperatures.append(None)
+                continue
+
+            raw = scratchpad[0] | (scratchpad[1] << 8)
+            if raw & 0x8000:
+                raw -= 0x10000
+
+            temperatures.append(raw / 16.0)
+
+        return temperatures
+
 #endregion
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2021] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import argparse
+import time
+
+from devices.vendors.dallas.ds2480b.ds2480b import DS2480B
+from devices.vendors.dallas.ds2480b.tests.fake_ds2480b import FakeDS2480B
+from devices.vendors.dallas.ds2480b.tests.fake_ds2480b import sensor_roms
+from devices.vendors.dallas.ds18b20.commands import Commands as DS18B20
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2021, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+def read_sequential(owbm, roms, conversion_time):
+    """Read the sensors one by one, as in the example of the driver.
+
+    Returns:
+        list: Temperatures in deg C.
+    """
+
+    temperatures = []
+
+    for rom in roms:
+        owbm.reset_the_bus()
+
+        commands = [DS18B20.MATCH_ROM.value]
+        commands.extend(rom)
+        commands.append(DS18B20.CONVERT_T.value)
+        owbm.read_device_param(commands=commands)
+
+        time.sleep(conversion_time)
+        owbm.reset_the_bus()
+
+        commands = [DS18B20.MATCH_ROM.value]
+        commands.extend(rom)
+        commands.append(DS18B20.READ_SCRATCHPAD.value)
+        commands.extend([0xFF] * 9)
+        response = owbm.read_scratchpad(commands=commands)
+
+        raw = response[10] | (response[11] << 8)
+        if raw & 0x8000:
+            raw -= 0x10000
+        temperatures.append(raw / 16.0)
+
+    return temperatures
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--sensors", type=int, default=5, help="Count of the sensors on the bus.")
+    parser.add_argument("--byte-time", type=float, default=10 / 9600, help="Transmit time of one byte.")
+    parser.add_argument("--conversion-time", type=float, default=0.75, help="Conversion time of the sensors.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    temperatures = {}
+    for index, rom in enumerate(sensor_roms(args.sensors)):
+        temperatures[rom] = 20.0 + index * 0.5 - index * index * 0.0625
+    roms = list(temperatures)
+    expected = list(temperatures.values())
+
+    fake = FakeDS2480B(temperatures, args.byte_time)
+    fake.start()
+
+    try:
+        owbm = DS2480B(port_name=fake.port_name, baudrate=9600,\
+            conversion_time=args.conversion_time, timeout=2)
+        owbm.connect()
+        owbm.sync_the_uart()
+        owbm.configure_the_bus()
+
+        t_start = time.perf_counter()
+        values = read_sequential(owbm, roms, args.conversion_time)
+        t_passed = time.perf_counter() - t_start
+        print("Sequential: {:8.1f} ms per sensor; valid: {}"\
+            .format(t_passed * 1000 / args.sensors, values == expected))
+
+        if hasattr(owbm, "read_temperatures"):
+            t_start = time.perf_counter()
+            values = owbm.read_temperatures(roms)
+            t_passed = time.perf_counter() - t_start
+            print("Pipelined:  {:8.1f} ms per sensor; valid: {}"\
+                .format(t_passed * 1000 / args.sensors, values == expected))
+
+        # The pseudo terminal has no modem lines, so the driver is not disconnected.
+
+    finally:
+        fake.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2021] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import os
+import select
+import threading
+import time
+import tty
+
+from devices.vendors.dallas.ds2480b.commands import Commands
+from devices.vendors.dallas.ds18b20.commands import Commands as DS18B20
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2021, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+def crc8(data):
+    """Dallas/Maxim CRC8 of the data.
+    """
+
+    crc = 0
+
+    for item in data:
+        for _ in range(8):
+            mix = (crc ^ item) & 0x01
+            crc >>= 1
+            if mix:
+                crc ^= 0x8C
+            item >>= 1
+
+    return crc
+
+def sensor_roms(count):
+    """ROM codes of DS18B20 sensors. Every second one has 0xE3 in its serial number,
+    the value that switches the master to command mode.
+
+    Args:
+        count (int): Count of the sensors.
+
+    Returns:
+        list: ROM codes (bytes).
+    """
+
+    roms = []
+
+    for index in range(count):
+        rom = [DS18B20.FamilyCode.value, 0xE3 if index % 2 else 0xFF, 0xFC, 0xD0, 0x00, 0x17, index]
+        rom.append(crc8(rom))
+        roms.append(bytes(rom))
+
+    return roms
+
+class FakeDS2480B:
+    """DS2480B with DS18B20 sensors on a pseudo terminal, for tests without hardware.
+    """
+
+#region Constructor
+
+    def __init__(self, temperatures, byte_time=0.0):
+        """Constructor
+
+        Args:
+            temperatures (dict): Temperature in deg C by ROM code (bytes).
+            byte_time (float): Transmit time of one response byte. Defaults to 0.0.
+        """
+
+        self.__temperatures = temperatures
+        """Temperature by ROM code.
+        """
+
+        self.__scratchpads = {}
+        """Scratchpad by ROM code, the power on value is 85 deg C.
+        """
+
+        for rom in temperatures:
+            self.__scratchpads[rom] = self.__scratchpad(85.0)
+
+        self.__byte_time = byte_time
+        """Transmit time of one response byte.
+        """
+
+        self.__master = None
+        """Master side of the pseudo terminal.
+        """
+
+        self.__slave = None
+        """Slave side of the pseudo terminal.
+        """
+
+        self.__thread = None
+        """Worker thread.
+        """
+
+        self.__stop = threading.Event()
+        """Stop flag.
+        """
+
+        self.__data_mode = False
+        """Bus master mode.
+        """
+
+        self.__escape = False
+        """Switch to command mode is received in data mode, the next byte tells if it is data.
+        """
+
+        self.__state = "idle"
+        """1-Wire transaction state: idle, rom, match, function, read.
+        """
+
+        self.__rom = []
+        """ROM code that is received with match ROM.
+        """
+
+        self.__selected = []
+        """Selected sensors.
+        """
+
+        self.__read_index = 0
+        """Index of the scratchpad byte to read.
+        """
+
+#endregion
+
+#region Properties
+
+    @property
+    def port_name(self):
+        """Name of the port to open with the driver.
+
+        Returns:
+            str: Name of the slave terminal.
+        """
+
+        return os.ttyname(self.__slave)
+
+#endregion
+
+#region Private Methods
+
+    def __scratchpad(self, temperature):
+        """Scratchpad with the temperature.
+        """
+
+        raw = int(round(temperature * 16)) & 0xFFFF
+        scratchpad = [raw & 0xFF, raw >> 8, 0x4B, 0x46, 0x7F, 0xFF, 0x0C, 0x10]
+        scratchpad.append(crc8(scratchpad))
+
+        return scratchpad
+
+    def __data_byte(self, item):
+        """Write and read one byte on the 1-Wire bus.
+        """
+
+        response = item
+
+        if self.__state == "rom":
+            if item == DS18B20.SKIP_ROM.value:
+                self.__selected = list(self.__temperatures)
+                self.__state = "function"
+
+            elif item == DS18B20.MATCH_ROM.value:
+                self.__rom = []
+                self.__state = "match"
+
+        elif self.__state == "match":
+            self.__rom.append(item)
+            if len(self.__rom) == 8:
+                rom = bytes(self.__rom)
+                self.__selected = [rom] if rom in self.__temperatures else []
+                self.__state = "function"
+
+        elif self.__state == "function":
+            self.__state = "idle"
+
+            if item == DS18B20.CONVERT_T.value:
+                for rom in self.__selected:
+                    self.__scratchpads[rom] = self.__scratchpad(self.__temperatures[rom])
+
+            elif item == DS18B20.READ_SCRATCHPAD.value:
+                self.__read_index = 0
+                self.__state = "read"
+
+        elif self.__state == "read":
+
+            # Only one sensor may talk, the bus is pulled up otherwise.
+            if len(self.__selected) == 1 and self.__read_index < 9:
+                response &= self.__scratchpads[self.__selected[0]][self.__read_index]
+                self.__read_index += 1
+
+        return response
+
+    def __process(self, frame):
+        """Process the received bytes.
+
+        Returns:
+            bytes: Response.
+        """
+
+        response = bytearray()
+
+        for item in frame:
+
+            if self.__data_mode:
+
+                # Sent twice, it is one data byte.
+                if self.__escape:
+                    self.__escape = False
+                    if item == Commands.SwitchToCommandMode.value:
+                        response.append(self.__data_byte(item))
+                        continue
+
+                    self.__data_mode = False
+
+                elif item == Commands.SwitchToCommandMode.value:
+                    self.__escape = True
+                    continue
+
+                else:
+                    response.append(self.__data_byte(item))
+                    continue
+
+            if item == Commands.SwitchToDataMode.value:
+                self.__data_mode = True
+
+            elif item == Commands.SwitchToCommandMode.value:
+                pass
+
+            # Search accelerator control.
+            elif (item & 0xE3) == 0xA1:
+                pass
+
+            # Reset with presence pulse.
+            elif (item & 0xE0) == 0xC0:
+                self.__state = "rom"
+                response.append(0xCD)
+
+            # Single bit, read as 1.
+            elif (item & 0xE0) == 0x80:
+                response.append(item | 0x02)
+
+            # Configuration.
+            else:
+                response.append(item & 0xFE)
+
+        return bytes(response)
+
+    def __run(self):
+        """Serve the requests.
+        """
+
+        while not self.__stop.is_set():
+
+            readable, _, _ = select.select([self.__master], [], [], 0.1)
+            if not readable:
+                continue
+
+            try:
+                frame = os.read(self.__master, 1024)
+            except OSError:
+                break
+
+            response = self.__process(frame)
+            if len(response) == 0:
+                continue
+
+            if self.__byte_time > 0:
+                time.sleep(len(response) * self.__byte_time)
+
+            os.write(self.__master, response)
+
+#endregion
+
+#region Public Methods
+
+    def start(self):
+        """Open the pseudo terminal and start serving.
+        """
+
+        self.__master, self.__slave = os.openpty()
+        tty.setraw(self.__master)
+        tty.setraw(self.__slave)
+
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """Stop serving and close the pseudo terminal.
+        """
+
+        self.__stop.set()
+
+        if self.__thread is not None:
+            self.__thread.join()
+
+        os.close(self.__master)
+        os.close(self.__slave)
+
+#endregion
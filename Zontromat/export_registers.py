@@ -106,6 +106,10 @@ __enable_matrix = \
         Profiles.NORTH_SERVER_ROOMS: ["sys", ]
     }
 
+ENABLED = object()
+"""Default value of the plugin enable flag in the tables, it is taken from the enable matrix.
+"""
+
 #endregion
 
 def __is_enabled(name: str, profile: Profiles):
@@ -121,10 +125,37 @@ def __is_enabled(name: str, profile: Profiles):
 
     return state
 
+def __add_table(args, plugin_name, profiles, rows):
+    """Add the registers of plugin, described by table.
+
+    Args:
+        args (Namespace): Arguments.
+        plugin_name (str): Plugin name of the registers.
+        profiles (list): Profiles that the registers are used in.
+        rows (list): Tuples of name, scope, description, range and default value.
+    """
+
+    global __registers
+
+    for name, scope, description, range, value in rows:
+
+        register = Register(name)
+        register.scope = scope
+        register.plugin_name = plugin_name
+        register.description = description
+        register.range = range
+        register.profiles = Register.create_profile(*[profile.value for profile in profiles])
+
+        if value is ENABLED:
+            value = __is_enabled(register.base_name, args.profile)
+
+        register.value = value
+        __registers.append(register)
+
 def __set_parser():
     global __parser, INVALID_MB_ID
 
-    actions = ["w_csv", "w_json", "w_md"]
+    actions = ["w_csv", "w_json", "w_md", "w_bin"]
 
     # Add action.
     __parser.add_argument("--action", type=str, default="w_csv", choices=actions, help="Export to file.")
@@ -643,7 +674,7 @@ def __add_registers(args):
             }
         }
     else:
-        register.valve = {}
+        register.value = {}
     register.profiles = Register.create_profile(Profiles.ZONE.value)
     __registers.append(register)
 
@@ -775,6 +806,24 @@ def __add_registers(args):
     register.profiles = Register.create_profile(Profiles.ZONE.value)
     __registers.append(register)
 
+    register = Register("monitoring.cw.measurements_1m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Cold water liters by 1 minute, last hour"
+    register.range = REGS_RANGES["NONE"]
+    register.value = []
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
+    register = Register("monitoring.cw.measurements_15m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Cold water liters by 15 minutes"
+    register.range = REGS_RANGES["NONE"]
+    register.value = []
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
     register = Register("monitoring.cw.leak")
     register.scope = Scope.Device
     register.plugin_name = "Monitoring"
@@ -814,6 +863,24 @@ def __add_registers(args):
     register.profiles = Register.create_profile(Profiles.ZONE.value)
     __registers.append(register)
 
+    register = Register("monitoring.hw.measurements_1m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Hot water liters by 1 minute, last hour"
+    register.range = REGS_RANGES["NONE"]
+    register.value = []
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
+    register = Register("monitoring.hw.measurements_15m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Hot water liters by 15 minutes"
+    register.range = REGS_RANGES["NONE"]
+    register.value = []
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
     register = Register("monitoring.hw.leak")
     register.scope = Scope.Device
     register.plugin_name = "Monitoring"
@@ -854,6 +921,24 @@ def __add_registers(args):
     register.profiles = Register.create_profile(Profiles.ZONE.value)
     __registers.append(register)
 
+    register = Register("monitoring.pa.measurements_1m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Power analyzer measurements by 1 minute, last hour"
+    register.range = REGS_RANGES["NONE"]
+    register.value = []
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
+    register = Register("monitoring.pa.measurements_15m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Power analyzer measurements by 15 minutes"
+    register.range = REGS_RANGES["NONE"]
+    register.value = []
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
     # ====================== NEW ======================
 
     register = Register("monitoring.demand_time")
@@ -865,6 +950,15 @@ def __add_registers(args):
     register.profiles = Register.create_profile(Profiles.ZONE.value)
     __registers.append(register)
 
+    register = Register("monitoring.raw_window")
+    register.scope = Scope.System
+    register.plugin_name = "Monitoring"
+    register.description = "Raw measurements window"
+    register.range = "0.0/"
+    register.value = 900.0 # Last 15 minutes, the older are in the rollups.
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
 
     register = Register("monitoring.fl_1.hm.settings")
     register.scope = Scope.System
@@ -895,6 +989,24 @@ def __add_registers(args):
     register.profiles = Register.create_profile(Profiles.ZONE.value)
     __registers.append(register)
 
+    register = Register("monitoring.fl_1.hm.measurements_1m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Floor loop 1 heat meter measurements. by 1 minute, last hour"
+    register.range = REGS_RANGES["NONE"]
+    register.value = {}
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
+    register = Register("monitoring.fl_1.hm.measurements_15m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Floor loop 1 heat meter measurements. by 15 minutes"
+    register.range = REGS_RANGES["NONE"]
+    register.value = {}
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
 
     register = Register("monitoring.fl_2.hm.settings")
     register.scope = Scope.System
@@ -926,6 +1038,24 @@ def __add_registers(args):
     register.profiles = Register.create_profile(Profiles.ZONE.value)
     __registers.append(register)
 
+    register = Register("monitoring.fl_2.hm.measurements_1m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Floor loop 2 heat meter measurements. by 1 minute, last hour"
+    register.range = REGS_RANGES["NONE"]
+    register.value = {}
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
+    register = Register("monitoring.fl_2.hm.measurements_15m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Floor loop 2 heat meter measurements. by 15 minutes"
+    register.range = REGS_RANGES["NONE"]
+    register.value = {}
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
 
     register = Register("monitoring.fl_3.hm.settings")
     register.scope = Scope.System
@@ -956,6 +1086,24 @@ def __add_registers(args):
     register.profiles = Register.create_profile(Profiles.ZONE.value)
     __registers.append(register)
 
+    register = Register("monitoring.fl_3.hm.measurements_1m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Floor loop 3 heat meter measurements. by 1 minute, last hour"
+    register.range = REGS_RANGES["NONE"]
+    register.value = {}
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
+    register = Register("monitoring.fl_3.hm.measurements_15m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Floor loop 3 heat meter measurements. by 15 minutes"
+    register.range = REGS_RANGES["NONE"]
+    register.value = {}
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
 
     register = Register("monitoring.cl_1.hm.settings")
     register.scope = Scope.System
@@ -986,6 +1134,24 @@ def __add_registers(args):
     register.profiles = Register.create_profile(Profiles.ZONE.value)
     __registers.append(register)
 
+    register = Register("monitoring.cl_1.hm.measurements_1m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Convector loop 1 heat meter measurements. by 1 minute, last hour"
+    register.range = REGS_RANGES["NONE"]
+    register.value = {}
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
+    register = Register("monitoring.cl_1.hm.measurements_15m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Convector loop 1 heat meter measurements. by 15 minutes"
+    register.range = REGS_RANGES["NONE"]
+    register.value = {}
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
 
     register = Register("monitoring.cl_2.hm.settings")
     register.scope = Scope.System
@@ -1016,6 +1182,24 @@ def __add_registers(args):
     register.profiles = Register.create_profile(Profiles.ZONE.value)
     __registers.append(register)
 
+    register = Register("monitoring.cl_2.hm.measurements_1m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Convector loop 2 heat meter measurements. by 1 minute, last hour"
+    register.range = REGS_RANGES["NONE"]
+    register.value = {}
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
+    register = Register("monitoring.cl_2.hm.measurements_15m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Convector loop 2 heat meter measurements. by 15 minutes"
+    register.range = REGS_RANGES["NONE"]
+    register.value = {}
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
 
     register = Register("monitoring.cl_3.hm.settings")
     register.scope = Scope.System
@@ -1046,6 +1230,24 @@ def __add_registers(args):
     register.profiles = Register.create_profile(Profiles.ZONE.value)
     __registers.append(register)
 
+    register = Register("monitoring.cl_3.hm.measurements_1m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Convector loop 3 heat meter measurements. by 1 minute, last hour"
+    register.range = REGS_RANGES["NONE"]
+    register.value = {}
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
+    register = Register("monitoring.cl_3.hm.measurements_15m")
+    register.scope = Scope.Device
+    register.plugin_name = "Monitoring"
+    register.description = "Convector loop 3 heat meter measurements. by 15 minutes"
+    register.range = REGS_RANGES["NONE"]
+    register.value = {}
+    register.profiles = Register.create_profile(Profiles.ZONE.value)
+    __registers.append(register)
+
     # ====================== DEPRECATED ======================
 
     register = Register("monitoring.pa.demand_time")
@@ -2050,7 +2252,20 @@ def __add_registers(args):
             Profiles.DISTRIBUTION.value,
             Profiles.HEAT_PUMP.value,
             Profiles.NORTH_SERVER_ROOMS.value)
-    # GlobalErrorHandler.set_register(register)
+    __registers.append(register)
+
+    # Rates of the error codes
+    register = Register("sys.last_update_errs.rates")
+    register.scope = Scope.Device
+    register.plugin_name = "System"
+    register.description = "Error codes occurrences per minute"
+    register.range = REGS_RANGES["NONE"]
+    register.value = {}
+    register.profiles = \
+            Register.create_profile(Profiles.ZONE.value,
+            Profiles.DISTRIBUTION.value,
+            Profiles.HEAT_PUMP.value,
+            Profiles.NORTH_SERVER_ROOMS.value)
     __registers.append(register)
 
     # Systrem resources
@@ -2080,6 +2295,19 @@ def __add_registers(args):
             Profiles.NORTH_SERVER_ROOMS.value)
     __registers.append(register)
 
+    register = Register("sys.ram.profile")
+    register.scope = Scope.System
+    register.plugin_name = "System"
+    register.description = "Trace the memory allocations"
+    register.range = REGS_RANGES["BOOL"]
+    register.value = False
+    register.profiles = \
+            Register.create_profile(Profiles.ZONE.value,
+            Profiles.DISTRIBUTION.value,
+            Profiles.HEAT_PUMP.value,
+            Profiles.NORTH_SERVER_ROOMS.value)
+    __registers.append(register)
+
     register = Register("sys.time.usage")
     register.scope = Scope.Device
     register.plugin_name = "System"
@@ -2093,6 +2321,32 @@ def __add_registers(args):
             Profiles.NORTH_SERVER_ROOMS.value)
     __registers.append(register)
 
+    register = Register("sys.time.profile")
+    register.scope = Scope.Device
+    register.plugin_name = "System"
+    register.description = "Application time cycle sections, p50, p95 and max in ms"
+    register.range = REGS_RANGES["NONE"]
+    register.value = {}
+    register.profiles = \
+            Register.create_profile(Profiles.ZONE.value,
+            Profiles.DISTRIBUTION.value,
+            Profiles.HEAT_PUMP.value,
+            Profiles.NORTH_SERVER_ROOMS.value)
+    __registers.append(register)
+
+    register = Register("sys.plugins.overruns")
+    register.scope = Scope.Device
+    register.plugin_name = "System"
+    register.description = "Plugins updates over the time budget and skipped updates"
+    register.range = REGS_RANGES["NONE"]
+    register.value = {}
+    register.profiles = \
+            Register.create_profile(Profiles.ZONE.value,
+            Profiles.DISTRIBUTION.value,
+            Profiles.HEAT_PUMP.value,
+            Profiles.NORTH_SERVER_ROOMS.value)
+    __registers.append(register)
+
     register = Register("sys.time.boot")
     register.scope = Scope.Device
     register.plugin_name = "System"
@@ -5183,76 +5437,32 @@ def __add_registers(args):
 
 #region Statistics (stat)
 
-    # Enable
-    register = Register("stat.enabled")
-    register.scope = Scope.System
-    register.plugin_name = "Statistics"
-    register.description = "Statistics module enable flag."
-    register.range = REGS_RANGES["BOOL"]
-    register.profiles = \
-            Register.create_profile(Profiles.ZONE.value,
-            Profiles.DISTRIBUTION.value,
-            Profiles.HEAT_PUMP.value,
-            Profiles.NORTH_SERVER_ROOMS.value)
-    register.value = __is_enabled(register.base_name, args.profile)
-    __registers.append(register)
+    __add_table(args, "Statistics",
+        [Profiles.ZONE, Profiles.DISTRIBUTION, Profiles.HEAT_PUMP, Profiles.NORTH_SERVER_ROOMS],
+        [
+            ("stat.enabled", Scope.System, "Statistics module enable flag.", REGS_RANGES["BOOL"], ENABLED),
+        ])
 
 #endregion
 
 #region Office Conference Hall (oc_hall)
 
-    # Enable
-    register = Register("oc_hall.enabled")
-    register.scope = Scope.System
-    register.plugin_name = "Office Conference Hall"
-    register.description = "Office conference hall module enable flag."
-    register.range = REGS_RANGES["BOOL"]
-    register.value = False
-    __registers.append(register)
+    __add_table(args, "Office Conference Hall", [],
+        [
+            ("oc_hall.enabled", Scope.System, "Office conference hall module enable flag.", REGS_RANGES["BOOL"], False),
+        ])
 
 #endregion
 
 #region Global
 
-    # Global floor mode.
-    register = Register("glob.floor.mode")
-    register.scope = Scope.System
-    register.plugin_name = "No plugin, just global"
-    register.description = "Global floor thermal mode."
-    register.range = "0|1|2"
-    register.value = 0
-    register.profiles = Register.create_profile(Profiles.ZONE.value)
-    __registers.append(register)
-
-    # Global convector mode.
-    register = Register("glob.conv.mode")
-    register.scope = Scope.System
-    register.plugin_name = "No plugin, just global"
-    register.description = "Global convector thermal mode."
-    register.range = "0|1|2"
-    register.value = 0
-    register.profiles = Register.create_profile(Profiles.ZONE.value)
-    __registers.append(register)
-
-    # Global illumination east.
-    register = Register("glob.illumination.east")
-    register.scope = Scope.System
-    register.plugin_name = "No plugin, just global"
-    register.description = "Global east ilumination."
-    register.range = ""
-    register.value = 0.0
-    register.profiles = Register.create_profile(Profiles.ZONE.value)
-    __registers.append(register)
-
-    # Global illumination west.
-    register = Register("glob.illumination.west")
-    register.scope = Scope.System
-    register.plugin_name = "No plugin, just global"
-    register.description = "Global west ilumination."
-    register.range = ""
-    register.value = 0.0
-    register.profiles = Register.create_profile(Profiles.ZONE.value)
-    __registers.append(register)
+    __add_table(args, "No plugin, just global", [Profiles.ZONE],
+        [
+            ("glob.floor.mode", Scope.System, "Global floor thermal mode.", "0|1|2", 0),
+            ("glob.conv.mode", Scope.System, "Global convector thermal mode.", "0|1|2", 0),
+            ("glob.illumination.east", Scope.System, "Global east ilumination.", "", 0.0),
+            ("glob.illumination.west", Scope.System, "Global west ilumination.", "", 0.0),
+        ])
 
 #endregion
 
@@ -5276,6 +5486,8 @@ def main():
         __f_ext = "csv"
     if args.action.endswith("md"):
         __f_ext = "md"
+    if args.action.endswith("bin"):
+        __f_ext = "bin"
 
     # Current file path. & Go to file.
     cwf = os.path.dirname(os.path.abspath(__file__))
@@ -5300,6 +5512,10 @@ def main():
         for register in registers:
             print(register)
 
+    elif args.action == "w_bin":
+        # Only the registers of the profile are compiled.
+        Registers.to_compiled(__registers, file_name, args.profile)
+
     elif args.action == "w_md":
         Registers.to_md(__registers, file_name) #"../Zontromat/plugins/registers.md")
 
@@ -23,6 +23,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import traceback
+from collections import deque
 
 from utils.configurable import Configurable
 
@@ -83,6 +84,52 @@ class BasePlugin(Configurable):
     __in_cycle_flag = False
     """In cycle flag.
     """
+
+    _update_period = 0.0
+    """Minimum time between the updates in seconds, 0 for every tick.
+    """
+
+    _time_budget = 0.1
+    """Expected longest update in seconds.
+    """
+
+    _threaded = False
+    """Update in a worker thread. The plugin must change the registers only with write().
+    """
+#endregion
+
+#region Properties
+
+    @property
+    def update_period(self):
+        """Minimum time between the updates in seconds.
+
+        Returns:
+            float: Update period.
+        """
+
+        return self._update_period
+
+    @property
+    def time_budget(self):
+        """Expected longest update in seconds.
+
+        Returns:
+            float: Time budget.
+        """
+
+        return self._time_budget
+
+    @property
+    def threaded(self):
+        """Update in a worker thread.
+
+        Returns:
+            bool: Threaded flag.
+        """
+
+        return self._threaded
+
 #endregion
 
 #region Constructor / Destructor
@@ -102,6 +149,10 @@ class BasePlugin(Configurable):
         # Create logger.
         self.__logger = get_logger(__name__)
 
+        self.__callbacks = deque()
+        """Register handlers that wait for the next update of the threaded plugin.
+        """
+
     def __del__(self):
         """Destructor
         """
@@ -150,6 +201,26 @@ class BasePlugin(Configurable):
 
 #region Protected Methods (Plugin protected interface)
 
+    def _in_update(self, callback):
+        """Register handler that changes the state of the plugin.
+        The threaded plugin queues the calls and runs them in its worker thread,
+        at the start of the next update.
+
+        Args:
+            callback (function): Register handler.
+
+        Returns:
+            function: Handler to set in the register.
+        """
+
+        if not self._threaded:
+            return callback
+
+        def handler(register):
+            self.__callbacks.append((callback, register))
+
+        return handler
+
     def _init(self):
         """Initialize the plugin.
         """
@@ -194,6 +265,11 @@ class BasePlugin(Configurable):
         self.__in_cycle(True)
 
         try:
+            # Register handlers of the threaded plugin.
+            while self.__callbacks:
+                callback, register = self.__callbacks.popleft()
+                callback(register)
+
             self._update()
 
         except:
@@ -88,6 +88,10 @@ class EnergyCenterDistribution(BasePlugin):
 
 #region Attributes
 
+    _time_budget = 1.0
+    """Heat pump and valves MODBUS requests.
+    """
+
 #endregion
 
 #region Constructor / Destructor
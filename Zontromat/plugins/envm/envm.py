@@ -32,6 +32,7 @@ from plugins.base_plugin import BasePlugin
 # from sunposition import sunpos
 # from plugins.envm.sunposition import sunpos
 from plugins.envm.sunposition2 import sunpos
+from plugins.envm.sun_ephemeris import SunEphemeris
 
 from devices.factories.pir.pir_factory import PIRFactory
 
@@ -344,7 +345,9 @@ class Environment(BasePlugin):
         """
 
         # elv_out, azm_out = self.__old_sunpos()
-        azm_out, elv_out = self.__new_sunpos()
+        # azm_out, elv_out = self.__new_sunpos()
+        location = (self.__location_lat, self.__location_lon)
+        azm_out, elv_out = SunEphemeris.get_instance().position(location, self.__location_elv)
 
         # self.__logger.info(f"Azimuth: {azm:.2f}; Elevation: {elv:.2f}")
         # print(f"SunPos -> Azm: {azm_out:.2f}; Elev: {elv_out:.2f}")
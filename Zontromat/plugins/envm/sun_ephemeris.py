@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import time
+from datetime import datetime
+
+from plugins.envm.sunposition2 import sunpos
+
+# The SPA implementation needs NumPy, the controllers without it
+# fall back to the pure math algorithm.
+try:
+    import numpy
+    from plugins.envm import sunposition
+except ImportError:
+    numpy = None
+    sunposition = None
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class SunEphemeris:
+    """Solar ephemeris cache.
+
+    Precomputes the sun azimuth and elevation for the whole UTC day at coarse steps
+    and answers the queries by linear interpolation between the nodes.
+    The sun moves about 0.004 deg per second, so a five minutes grid keeps
+    the interpolation error far below the precision of the blinds.
+    """
+
+#region Attributes
+
+    __instance = None
+    """Shared instance object."""
+
+    __day_length = 86400
+    """Length of the table in seconds."""
+
+#endregion
+
+#region Constructor
+
+    def __init__(self, step=300):
+        """Constructor
+
+        Args:
+            step (int): Table step in seconds. Defaults to 300.
+        """
+
+        self.__step = step
+        """Table step in seconds.
+        """
+
+        self.__key = None
+        """Key of the table: location and day.
+        """
+
+        self.__azimuth = []
+        """Azimuth nodes.
+        """
+
+        self.__elevation = []
+        """Elevation nodes.
+        """
+
+        self.__last = (None, None)
+        """Last query: second, location and elevation, and the position.
+        """
+
+        self.__builds = 0
+        """Count of the table builds.
+        """
+
+#endregion
+
+#region Properties
+
+    @property
+    def step(self):
+        """Table step.
+
+        Returns:
+            int: Table step in seconds.
+        """
+
+        return self.__step
+
+    @property
+    def builds(self):
+        """Count of the table builds.
+
+        Returns:
+            int: Count of the table builds.
+        """
+
+        return self.__builds
+
+    @property
+    def vectorized(self):
+        """Is the table computed with the NumPy SPA.
+
+        Returns:
+            bool: True if NumPy is available.
+        """
+
+        return sunposition is not None
+
+#endregion
+
+#region Private Methods
+
+    def __build_spa(self, day, location, elevation):
+        """Compute the table with the vectorized SPA.
+        """
+
+        timestamps = numpy.arange(day, day + self.__day_length + self.__step, self.__step, dtype=float)
+        azimuth, zenith = sunposition.observed_sunpos(timestamps, location[0], location[1], elevation)
+
+        self.__azimuth = azimuth.tolist()
+        self.__elevation = (90.0 - zenith).tolist()
+
+    def __build_math(self, day, location):
+        """Compute the table with the pure math algorithm.
+        """
+
+        self.__azimuth = []
+        self.__elevation = []
+
+        for timestamp in range(day, day + self.__day_length + self.__step, self.__step):
+            utc = datetime.utcfromtimestamp(timestamp)
+            when = (utc.year, utc.month, utc.day, utc.hour, utc.minute, utc.second, 0)
+            azimuth, elevation = sunpos(when, location, True)
+            self.__azimuth.append(azimuth)
+            self.__elevation.append(elevation)
+
+    def __build(self, day, location, elevation):
+        """Compute the table for the day.
+        """
+
+        if self.vectorized:
+            self.__build_spa(day, location, elevation)
+        else:
+            self.__build_math(day, location)
+
+        self.__key = (day, tuple(location), elevation)
+        self.__last = (None, None)
+        self.__builds += 1
+
+#endregion
+
+#region Public Methods
+
+    def position(self, location, elevation=0.0, timestamp=None):
+        """Sun position.
+
+        Args:
+            location (tuple): Latitude and longitude in degrees.
+            elevation (float): Elevation of the location in meters. Defaults to 0.0.
+            timestamp (float): UTC timestamp. Defaults to now.
+
+        Returns:
+            tuple: Azimuth and elevation in degrees.
+        """
+
+        if timestamp is None:
+            timestamp = time.time()
+
+        # Every reader in the same second gets the same value.
+        second = int(timestamp)
+        query = (second, location, elevation)
+        if self.__last[0] == query:
+            return self.__last[1]
+
+        day = second // self.__day_length * self.__day_length
+        if self.__key != (day, tuple(location), elevation):
+            self.__build(day, location, elevation)
+
+        offset = (second - day) / self.__step
+        index = min(int(offset), len(self.__azimuth) - 2)
+        fraction = offset - index
+
+        # Interpolate the azimuth on the shorter arc.
+        azimuth_0 = self.__azimuth[index]
+        azimuth_delta = (self.__azimuth[index + 1] - azimuth_0 + 180.0) % 360.0 - 180.0
+        azimuth = (azimuth_0 + azimuth_delta * fraction) % 360.0
+
+        altitude_0 = self.__elevation[index]
+        altitude = altitude_0 + (self.__elevation[index + 1] - altitude_0) * fraction
+
+        position = (round(azimuth, 2), round(altitude, 2))
+        self.__last = (query, position)
+
+        return position
+
+    def clear(self):
+        """Drop the table.
+        """
+
+        self.__key = None
+        self.__last = (None, None)
+
+#endregion
+
+#region Static Methods
+
+    @staticmethod
+    def get_instance():
+        """Shared instance.
+
+        Returns:
+            SunEphemeris: Instance shared by all the plugins.
+        """
+
+        if SunEphemeris.__instance is None:
+            SunEphemeris.__instance = SunEphemeris()
+
+        return SunEphemeris.__instance
+
+#endregion
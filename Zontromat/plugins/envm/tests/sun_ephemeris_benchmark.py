@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import argparse
+import time
+from datetime import datetime
+
+from plugins.envm.sunposition2 import sunpos
+from plugins.envm.sun_ephemeris import SunEphemeris
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+def direct(location, timestamp):
+    """Sun position with the full algorithm.
+
+    Returns:
+        tuple: Azimuth and elevation in degrees.
+    """
+
+    utc = datetime.utcfromtimestamp(timestamp)
+    when = (utc.year, utc.month, utc.day, utc.hour, utc.minute, utc.second, 0)
+    return sunpos(when, location, True)
+
+def angle_error(value, reference):
+    """Difference of two angles on the shorter arc.
+    """
+
+    return abs((value - reference + 180.0) % 360.0 - 180.0)
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--lat", type=float, default=43.0785, help="Latitude in degrees.")
+    parser.add_argument("--lon", type=float, default=25.5950, help="Longitude in degrees.")
+    parser.add_argument("--readers", type=int, default=5, help="Count of the readers per tick, envm and the blinds.")
+    parser.add_argument("--ticks", type=int, default=86400, help="Count of the one second ticks.")
+    parser.add_argument("--step", type=int, default=300, help="Table step in seconds.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    location = (args.lat, args.lon)
+    start = int(time.time() // 86400) * 86400
+    timestamps = range(start, start + args.ticks)
+
+    t_start = time.perf_counter()
+    references = []
+    for timestamp in timestamps:
+        for _ in range(args.readers):
+            position = direct(location, timestamp)
+        references.append(position)
+    t_direct = time.perf_counter() - t_start
+
+    ephemeris = SunEphemeris(args.step)
+    t_start = time.perf_counter()
+    positions = []
+    for timestamp in timestamps:
+        for _ in range(args.readers):
+            position = ephemeris.position(location, 0.0, timestamp)
+        positions.append(position)
+    t_cached = time.perf_counter() - t_start
+
+    azimuth_error = 0.0
+    elevation_error = 0.0
+    for position, reference in zip(positions, references):
+        # The blinds follow the sun only above the horizon.
+        if reference[1] > 0:
+            azimuth_error = max(azimuth_error, angle_error(position[0], reference[0]))
+            elevation_error = max(elevation_error, abs(position[1] - reference[1]))
+
+    print("Backend: {}; builds: {}".format("SPA" if ephemeris.vectorized else "math", ephemeris.builds))
+    print("Direct: {:8.1f} ms; cached: {:8.1f} ms; x{:.1f}"\
+        .format(t_direct * 1000, t_cached * 1000, t_direct / t_cached))
+    print("Max error azimuth: {:.3f} deg; elevation: {:.3f} deg".format(azimuth_error, elevation_error))
+
+if __name__ == "__main__":
+    main()
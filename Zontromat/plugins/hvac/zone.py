@@ -1256,14 +1256,14 @@ class Zone(BasePlugin):
             # Stop the HVAC.
             self.__stop_flag = False
             # Clear last time to provoke instant expiration of the update timer.
-            self.__stop_timer.update_last_time(0)
+            self.__stop_timer.force_expire()
 
         # If update now flag is activated.
         if self.__update_now_flag:
             # Clear the flag.
             self.__update_now_flag = False
             # Clear last time to provoke instant expiration of the update timer.
-            self.__update_timer.update_last_time(0)
+            self.__update_timer.force_expire()
 
         # Stop the zone instantly.
         if self.__stop_flag:
@@ -22,13 +22,12 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
-import json
 import os
 import time
 
 from utils.logger import get_logger
 from utils.logic.timer import Timer
-from utils.logic.functions import filter_measurements_by_time
+from utils.logic.rollup import Rollup
 
 from plugins.base_plugin import BasePlugin
 
@@ -36,6 +35,7 @@ from devices.tests.leak_test.leak_test import LeakTest
 from devices.factories.power_analyzers.power_analyser_factory import PowerAnalyzerFactory
 from devices.factories.flowmeters.flowmeters_factory import FlowmeterFactory
 from devices.drivers.modbus.function_code import FunctionCode
+from devices.drivers.modbus.priority import Priority
 
 from services.evok.settings import EvokSettings
 
@@ -80,6 +80,24 @@ class Monitoring(BasePlugin):
 
 #region Attributes
 
+    __hm_counters = ["PositiveCumulativeEnergy", "PositiveCumulativeFlow"]
+    """Cumulative counters of the heat meters.
+    """
+
+    __windows = {60: 3600}
+    """Window of the buckets by resolution. The 1 minute buckets are kept for the last hour,
+    the 15 minutes ones for the whole day.
+    """
+
+    _threaded = True
+    """The meters are read in a worker thread, the registers are changed only with write()
+    and the register handlers run in the worker with _in_update().
+    """
+
+    _time_budget = 5.0
+    """Reading all meters on the serial lines.
+    """
+
 #endregion
 
 #region Constructor / Destructor
@@ -98,7 +116,7 @@ class Monitoring(BasePlugin):
         """Cold water leak test.
         """
 
-        self.__cw_measurements = []
+        self.__cw_measurements = Rollup(counters=["CumulativeTraffic"], windows=self.__windows)
         """How water measurements.
         """
 
@@ -111,7 +129,7 @@ class Monitoring(BasePlugin):
         """Hot water leak test.
         """
 
-        self.__hw_measurements = []
+        self.__hw_measurements = Rollup(counters=["CumulativeTraffic"], windows=self.__windows)
         """How water measurements.
         """
 
@@ -124,7 +142,8 @@ class Monitoring(BasePlugin):
         """EVOK settings.
         """
 
-        self.__pa_measurements = []
+        self.__pa_measurements = Rollup(counters=["ImportActiveEnergy", "ExportActiveEnergy",\
+            "ImportReactiveEnergy", "ExportReactiveEnergy"], windows=self.__windows)
         """Power analyzer measurements.
         """
 
@@ -133,7 +152,7 @@ class Monitoring(BasePlugin):
         """Convector heat meter.
         """
 
-        self.__cl_1_hm_measurements = []
+        self.__cl_1_hm_measurements = Rollup(counters=self.__hm_counters, windows=self.__windows)
         """Convector loop heat meter measurements.
         """
 
@@ -142,12 +161,12 @@ class Monitoring(BasePlugin):
         """Convector heat meter.
         """
 
-        self.__cl_2_hm_measurements = []
+        self.__cl_2_hm_measurements = Rollup(counters=self.__hm_counters, windows=self.__windows)
         """Convector loop heat meter measurements.
         """
 
 
-        self.__cl_3_hm_measurements = []
+        self.__cl_3_hm_measurements = Rollup(counters=self.__hm_counters, windows=self.__windows)
         """Convector loop heat meter measurements.
         """
 
@@ -160,7 +179,7 @@ class Monitoring(BasePlugin):
         """Floor heat meter.
         """
 
-        self.__fl_1_hm_measurements = []
+        self.__fl_1_hm_measurements = Rollup(counters=self.__hm_counters, windows=self.__windows)
         """Floor loop heat meter measurements.
         """
 
@@ -169,7 +188,7 @@ class Monitoring(BasePlugin):
         """Floor heat meter.
         """
 
-        self.__fl_2_hm_measurements = []
+        self.__fl_2_hm_measurements = Rollup(counters=self.__hm_counters, windows=self.__windows)
         """Floor loop heat meter measurements.
         """
 
@@ -178,7 +197,7 @@ class Monitoring(BasePlugin):
         """Floor heat meter.
         """
 
-        self.__fl_3_hm_measurements = []
+        self.__fl_3_hm_measurements = Rollup(counters=self.__hm_counters, windows=self.__windows)
         """Floor loop heat meter measurements.
         """
 
@@ -212,11 +231,12 @@ class Monitoring(BasePlugin):
         if self.__cw_flowmeter_dev is None:
             return
 
+        # The parameters that are not read stay None and are not aggregated.
         measurement = {
-            "CumulativeTraffic": 0.0,
-            "InstantaneousFlow": 0.0,
-            "WaterTemperature" : 0.0,
-            "BatteryVoltage" : 0.0,
+            "CumulativeTraffic": None,
+            "InstantaneousFlow": None,
+            "WaterTemperature" : None,
+            "BatteryVoltage" : None,
             "ts": 0,
         }
 
@@ -227,16 +247,21 @@ class Monitoring(BasePlugin):
                     measurement[item] = values[item]
 
             else:
-                for item in measurement:
-                    if item == "ts":
-                        pass
-                    try:
-                        measurement[item] = self.__cw_flowmeter_dev.get_value(item)
-                    except Exception as e:
-                        print(e)
-                        msg = f"{self.__cw_flowmeter_dev} / parameter({item})"
-                        print(msg)
-                        GlobalErrorHandler.log_missing_resource(self.__logger, msg)
+                names = [item for item in measurement if item != "ts"]
+
+                # Read all parameters with the fewest requests.
+                values = {}
+                try:
+                    values = self.__cw_flowmeter_dev.read_parameters(names, Priority.Metering)
+                except Exception as e:
+                    print(e)
+                    msg = f"{self.__cw_flowmeter_dev} / parameters({names})"
+                    print(msg)
+                    GlobalErrorHandler.log_missing_resource(self.__logger, msg)
+
+                for item in names:
+                    if item in values:
+                        measurement[item] = values[item]
 
                     # Scale unit from milli liter to cubic meter.
                     if item == "CumulativeTraffic":
@@ -256,18 +281,21 @@ class Monitoring(BasePlugin):
         else:
             self.__logger.error("Unknown power water meter")
 
+        # Nothing is read, the failed read is not a measurement.
+        if all(measurement[item] is None for item in measurement if item != "ts"):
+            return
+
         # Set the time of the measurement.
         measurement["ts"] = time.time()
 
         # Add measurement to the tail.
         self.__cw_measurements.append(measurement)
 
-        # This magical number represents seconds for 24 hours.
-        filter_measurements_by_time(self.__cw_measurements, 86400)
+        # Drop the measurements and the buckets out of their windows.
+        self.__cw_measurements.evict(measurement["ts"])
 
         # Update parameters in the registers.
-        self._registers.write(f"{self.key}.cw.measurements",
-                              json.dumps(self.__cw_measurements))
+        self.__write_measurements("cw", self.__cw_measurements)
 
         # print(f"{self.__cw_flowmeter_dev}")
         # print(f"CW: {self.__cw_measurements}")
@@ -318,7 +346,7 @@ class Monitoring(BasePlugin):
     def __init_cw(self):
         cw_flowmeter = self._registers.by_name(f"{self.key}.cw.flowmeter_settings")
         if cw_flowmeter is not None:
-            cw_flowmeter.update_handlers = self.__cw_flowmeter_settings_cb
+            cw_flowmeter.update_handlers = self._in_update(self.__cw_flowmeter_settings_cb)
             cw_flowmeter.update()
 
 #endregion
@@ -334,11 +362,12 @@ class Monitoring(BasePlugin):
         if self.__hw_flowmeter_dev is None:
             return
 
+        # The parameters that are not read stay None and are not aggregated.
         measurement = {
-            "CumulativeTraffic": 0.0,
-            "InstantaneousFlow": 0.0,
-            "WaterTemperature" : 0.0,
-            "BatteryVoltage" : 0.0,
+            "CumulativeTraffic": None,
+            "InstantaneousFlow": None,
+            "WaterTemperature" : None,
+            "BatteryVoltage" : None,
             "ts": 0,
         }
 
@@ -349,10 +378,21 @@ class Monitoring(BasePlugin):
                     measurement[item] = values[item]
 
             else:
-                for item in measurement:
-                    if item == "ts":
-                        pass
-                    measurement[item] = self.__hw_flowmeter_dev.get_value(item)
+                names = [item for item in measurement if item != "ts"]
+
+                # Read all parameters with the fewest requests.
+                values = {}
+                try:
+                    values = self.__hw_flowmeter_dev.read_parameters(names, Priority.Metering)
+                except Exception as e:
+                    print(e)
+                    msg = f"{self.__hw_flowmeter_dev} / parameters({names})"
+                    print(msg)
+                    GlobalErrorHandler.log_missing_resource(self.__logger, msg)
+
+                for item in names:
+                    if item in values:
+                        measurement[item] = values[item]
 
                     # Scale unit from milli liter to cubic meter.
                     if item == "CumulativeTraffic":
@@ -372,18 +412,21 @@ class Monitoring(BasePlugin):
         else:
             self.__logger.error("Unknown power water meter")
 
+        # Nothing is read, the failed read is not a measurement.
+        if all(measurement[item] is None for item in measurement if item != "ts"):
+            return
+
         # Set the time of the measurement.
         measurement["ts"] = time.time()
 
         # Add measurement to the tail.
         self.__hw_measurements.append(measurement)
 
-        # This magical number represents seconds for 24 hours.
-        filter_measurements_by_time(self.__hw_measurements, 86400)
+        # Drop the measurements and the buckets out of their windows.
+        self.__hw_measurements.evict(measurement["ts"])
 
         # Update parameters in the registers.
-        self._registers.write(f"{self.key}.hw.measurements",
-                              json.dumps(self.__hw_measurements))
+        self.__write_measurements("hw", self.__hw_measurements)
 
         # If the zone is empty check for leaks.
         is_empty = self._registers.by_name("envm.is_empty")
@@ -433,7 +476,7 @@ class Monitoring(BasePlugin):
 
         hw_flowmeter = self._registers.by_name(f"{self.key}.hw.flowmeter_settings")
         if hw_flowmeter is not None:
-            hw_flowmeter.update_handlers = self.__hw_flowmeter_settings_cb
+            hw_flowmeter.update_handlers = self._in_update(self.__hw_flowmeter_settings_cb)
             hw_flowmeter.update()
 
 #endregion
@@ -473,61 +516,68 @@ class Monitoring(BasePlugin):
 
         # self.__read_all_parameters()
 
+        # The parameters that are not read stay None and are not aggregated.
         measurement = {
-            "ImportActiveEnergy": 0.0,
-            "ExportActiveEnergy": 0.0,
-            "ImportReactiveEnergy": 0.0,
-            "ExportReactiveEnergy": 0.0,
-            "Phase1Current": 0.0,
-            "Phase2Current": 0.0,
-            "Phase3Current": 0.0,
+            "ImportActiveEnergy": None,
+            "ExportActiveEnergy": None,
+            "ImportReactiveEnergy": None,
+            "ExportReactiveEnergy": None,
+            "Phase1Current": None,
+            "Phase2Current": None,
+            "Phase3Current": None,
             "ts": 0,
         }
 
+        # Parameters of the model by measurement field.
+        parameters = {}
+
         if self.__pa_dev.model == "SDM120":
+            parameters = {
+                "ImportActiveEnergy": "ImportActiveEnergy",
+                "ExportActiveEnergy": "ExportActiveEnergy",
+                "ImportReactiveEnergy": "ImportReactiveEnergy",
+                "ExportReactiveEnergy": "ExportReactiveEnergy",
+                "Phase1Current": "Current",
+            }
 
-            if self._controller.vendor == "UniPi":
+        elif self.__pa_dev.model == "SDM630":
+            parameters = {
+                "ImportActiveEnergy": "TotalImportkWh",
+                "ExportActiveEnergy": "TotalExportkWh",
+                "ImportReactiveEnergy": "TotalImportkVArh",
+                "ExportReactiveEnergy": "TotalExportkVArh",
+                "Phase1Current": "Phase1Current",
+                "Phase2Current": "Phase2Current",
+                "Phase3Current": "Phase3Current",
+            }
 
-                values = self.__read_unipi_mb_master()
+        else:
+            self.__logger.error("Unknown power analyser")
 
-                measurement["ImportActiveEnergy"] = values["ImportActiveEnergy"]
-                measurement["ExportActiveEnergy"] = values["ExportActiveEnergy"]
-                measurement["ImportReactiveEnergy"] = values["ImportReactiveEnergy"]
-                measurement["ExportReactiveEnergy"] = values["ExportReactiveEnergy"]
-                measurement["Phase1Current"] = values["Current"]
+        if parameters:
+            names = list(parameters.values())
 
-            else:
-                measurement["ImportActiveEnergy"] = self.__pa_dev.get_value("ImportActiveEnergy")
-                measurement["ExportActiveEnergy"] = self.__pa_dev.get_value("ExportActiveEnergy")
-                measurement["ImportReactiveEnergy"] = \
-                    self.__pa_dev.get_value("ImportReactiveEnergy")
-                measurement["ExportReactiveEnergy"] = \
-                    self.__pa_dev.get_value("ExportReactiveEnergy")
-                measurement["Phase1Current"] = self.__pa_dev.get_value("Current")
+            values = {}
+            try:
+                if self._controller.vendor == "UniPi":
+                    values = self.__read_unipi_mb_master()
 
-        elif self.__pa_dev.model == "SDM630":
+                else:
+                    # Read all parameters with the fewest requests.
+                    values = self.__pa_dev.read_parameters(names, Priority.Metering)
 
-            if self._controller.vendor == "UniPi":
-                values = self.__read_unipi_mb_master()
-                measurement["ImportActiveEnergy"] = values["TotalImportkWh"]
-                measurement["ExportActiveEnergy"] = values["TotalExportkWh"]
-                measurement["ImportReactiveEnergy"] = values["TotalImportkVArh"]
-                measurement["ExportReactiveEnergy"] = values["TotalExportkVArh"]
-                measurement["Phase1Current"] = values["Phase1Current"]
-                measurement["Phase2Current"] = values["Phase2Current"]
-                measurement["Phase3Current"] = values["Phase3Current"]
+            except Exception as e:
+                print(e)
+                msg = f"{self.__pa_dev} / parameters({names})"
+                print(msg)
+                GlobalErrorHandler.log_missing_resource(self.__logger, msg)
 
-            else:
-                measurement["ImportActiveEnergy"] = self.__pa_dev.get_value("TotalImportkWh")
-                measurement["ExportActiveEnergy"] = self.__pa_dev.get_value("TotalExportkWh")
-                measurement["ImportReactiveEnergy"] = self.__pa_dev.get_value("TotalImportkVArh")
-                measurement["ExportReactiveEnergy"] = self.__pa_dev.get_value("TotalExportkVArh")
-                measurement["Phase1Current"] = self.__pa_dev.get_value("Phase1Current")
-                measurement["Phase2Current"] = self.__pa_dev.get_value("Phase2Current")
-                measurement["Phase3Current"] = self.__pa_dev.get_value("Phase3Current")
+            for item in parameters:
+                measurement[item] = values.get(parameters[item], None)
 
-        else:
-            self.__logger.error("Unknown power analyser")
+        # Nothing is read, the failed read is not a measurement.
+        if all(measurement[item] is None for item in measurement if item != "ts"):
+            return
 
         # Set the time of the measurement.
         measurement["ts"] = time.time()
@@ -535,12 +585,11 @@ class Monitoring(BasePlugin):
         # Add measurement to the tail.
         self.__pa_measurements.append(measurement)
 
-        # This magical number represents seconds for 24 hours.
-        filter_measurements_by_time(self.__pa_measurements, 86400)
+        # Drop the measurements and the buckets out of their windows.
+        self.__pa_measurements.evict(measurement["ts"])
 
         # Update parameters in the registers.
-        self._registers.write(f"{self.key}.pa.measurements",
-                              json.dumps(self.__pa_measurements))
+        self.__write_measurements("pa", self.__pa_measurements)
 
     def __pa_settings_cb(self, register):
 
@@ -635,7 +684,7 @@ class Monitoring(BasePlugin):
 
         pa_enabled = self._registers.by_name(self.key + ".pa.settings")
         if pa_enabled is not None:
-            pa_enabled.update_handlers = self.__pa_settings_cb
+            pa_enabled.update_handlers = self._in_update(self.__pa_settings_cb)
             pa_enabled.update()
 
 #endregion
@@ -659,12 +708,11 @@ class Monitoring(BasePlugin):
         # Add measurement to the tail.
         self.__fl_1_hm_measurements.append(measurement)
 
-        # This magical number represents seconds for 24 hours.
-        filter_measurements_by_time(self.__fl_1_hm_measurements, 86400)
+        # Drop the measurements and the buckets out of their windows.
+        self.__fl_1_hm_measurements.evict(measurement["ts"])
 
-        # 2. If the following register is available then set its value to the thermometers value.
-        self._registers.write(f"{self.key}.fl_1.hm.measurements",
-                              json.dumps(self.__fl_1_hm_measurements))
+        # Update parameters in the registers.
+        self.__write_measurements("fl_1.hm", self.__fl_1_hm_measurements)
 
     def __fl_1_hm_settings_cb(self, register):
 
@@ -697,7 +745,7 @@ class Monitoring(BasePlugin):
 
         fl_hm_1_dev_settings = self._registers.by_name(f"{self.key}.fl_1.hm.settings")
         if fl_hm_1_dev_settings is not None:
-            fl_hm_1_dev_settings.update_handlers = self.__fl_1_hm_settings_cb
+            fl_hm_1_dev_settings.update_handlers = self._in_update(self.__fl_1_hm_settings_cb)
             fl_hm_1_dev_settings.update()
 
 #endregion
@@ -722,12 +770,11 @@ class Monitoring(BasePlugin):
         # Add measurement to the tail.
         self.__fl_2_hm_measurements.append(measurement)
 
-        # This magical number represents seconds for 24 hours.
-        filter_measurements_by_time(self.__fl_2_hm_measurements, 86400)
+        # Drop the measurements and the buckets out of their windows.
+        self.__fl_2_hm_measurements.evict(measurement["ts"])
 
-        # 2. If the following register is available then set its value to the thermometers value.
-        self._registers.write(f"{self.key}.fl_2.hm.measurements",
-                              json.dumps(self.__fl_2_hm_measurements))
+        # Update parameters in the registers.
+        self.__write_measurements("fl_2.hm", self.__fl_2_hm_measurements)
 
     def __fl_2_hm_settings_cb(self, register):
 
@@ -760,7 +807,7 @@ class Monitoring(BasePlugin):
 
         fl_hm_2_dev_settings = self._registers.by_name(f"{self.key}.fl_2.hm.settings")
         if fl_hm_2_dev_settings is not None:
-            fl_hm_2_dev_settings.update_handlers = self.__fl_2_hm_settings_cb
+            fl_hm_2_dev_settings.update_handlers = self._in_update(self.__fl_2_hm_settings_cb)
             fl_hm_2_dev_settings.update()
 
 #endregion
@@ -785,12 +832,11 @@ class Monitoring(BasePlugin):
         # Add measurement to the tail.
         self.__fl_3_hm_measurements.append(measurement)
 
-        # This magical number represents seconds for 24 hours.
-        filter_measurements_by_time(self.__fl_3_hm_measurements, 86400)
+        # Drop the measurements and the buckets out of their windows.
+        self.__fl_3_hm_measurements.evict(measurement["ts"])
 
-        # 2. If the following register is available then set its value to the thermometers value.
-        self._registers.write(f"{self.key}.floor_loop_3.hm.measurements",
-                              json.dumps(self.__fl_3_hm_measurements))
+        # Update parameters in the registers.
+        self.__write_measurements("fl_3.hm", self.__fl_3_hm_measurements)
 
     def __fl_3_hm_settings_cb(self, register):
 
@@ -822,7 +868,7 @@ class Monitoring(BasePlugin):
     def __init_fl_3_hm(self):
         fl_hm_3_dev_settings = self._registers.by_name(f"{self.key}.fl_3.hm.settings")
         if fl_hm_3_dev_settings is not None:
-            fl_hm_3_dev_settings.update_handlers = self.__fl_3_hm_settings_cb
+            fl_hm_3_dev_settings.update_handlers = self._in_update(self.__fl_3_hm_settings_cb)
             fl_hm_3_dev_settings.update()
 
 #endregion
@@ -846,13 +892,11 @@ class Monitoring(BasePlugin):
         # Add measurement to the tail.
         self.__cl_1_hm_measurements.append(measurement)
 
-        # This magical number represents seconds for 24 hours.
-        filter_measurements_by_time(self.__cl_1_hm_measurements, 86400)
+        # Drop the measurements and the buckets out of their windows.
+        self.__cl_1_hm_measurements.evict(measurement["ts"])
 
-
-        # 2. If the following register is available then set its value to the thermometers value.
-        self._registers.write(f"{self.key}.cl_1.hm.measurements",
-                              json.dumps(self.__cl_1_hm_measurements))
+        # Update parameters in the registers.
+        self.__write_measurements("cl_1.hm", self.__cl_1_hm_measurements)
 
     def __cl_1_hm_settings_cb(self, register):
 
@@ -884,7 +928,7 @@ class Monitoring(BasePlugin):
     def __init_cl_1_hm(self):
         cl_hm_1_dev_settings = self._registers.by_name(f"{self.key}.cl_1.hm.settings")
         if cl_hm_1_dev_settings is not None:
-            cl_hm_1_dev_settings.update_handlers = self.__cl_1_hm_settings_cb
+            cl_hm_1_dev_settings.update_handlers = self._in_update(self.__cl_1_hm_settings_cb)
             cl_hm_1_dev_settings.update()
 
 #endregion
@@ -908,12 +952,11 @@ class Monitoring(BasePlugin):
         # Add measurement to the tail.
         self.__cl_2_hm_measurements.append(measurement)
 
-        # This magical number represents seconds for 24 hours.
-        filter_measurements_by_time(self.__cl_2_hm_measurements, 86400)
+        # Drop the measurements and the buckets out of their windows.
+        self.__cl_2_hm_measurements.evict(measurement["ts"])
 
-        # 2. If the following register is available then set its value to the thermometers value.
-        self._registers.write(f"{self.key}.cl_2.hm.measurements",
-                              json.dumps(self.__cl_2_hm_measurements))
+        # Update parameters in the registers.
+        self.__write_measurements("cl_2.hm", self.__cl_2_hm_measurements)
 
     def __cl_2_hm_settings_cb(self, register):
 
@@ -945,7 +988,7 @@ class Monitoring(BasePlugin):
     def __init_cl_2_hm(self):
         cl_hm_2_dev_settings = self._registers.by_name(f"{self.key}.cl_2.hm.settings")
         if cl_hm_2_dev_settings is not None:
-            cl_hm_2_dev_settings.update_handlers = self.__cl_2_hm_settings_cb
+            cl_hm_2_dev_settings.update_handlers = self._in_update(self.__cl_2_hm_settings_cb)
             cl_hm_2_dev_settings.update()
 
 #endregion
@@ -969,12 +1012,11 @@ class Monitoring(BasePlugin):
         # Add measurement to the tail.
         self.__cl_3_hm_measurements.append(measurement)
 
-        # This magical number represents seconds for 24 hours.
-        filter_measurements_by_time(self.__cl_3_hm_measurements, 86400)
+        # Drop the measurements and the buckets out of their windows.
+        self.__cl_3_hm_measurements.evict(measurement["ts"])
 
-        # 2. If the following register is available then set its value to the thermometers value.
-        self._registers.write(f"{self.key}.cl_3.hm.measurements",
-                              json.dumps(self.__cl_3_hm_measurements))
+        # Update parameters in the registers.
+        self.__write_measurements("cl_3.hm", self.__cl_3_hm_measurements)
 
     def __cl_3_hm_settings_cb(self, register):
 
@@ -1006,11 +1048,53 @@ class Monitoring(BasePlugin):
     def __init_cl_3_hm(self):
         cl_hm_3_dev_settings = self._registers.by_name(f"{self.key}.cl_3.hm.settings")
         if cl_hm_3_dev_settings is not None:
-            cl_hm_3_dev_settings.update_handlers = self.__cl_3_hm_settings_cb
+            cl_hm_3_dev_settings.update_handlers = self._in_update(self.__cl_3_hm_settings_cb)
             cl_hm_3_dev_settings.update()
 
 #endregion
 
+#region Private Methods (Rollups)
+
+    def __write_measurements(self, name, measurements):
+        """Write the raw measurements and the buckets of each resolution in the registers.
+
+        Args:
+            name (str): Name of the channel in the registers.
+            measurements (Rollup): Measurements of the channel.
+        """
+
+        self._registers.write(f"{self.key}.{name}.measurements", measurements.to_json())
+
+        for resolution in measurements.resolutions:
+            self._registers.write(f"{self.key}.{name}.measurements_{resolution // 60}m",
+                                  measurements.to_json(resolution))
+
+    def __raw_window_cb(self, register):
+
+        # Check data type.
+        if not (register.data_type == "float" or register.data_type == "int"):
+            GlobalErrorHandler.log_bad_register_data_type(self.__logger, register)
+            return
+
+        if register.value < 0.0:
+            GlobalErrorHandler.log_bad_register_value(self.__logger, register)
+            return
+
+        for measurements in [self.__cw_measurements, self.__hw_measurements,\
+            self.__pa_measurements, self.__fl_1_hm_measurements,\
+            self.__fl_2_hm_measurements, self.__fl_3_hm_measurements,\
+            self.__cl_1_hm_measurements, self.__cl_2_hm_measurements,\
+            self.__cl_3_hm_measurements]:
+            measurements.raw_window = register.value
+
+    def __init_raw_window(self):
+        raw_window = self._registers.by_name(self.key + ".raw_window")
+        if raw_window is not None:
+            raw_window.update_handlers = self._in_update(self.__raw_window_cb)
+            raw_window.update()
+
+#endregion
+
 #region Private Methods (Demand timer)
 
     def __demand_time_cb(self, register):
@@ -1031,7 +1115,7 @@ class Monitoring(BasePlugin):
     def __init_demand_timer(self):
         demand_time = self._registers.by_name(self.key + ".demand_time")
         if demand_time is not None:
-            demand_time.update_handlers = self.__demand_time_cb
+            demand_time.update_handlers = self._in_update(self.__demand_time_cb)
             demand_time.update()
 
 #endregion
@@ -1044,6 +1128,9 @@ class Monitoring(BasePlugin):
 
         self.__init_demand_timer()
 
+        # Init raw measurements window.
+        self.__init_raw_window()
+
         # Init cold water flow meter.
         self.__init_cw()
 
@@ -1069,7 +1156,7 @@ class Monitoring(BasePlugin):
             self.__update_now_flag = False
 
             # Cheat and tell the timer to run in advance.
-            self.__demand_timer.update_last_time(0)
+            self.__demand_timer.force_expire()
 
         # Check is it time to measure.
         self.__demand_timer.update()
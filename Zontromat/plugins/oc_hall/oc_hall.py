@@ -22,7 +22,6 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
-from numpy import true_divide
 from utils.logger import get_logger
 from utils.logic.timer import Timer
 
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import time
+from threading import Event, Thread
+
+from utils.logger import get_logger
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class PluginRunner:
+    """Runs the update of a plugin with its update period and time budget.
+    Threaded plugins update in a worker thread, the main loop only starts them
+    and applies their register writes. The updates that are longer than the
+    budget and the skipped updates are counted."""
+
+#region Constructor
+
+    def __init__(self, plugin, registers=None):
+        """Constructor
+
+        Args:
+            plugin (BasePlugin): Plugin.
+            registers (DeferredRegisters, optional): Registers of the threaded plugin. Defaults to None.
+        """
+
+        self.__logger = get_logger(__name__)
+        """Logger
+        """
+
+        self.__plugin = plugin
+        """Plugin.
+        """
+
+        self.__registers = registers
+        """Registers of the threaded plugin.
+        """
+
+        self.__last_start = None
+        """Start time of the last update.
+        """
+
+        self.__duration = 0.0
+        """Duration of the last update in seconds.
+        """
+
+        self.__overruns = 0
+        """Count of the updates that are longer than the budget.
+        """
+
+        self.__skipped = 0
+        """Count of the updates skipped, because the previous one is still running.
+        """
+
+        self.__changed = False
+        """Counters are changed since the last statistics.
+        """
+
+        self.__thread = None
+        """Worker thread.
+        """
+
+        self.__trigger = Event()
+        """Start the update in the worker thread.
+        """
+
+        self.__busy = False
+        """The worker thread runs the update.
+        """
+
+        self.__stop_flag = False
+        """Stop the worker thread.
+        """
+
+#endregion
+
+#region Properties
+
+    @property
+    def plugin(self):
+        """Plugin.
+
+        Returns:
+            BasePlugin: Plugin.
+        """
+
+        return self.__plugin
+
+    @property
+    def busy(self):
+        """The worker thread runs the update.
+
+        Returns:
+            bool: Busy flag.
+        """
+
+        return self.__busy
+
+    @property
+    def changed(self):
+        """Counters are changed since the last statistics.
+
+        Returns:
+            bool: Changed flag.
+        """
+
+        return self.__changed
+
+#endregion
+
+#region Private Methods
+
+    def __record(self, duration):
+        """Record the duration of update.
+
+        Args:
+            duration (float): Duration in seconds.
+        """
+
+        self.__duration = duration
+
+        if duration > self.__plugin.time_budget:
+            self.__overruns += 1
+            self.__changed = True
+            self.__logger.warning("{} update took {:.3f} s, the budget is {:.3f} s"\
+                .format(self.__plugin.name, duration, self.__plugin.time_budget))
+
+    def __run(self):
+        """Worker thread.
+        """
+
+        while True:
+            self.__trigger.wait()
+            self.__trigger.clear()
+
+            if self.__stop_flag:
+                break
+
+            t_start = time.perf_counter()
+            self.__plugin.update()
+            self.__record(time.perf_counter() - t_start)
+
+            self.__busy = False
+
+#endregion
+
+#region Public Methods
+
+    def update(self, now=None):
+        """Update the plugin when its period is passed.
+
+        Args:
+            now (float, optional): Current time.monotonic. Defaults to None.
+
+        Returns:
+            bool: True if the update is started.
+        """
+
+        # Apply the writes of the last update.
+        if self.__registers is not None:
+            self.__registers.apply()
+
+        if now is None:
+            now = time.monotonic()
+
+        if self.__last_start is not None and\
+            now - self.__last_start < self.__plugin.update_period:
+            return False
+
+        if not self.__plugin.threaded:
+            self.__last_start = now
+            t_start = time.perf_counter()
+            self.__plugin.update()
+            self.__record(time.perf_counter() - t_start)
+            return True
+
+        if self.__busy:
+            self.__skipped += 1
+            self.__changed = True
+            return False
+
+        if self.__thread is None:
+            self.__thread = Thread(target=self.__run, name=f"Plugin {self.__plugin.name}", daemon=True)
+            self.__thread.start()
+
+        self.__last_start = now
+        self.__busy = True
+        self.__trigger.set()
+
+        return True
+
+    def statistics(self):
+        """Statistics of the updates. Clears the changed flag.
+
+        Returns:
+            dict: Overruns, skipped updates and the last duration in milliseconds.
+        """
+
+        self.__changed = False
+
+        return {
+            "overruns": self.__overruns,
+            "skipped": self.__skipped,
+            "last": round(self.__duration * 1000, 3),
+        }
+
+    def shutdown(self, timeout=None):
+        """Stop the worker thread and shutdown the plugin.
+
+        Args:
+            timeout (float, optional): Time to wait the running update. Defaults to the budget of the plugin.
+        """
+
+        if timeout is None:
+            timeout = self.__plugin.time_budget
+
+        if self.__thread is not None:
+            self.__stop_flag = True
+            self.__trigger.set()
+            self.__thread.join(timeout)
+
+            # The plugin can not be shutdown under its running update.
+            if self.__thread.is_alive():
+                self.__logger.warning("{} update is still running after {:.3f} s, it is not shutdown"\
+                    .format(self.__plugin.name, timeout))
+                return
+
+            self.__thread = None
+
+        self.__plugin.shutdown()
+
+        # The last writes of the plugin.
+        if self.__registers is not None:
+            self.__registers.apply()
+
+#endregion
@@ -23,10 +23,15 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import os
+import time
 import importlib
 
 from utils.logger import get_logger
 
+from data.deferred_registers import DeferredRegisters
+
+from plugins.plugin_runner import PluginRunner
+
 from services.global_error_handler.global_error_handler import GlobalErrorHandler
 
 #region File Attributes
@@ -77,6 +82,12 @@ class PluginsManager:
     __plugins = None
     """Plugins"""
 
+    __runners = None
+    """Runners of the plugins"""
+
+    __profiler = None
+    """Performance profiler"""
+
 #endregion
 
 #region Constructor
@@ -91,12 +102,37 @@ class PluginsManager:
 
         self.__logger = get_logger(__name__)
         self.__plugins = {}
+        self.__runners = {}
         self.__registers = registers
         self.__controller = controller
         self.__add_enable_handlers()
 
 #endregion
 
+#region Properties
+
+    @property
+    def profiler(self):
+        """Performance profiler that measures the update of each plugin.
+
+        Returns:
+            PerformanceProfiler: Profiler.
+        """
+
+        return self.__profiler
+
+    @profiler.setter
+    def profiler(self, value):
+        """Performance profiler that measures the update of each plugin.
+
+        Args:
+            value (PerformanceProfiler): Profiler.
+        """
+
+        self.__profiler = value
+
+#endregion
+
 #region Private Methods
 
     def __find_plugins(self):
@@ -175,8 +211,16 @@ class PluginsManager:
 
         config = self.__prepare_config(module.__class_name__, module_name)
 
+        # Threaded plugins write the registers through the main loop.
+        registers = None
+        if class_module._threaded:
+            registers = DeferredRegisters(self.__registers)
+            config["registers"] = registers
+
         class_isinstance = class_module(config)
 
+        self.__runners[module_name] = PluginRunner(class_isinstance, registers)
+
         return class_isinstance
 
     def __enable_plugin_cb(self, register):
@@ -192,9 +236,29 @@ class PluginsManager:
             self.__plugins[name].init()
 
         elif not register.value and name in self.__plugins:
-            self.__plugins[name].shutdown()
+            self.__runners[name].shutdown()
+            del self.__runners[name]
             del self.__plugins[name]
 
+    def __update_overruns(self):
+        """Write the statistics of the plugins when they are changed.
+        """
+
+        changed = False
+        for key in self.__runners:
+            if self.__runners[key].changed:
+                changed = True
+                break
+
+        if not changed:
+            return
+
+        statistics = {}
+        for key in self.__runners:
+            statistics[key] = self.__runners[key].statistics()
+
+        self.__registers.write("sys.plugins.overruns", statistics)
+
     def __add_enable_handlers(self):
 
         names = self.__find_plugins()
@@ -214,14 +278,24 @@ class PluginsManager:
         """Update plugins.
         """
 
-        for key in self.__plugins:
-            self.__plugins[key].update()
+        now = time.monotonic()
+
+        if self.__profiler is None:
+            for key in self.__runners:
+                self.__runners[key].update(now)
+
+        else:
+            for key in self.__runners:
+                with self.__profiler.measure(f"plugins.{key}"):
+                    self.__runners[key].update(now)
+
+        self.__update_overruns()
 
     def shutdown(self):
         """Shutdown plugins.
         """
 
-        for key in self.__plugins:
-            self.__plugins[key].shutdown()
+        for key in self.__runners:
+            self.__runners[key].shutdown()
 
 #endregion
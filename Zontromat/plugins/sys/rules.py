@@ -60,13 +60,23 @@ __status__ = "Debug"
 class Rules:
     """Entities collection"""
 
-#region Attributes
+#region Constructor
 
-    __rules = []
-    """Entities for"""
+    def __init__(self):
+        """Constructor
+        """
+
+        self.__rules = {}
+        """Rules by resource name."""
+
+        self.__users = {}
+        """Reverse index: resource name -> registers that use it."""
 
-    __on_event_cb = None
-    """On event callback."""
+        self.__resources = {}
+        """Register name -> used resource name."""
+
+        self.__on_event_cb = None
+        """On event callback."""
 
 #endregion
 
@@ -77,6 +87,88 @@ class Rules:
         if not self.__on_event_cb is None:
             self.__on_event_cb(intersections, rule)
 
+    def __resource(self, register):
+        """Resource used by the register.
+
+        Parameters
+        ----------
+        register : Register
+            The register.
+
+        Returns
+        -------
+        str/None
+            Name of the resource or None if it does not use one.
+        """
+
+        if register.data_type != "str":
+            return None
+
+        # Remove !, it is used as inversion.
+        resource = register.value.replace("!", "")
+
+        if resource not in self.__rules:
+            return None
+
+        return resource
+
+    def __index(self, register):
+        """Move the register to the bucket of the resource it uses now.
+
+        Parameters
+        ----------
+        register : Register
+            The register.
+
+        Returns
+        -------
+        str/None
+            Name of the resource if it is changed, else None.
+        """
+
+        resource = self.__resource(register)
+        last_resource = self.__resources.get(register.name)
+
+        if resource == last_resource:
+            return None
+
+        if last_resource is not None:
+            del self.__users[last_resource][register.name]
+            del self.__resources[register.name]
+
+        if resource is None:
+            return None
+
+        self.__users.setdefault(resource, {})[register.name] = register
+        self.__resources[register.name] = resource
+
+        return resource
+
+    def __check_resource(self, resource):
+        """Check the count of the users of the resource.
+
+        Parameters
+        ----------
+        resource : str
+            Name of the resource.
+        """
+
+        users = self.__users.get(resource)
+        if not users:
+            return
+
+        rule = self.__rules[resource]
+        if rule.count < len(users):
+            intersections = [{register: register.value} for register in users.values()]
+            self.__call_event(intersections, rule)
+
+    def __register_cb(self, register):
+        """Check the resource at the moment the register starts to use it."""
+
+        resource = self.__index(register)
+        if resource is not None:
+            self.__check_resource(resource)
+
 #endregion
 
 #region Public Methods
@@ -108,7 +200,9 @@ class Rules:
             Rule describing action.
         """
 
-        self.__rules.append(rule)
+        # First rule with the name wins.
+        if rule.name not in self.__rules:
+            self.__rules[rule.name] = rule
 
     def from_file(self, file_name):
         """Load rules from file.
@@ -143,7 +237,7 @@ class Rules:
 
         # Save content to file.
         js_rules = []
-        for rule in self.__rules:
+        for rule in self.__rules.values():
             js_rule = {"name": rule.name, "level": rule.level, "count": rule.count}
             js_rules.append(js_rule)
 
@@ -169,14 +263,7 @@ class Rules:
             Exists or not.
         """
 
-        exists = False
-
-        for rule in self.__rules:
-            if rule.name == name:
-                exists = True
-                break
-
-        return exists
+        return name in self.__rules
 
     def by_name(self, name):
         """Get rule with name.
@@ -195,103 +282,52 @@ class Rules:
             Rule with name.
         """
 
-        exists = None
-
-        for rule in self.__rules:
-            if rule.name == name:
-                exists = rule
-                break
-
-        return exists
+        return self.__rules.get(name)
 
-    def check(self, registers=None):
-        """Check for intersection of usage of resources.
+    def attach(self, registers):
+        """Watch the registers, so the collision is detected
+        at the moment a register starts to use a resource.
 
         Parameters
         ----------
         self : Current class.
             Current class instance.
 
-        registers : JSON object
-            JSON objects of resources.
-
-        Returns
-        -------
-        JSON object/None
-            Intersections of resources.
+        registers : Registers
+            Registers to watch.
         """
 
-        if registers is None:
-            return
-
-        # Create array of registers unique contents.
-        registers_values = []
-
-        # Go trough all keys.
         for register in registers:
 
-            # Check for existence.
-            if not register.value in registers_values:
-
-                # # If it is list, we do not care.
-                # if register.data_type == "list":
-                #     continue
+            # Only the text registers map the resources.
+            if register.data_type != "str":
+                continue
 
-                # # If it is list, we do not care.
-                # if register.data_type == "dict":
-                #     continue
+            if self.__register_cb not in register.update_handlers:
+                register.update_handlers = self.__register_cb
 
-                # # If it is list, we do not care.
-                # if register.data_type == "json":
-                #     continue
+        self.check(registers)
 
-                # If it is string, and it is part of allowed registers, append.
-                if register.data_type == "str":
-                    formated_reg_val = register.value.replace("!", "")
-
-                    # If it is not exiting then add it.
-                    if self.exists(formated_reg_val):
-                        registers_values.append(formated_reg_val)
-
-
-        # Create array of intersections.
-        intersections = dict.fromkeys(registers_values)
-
-        # Fill in the cells with sum arrays.
-        for intersection in intersections:
-            intersections[intersection] = []
-
-        # Go thought all registers fo find duplicates.
-        for register in registers:
-
-            reg_value = register.value
-
-            # # We do not handle the list types.
-            # if register.data_type == "list":
-            #     continue
-
-            # elif register.data_type == "dict":
-            #     continue
-
-            # elif register.data_type == "json":
-            #     continue
+    def check(self, registers=None):
+        """Check for intersection of usage of resources.
 
-            # If type is string, remove !, it is used as inversion.
-            if register.data_type == "str":
-                reg_value = reg_value.replace("!", "")
+        Parameters
+        ----------
+        self : Current class.
+            Current class instance.
 
-                # If the value is part of the intersections, then append it.
-                if reg_value in intersections:
-                    reg = {register: register.value}
-                    intersections[reg_value].append(reg)
+        registers : Registers
+            Registers to index again. Defaults to None, check the index only.
+        """
 
-        for intersection in intersections:
+        if registers is not None:
+            self.__users.clear()
+            self.__resources.clear()
 
-            count = len(intersections[intersection])
-            rule = self.by_name(intersection)
+            for register in registers:
+                self.__index(register)
 
-            if rule is not None:
-                if rule.count < count:
-                    self.__call_event(intersections[intersection], rule)
+        for resource in list(self.__users):
+            self.__check_resource(resource)
 
 #endregion
@@ -88,9 +88,6 @@ class Sys(BasePlugin):
     __led_out = verbal_const.OFF
     """LED Output"""
 
-    __collission_timer = None
-    """Update timer."""
-
     __rules = None
     """Rules"""
 
@@ -164,6 +161,9 @@ class Sys(BasePlugin):
         # Add event.
         self.__rules.on_event(self.__on_event)
 
+        # Check the registers now and then each time they change.
+        self.__rules.attach(self._registers)
+
     def __on_event(self, intersections, rule: Rule):
         """On event callback for collisions."""
 
@@ -220,6 +220,10 @@ class Sys(BasePlugin):
             # Clear error messages.
             self._registers.write("{}.col.error_message".format(self.key), {})
 
+            # Report again the collisions that are still present.
+            if self.__rules is not None:
+                self.__rules.check()
+
     def __enable_info_msg_cb(self, register):
 
         # Check data type.
@@ -307,9 +311,6 @@ class Sys(BasePlugin):
         # Status LED blink timer.
         self.__blink_timer = Timer(1)
 
-        # Colission detection.
-        self.__collission_timer = Timer(1)
-
         # Create disc check timer.
         self.__disc_status_timer = Timer(10)
 
@@ -334,14 +335,6 @@ class Sys(BasePlugin):
             # update the LED state.
             self.__set_led(self.__led_state)
 
-        # Update the collision timer.
-        self.__collission_timer.update()
-        if self.__collission_timer.expired:
-            self.__collission_timer.clear()
-
-             # Check for collision.
-            self.__rules.check(self._registers)
-
         # Update disc space.
         self.__disc_status_timer.update()
         if self.__disc_status_timer.expired:
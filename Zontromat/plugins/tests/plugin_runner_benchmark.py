@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import argparse
+import time
+
+from data.register import Register
+from data.registers import Registers
+from data.deferred_registers import DeferredRegisters
+
+from plugins.base_plugin import BasePlugin
+from plugins.plugin_runner import PluginRunner
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class SlowPlugin(BasePlugin):
+    """Plugin that blocks on I/O, as reading meters on a slow serial line.
+    """
+
+    _time_budget = 0.1
+
+    def __init__(self, config, delay, threaded):
+
+        super().__init__(config)
+
+        self.__delay = delay
+        self._threaded = threaded
+
+    def _update(self):
+
+        time.sleep(self.__delay)
+        self._registers.write("slow.value", time.time())
+
+class AccessControl(BasePlugin):
+    """Plugin that must respond to the cards in each tick.
+    """
+
+    def __init__(self, config):
+
+        super().__init__(config)
+
+        self.tick_time = 0.0
+        """Time when the tick started.
+        """
+
+        self.latencies = []
+        """Time from the start of the tick to the update.
+        """
+
+    def _update(self):
+
+        self.latencies.append(time.perf_counter() - self.tick_time)
+
+def run(threaded, ticks, period, delay):
+    """Run the plugins in ticks.
+
+    Returns:
+        tuple: Latencies of the access control [s] and the slow plugin statistics.
+    """
+
+    registers = Registers()
+    register = Register("slow.value")
+    register.value = 0.0
+    registers.append(register)
+
+    slow_registers = DeferredRegisters(registers) if threaded else registers
+    slow = SlowPlugin({"name": "Slow", "key": "slow", "registers": slow_registers}, delay, threaded)
+    access_control = AccessControl({"name": "AccessControl", "key": "ac", "registers": registers})
+
+    runners = [
+        PluginRunner(slow, slow_registers if threaded else None),
+        PluginRunner(access_control),
+    ]
+
+    for runner in runners:
+        runner.plugin.init()
+
+    for _ in range(ticks):
+        t_tick = time.perf_counter()
+        access_control.tick_time = t_tick
+
+        for runner in runners:
+            runner.update()
+
+        # Sleep to the next tick.
+        remaining = period - (time.perf_counter() - t_tick)
+        if remaining > 0:
+            time.sleep(remaining)
+
+    statistics = runners[0].statistics()
+
+    for runner in runners:
+        runner.shutdown(delay * 2)
+
+    return access_control.latencies, statistics
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--ticks", type=int, default=40, help="Count of the ticks.")
+    parser.add_argument("--period", type=float, default=0.05, help="Tick period in seconds.")
+    parser.add_argument("--delay", type=float, default=0.3, help="Update time of the slow plugin in seconds.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    for threaded in (False, True):
+        latencies, statistics = run(threaded, args.ticks, args.period, args.delay)
+        latencies = sorted(latencies)
+        print("{:8s} ac latency p50: {:8.3f} ms; max: {:8.3f} ms; slow plugin: {}"\
+            .format("Threaded" if threaded else "Inline",
+                latencies[len(latencies) // 2] * 1000, latencies[-1] * 1000, statistics))
+
+if __name__ == "__main__":
+    main()
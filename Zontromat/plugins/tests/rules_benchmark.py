@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import argparse
+import time
+
+from data.register import Register
+from data.registers import Registers
+
+from plugins.sys.rule import Rule
+from plugins.sys.rules import Rules
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+def create_registers(count):
+    """Registers as in a zone: mostly numbers and a text I/O mapping per ten.
+
+    Returns:
+        Registers: The registers.
+    """
+
+    registers = Registers()
+
+    for index in range(count):
+        register = Register("plugin_{}.param_{}".format(index // 10, index))
+        if index % 10 == 0:
+            register.value = "U0:ID1:DO{}".format(index % 12)
+        elif index % 10 == 1:
+            register.value = "!DI{}".format(index % 12)
+        else:
+            register.value = float(index)
+        registers.append(register)
+
+    return registers
+
+def create_rules():
+    """Rules as in the Sys plugin.
+
+    Returns:
+        Rules: The rules.
+    """
+
+    rules = Rules()
+
+    for index in range(12):
+        rules.add(Rule("DO{}".format(index), 2))
+        rules.add(Rule("DI{}".format(index), 1))
+        rules.add(Rule("AO{}".format(index), 2))
+        rules.add(Rule("AI{}".format(index), 1))
+        rules.add(Rule("RO{}".format(index), 2))
+
+    for index in range(0, 11):
+        rules.add(Rule("/dev/ttyS{}".format(index), 2))
+        rules.add(Rule("/dev/ttyUSB{}".format(index), 2))
+        rules.add(Rule("/dev/ttyACM{}".format(index), 2))
+
+    return rules
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--registers", type=int, default=1500, help="Count of the registers.")
+    parser.add_argument("--checks", type=int, default=20, help="Count of the full checks.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    registers = create_registers(args.registers)
+    rules = create_rules()
+
+    events = []
+    rules.on_event(lambda intersections, rule: events.append(rule.name))
+
+    t_start = time.perf_counter()
+    for _ in range(args.checks):
+        rules.check(registers)
+    t_check = (time.perf_counter() - t_start) / args.checks
+    print("Full check: {:8.3f} ms; collisions: {}".format(t_check * 1000, len(events) // args.checks))
+
+    if not hasattr(rules, "attach"):
+        return
+
+    rules.attach(registers)
+    events.clear()
+
+    # Move an output to a resource that is already in use and back.
+    register = registers.by_name("plugin_1.param_10")
+    t_start = time.perf_counter()
+    for _ in range(args.checks):
+        register.value = "DI1"
+        register.value = "U0:ID1:DO10"
+    t_write = (time.perf_counter() - t_start) / (args.checks * 2)
+    print("Write with detection: {:8.3f} us; collisions: {}".format(t_write * 1000000, len(events) // args.checks))
+
+if __name__ == "__main__":
+    main()
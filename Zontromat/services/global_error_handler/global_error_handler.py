@@ -23,6 +23,8 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
 import time
+from collections import OrderedDict
+from threading import Lock
 
 from data.register import Register
 
@@ -64,46 +66,88 @@ class GlobalErrorHandler:
 
 #region Attributes
 
-    __last_minute_errors = []
-    """Circular queue for the last 100 errors."""
+    __capacity = 100
+    """Maximum count of the distinct errors in the queue."""
+
+    __window = 60
+    """Time in seconds that the error stays in the queue after its last occurrence."""
+
+    __last_minute_errors = OrderedDict()
+    """Ring of the distinct errors, ordered by the last occurrence. (Code, message) -> record."""
+
+    __counters = {}
+    """Total occurrences by error code."""
+
+    __rates = {}
+    """Rate windows by error code: start of the window, count in it and count in the previous one."""
+
+    __lock = Lock()
+    """The errors are logged from the ERP server and the plugin threads too."""
 
     __register = None
     """Register holding error messages."""
 
+    __rates_register = None
+    """Register holding the rates of the error codes."""
+
+    __publish_interval = 1.0
+    """Minimum time in seconds between two updates of the registers."""
+
+    __last_publish = 0.0
+    """Time of the last update of the registers."""
+
+    __dirty = False
+    """The queue is changed after the last update of the registers."""
+
 #endregion
 
 #region Private Static Methods
 
     @staticmethod
-    def __filter_error_by_time(time_sec):
+    def __filter_error_by_time(time_now):
+        """Drop the errors that did not occur in the window. (Call it with the lock.)"""
 
-        # Create filter list.
-        filtered_atendee = []
+        errors = GlobalErrorHandler.__last_minute_errors
+        time_min = time_now - GlobalErrorHandler.__window
 
-        # Reset delete flag.
-        delete_flag = False
+        while len(errors) > 0:
+            oldest = next(iter(errors.values()))
+            if oldest["ts"] >= time_min:
+                break
 
-        # Now!
-        time_now = time.time()
+            errors.popitem(last=False)
+            GlobalErrorHandler.__dirty = True
 
-        # Filter all records.
-        for attendee in GlobalErrorHandler.__last_minute_errors:
+    @staticmethod
+    def __count(err_code, time_now):
+        """Count the occurrence of the error code. (Call it with the lock.)"""
 
-            # Calculate delta time.
-            delta_t = time_now - attendee["ts"]
+        GlobalErrorHandler.__counters[err_code] = GlobalErrorHandler.__counters.get(err_code, 0) + 1
 
-            # Filter
-            if delta_t < time_sec:
-                filtered_atendee.append(attendee)
+        window = GlobalErrorHandler.__rates.get(err_code)
+        if window is None:
+            window = [time_now, 0, 0]
+            GlobalErrorHandler.__rates[err_code] = window
 
-            # Else mark for deletion.
-            else:
-                delete_flag = True
+        GlobalErrorHandler.__roll(window, time_now)
+        window[1] += 1
 
-        # Execute the flag.
-        if delete_flag:
-            GlobalErrorHandler.__last_minute_errors.clear()
-            GlobalErrorHandler.__last_minute_errors = filtered_atendee
+    @staticmethod
+    def __roll(window, time_now):
+        """Move the rate window to the current time."""
+
+        passed = time_now - window[0]
+        if passed < GlobalErrorHandler.__window:
+            return
+
+        # The current window becomes the previous one, if it is not too old.
+        if passed < 2 * GlobalErrorHandler.__window:
+            window[2] = window[1]
+        else:
+            window[2] = 0
+
+        window[1] = 0
+        window[0] = time_now - passed % GlobalErrorHandler.__window
 
 #endregion
 
@@ -252,29 +296,123 @@ class GlobalErrorHandler:
 
     @staticmethod
     def append(message, err_code):
-        """Put message to the queue."""
+        """Put message to the queue. Repeated errors are counted in their first record.
+
+        Args:
+            message (str): Error message.
+            err_code (ErrorCodes): Error code.
+        """
+
+        time_now = time.time()
+        key = (err_code.value, message)
+
+        with GlobalErrorHandler.__lock:
+
+            errors = GlobalErrorHandler.__last_minute_errors
+
+            error = errors.get(key)
+            if error is not None:
+                error["ts"] = time_now
+                error["count"] += 1
+                errors.move_to_end(key)
+
+            else:
+                errors[key] = \
+                    {
+                        "ts": time_now,
+                        "err_code": err_code.value,
+                        "message": message,
+                        "count": 1,
+                        "since": time_now
+                    }
+
+                # Drop the oldest one.
+                if len(errors) > GlobalErrorHandler.__capacity:
+                    errors.popitem(last=False)
+
+            GlobalErrorHandler.__count(err_code.value, time_now)
+            GlobalErrorHandler.__dirty = True
+
+        GlobalErrorHandler.update(time_now)
+
+    @staticmethod
+    def update(time_now=None):
+        """Update the registers, at most once per publish interval.
+
+        Args:
+            time_now (float): Current time. Defaults to None, now.
+        """
+
+        if time_now is None:
+            time_now = time.time()
+
+        if time_now - GlobalErrorHandler.__last_publish < GlobalErrorHandler.__publish_interval:
+            return
+
+        with GlobalErrorHandler.__lock:
+            GlobalErrorHandler.__filter_error_by_time(time_now)
 
-        error = \
-            {
-                "ts": time.time(),
-                "err_code": err_code.value,
-                "message": message
-            }
+            if not GlobalErrorHandler.__dirty:
+                return
 
-        # Put to the end of the queue.
-        GlobalErrorHandler.__last_minute_errors.append(error)
+            GlobalErrorHandler.__dirty = False
 
-        GlobalErrorHandler.__filter_error_by_time(60)
+        GlobalErrorHandler.__last_publish = time_now
 
-        # Update the register.
         if GlobalErrorHandler.__register is not None:
-            GlobalErrorHandler.__register.value = GlobalErrorHandler.__last_minute_errors
+            GlobalErrorHandler.__register.value = GlobalErrorHandler.get_queue()
+
+        if GlobalErrorHandler.__rates_register is not None:
+            GlobalErrorHandler.__rates_register.value = GlobalErrorHandler.get_rates()
 
     @staticmethod
     def get_queue():
-        """Get the whole queue."""
+        """Get the whole queue.
+
+        Returns:
+            list: Copies of the error records from the oldest to the newest.
+        """
+
+        with GlobalErrorHandler.__lock:
+            GlobalErrorHandler.__filter_error_by_time(time.time())
 
-        return GlobalErrorHandler.__last_minute_errors
+            return [dict(error) for error in GlobalErrorHandler.__last_minute_errors.values()]
+
+    @staticmethod
+    def get_counters():
+        """Get the total occurrences by error code.
+
+        Returns:
+            dict: Error code -> count.
+        """
+
+        with GlobalErrorHandler.__lock:
+            return dict(GlobalErrorHandler.__counters)
+
+    @staticmethod
+    def get_rates():
+        """Get the rates of the error codes in the sliding window.
+
+        Returns:
+            dict: Error code -> occurrences per minute.
+        """
+
+        time_now = time.time()
+        rates = {}
+
+        with GlobalErrorHandler.__lock:
+            for err_code, window in GlobalErrorHandler.__rates.items():
+                GlobalErrorHandler.__roll(window, time_now)
+
+                # Weight the previous window by the part that is still in the sliding one.
+                weight = 1.0 - (time_now - window[0]) / GlobalErrorHandler.__window
+                count = window[1] + window[2] * weight
+
+                rate = count * 60 / GlobalErrorHandler.__window
+                if rate > 0:
+                    rates[str(err_code)] = round(rate, 2)
+
+        return rates
 
     @staticmethod
     def set_register(register):
@@ -286,4 +424,24 @@ class GlobalErrorHandler:
         if isinstance(register, Register):
             GlobalErrorHandler.__register = register
 
+    @staticmethod
+    def set_rates_register(register):
+        """Set register to be stored the rates of the error codes."""
+
+        if register is None:
+            return
+
+        if isinstance(register, Register):
+            GlobalErrorHandler.__rates_register = register
+
+    @staticmethod
+    def clear():
+        """Clear the queue and the counters."""
+
+        with GlobalErrorHandler.__lock:
+            GlobalErrorHandler.__last_minute_errors.clear()
+            GlobalErrorHandler.__counters.clear()
+            GlobalErrorHandler.__rates.clear()
+            GlobalErrorHandler.__dirty = True
+
 #endregion
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import argparse
+import logging
+import time
+
+from data.register import Register
+
+from services.global_error_handler.global_error_handler import GlobalErrorHandler
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--ticks", type=int, default=20000, help="Count of the ticks in the outage.")
+    parser.add_argument("--sensors", type=int, default=5, help="Count of the sensors with bad data.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    # Only the queue is measured.
+    logger = logging.getLogger("benchmark")
+    logger.disabled = True
+
+    notifications = []
+    register = Register("sys.last_update_errs")
+    register.value = []
+    register.update_handlers = lambda register: notifications.append(len(register.value))
+    GlobalErrorHandler.set_register(register)
+
+    sensors = []
+    for index in range(args.sensors):
+        sensor = Register("sensor_{}.value".format(index))
+        sensor.value = "nan"
+        sensors.append(sensor)
+
+    t_start = time.perf_counter()
+    for _ in range(args.ticks):
+        GlobalErrorHandler.log_no_connection_erp(logger)
+        GlobalErrorHandler.log_no_connection_plc(logger)
+        for sensor in sensors:
+            GlobalErrorHandler.log_bad_register_value(logger, sensor)
+    t_passed = time.perf_counter() - t_start
+
+    errors = args.ticks * (args.sensors + 2)
+    print("Errors: {}; time: {:8.1f} ms; per error: {:6.2f} us"\
+        .format(errors, t_passed * 1000, t_passed * 1000000 / errors))
+    print("Queue: {} records; register notifications: {}"\
+        .format(len(GlobalErrorHandler.get_queue()), len(notifications)))
+
+    if hasattr(GlobalErrorHandler, "get_rates"):
+        print("Counters: {}".format(GlobalErrorHandler.get_counters()))
+        print("Rates: {}".format(GlobalErrorHandler.get_rates()))
+
+if __name__ == "__main__":
+    main()
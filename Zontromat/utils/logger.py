@@ -21,9 +21,11 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
-
 import os
+import atexit
 import logging
+import logging.handlers
+import queue
 from time import gmtime, strftime
 
 from utils.settings import ApplicationSettings
@@ -64,12 +66,179 @@ __status__ = "Debug"
 __MODULES_NAMES = []
 """Modules names."""
 
+__LISTENER = None
+"""Background writer of the log records."""
+
+__QUEUE_HANDLER = None
+"""Handler of the root logger that puts the records in the queue."""
+
+__QUEUE_SIZE = 10000
+"""Maximum count of the log records waiting for the writer."""
+
+#endregion
+
+#region Classes
+
+class DailyFileHandler(logging.FileHandler):
+    """File handler that writes each record in the file of its UTC day, YYYYMMDD.log."""
+
+    def __init__(self, dir_path, encoding=None):
+        """Constructor
+
+        Args:
+            dir_path (str): Path to the log directory.
+            encoding (str, optional): File encoding. Defaults to None.
+        """
+
+        self.__dir_path = dir_path
+        """Path to the log directory.
+        """
+
+        self.__day_end = 0
+        """Time of the end of the current file day.
+        """
+
+        super().__init__(os.path.join(dir_path, "current.log"), encoding=encoding, delay=True)
+
+    def __open_day(self, created):
+        """Switch to the file of the day.
+
+        Args:
+            created (float): Time of the record.
+        """
+
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+        file_name = strftime("%Y%m%d", gmtime(created)) + ".log"
+        self.baseFilename = os.path.join(self.__dir_path, file_name)
+        self.__day_end = (created // 86400 + 1) * 86400
+
+    def emit(self, record):
+        """Write the record in the file of its day.
+
+        Args:
+            record (LogRecord): Log record.
+        """
+
+        if record.created >= self.__day_end:
+            self.__open_day(record.created)
+
+        super().emit(record)
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops the records when the queue is full, instead of blocking."""
+
+    def __init__(self, log_queue):
+        """Constructor
+
+        Args:
+            log_queue (Queue): Queue of the records.
+        """
+
+        super().__init__(log_queue)
+
+        self.__dropped = 0
+        """Count of the dropped records since the last enqueued one.
+        """
+
+    def enqueue(self, record):
+        """Put the record in the queue without waiting.
+
+        Args:
+            record (LogRecord): Log record.
+        """
+
+        if self.__dropped > 0:
+            record.msg = "{} ({} log records dropped)".format(record.msg, self.__dropped)
+
+        try:
+            self.queue.put_nowait(record)
+            self.__dropped = 0
+
+        except queue.Full:
+            self.__dropped += 1
+
+class RateLimitFilter(logging.Filter):
+    """Filter of the repeated messages.
+    Each call site can log burst records in the period, the rest are counted and
+    suppressed until the next period."""
+
+    def __init__(self, period=60.0, burst=10):
+        """Constructor
+
+        Args:
+            period (float, optional): Period in seconds. Defaults to 60.0.
+            burst (int, optional): Records per period for each call site. Defaults to 10.
+        """
+
+        super().__init__()
+
+        self.__period = period
+        """Period in seconds.
+        """
+
+        self.__burst = burst
+        """Records per period for each call site.
+        """
+
+        self.__sites = {}
+        """Period start, records count and suppressed count by call site.
+        """
+
+    def filter(self, record):
+        """Check is the record allowed.
+
+        Args:
+            record (LogRecord): Log record.
+
+        Returns:
+            bool: True if the record should be logged.
+        """
+
+        key = (record.pathname, record.lineno)
+
+        site = self.__sites.get(key)
+        if site is None or record.created - site[0] >= self.__period:
+            self.__sites[key] = [record.created, 1, 0]
+
+            if site is not None and site[2] > 0:
+                record.msg = "{} ({} similar messages suppressed)".format(record.getMessage(), site[2])
+                record.args = None
+
+            return True
+
+        site[1] += 1
+        if site[1] <= self.__burst:
+            return True
+
+        site[2] += 1
+        return False
+
+#endregion
+
+#region Private Functions
+
+def __is_module_record(record):
+    """Check is the record from logger created by get_logger.
+
+    Args:
+        record (LogRecord): Log record.
+
+    Returns:
+        bool: True if it is.
+    """
+
+    return record.name in __MODULES_NAMES
+
 #endregion
 
 #region Public Functions
 
 def crate_log_file(logs_dir_name="logs"):
-    """This method create a new instance of the LOG direcotry.
+    """This method create the LOG direcotry and the background log writer.
+    It does nothing if the writer is already running.
 
     Parameters
     ----------
@@ -77,6 +246,11 @@ def crate_log_file(logs_dir_name="logs"):
         Path to the log direcotory.
     """
 
+    global __LISTENER, __QUEUE_HANDLER
+
+    if __LISTENER is not None:
+        return
+
     settings = ApplicationSettings.get_instance()
     debug_level = settings.debug_level
     full_dir_path = "/"
@@ -89,18 +263,44 @@ def crate_log_file(logs_dir_name="logs"):
     if not os.path.exists(full_dir_path):
         os.makedirs(full_dir_path)
 
-    # File name.
-    log_file = strftime("%Y%m%d", gmtime()) + ".log"
-    log_file = os.path.join(full_dir_path, log_file)
-
     # create message format.
     log_format = "%(asctime)s\t%(levelname)s\t%(name)s\t:%(lineno)s\t%(message)s"
 
-    # Set basic config.
-    logging.basicConfig(
-        filename=log_file,
-        level=debug_level,
-        format=log_format)
+    # File handler, new file every day.
+    file_handler = DailyFileHandler(full_dir_path)
+    file_handler.setFormatter(logging.Formatter(log_format))
+
+    # Console handler, only for the modules loggers.
+    console_handler = logging.StreamHandler()
+    console_handler.addFilter(__is_module_record)
+
+    # The writer thread does the I/O, the callers only put the records in the queue.
+    log_queue = queue.Queue(__QUEUE_SIZE)
+    __LISTENER = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+
+    __QUEUE_HANDLER = NonBlockingQueueHandler(log_queue)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(debug_level)
+    root_logger.addHandler(__QUEUE_HANDLER)
+
+    __LISTENER.start()
+    atexit.register(close_log_file)
+
+def close_log_file():
+    """Write the waiting records and stop the background log writer.
+    """
+
+    global __LISTENER, __QUEUE_HANDLER
+
+    if __LISTENER is None:
+        return
+
+    logging.getLogger().removeHandler(__QUEUE_HANDLER)
+    __QUEUE_HANDLER = None
+
+    __LISTENER.stop()
+    __LISTENER = None
 
 def get_logger(module_name):
     """Get logger instance.
@@ -116,8 +316,6 @@ def get_logger(module_name):
         Logger instance.
     """
 
-    global __MODULES_NAMES
-
     logger = logging.getLogger(module_name)
 
     if module_name in __MODULES_NAMES:
@@ -125,17 +323,8 @@ def get_logger(module_name):
 
     __MODULES_NAMES.append(module_name)
 
-    # Get debug level.
-    debug_level = ApplicationSettings.get_instance().debug_level
-
-    # Create console handler.
-    console_handler = logging.StreamHandler()
-
-    # Set debug level.
-    console_handler.setLevel(debug_level)
-
-    # Add console handler to logger.
-    logger.addHandler(console_handler)
+    # Limit the repeated messages of the module.
+    logger.addFilter(RateLimitFilter())
 
     return logger
 
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import math
+import time
+
+from utils.logic.time_series import TimeSeries
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class Rollup:
+    """Downsampled history of measurements.
+    The raw measurements are kept for a short window. Every resolution keeps
+    buckets with min, max, mean and last of each field for the long window.
+    Cumulative counters (energy, volume) are aggregated by their delta in the bucket
+    and their last value, so the deltas of the buckets sum to the consumption
+    even when the counter is reset. A lower counter value is taken as reset only
+    when the next value confirms it, a single bad read is dropped."""
+
+#region Attributes
+
+    __ts_key = "ts"
+    """Timestamp key of the measurements.
+    """
+
+#endregion
+
+#region Constructor
+
+    def __init__(self, raw_window=900, resolutions=(60, 900), window=86400, counters=None, windows=None):
+        """Constructor
+
+        Args:
+            raw_window (float, optional): Window of the raw measurements in seconds. Defaults to 900.
+            resolutions (tuple, optional): Buckets sizes in seconds. Defaults to (60, 900).
+            window (float, optional): Window of the buckets in seconds. Defaults to 86400.
+            counters (list, optional): Names of the cumulative counter fields. Defaults to None.
+            windows (dict, optional): Window of the buckets by resolution, for the ones that are kept shorter. Defaults to None.
+        """
+
+        self.__raw = TimeSeries(raw_window)
+        """Raw measurements.
+        """
+
+        self.__window = window
+        """Window of the buckets in seconds.
+        """
+
+        self.__buckets = {}
+        """Closed buckets by resolution.
+        """
+
+        self.__open = {}
+        """Open bucket by resolution.
+        """
+
+        if windows is None:
+            windows = {}
+
+        for resolution in sorted(resolutions):
+            resolution_window = windows.get(resolution, window)
+            self.__buckets[resolution] = TimeSeries(resolution_window, int(resolution_window // resolution) + 1)
+            self.__open[resolution] = None
+
+        self.__counters = set()
+        """Names of the cumulative counter fields.
+        """
+
+        if counters is not None:
+            self.__counters = set(counters)
+
+        self.__last_counters = {}
+        """Last value of each counter.
+        """
+
+        self.__drops = {}
+        """Lower value of each counter, that waits to be confirmed as reset.
+        """
+
+#endregion
+
+#region Properties
+
+    @property
+    def raw(self):
+        """Raw measurements.
+
+        Returns:
+            TimeSeries: Raw measurements.
+        """
+
+        return self.__raw
+
+    @property
+    def raw_window(self):
+        """Window of the raw measurements in seconds.
+
+        Returns:
+            float: Raw window.
+        """
+
+        return self.__raw.window
+
+    @raw_window.setter
+    def raw_window(self, value):
+        """Window of the raw measurements in seconds.
+
+        Args:
+            value (float): Raw window.
+        """
+
+        self.__raw.window = value
+
+    @property
+    def window(self):
+        """Window of the buckets in seconds, of the resolutions that are not kept shorter.
+
+        Returns:
+            float: Window.
+        """
+
+        return self.__window
+
+    @property
+    def resolutions(self):
+        """Buckets sizes in seconds.
+
+        Returns:
+            list: Resolutions.
+        """
+
+        return list(self.__buckets)
+
+#endregion
+
+#region Private Methods
+
+    def __increments(self, measurement):
+        """Increments of the counters since the previous measurement.
+
+        Args:
+            measurement (dict): Measurement.
+
+        Returns:
+            dict: Increment by counter name.
+        """
+
+        increments = {}
+
+        for name in self.__counters:
+            value = Rollup.__to_float(measurement.get(name))
+            if math.isnan(value):
+                continue
+
+            last = self.__last_counters.get(name)
+            if last is None:
+                increment = 0.0
+
+            elif value >= last:
+                increment = value - last
+                self.__drops.pop(name, None)
+
+            else:
+                # The first lower value may be a bad read, it waits for the next one.
+                drop = self.__drops.get(name)
+                if drop is None or value < drop:
+                    self.__drops[name] = value
+                    continue
+
+                # The counter is reset, it counts from zero.
+                increment = value
+                del self.__drops[name]
+
+            self.__last_counters[name] = value
+            increments[name] = increment
+
+        return increments
+
+    def __accumulate(self, bucket, measurement, increments):
+        """Add measurement to the bucket.
+
+        Args:
+            bucket (dict): Open bucket.
+            measurement (dict): Measurement.
+            increments (dict): Counters increments.
+        """
+
+        bucket["count"] += 1
+
+        for name in measurement:
+            if name == self.__ts_key:
+                continue
+
+            if name in self.__counters:
+                if name not in increments:
+                    continue
+
+                stats = bucket["counters"].get(name)
+                if stats is None:
+                    stats = bucket["counters"][name] = [0.0, 0.0]
+
+                stats[0] += increments[name]
+                stats[1] = self.__last_counters[name]
+                continue
+
+            value = Rollup.__to_float(measurement[name])
+            if math.isnan(value):
+                continue
+
+            stats = bucket["gauges"].get(name)
+            if stats is None:
+                # Min, max, sum, count and last.
+                bucket["gauges"][name] = [value, value, value, 1, value]
+                continue
+
+            if value < stats[0]:
+                stats[0] = value
+            if value > stats[1]:
+                stats[1] = value
+            stats[2] += value
+            stats[3] += 1
+            stats[4] = value
+
+    def __close(self, resolution):
+        """Close the open bucket of the resolution.
+
+        Args:
+            resolution (int): Bucket size in seconds.
+        """
+
+        bucket = self.__open[resolution]
+        if bucket is None:
+            return
+
+        record = {self.__ts_key: bucket["ts"], "count": bucket["count"]}
+
+        for name, stats in bucket["gauges"].items():
+            record[f"{name}.min"] = stats[0]
+            record[f"{name}.max"] = stats[1]
+            record[f"{name}.mean"] = stats[2] / stats[3]
+            record[f"{name}.last"] = stats[4]
+
+        for name, stats in bucket["counters"].items():
+            record[f"{name}.delta"] = stats[0]
+            record[f"{name}.last"] = stats[1]
+
+        self.__buckets[resolution].append(record)
+        self.__open[resolution] = None
+
+    @staticmethod
+    def __to_float(value):
+        """Numeric value of the measurement field.
+
+        Args:
+            value (mixed): Field value.
+
+        Returns:
+            float: Value or NaN when it is missing.
+        """
+
+        try:
+            return float(value)
+
+        except (TypeError, ValueError):
+            return math.nan
+
+#endregion
+
+#region Public Methods
+
+    def append(self, measurement):
+        """Append measurement to the raw window and to the open buckets.
+        The open buckets are closed when the measurement is after their end.
+
+        Args:
+            measurement (dict): Fields values and timestamp in "ts".
+        """
+
+        ts = measurement.get(self.__ts_key, time.time())
+
+        self.__raw.append(measurement)
+
+        increments = self.__increments(measurement)
+
+        for resolution in self.__buckets:
+            start = ts - ts % resolution
+
+            bucket = self.__open[resolution]
+            if bucket is not None and bucket["ts"] != start:
+                self.__close(resolution)
+                bucket = None
+
+            if bucket is None:
+                bucket = {self.__ts_key: start, "count": 0, "gauges": {}, "counters": {}}
+                self.__open[resolution] = bucket
+
+            self.__accumulate(bucket, measurement, increments)
+
+    def evict(self, now=None):
+        """Drop the raw measurements and the buckets that are out of their windows.
+
+        Args:
+            now (float, optional): Current time. Defaults to time.time().
+        """
+
+        if now is None:
+            now = time.time()
+
+        self.__raw.evict(now)
+
+        for resolution in self.__buckets:
+            self.__buckets[resolution].evict(now)
+
+    def flush(self):
+        """Close all open buckets.
+        """
+
+        for resolution in self.__buckets:
+            self.__close(resolution)
+
+    def clear(self):
+        """Drop all measurements and buckets.
+        """
+
+        self.__raw.clear()
+        self.__last_counters = {}
+        self.__drops = {}
+
+        for resolution in self.__buckets:
+            self.__buckets[resolution].clear()
+            self.__open[resolution] = None
+
+    def buckets(self, resolution):
+        """Closed buckets of the resolution.
+
+        Args:
+            resolution (int): Bucket size in seconds.
+
+        Returns:
+            TimeSeries: Buckets.
+        """
+
+        return self.__buckets[resolution]
+
+    def to_json(self, resolution=None):
+        """JSON of the raw measurements or of the buckets of the resolution.
+
+        Args:
+            resolution (int, optional): Bucket size in seconds. Defaults to None, the raw measurements.
+
+        Returns:
+            str: Encoded measurements.
+        """
+
+        if resolution is None:
+            return self.__raw.to_json()
+
+        return self.__buckets[resolution].to_json()
+
+#endregion
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import heapq
+import itertools
+import time
+from threading import Event
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class Scheduler:
+    """Deadlines scheduler. Keeps heap of the deadlines of the attached timers
+    and lets the runtime sleep until the next one or until an I/O event.
+    All times are in time.monotonic seconds."""
+
+#region Attributes
+
+#endregion
+
+#region Constructor
+
+    def __init__(self, max_sleep=1.0):
+        """Constructor
+
+        Args:
+            max_sleep (float, optional): Longest sleep without a deadline. Defaults to 1.0.
+        """
+
+        self.__max_sleep = max_sleep
+        """Longest sleep without a deadline.
+        """
+
+        self.__timers = set()
+        """Attached timers.
+        """
+
+        self.__heap = []
+        """Deadlines heap. Entries are (deadline, sequence, timer).
+        Entries that do not match the current deadline of the timer are skipped.
+        """
+
+        self.__sequence = itertools.count()
+        """Sequence that keeps the equal deadlines in order.
+        """
+
+        self.__event = Event()
+        """I/O event.
+        """
+
+#endregion
+
+#region Properties
+
+    @property
+    def max_sleep(self):
+        """Longest sleep without a deadline.
+
+        Returns:
+            float: Time in seconds.
+        """
+
+        return self.__max_sleep
+
+    @max_sleep.setter
+    def max_sleep(self, value):
+        """Longest sleep without a deadline.
+
+        Args:
+            value (float): Time in seconds.
+        """
+
+        self.__max_sleep = value
+
+#endregion
+
+#region Private Methods
+
+    def __compact(self):
+        """Remove the outdated entries when the heap grows too much.
+        """
+
+        if len(self.__heap) <= 4 * len(self.__timers) + 16:
+            return
+
+        self.__heap = [entry for entry in self.__heap\
+            if entry[2] in self.__timers and entry[2].deadline == entry[0]]
+        heapq.heapify(self.__heap)
+
+#endregion
+
+#region Public Methods
+
+    def add(self, timer):
+        """Attach timer.
+
+        Args:
+            timer (Timer): The timer.
+        """
+
+        self.__timers.add(timer)
+        self.reschedule(timer)
+
+    def remove(self, timer):
+        """Detach timer.
+
+        Args:
+            timer (Timer): The timer.
+        """
+
+        self.__timers.discard(timer)
+
+    def reschedule(self, timer):
+        """Put the current deadline of the timer in the heap.
+        Called by the timer when its deadline is changed.
+
+        Args:
+            timer (Timer): The timer.
+        """
+
+        if timer not in self.__timers:
+            return
+
+        heapq.heappush(self.__heap, (timer.deadline, next(self.__sequence), timer))
+        self.__compact()
+
+    def next_deadline(self):
+        """Returns the earliest deadline of the attached timers.
+
+        Returns:
+            float: Deadline or None if there are no timers.
+        """
+
+        while self.__heap:
+            deadline, _, timer = self.__heap[0]
+
+            if timer in self.__timers and timer.deadline == deadline:
+                return deadline
+
+            heapq.heappop(self.__heap)
+
+        return None
+
+    def notify(self):
+        """Wake up the waiting runtime. Can be called from any thread.
+        """
+
+        self.__event.set()
+
+    def wait(self):
+        """Sleep until the next deadline or an I/O event.
+
+        Returns:
+            bool: True if woken up by an I/O event.
+        """
+
+        timeout = self.__max_sleep
+
+        deadline = self.next_deadline()
+        if deadline is not None:
+            timeout = min(timeout, max(0.0, deadline - time.monotonic()))
+
+        state = self.__event.wait(timeout)
+        if state:
+            self.__event.clear()
+
+        return state
+
+#endregion
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+import json
+import math
+import time
+from array import array
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class TimeSeries:
+    """Time window of measurements in a fixed capacity ring buffer.
+    Each field is a float64 column and the timestamps are one more column.
+    The JSON of the window is kept encoded. Each measurement is encoded once on append
+    and the new tail is joined to the already encoded prefix when the JSON is requested.
+    The JSON is the same as json.dumps of the list of measurements."""
+
+#region Attributes
+
+    __ts_key = "ts"
+    """Timestamp key of the measurements.
+    """
+
+#endregion
+
+#region Constructor
+
+    def __init__(self, window=86400, capacity=86400):
+        """Constructor
+
+        Args:
+            window (float, optional): Time window in seconds. Defaults to 86400, 24 hours.
+            capacity (int, optional): Maximum count of the measurements. Defaults to 86400.
+        """
+
+        self.__window = window
+        """Time window in seconds.
+        """
+
+        self.__capacity = capacity
+        """Maximum count of the measurements.
+        """
+
+        self.__size = 0
+        """Allocated size of the columns, grows up to the capacity.
+        """
+
+        self.__head = 0
+        """Physical index of the oldest measurement.
+        """
+
+        self.__count = 0
+        """Count of the measurements.
+        """
+
+        self.__ts = array("d")
+        """Timestamps column.
+        """
+
+        self.__columns = {}
+        """Fields columns by name.
+        """
+
+        self.__lengths = array("l")
+        """Length of the encoded measurements.
+        """
+
+        self.__encoded = "[]"
+        """Last encoded window.
+        """
+
+        self.__encoded_count = 0
+        """Measurements in the encoded window that are still in the buffer.
+        """
+
+        self.__cut = 0
+        """Characters of the dropped measurements at the begin of the encoded window.
+        """
+
+        self.__tail = []
+        """Encoded measurements that are not joined to the encoded window yet.
+        """
+
+#endregion
+
+#region Properties
+
+    @property
+    def window(self):
+        """Time window in seconds.
+
+        Returns:
+            float: Time window.
+        """
+
+        return self.__window
+
+    @window.setter
+    def window(self, value):
+        """Time window in seconds.
+
+        Args:
+            value (float): Time window.
+        """
+
+        self.__window = value
+
+    @property
+    def capacity(self):
+        """Maximum count of the measurements.
+
+        Returns:
+            int: Capacity.
+        """
+
+        return self.__capacity
+
+    @property
+    def fields(self):
+        """Names of the fields.
+
+        Returns:
+            list: Fields names.
+        """
+
+        return list(self.__columns)
+
+#endregion
+
+#region Private Methods
+
+    def __index(self, position):
+        """Physical index of the logical position.
+
+        Args:
+            position (int): Position from the oldest measurement.
+
+        Returns:
+            int: Index in the columns.
+        """
+
+        return (self.__head + position) % self.__size
+
+    def __ordered(self, column):
+        """Column values from the oldest to the newest.
+
+        Args:
+            column (array): Column.
+
+        Returns:
+            array: Values in logical order.
+        """
+
+        end = self.__head + self.__count
+        if end <= self.__size:
+            return column[self.__head:end]
+
+        return column[self.__head:] + column[:end - self.__size]
+
+    def __grow(self):
+        """Double the columns up to the capacity. The ring is unrolled in logical order.
+        """
+
+        size = min(max(16, self.__size * 2), self.__capacity)
+        padding = size - self.__count
+
+        self.__ts = self.__ordered(self.__ts) + array("d", [math.nan]) * padding
+        self.__lengths = self.__ordered(self.__lengths) + array("l", [0]) * padding
+
+        for name in self.__columns:
+            self.__columns[name] = self.__ordered(self.__columns[name])\
+                + array("d", [math.nan]) * padding
+
+        self.__head = 0
+        self.__size = size
+
+    def __drop(self, count):
+        """Drop the oldest measurements.
+
+        Args:
+            count (int): Count of measurements.
+        """
+
+        if count <= 0:
+            return
+
+        if count >= self.__count:
+            self.clear()
+            return
+
+        # Encoded measurements are separated with ", ".
+        encoded = min(count, self.__encoded_count)
+        for position in range(encoded):
+            self.__cut += self.__lengths[self.__index(position)] + 2
+
+        self.__encoded_count -= encoded
+
+        # The rest are not joined yet.
+        del self.__tail[:count - encoded]
+
+        self.__head = self.__index(count)
+        self.__count -= count
+
+    @staticmethod
+    def __to_float(value):
+        """Column value of the measurement field.
+
+        Args:
+            value (mixed): Field value.
+
+        Returns:
+            float: Value or NaN when it is missing.
+        """
+
+        try:
+            return float(value)
+
+        except (TypeError, ValueError):
+            return math.nan
+
+#endregion
+
+#region Public Methods
+
+    def append(self, measurement):
+        """Append measurement at the tail. The oldest one is dropped when the buffer is full.
+
+        Args:
+            measurement (dict): Fields values and timestamp in "ts".
+        """
+
+        if self.__count == self.__capacity:
+            self.__drop(1)
+
+        if self.__count == self.__size:
+            self.__grow()
+
+        index = self.__index(self.__count)
+        self.__ts[index] = TimeSeries.__to_float(measurement.get(self.__ts_key, time.time()))
+
+        for name in measurement:
+            if name == self.__ts_key:
+                continue
+
+            if name not in self.__columns:
+                self.__columns[name] = array("d", [math.nan]) * self.__size
+
+            self.__columns[name][index] = TimeSeries.__to_float(measurement[name])
+
+        for name in self.__columns:
+            if name not in measurement:
+                self.__columns[name][index] = math.nan
+
+        record = json.dumps(measurement)
+        self.__lengths[index] = len(record)
+        self.__tail.append(record)
+
+        self.__count += 1
+
+    def evict(self, now=None):
+        """Drop the measurements that are out of the time window.
+
+        Args:
+            now (float, optional): Current time. Defaults to time.time().
+        """
+
+        if now is None:
+            now = time.time()
+
+        limit = now - self.__window
+
+        # Binary search of the first measurement in the window.
+        low = 0
+        high = self.__count
+        while low < high:
+            middle = (low + high) // 2
+            if self.__ts[self.__index(middle)] <= limit:
+                low = middle + 1
+            else:
+                high = middle
+
+        self.__drop(low)
+
+    def clear(self):
+        """Drop all measurements.
+        """
+
+        self.__head = 0
+        self.__count = 0
+        self.__encoded = "[]"
+        self.__encoded_count = 0
+        self.__cut = 0
+        self.__tail = []
+
+    def timestamps(self):
+        """Timestamps from the oldest to the newest.
+
+        Returns:
+            array: Timestamps.
+        """
+
+        if self.__count == 0:
+            return array("d")
+
+        return self.__ordered(self.__ts)
+
+    def column(self, name):
+        """Field values from the oldest to the newest. Missing values are NaN.
+
+        Args:
+            name (str): Field name.
+
+        Returns:
+            array: Values.
+        """
+
+        if self.__count == 0 or name not in self.__columns:
+            return array("d", [math.nan]) * self.__count
+
+        return self.__ordered(self.__columns[name])
+
+    def to_json(self):
+        """JSON of the measurements in the window.
+
+        Returns:
+            str: Encoded measurements.
+        """
+
+        if self.__cut == 0 and not self.__tail:
+            return self.__encoded
+
+        items = ["["]
+        if self.__encoded_count > 0:
+            # Drop the begin and the closing bracket of the encoded window.
+            items.append(self.__encoded[1 + self.__cut:-1])
+
+        for record in self.__tail:
+            if len(items) > 1:
+                items.append(", ")
+            items.append(record)
+
+        items.append("]")
+
+        self.__encoded = "".join(items)
+        self.__encoded_count = self.__count
+        self.__cut = 0
+        self.__tail = []
+
+        return self.__encoded
+
+    def __len__(self):
+        """Count of the measurements.
+        """
+
+        return self.__count
+
+#endregion
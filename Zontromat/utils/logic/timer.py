@@ -23,6 +23,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
 
+import math
 import time
 
 #region File Attributes
@@ -67,8 +68,8 @@ class Timer:
     __expiration_time = 0
     """Expiration time."""
 
-    __last_time = 0
-    """Last time."""
+    __last_time = -math.inf
+    """Last time. Minus infinity, so the first update expires."""
 
     __now = 0
     """Current time."""
@@ -76,22 +77,33 @@ class Timer:
     __callback = None
     """Callback when expire."""
 
+    __scheduler = None
+    """Scheduler that the timer is attached to."""
+
 #endregion
 
 #region Constructor
 
-    def __init__(self, expiration_time=None):
+    def __init__(self, expiration_time=None, scheduler=None):
         """Constructor
 
         Parameters
         ----------
         self : Template
             Current class instance.
+        expiration_time : float
+            Expiration time in seconds.
+        scheduler : Scheduler
+            Scheduler that should know the deadline of the timer.
         """
 
         if expiration_time is not None:
             self.expiration_time = expiration_time
 
+        if scheduler is not None:
+            self.__scheduler = scheduler
+            self.__scheduler.add(self)
+
 #endregion
 
 #region Properties
@@ -144,6 +156,21 @@ class Timer:
 
         self.__expiration_time = value
 
+        if self.__scheduler is not None:
+            self.__scheduler.reschedule(self)
+
+    @property
+    def deadline(self):
+        """Time when the timer expires. (time.monotonic)
+
+        Returns
+        -------
+        float
+            Deadline.
+        """
+
+        return self.__last_time + self.__expiration_time
+
 #endregion
 
 #region Public Methods
@@ -158,15 +185,23 @@ class Timer:
         """
 
         if value is None:
-            self.__last_time = time.time()
+            self.__last_time = time.monotonic()
         else:
             self.__last_time = value
 
+        if self.__scheduler is not None:
+            self.__scheduler.reschedule(self)
+
+    def force_expire(self):
+        """Expire on the next update, whatever the time since the last expiration is."""
+
+        self.update_last_time(-math.inf)
+
     def update(self):
         """Update cycle of the timer."""
 
         # Recalculate passed time.
-        self.__now = time.time()
+        self.__now = time.monotonic()
         pass_time = self.__now - self.__last_time
         if pass_time >= self.__expiration_time:
             self.__expired = True
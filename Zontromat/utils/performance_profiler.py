@@ -21,7 +21,6 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """
-
 import time
 import tracemalloc
 from functools import wraps
@@ -68,8 +67,190 @@ class CurrentConsuption:
     __min_time = 0
     __cur_time = 0
 
+class Histogram:
+    """Log-linear histogram of durations in nanoseconds.
+    Each power of two is split in 8 buckets, so the percentiles are within 12.5%
+    and recording is O(1) without keeping the samples."""
+
+#region Attributes
+
+    __sub_bits = 3
+    """Bits of the buckets in each power of two.
+    """
+
+#endregion
+
+#region Constructor
+
+    def __init__(self):
+        """Constructor
+        """
+
+        self.__counts = {}
+        """Count by bucket index.
+        """
+
+        self.__count = 0
+        """Count of the values.
+        """
+
+        self.__max = 0
+        """Maximum value.
+        """
+
+#endregion
+
+#region Properties
+
+    @property
+    def count(self):
+        """Count of the values.
+
+        Returns:
+            int: Count.
+        """
+
+        return self.__count
+
+    @property
+    def max(self):
+        """Maximum value.
+
+        Returns:
+            int: Maximum in nanoseconds.
+        """
+
+        return self.__max
+
+#endregion
+
+#region Private Methods
+
+    @staticmethod
+    def __index(value):
+        """Bucket index of the value.
+
+        Args:
+            value (int): Value.
+
+        Returns:
+            int: Index.
+        """
+
+        shift = value.bit_length() - Histogram.__sub_bits - 1
+        if shift <= 0:
+            return value
+
+        return (shift << Histogram.__sub_bits) + (value >> shift)
+
+    @staticmethod
+    def __upper(index):
+        """Upper value of the bucket.
+
+        Args:
+            index (int): Bucket index.
+
+        Returns:
+            int: Value.
+        """
+
+        first = 2 << Histogram.__sub_bits
+        if index < first:
+            return index
+
+        shift = (index >> Histogram.__sub_bits) - 1
+        mantissa = index - (shift << Histogram.__sub_bits)
+
+        return ((mantissa + 1) << shift) - 1
+
+#endregion
+
+#region Public Methods
+
+    def record(self, value):
+        """Record value.
+
+        Args:
+            value (int): Duration in nanoseconds.
+        """
+
+        index = Histogram.__index(value)
+        self.__counts[index] = self.__counts.get(index, 0) + 1
+        self.__count += 1
+
+        if value > self.__max:
+            self.__max = value
+
+    def percentile(self, percent):
+        """Value of the percentile.
+
+        Args:
+            percent (float): Percent, 0 - 100.
+
+        Returns:
+            int: Upper value of the bucket of the percentile, in nanoseconds.
+        """
+
+        if self.__count == 0:
+            return 0
+
+        target = self.__count * percent / 100.0
+        passed = 0
+        for index in sorted(self.__counts):
+            passed += self.__counts[index]
+            if passed >= target:
+                return min(Histogram.__upper(index), self.__max)
+
+        return self.__max
+
+    def clear(self):
+        """Drop all values.
+        """
+
+        self.__counts = {}
+        self.__count = 0
+        self.__max = 0
+
+#endregion
+
+class Section:
+    """Measured section of the code. Use it as context manager."""
+
+    __slots__ = ("name", "histogram", "__start")
+
+    def __init__(self, name):
+        """Constructor
+
+        Args:
+            name (str): Name of the section.
+        """
+
+        self.name = name
+        """Name of the section.
+        """
+
+        self.histogram = Histogram()
+        """Durations of the section.
+        """
+
+        self.__start = 0
+        """Start time of the current run.
+        """
+
+    def __enter__(self):
+
+        self.__start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        self.histogram.record(time.perf_counter_ns() - self.__start)
+        return False
+
 class PerformanceProfiler:
-    """Performance profiler."""
+    """Performance profiler.
+    The time of each section is recorded in its histogram on every run.
+    The memory is traced only when the memory profile is enabled."""
 
 #region Attributes
 
@@ -91,6 +272,12 @@ class PerformanceProfiler:
     __on_change_callback = None
     """On change time callback."""
 
+    __sections = None
+    """Measured sections by name."""
+
+    __trace_frames = 1
+    """Frames stored for each traced memory block."""
+
 #endregion
 
 #region Properties
@@ -127,12 +314,18 @@ class PerformanceProfiler:
 
     @enable_mem_profile.setter
     def enable_mem_profile(self, value):
-        """Enable memory profile.
+        """Enable memory profile. The tracing runs until it is disabled.
 
         Args:
             value (float): Memory profile flag.
         """
 
+        if value and not tracemalloc.is_tracing():
+            tracemalloc.start(self.__trace_frames)
+
+        elif not value and self.__enable_mem_profile and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
         self.__enable_mem_profile = value
 
     @property
@@ -155,6 +348,19 @@ class PerformanceProfiler:
 
         self.__enable_time_profile = value
 
+    @property
+    def sections(self):
+        """Measured sections.
+
+        Returns:
+            dict: Sections by name.
+        """
+
+        if self.__sections is None:
+            self.__sections = {}
+
+        return self.__sections
+
 #endregion
 
 #region Public Methods
@@ -177,8 +383,95 @@ class PerformanceProfiler:
         if callback is not None:
             self.__on_change_callback = callback
 
+    def measure(self, name):
+        """Section to measure with the with statement.
+
+        Args:
+            name (str): Name of the section.
+
+        Returns:
+            Section: Section context manager.
+        """
+
+        sections = self.sections
+
+        section = sections.get(name)
+        if section is None:
+            section = sections[name] = Section(name)
+
+        return section
+
+    def report(self, clear=True):
+        """Statistics of the sections since the last report.
+
+        Args:
+            clear (bool, optional): Clear the histograms. Defaults to True.
+
+        Returns:
+            dict: p50, p95 and max in milliseconds and count, by section name.
+        """
+
+        report = {}
+
+        for name, section in self.sections.items():
+            histogram = section.histogram
+            if histogram.count == 0:
+                continue
+
+            report[name] = {
+                "p50": round(histogram.percentile(50) / 1e6, 3),
+                "p95": round(histogram.percentile(95) / 1e6, 3),
+                "max": round(histogram.max / 1e6, 3),
+                "count": histogram.count,
+            }
+
+            if clear:
+                histogram.clear()
+
+        return report
+
+    def memory(self):
+        """Traced memory since the last call.
+
+        Returns:
+            tuple: Current and peak in bytes, zeros when the memory profile is disabled.
+        """
+
+        if not (self.__enable_mem_profile and tracemalloc.is_tracing()):
+            return 0, 0
+
+        current, peak = tracemalloc.get_traced_memory()
+
+        # Python 3.9+
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+        return current, peak
+
+    def memory_top(self, limit=10):
+        """Snapshot of the traced memory, grouped by source line.
+
+        Args:
+            limit (int, optional): Count of the lines. Defaults to 10.
+
+        Returns:
+            list: Biggest allocations, empty when the memory profile is disabled.
+        """
+
+        if not (self.__enable_mem_profile and tracemalloc.is_tracing()):
+            return []
+
+        snapshot = tracemalloc.take_snapshot()
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ])
+
+        return [str(stat) for stat in snapshot.statistics("lineno")[:limit]]
+
     def profile(self, function):
         """Mesure consumed RAM and Time for execution.
+        The time is recorded in the section with the name of the function, without the leading underscores.
 
         Parameters
         ----------
@@ -195,42 +488,29 @@ class PerformanceProfiler:
         @wraps(function)
         def fn_measure(*args, **config):
 
-            current = 0
-            peak = 0
-            passed_time = 0
+            if not self.__enable_time_profile:
+                return function(*args, **config)
 
-            if self.__enable_mem_profile and self.__enable:
-                tracemalloc.start()
+            section = self.measure(function.__name__.lstrip("_"))
 
-            if self.__enable_time_profile and self.__enable:
-                t_0 = time.time()
+            t_0 = time.perf_counter_ns()
 
             result = function(*args, **config)
 
-            if self.__enable_time_profile and self.__enable:
-                t_1 = time.time()
-                passed_time = t_1 - t_0
+            passed_time = time.perf_counter_ns() - t_0
+            section.histogram.record(passed_time)
 
-            if self.__enable_mem_profile and self.__enable:
-                current, peak = tracemalloc.get_traced_memory()
-                tracemalloc.stop()
+            if self.__enable:
+                current, peak = self.memory()
 
-                # print(f"Current memory usage is {current / 10**6}MB; Peak was {peak / 10**6}MB")
-
-                if self.__on_memory_change_callback is not None:
+                if self.__enable_mem_profile and self.__on_memory_change_callback is not None:
                     self.__on_memory_change_callback(current, peak)
 
-            if self.__enable_time_profile and self.__enable:
-
-                # print("Total time: {0:.3f} sec".format(passed_time))
-
                 if self.__on_time_change_callback is not None:
-                    self.__on_time_change_callback(passed_time)
-
-            if (self.__enable_mem_profile or self.__enable_time_profile) and self.__enable:
+                    self.__on_time_change_callback(passed_time / 1e9)
 
                 if self.__on_change_callback is not None:
-                    self.__on_change_callback(current, peak, passed_time)
+                    self.__on_change_callback(current, peak, passed_time / 1e9)
 
             return result
 
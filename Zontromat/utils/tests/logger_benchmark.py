@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import argparse
+import logging
+import logging.handlers
+import queue
+import time
+
+from utils.logger import NonBlockingQueueHandler, RateLimitFilter
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+class SlowHandler(logging.Handler):
+    """Handler that waits on each record, as writing on slow SD card.
+    """
+
+    def __init__(self, delay):
+
+        super().__init__()
+
+        self.delay = delay
+        """Time of one write in seconds.
+        """
+
+        self.count = 0
+        """Count of the written records.
+        """
+
+    def emit(self, record):
+
+        self.format(record)
+        time.sleep(self.delay)
+        self.count += 1
+
+def run(logger, records, interval):
+    """Log records from the control loop.
+
+    Returns:
+        list: Time of each log call [s].
+    """
+
+    times = []
+    for index in range(records):
+        t_start = time.perf_counter()
+        logger.debug("Frame %d", index)
+        times.append(time.perf_counter() - t_start)
+        time.sleep(interval)
+
+    return times
+
+def report(name, times, handler):
+    """Print the statistics of the log calls.
+    """
+
+    times = sorted(times)
+    print("{:10s} p50: {:8.3f} ms; max: {:8.3f} ms; total: {:8.1f} ms; written: {}"\
+        .format(name, times[len(times) // 2] * 1000, times[-1] * 1000, sum(times) * 1000, handler.count))
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--records", type=int, default=500, help="Count of the log calls.")
+    parser.add_argument("--delay", type=float, default=0.005, help="Time of one write in seconds.")
+    parser.add_argument("--interval", type=float, default=0.001, help="Time between the log calls in seconds.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    # Synchronous writing, as the logging was.
+    handler = SlowHandler(args.delay)
+    logger = logging.getLogger("benchmark.sync")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(handler)
+    report("Sync", run(logger, args.records, args.interval), handler)
+
+    # Background writer.
+    handler = SlowHandler(args.delay)
+    log_queue = queue.Queue(10000)
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    logger = logging.getLogger("benchmark.queue")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(NonBlockingQueueHandler(log_queue))
+    times = run(logger, args.records, args.interval)
+    listener.stop()
+    report("Queue", times, handler)
+
+    # Background writer and rate limit of the repeated messages.
+    handler = SlowHandler(args.delay)
+    log_queue = queue.Queue(10000)
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    logger = logging.getLogger("benchmark.limited")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.addFilter(RateLimitFilter())
+    logger.addHandler(NonBlockingQueueHandler(log_queue))
+    times = run(logger, args.records, args.interval)
+    listener.stop()
+    report("Limited", times, handler)
+
+if __name__ == "__main__":
+    main()
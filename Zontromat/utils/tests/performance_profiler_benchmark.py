@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from utils.performance_profiler import PerformanceProfiler
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+SECTIONS = ["ui", "controller", "plugins.hvac", "plugins.light", "plugins.monitoring", "flush", "erp"]
+"""Sections of the tick.
+"""
+
+def work():
+    """Work of one section, allocates and encodes registers like values.
+    """
+
+    registers = [{"name": f"reg.{index}", "value": index * 0.5} for index in range(50)]
+    return json.dumps(registers)
+
+def tick():
+    """Tick without measuring.
+    """
+
+    for _ in SECTIONS:
+        work()
+
+def run_bare(ticks):
+    """Tick without profiler.
+
+    Returns:
+        float: Time of one tick [s].
+    """
+
+    t_start = time.perf_counter()
+    for _ in range(ticks):
+        tick()
+
+    return (time.perf_counter() - t_start) / ticks
+
+def run_tracemalloc(ticks):
+    """Whole tick with tracemalloc start and stop, as the profiler was doing.
+
+    Returns:
+        float: Time of one tick [s].
+    """
+
+    t_start = time.perf_counter()
+    for _ in range(ticks):
+        tracemalloc.start()
+        t_0 = time.time()
+        tick()
+        _ = time.time() - t_0
+        tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return (time.perf_counter() - t_start) / ticks
+
+def run_sections(ticks):
+    """Histogram for each section and for the whole tick.
+
+    Returns:
+        tuple: Time of one tick [s] and the report.
+    """
+
+    profiler = PerformanceProfiler()
+    profiler.enable_time_profile = True
+
+    @profiler.profile
+    def measured_tick():
+        for name in SECTIONS:
+            with profiler.measure(name):
+                work()
+
+    t_start = time.perf_counter()
+    for _ in range(ticks):
+        measured_tick()
+
+    return (time.perf_counter() - t_start) / ticks, profiler.report()
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--ticks", type=int, default=2000, help="Count of the ticks.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    # Warm up.
+    run_bare(args.ticks)
+
+    bare = run_bare(args.ticks)
+    print("Bare        tick: {:8.3f} ms".format(bare * 1000))
+
+    traced = run_tracemalloc(args.ticks)
+    print("Tracemalloc tick: {:8.3f} ms; overhead: {:6.1f} %".format(traced * 1000, (traced / bare - 1) * 100))
+
+    measured, report = run_sections(args.ticks)
+    print("Sections    tick: {:8.3f} ms; overhead: {:6.1f} %".format(measured * 1000, (measured / bare - 1) * 100))
+
+    for name in report:
+        print("  {:20s} p50: {:7.3f} ms; p95: {:7.3f} ms; max: {:7.3f} ms"\
+            .format(name, report[name]["p50"], report[name]["p95"], report[name]["max"]))
+
+if __name__ == "__main__":
+    main()
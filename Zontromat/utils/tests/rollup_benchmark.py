@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import argparse
+import json
+import random
+import time
+
+from utils.logic.rollup import Rollup
+from utils.logic.time_series import TimeSeries
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+WINDOW = 86400
+"""24 hours in seconds.
+"""
+
+COUNTERS = ["ImportActiveEnergy", "ExportActiveEnergy"]
+"""Cumulative energy counters.
+"""
+
+WINDOWS = {60: 3600}
+"""Window of the buckets by resolution, as in the monitoring.
+"""
+
+class Meter:
+    """Power analyzer like meter with cumulative energy counters.
+    """
+
+    def __init__(self):
+
+        self.energy = {name: random.uniform(0, 1e5) for name in COUNTERS}
+        """Counters values.
+        """
+
+        self.consumed = {name: 0.0 for name in COUNTERS}
+        """Energy consumed after the first measurement.
+        """
+
+        self.measurements = 0
+        """Count of the measurements.
+        """
+
+    def measurement(self, ts, reset=False):
+        """Measurement of the meter.
+
+        Args:
+            ts (float): Timestamp.
+            reset (bool, optional): Reset the counters. Defaults to False.
+
+        Returns:
+            dict: Measurement.
+        """
+
+        for name in COUNTERS:
+            increment = random.uniform(0, 0.01)
+            if self.measurements > 0:
+                self.consumed[name] += increment
+            if reset:
+                self.energy[name] = increment
+            else:
+                self.energy[name] += increment
+
+        self.measurements += 1
+
+        return {
+            "ImportActiveEnergy": self.energy["ImportActiveEnergy"],
+            "ExportActiveEnergy": self.energy["ExportActiveEnergy"],
+            "Phase1Current": random.uniform(0, 32),
+            "Phase2Current": random.uniform(0, 32),
+            "Phase3Current": random.uniform(0, 32),
+            "ts": ts,
+        }
+
+def run_series(interval, samples):
+    """Whole 24 hours of raw measurements, as the monitoring was doing.
+
+    Returns:
+        tuple: Time for one sample [s] and size of the JSON.
+    """
+
+    meter = Meter()
+    t_now = time.time()
+    series = TimeSeries(WINDOW)
+    for index in range(int(WINDOW / interval)):
+        series.append(meter.measurement(t_now - WINDOW + index * interval))
+
+    encoded = series.to_json()
+    t_start = time.perf_counter()
+
+    for index in range(samples):
+        item = meter.measurement(t_now + index * interval)
+        series.append(item)
+        series.evict(item["ts"])
+        encoded = series.to_json()
+
+    return (time.perf_counter() - t_start) / samples, len(encoded)
+
+def run_rollup(interval, samples, raw_window):
+    """Raw measurements for the raw window and buckets by 1 and 15 minutes.
+
+    Returns:
+        tuple: Time for one sample [s], size of the JSONs and the energy error.
+    """
+
+    meter = Meter()
+    t_now = time.time()
+    rollup = Rollup(raw_window, counters=COUNTERS, windows=WINDOWS)
+    count = int(WINDOW / interval)
+    for index in range(count):
+        # Reset the counters once in the middle of the day.
+        rollup.append(meter.measurement(t_now - WINDOW + index * interval, index == count // 2))
+
+    encoded = [rollup.to_json()] + [rollup.to_json(resolution) for resolution in rollup.resolutions]
+    t_start = time.perf_counter()
+
+    for index in range(samples):
+        item = meter.measurement(t_now + index * interval)
+        rollup.append(item)
+        rollup.evict(item["ts"])
+        encoded = [rollup.to_json()] + [rollup.to_json(resolution) for resolution in rollup.resolutions]
+
+    sample_time = (time.perf_counter() - t_start) / samples
+
+    # The deltas of the buckets must sum to the consumed energy.
+    rollup = Rollup(raw_window, window=WINDOW * 2, counters=COUNTERS)
+    meter = Meter()
+    for index in range(count):
+        rollup.append(meter.measurement(t_now - WINDOW + index * interval, index == count // 2))
+    rollup.flush()
+
+    error = 0.0
+    for resolution in rollup.resolutions:
+        buckets = json.loads(rollup.to_json(resolution))
+        for name in COUNTERS:
+            delta = sum([bucket[f"{name}.delta"] for bucket in buckets])
+            error = max(error, abs(delta - meter.consumed[name]))
+
+    return sample_time, [len(item) for item in encoded], error
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--samples", type=int, default=100, help="Measured samples on full 24 hours history.")
+    parser.add_argument("--raw_window", type=float, default=900.0, help="Raw measurements window in seconds.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    for interval in (10, 2):
+        sample_time, size = run_series(interval, args.samples)
+        print("Demand {:2d} s; Raw 24h sample: {:7.3f} ms; JSON: {:9.1f} kB"\
+            .format(interval, sample_time * 1000, size / 1e3))
+
+        sample_time, sizes, error = run_rollup(interval, args.samples, args.raw_window)
+        print("Demand {:2d} s; Rollup  sample: {:7.3f} ms; JSON: {:9.1f} kB (raw {:.1f}, 1m {:.1f}, 15m {:.1f}); energy error: {:.2e}"\
+            .format(interval, sample_time * 1000, sum(sizes) / 1e3,\
+                sizes[0] / 1e3, sizes[1] / 1e3, sizes[2] / 1e3, error))
+
+if __name__ == "__main__":
+    main()
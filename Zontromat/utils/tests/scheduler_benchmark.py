@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+import argparse
+import math
+import statistics
+import time
+
+from utils.logic.scheduler import Scheduler
+from utils.logic.timer import Timer
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+def work(load):
+    """Simulated zone update.
+
+    Args:
+        load (float): Busy time in seconds.
+    """
+
+    t_end = time.perf_counter() + load
+    while time.perf_counter() < t_end:
+        pass
+
+def run_polling(rate, duration, load):
+    """Busy polling loop, as the zone was running before the scheduler.
+
+    Returns:
+        tuple: CPU time and the lateness of each update.
+    """
+
+    lateness = []
+    timer = Timer(rate)
+    timer.update_last_time()
+
+    t_stop = time.monotonic() + duration
+    cpu_start = time.process_time()
+
+    while time.monotonic() < t_stop:
+
+        deadline = timer.deadline
+        timer.update()
+
+        if timer.expired:
+            timer.clear()
+            lateness.append(time.monotonic() - deadline)
+            work(load)
+
+    return time.process_time() - cpu_start, lateness
+
+def run_scheduled(rate, duration, load):
+    """Loop that sleeps until the next deadline.
+
+    Returns:
+        tuple: CPU time and the lateness of each update.
+    """
+
+    lateness = []
+    scheduler = Scheduler()
+    timer = Timer(rate, scheduler)
+    timer.update_last_time()
+
+    t_stop = time.monotonic() + duration
+    cpu_start = time.process_time()
+
+    while time.monotonic() < t_stop:
+
+        scheduler.wait()
+
+        deadline = timer.deadline
+        timer.update()
+
+        if timer.expired:
+            timer.clear()
+            lateness.append(time.monotonic() - deadline)
+            work(load)
+
+    return time.process_time() - cpu_start, lateness
+
+def report(name, duration, cpu_time, lateness):
+    """Print the results.
+    """
+
+    lateness = sorted(value * 1000 for value in lateness)
+
+    # Nearest rank, the smallest value that is not lower than 99 % of the samples.
+    p99 = lateness[math.ceil(len(lateness) * 0.99) - 1] if lateness else float("nan")
+
+    print("{:<10} CPU: {:6.2f} %; updates: {:4d}; jitter mean: {:7.3f} ms; p99: {:7.3f} ms; max: {:7.3f} ms"\
+        .format(name, 100 * cpu_time / duration, len(lateness),\
+            statistics.mean(lateness) if lateness else float("nan"), p99,\
+            lateness[-1] if lateness else float("nan")))
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--rate", type=float, default=0.5, help="Zone update rate [s].")
+    parser.add_argument("--duration", type=float, default=10.0, help="Measurement time for each loop [s].")
+    parser.add_argument("--load", type=float, default=0.005, help="Busy time of each update [s].")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    cpu_time, lateness = run_polling(args.rate, args.duration, args.load)
+    report("Polling", args.duration, cpu_time, lateness)
+
+    cpu_time, lateness = run_scheduled(args.rate, args.duration, args.load)
+    report("Scheduled", args.duration, cpu_time, lateness)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from data.register import Profiles
+from data.registers import Registers
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+def import_times(module):
+    """Import the module in new interpreter with -X importtime.
+
+    Args:
+        module (str): Module name.
+
+    Returns:
+        list: Tuples of self [us], cumulative [us], nesting level and module name.
+    """
+
+    # Root of the application.
+    cwd = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+
+    times = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+
+        name = fields[2].rstrip()
+        level = (len(name) - len(name.lstrip())) // 2
+
+        times.append((int(fields[0]), int(fields[1]), level, name.strip()))
+
+    if process.returncode != 0:
+        print(process.stderr.splitlines()[-1])
+
+    return times
+
+def registers_times(file_path, repeat, profile):
+    """Load the registers from the source, from the snapshot and from the compiled file of the profile.
+
+    Returns:
+        tuple: Time of the source, of the snapshot and of the compiled loading [s], count of the compiled registers.
+    """
+
+    temp_dir = tempfile.mkdtemp()
+    snapshot_path = os.path.join(temp_dir, "registers.snapshot")
+    compiled_path = os.path.join(temp_dir, "registers.bin")
+
+    # Create the snapshot and the compiled file.
+    Registers.from_snapshot(file_path, snapshot_path)
+    Registers.to_compiled(Registers.from_json(file_path), compiled_path, profile)
+
+    t_start = time.perf_counter()
+    for _ in range(repeat):
+        Registers.from_json(file_path)
+    source = (time.perf_counter() - t_start) / repeat
+
+    t_start = time.perf_counter()
+    for _ in range(repeat):
+        Registers.from_snapshot(file_path, snapshot_path)
+    snapshot = (time.perf_counter() - t_start) / repeat
+
+    t_start = time.perf_counter()
+    for _ in range(repeat):
+        registers = Registers.from_compiled(compiled_path)
+    compiled = (time.perf_counter() - t_start) / repeat
+
+    os.remove(snapshot_path)
+    os.remove(compiled_path)
+    os.rmdir(temp_dir)
+
+    return source, snapshot, compiled, len(registers)
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--module", type=str, default="zone", help="Imported module.")
+    parser.add_argument("--top", type=int, default=15, help="Count of the slowest imports.")
+    parser.add_argument("--registers", type=str, default=os.path.join("..", "registers.json"), help="Registers file.")
+    parser.add_argument("--repeat", type=int, default=20, help="Registers loads.")
+    parser.add_argument("--profile", type=Profiles, default=Profiles.ZONE, choices=list(Profiles), help="Profile of the compiled registers.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    times = import_times(args.module)
+    total = sum([item[1] for item in times if item[2] == 1])
+    print("Import {}: {:8.1f} ms, {} modules".format(args.module, total / 1000, len(times)))
+
+    for item in sorted(times, key=lambda item: item[1], reverse=True)[:args.top]:
+        print("  {:8.1f} ms  {}".format(item[1] / 1000, item[3]))
+
+    if os.path.exists(args.registers):
+        source, snapshot, compiled, count = registers_times(args.registers, args.repeat, args.profile)
+        print("Registers source: {:8.3f} ms; snapshot: {:8.3f} ms; compiled {}: {:8.3f} ms, {} registers"\
+            .format(source * 1000, snapshot * 1000, args.profile.value, compiled * 1000, count))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf8 -*-
+
+"""
+
+Zontromat - Zonal Electronic Automation
+
+Copyright (C) [2020] [POLYGONTeam Ltd.]
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+import argparse
+import json
+import random
+import time
+
+from utils.logic.functions import filter_measurements_by_time
+from utils.logic.time_series import TimeSeries
+
+#region File Attributes
+
+__author__ = "Orlin Dimitrov"
+"""Author of the file."""
+
+__copyright__ = "Copyright 2020, POLYGON Team Ltd."
+"""Copyrighter
+@see http://polygonteam.com/"""
+
+__credits__ = ["Angel Boyarov"]
+"""Credits"""
+
+__license__ = "GPLv3"
+"""License
+@see http://www.gnu.org/licenses/"""
+
+__version__ = "1.0.0"
+"""Version of the file."""
+
+__maintainer__ = "Orlin Dimitrov"
+"""Name of the maintainer."""
+
+__email__ = "or.dimitrov@polygonteam.com"
+"""E-mail of the author.
+@see or.dimitrov@polygonteam.com"""
+
+__status__ = "Debug"
+"""File status."""
+
+#endregion
+
+WINDOW = 86400
+"""24 hours in seconds.
+"""
+
+def measurement(ts):
+    """Power analyzer like measurement.
+    """
+
+    return {
+        "ImportActiveEnergy": random.uniform(0, 1e5),
+        "ExportActiveEnergy": random.uniform(0, 1e5),
+        "ImportReactiveEnergy": random.uniform(0, 1e5),
+        "ExportReactiveEnergy": random.uniform(0, 1e5),
+        "Phase1Current": random.uniform(0, 32),
+        "ts": ts,
+    }
+
+def run_list(interval, samples):
+    """List of dicts, filter and whole history encoding, as the monitoring was doing.
+
+    Returns:
+        tuple: Time for one sample [s] and size of the JSON.
+    """
+
+    t_now = time.time()
+    measurements = [measurement(t_now - WINDOW + index * interval)\
+        for index in range(int(WINDOW / interval))]
+
+    encoded = ""
+    t_start = time.perf_counter()
+
+    for _ in range(samples):
+        measurements.append(measurement(time.time()))
+        filter_measurements_by_time(measurements, WINDOW)
+        encoded = json.dumps(measurements)
+
+    return (time.perf_counter() - t_start) / samples, len(encoded)
+
+def run_series(interval, samples):
+    """Ring buffer with incremental encoding.
+
+    Returns:
+        tuple: Time for one sample [s] and size of the JSON.
+    """
+
+    t_now = time.time()
+    series = TimeSeries(WINDOW)
+    for index in range(int(WINDOW / interval)):
+        series.append(measurement(t_now - WINDOW + index * interval))
+
+    # Steady state, the history is already encoded.
+    encoded = series.to_json()
+    t_start = time.perf_counter()
+
+    for _ in range(samples):
+        item = measurement(time.time())
+        series.append(item)
+        series.evict(item["ts"])
+        encoded = series.to_json()
+
+    return (time.perf_counter() - t_start) / samples, len(encoded)
+
+def main():
+    """Main function.
+    """
+
+    # Create parser.
+    parser = argparse.ArgumentParser()
+
+    # Add arguments.
+    parser.add_argument("--samples", type=int, default=20, help="Measured samples on full 24 hours history.")
+
+    # Take arguments.
+    args = parser.parse_args()
+
+    for interval in (10, 1):
+        sample_time, size = run_list(interval, args.samples)
+        print("Demand {:2d} s; List    sample: {:9.3f} ms; JSON: {:6.2f} MB"\
+            .format(interval, sample_time * 1000, size / 1e6))
+
+        sample_time, size = run_series(interval, args.samples)
+        print("Demand {:2d} s; Series  sample: {:9.3f} ms; JSON: {:6.2f} MB"\
+            .format(interval, sample_time * 1000, size / 1e6))
+
+if __name__ == "__main__":
+    main()
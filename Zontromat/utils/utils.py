@@ -27,7 +27,6 @@ import time
 from functools import wraps
 import tracemalloc
 import shutil
-import serial.tools.list_ports
 import locale
 
 if os.name == "posix":
@@ -193,6 +192,9 @@ def serial_ports():
     """List all serial ports.
     """
 
+    # pyserial is needed only here.
+    import serial.tools.list_ports
+
     ports = serial.tools.list_ports.comports()
     names = [port.name for port in ports]
     return names
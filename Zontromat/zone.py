@@ -29,10 +29,11 @@ import traceback
 import os
 
 from utils.settings import ApplicationSettings
-from utils.logger import get_logger, crate_log_file
+from utils.logger import get_logger
 from utils.performance_profiler import PerformanceProfiler
 from utils.logic.state_machine import StateMachine
 from utils.logic.timer import Timer
+from utils.logic.scheduler import Scheduler
 from utils.updater import update as software_update
 from utils.utils import uptime
 
@@ -50,8 +51,6 @@ from plugins.plugins_manager import PluginsManager
 from services.evok.settings import EvokSettings
 from services.global_error_handler.global_error_handler import GlobalErrorHandler
 
-from ztm_ui.ztm_ui import ZtmUI
-
 #region File Attributes
 
 __author__ = "Orlin Dimitrov"
@@ -121,6 +120,9 @@ class Zone():
         self.__update_timer = None
         """Update timer."""
 
+        self.__scheduler = Scheduler()
+        """Runtime scheduler. The main loop sleeps until its next deadline or I/O event."""
+
         self.__erp_service_update_timer = None
         """ERP update timer."""
 
@@ -148,6 +150,15 @@ class Zone():
         """ZtmUI update timer.
         """
 
+        self.__ztm_ui_regs_names = ["envm.door_tamper.activations",
+                            "envm.window_tamper.activations",
+                            "envm.pir.activations",
+                            "envm.forecast.icon_0", "envm.forecast.rh_0", "envm.forecast.temp_0", "envm.forecast.wind_0",
+                            "envm.forecast.icon_3", "envm.forecast.rh_3", "envm.forecast.temp_3", "envm.forecast.wind_3",
+                            "envm.forecast.icon_6", "envm.forecast.rh_6", "envm.forecast.temp_6", "envm.forecast.wind_6"]
+        """Registers that are shown in the ZtmUI.
+        """
+
 #endregion
 
 #region Private Methods (Registers Interface)
@@ -205,14 +216,17 @@ class Zone():
         # Current file path. & Go to file.
         cwf = os.path.dirname(os.path.abspath(__file__))
         registers_file = os.path.join(cwf, "..", "registers.json")
+        compiled_file = os.path.join(cwf, "..", "registers.bin")
 
-        # Load depending of file format.
-        if registers_file.endswith('json'):
-            self.__registers = Registers.from_json(registers_file)
-        elif registers_file.endswith('csv'):
-            self.__registers = Registers.from_csv(registers_file)
-        else:
-            sys.exit(0)
+        # The compiled registers of the profile, when they are built after the source.
+        self.__registers = Registers.from_compiled(compiled_file, registers_file)
+
+        # Load depending of file format, from the binary snapshot when it is up to date.
+        if self.__registers is None:
+            if registers_file.endswith('json') or registers_file.endswith('csv'):
+                self.__registers = Registers.from_snapshot(registers_file)
+            else:
+                sys.exit(0)
 
         target_version = self.__registers.by_name("sys.software.current_version")
         if target_version is not None:
@@ -223,6 +237,10 @@ class Zone():
             target_version.update_handlers = self.__target_version_cb
             # TODO: Will we ask for update on every start?
 
+        # Publish the errors of the last minute and their rates.
+        GlobalErrorHandler.set_register(self.__registers.by_name("sys.last_update_errs"))
+        GlobalErrorHandler.set_rates_register(self.__registers.by_name("sys.last_update_errs.rates"))
+
         # Set boot time.
         sys_boot_time = self.__registers.by_name("sys.time.boot")
         if sys_boot_time is not None:
@@ -237,11 +255,11 @@ class Zone():
 
 #region Private Methods (PLC)
 
-    def __evok_cb(self, device):
+    def __evok_cb(self, devices):
         """EVOK callback service handler.
 
         Args:
-            device (JSON): GPIOs that was changed.
+            devices (JSON): GPIOs that was changed, one or list of them.
         """
 
         # Target inputs, by registers names.
@@ -250,17 +268,40 @@ class Zone():
             "ac.window_closed_1.input", "ac.window_closed_2.input",\
             "monitoring.cw.input", "monitoring.hw.input", "sys.at.input"]
         inputs = self.__registers.by_names(names)
-        gpio = self.__controller.device_to_uniname(device)
 
-        for input_reg in inputs:
-            if input_reg is not None:
-                if input_reg.value == gpio:
+        # Complex events come as a list.
+        if isinstance(devices, dict):
+            devices = [devices]
 
-                    # If register exists, apply value.
-                    required_name = input_reg.name.replace("input", "state")
+        if devices is None:
+            devices = []
 
-                    if self.__registers is not None:
-                        self.__registers.write(required_name, device["value"])
+        # Watched input is changed.
+        input_changed = False
+
+        for device in devices:
+
+            # The incremental state mode reports all device types, only the inputs are interesting here.
+            if device.get("dev", None) != "input":
+                continue
+
+            gpio = self.__controller.device_to_uniname(device)
+
+            for input_reg in inputs:
+                if input_reg is not None:
+                    if input_reg.value == gpio:
+
+                        # If register exists, apply value.
+                        required_name = input_reg.name.replace("input", "state")
+
+                        if self.__registers is not None:
+                            self.__registers.write(required_name, device["value"])
+                            input_changed = True
+
+        # Wake up the runtime to react on the input. The echoes of the outputs
+        # and the analog changes wait for the next tick.
+        if input_changed:
+            self.__scheduler.notify()
 
     def __init_controller(self):
         """Initialize the controller.
@@ -289,7 +330,7 @@ class Zone():
                 # Modifie
                 evok_settings.webhook_address = "http://127.0.0.1:8889/api/v1/evok/webhooks   ; Put your server endpoint address here (e.g. http://123.123.123.123:/wh )"
                 evok_settings.webhook_enabled = True
-                evok_settings.webhook_device_mask = ["input", "wd"]
+                evok_settings.webhook_device_mask = self.__controller.webhook_device_mask
                 evok_settings.webhook_complex_events = True
 
                 # Save
@@ -386,6 +427,9 @@ class Zone():
                 # Add phase shift time for reducing the self DDoS attack to the server.
                 int(self.__app_settings.erp_service["serial_number"]) * 0.5)
 
+        # Track the device registers changes for the ERP.
+        self.__registers.add_consumer("erp", scope=Scope.Device)
+
         # Set zone state machine.
         self.__erp_state_machine = StateMachine()
         self.__erp_state_machine.on_change(self.__on_erp_state_change_cb)
@@ -408,6 +452,9 @@ class Zone():
                 self.__app_settings.erp_service["erp_id"] = self.__erp.erp_id
                 self.__app_settings.save()
 
+            # Send the full state after each login.
+            self.__registers.reset_changes("erp")
+
             self.__erp_state_machine.set_state(ERPState.Update)
 
         else:
@@ -434,11 +481,18 @@ class Zone():
                 self.__erp_service_update_timer.expiration_time = \
                 int(self.__app_settings.erp_service["update_rate"])
 
-            ztm_regs = self.__registers.by_scope(Scope.Device)
-            ztm_regs = ztm_regs.new_then(120)
+            # Take only what is changed since the last successful sync.
+            ztm_regs = self.__registers.drain_changes("erp")
             ztm_regs_dict = ztm_regs.to_dict()
 
-            update_state = self.__erp.sync(ztm_regs_dict)
+            update_state = None
+            try:
+                update_state = self.__erp.sync(ztm_regs_dict)
+
+            finally:
+                # Not delivered, send it again next time.
+                if update_state is None:
+                    self.__registers.restore_changes("erp", ztm_regs)
 
             if update_state is not None: #  is not None
 
@@ -490,6 +544,9 @@ class Zone():
         # Check is it enabled.
         if self.__app_settings.ui["enabled"] == "True":
 
+            # The UI client is imported only when it is enabled.
+            from ztm_ui.ztm_ui import ZtmUI
+
             self.__ztm_ui = ZtmUI(host = self.__app_settings.ui["host"],
                 email = self.__app_settings.ui["email"],
                 password = self.__app_settings.ui["password"],
@@ -498,33 +555,39 @@ class Zone():
 
             self.__ztm_ui_ut = Timer(1)
 
+            # Track the changes of the shown registers for the UI.
+            self.__registers.add_consumer("ztm_ui", names=self.__ztm_ui_regs_names)
+
             # Log in.
             if not self.__ztm_ui.is_logged_in:
                 self.__ztm_ui.login()
 
     def __sync_ztmui(self):
-        target_regs_names = ["envm.door_tamper.activations",
-                            "envm.window_tamper.activations",
-                            "envm.pir.activations",
-                            "envm.forecast.icon_0", "envm.forecast.rh_0", "envm.forecast.temp_0", "envm.forecast.wind_0",
-                            "envm.forecast.icon_3", "envm.forecast.rh_3", "envm.forecast.temp_3", "envm.forecast.wind_3",
-                            "envm.forecast.icon_6", "envm.forecast.rh_6", "envm.forecast.temp_6", "envm.forecast.wind_6"]
-        target_registers = self.__registers.by_names(target_regs_names)
-        if target_registers != []:
-            # Check UI data and send only if changes ocurred.
+
+        # Send only the changes since the last successful sync.
+        target_registers = self.__registers.drain_changes("ztm_ui")
+
+        response_registers = None
+        try:
             response_registers = self.__ztm_ui.sync(target_registers)
-            if response_registers is not None:
-                    # Update changes.
-                    for register in response_registers:
-                        try:
-                            target_register = self.__registers.by_name(register["name"])
-                            if target_register is not None:
-                                if target_register.data_type == "float":
-                                    target_register.value = float(register["value"])
-                                elif target_register.data_type == "int":
-                                    target_register.value = float(register["value"])
-                        except Exception as e:
-                            self.__logger.error(e)
+
+        finally:
+            # Not delivered, send it again next time.
+            if response_registers is None:
+                self.__registers.restore_changes("ztm_ui", target_registers)
+
+        if response_registers is not None:
+            # Update changes.
+            for register in response_registers:
+                try:
+                    target_register = self.__registers.by_name(register["name"])
+                    if target_register is not None:
+                        if target_register.data_type == "float":
+                            target_register.value = float(register["value"])
+                        elif target_register.data_type == "int":
+                            target_register.value = float(register["value"])
+                except Exception as e:
+                    self.__logger.error(e)
 
     def __update_ztmui(self):
 
@@ -544,6 +607,10 @@ class Zone():
                 else:
                     self.__ztm_ui.login()
 
+                    # Send the full state after each login.
+                    if self.__ztm_ui.is_logged_in:
+                        self.__registers.reset_changes("ztm_ui")
+
 #endregion
 
 #region Private Methods (Runtime)
@@ -551,7 +618,7 @@ class Zone():
     def __init_runtime(self):
 
         # Update timer.
-        self.__update_timer = Timer(self.__update_rate)
+        self.__update_timer = Timer(self.__update_rate, self.__scheduler)
 
         # Update with offset based on the serial number of the device.
         time_offset = 0
@@ -569,13 +636,21 @@ class Zone():
         """Set the performance profiler.
         """
 
-        self.__performance_profiler.enable_mem_profile = True
         self.__performance_profiler.enable_time_profile = True
         self.__performance_profiler.on_time_change(self.__on_time_change)
         self.__performance_profiler.on_memory_change(self.__on_memory_change)
 
+        # Trace the memory only on demand.
+        sys_ram_profile = self.__registers.by_name("sys.ram.profile")
+        if sys_ram_profile is not None:
+            sys_ram_profile.update_handlers = self.__ram_profile_cb
+            sys_ram_profile.update()
+
+        # Measure each plugin.
+        self.__plugin_manager.profiler = self.__performance_profiler
+
         # Setup the performance profiler timer. (60) 10 is for tests.
-        self.__performance_profiler_timer = Timer(10)
+        self.__performance_profiler_timer = Timer(10, self.__scheduler)
 
     def __on_time_change(self, passed_time):
         """On consumed time change.
@@ -588,6 +663,9 @@ class Zone():
 
             self.__registers.write("sys.time.usage", float("{:10.3f}".format(passed_time)))
 
+            # Percentiles of the sections since the last profile.
+            self.__registers.write("sys.time.profile", self.__performance_profiler.report())
+
     def __on_memory_change(self, current, peak):
         """On RAM memory change.
 
@@ -603,19 +681,31 @@ class Zone():
 
         # print(f"Current memory usage is {current / 10**3}kB; Peak was {peak / 10**3}kB")
 
+        top = self.__performance_profiler.memory_top()
+        if len(top) > 0:
+            self.__logger.info("Memory usage:\n{}".format("\n".join(top)))
+
+    def __ram_profile_cb(self, register):
+
+        # Check data type.
+        if not register.data_type == "bool":
+            GlobalErrorHandler.log_bad_register_data_type(self.__logger, register)
+            return
+
+        self.__performance_profiler.enable_mem_profile = register.value
+
     @__performance_profiler.profile
     def __update(self):
         """Update the zone.
         """
 
-        # Create log if if it does not.
-        crate_log_file()
-
         # Update Zontromat UI.
-        self.__update_ztmui()
+        with self.__performance_profiler.measure("ui"):
+            self.__update_ztmui()
 
         # Update the neuron.
-        state = self.__controller.update()
+        with self.__performance_profiler.measure("controller"):
+            state = self.__controller.update()
         if not state:
             self.__logger.error("PLC service should be restarted.")
             GlobalErrorHandler.log_no_connection_plc(self.__logger)
@@ -624,7 +714,15 @@ class Zone():
         # Give plugins runtime.
         self.__plugin_manager.update()
 
-        self.__update_erp()
+        # Send the outputs that the plugins changed in this tick.
+        with self.__performance_profiler.measure("flush"):
+            self.__controller.flush()
+
+        with self.__performance_profiler.measure("erp"):
+            self.__update_erp()
+
+        # Publish the errors that were throttled.
+        GlobalErrorHandler.update()
 
         # Update uptime.
         sys_uptime_time = self.__registers.by_name("sys.time.uptime")
@@ -682,12 +780,18 @@ class Zone():
 
         while not self.__stop_flag:
 
+            # Sleep until the next deadline or I/O event.
+            io_event = self.__scheduler.wait()
+
+            if self.__stop_flag:
+                break
+
             # Update process timers.
             self.__update_timer.update()
             self.__performance_profiler_timer.update()
 
-            # If time has come for execution then run it once and clear the timer.
-            if self.__update_timer.expired:
+            # If time has come for execution, or an input is changed, then run it once and clear the timer.
+            if self.__update_timer.expired or io_event:
                 self.__update_timer.clear()
 
                 # If the busy flag is raise pass the update cycle.
@@ -725,10 +829,17 @@ class Zone():
         # Shutdown the plugins.
         self.__plugin_manager.shutdown()
 
+        # Send the safe states that the plugins left.
+        if self.__controller is not None:
+            self.__controller.flush()
+
     def shutdown(self):
         """Shutdown the process.
         """
 
         self.__stop_flag = True
 
+        # Wake up the main loop.
+        self.__scheduler.notify()
+
 #endregion